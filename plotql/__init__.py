@@ -12,23 +12,26 @@ Usage:
     from plotql.ui import run_tui
     run_tui()
 """
-from plotql.core import (
-    # Main API
-    parse,
-    execute,
-    render,
-    # Result types
-    PlotData,
-    PlotResult,
-    PlotQuery,
-    PlotType,
-    # Errors
-    ParseError,
-    ExecutionError,
-    # Engine management
-    get_engine,
-    set_engine,
-)
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from plotql.core import (
+        # Main API
+        parse,
+        execute,
+        render,
+        # Result types
+        PlotData,
+        PlotResult,
+        PlotQuery,
+        PlotType,
+        # Errors
+        ParseError,
+        ExecutionError,
+        # Engine management
+        get_engine,
+        set_engine,
+    )
 
 __all__ = [
     "parse",
@@ -44,3 +47,16 @@ __all__ = [
     "set_engine",
 ]
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import the core API on first access, keeping `import plotql` cheap."""
+    if name in __all__:
+        import plotql.core
+
+        return getattr(plotql.core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,15 +5,192 @@ Usage:
     plotql                    # Launch interactive TUI
     plotql -q "WITH ..."      # Execute query and show in TUI
     plotql script.pql         # Run queries from file
+    plotql render script.pql -o outdir/   # Render every query to image files
+    plotql render script.pql --grid 2     # Tile every query into one image
+    plotql dashboard script.pql           # Watch every query in one screen
+    plotql --engine raster    # Use the lightweight raster engine
+    plotql --live             # Re-run the query as you edit it
 """
 
 import argparse
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 
-def main() -> int:
+def _add_engine_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-e", "--engine",
+        help="Rendering engine, e.g. matplotlib or raster (default: from config, else matplotlib)",
+    )
+
+
+def _select_engine(name: Optional[str]) -> bool:
+    """Make the named engine the default. Returns False if it doesn't exist."""
+    if name is None:
+        return True
+    from plotql.core.engines import set_engine
+    try:
+        set_engine(name)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return False
+    return True
+
+
+def render_main(argv: List[str]) -> int:
+    """Headless batch rendering: ``plotql render script.pql -o outdir/``."""
+    parser = argparse.ArgumentParser(
+        prog="plotql render",
+        description="Render every query in a script to image files",
+    )
+    parser.add_argument(
+        "file",
+        help="Script file containing one or more queries (.pql)",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default=".",
+        help="Output directory (default: current directory)",
+    )
+    parser.add_argument(
+        "-f", "--format",
+        choices=["png", "svg"],
+        default="png",
+        help="Output format (default: png)",
+    )
+    parser.add_argument(
+        "--width",
+        type=int,
+        default=800,
+        help="Chart width in pixels (default: 800)",
+    )
+    parser.add_argument(
+        "--height",
+        type=int,
+        default=600,
+        help="Chart height in pixels (default: 600)",
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Render processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "-g", "--grid",
+        type=int,
+        metavar="COLUMNS",
+        help="Tile all charts into one PNG with COLUMNS charts per row",
+    )
+    _add_engine_argument(parser)
+
+    args = parser.parse_args(argv)
+    if not _select_engine(args.engine):
+        return 1
+
+    try:
+        with open(args.file) as f:
+            script = f.read()
+    except FileNotFoundError:
+        print(f"Error: File not found: {args.file}", file=sys.stderr)
+        return 1
+
+    from plotql.core import render_script
+    try:
+        results = render_script(
+            script,
+            args.output,
+            name=Path(args.file).stem,
+            format=args.format,
+            width=args.width,
+            height=args.height,
+            workers=args.workers,
+            columns=args.grid,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not results:
+        print(f"Error: No queries found in {args.file}", file=sys.stderr)
+        return 1
+
+    failed = 0
+    written = set()
+    for result in results:
+        if result.ok:
+            # A grid holds every chart in one file
+            if result.path not in written:
+                print(result.path)
+                written.add(result.path)
+        else:
+            failed += 1
+            print(
+                f"Error: query {result.index + 1}: {result.error}",
+                file=sys.stderr,
+            )
+    return 1 if failed else 0
+
+
+def dashboard_main(argv: List[str]) -> int:
+    """Dashboard TUI: ``plotql dashboard script.pql --refresh 30``."""
+    parser = argparse.ArgumentParser(
+        prog="plotql dashboard",
+        description="Show every query in a script as a pane of one dashboard",
+    )
+    parser.add_argument(
+        "file",
+        help="Script file containing one or more queries (.pql)",
+    )
+    parser.add_argument(
+        "-c", "--columns",
+        type=int,
+        default=2,
+        help="Panes per row (default: 2)",
+    )
+    parser.add_argument(
+        "-r", "--refresh",
+        type=float,
+        default=0,
+        metavar="SECONDS",
+        help="Refresh every pane this often; press i on a pane to change it (default: off)",
+    )
+    _add_engine_argument(parser)
+
+    args = parser.parse_args(argv)
+    if not _select_engine(args.engine):
+        return 1
+
+    try:
+        with open(args.file) as f:
+            script = f.read()
+    except FileNotFoundError:
+        print(f"Error: File not found: {args.file}", file=sys.stderr)
+        return 1
+
+    from plotql.core import ParseError
+    from plotql.ui import run_dashboard
+    try:
+        run_dashboard(script, columns=args.columns, refresh=args.refresh)
+    except ParseError as e:
+        print(f"Error: {args.file}: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "render":
+        return render_main(argv[1:])
+    if argv and argv[0] == "dashboard":
+        return dashboard_main(argv[1:])
+
     parser = argparse.ArgumentParser(
         prog="plotql",
         description="SQL-like DSL for terminal plotting",
@@ -23,6 +200,11 @@ Examples:
   plotql                              Launch interactive TUI
   plotql -q "WITH 'data.csv' PLOT y AGAINST x"
   plotql script.pql                   Run from file
+  plotql render script.pql -o out/    Render all queries in a file to PNG
+  plotql render script.pql --grid 2   Tile all queries into one PNG dashboard
+  plotql dashboard script.pql -r 30   Watch all queries, refreshed every 30s
+  plotql --engine raster              Use the lightweight raster engine
+  plotql --live                       Re-run the query as you edit it
 
 Query Syntax:
   WITH 'file.csv'
@@ -32,6 +214,7 @@ Query Syntax:
 
 Keybindings:
   F5            Execute query
+  F4            Toggle live mode
   Ctrl+Q        Quit
         """,
     )
@@ -45,13 +228,21 @@ Keybindings:
         "-q", "--query",
         help="Query string to execute",
     )
+    _add_engine_argument(parser)
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Start in live mode: re-run the query after each valid edit",
+    )
     parser.add_argument(
         "--version",
         action="version",
         version="%(prog)s 0.1.0",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if not _select_engine(args.engine):
+        return 1
 
     # Get query from file or argument
     query: Optional[str] = None
@@ -67,7 +258,7 @@ Keybindings:
 
     # Launch TUI
     from plotql.ui import run_tui
-    run_tui(query)
+    run_tui(query, live=args.live)
     return 0
 
 
@@ -19,23 +19,118 @@ Usage:
 """
 from __future__ import annotations
 
-from plotql.core.ast import (
-    AggregateFunc,
-    ColumnRef,
-    Condition,
-    ComparisonOp,
-    FormatOptions,
-    LogicalOp,
-    PlotQuery,
-    PlotType,
-    WhereClause,
-)
-from plotql.core.config import CONFIG_PATH
-from plotql.core.executor import execute, ExecutionError, PlotData
-from plotql.core.parser import parse, ParseError
-from plotql.core.result import PlotResult
-from plotql.core.engines import get_engine, set_engine, Engine, MatplotlibEngine
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
+# Public names and the module each is defined in. They are imported on
+# first access (PEP 562), so `import plotql.core` doesn't load Polars or
+# matplotlib until a query is executed or rendered.
+_LAZY_IMPORTS = {
+    "AggregateFunc": "plotql.core.ast",
+    "ColumnRef": "plotql.core.ast",
+    "Condition": "plotql.core.ast",
+    "ComparisonOp": "plotql.core.ast",
+    "FormatOptions": "plotql.core.ast",
+    "LogicalOp": "plotql.core.ast",
+    "PlotQuery": "plotql.core.ast",
+    "PlotType": "plotql.core.ast",
+    "WhereClause": "plotql.core.ast",
+    "CONFIG_PATH": "plotql.core.config",
+    "execute": "plotql.core.executor",
+    "CancelToken": "plotql.core.executor",
+    "ExecutionCancelled": "plotql.core.executor",
+    "ExecutionError": "plotql.core.executor",
+    "PlotData": "plotql.core.executor",
+    "SourceCache": "plotql.core.executor",
+    "SeriesCache": "plotql.core.executor",
+    "restyle": "plotql.core.executor",
+    "TileCache": "plotql.core.executor",
+    "XRange": "plotql.core.executor",
+    "x_extent": "plotql.core.executor",
+    "PyramidStore": "plotql.core.pyramid",
+    "Refresher": "plotql.core.refresh",
+    "parse": "plotql.core.parser",
+    "parse_script": "plotql.core.parser",
+    "ParseError": "plotql.core.parser",
+    "Diagnostic": "plotql.core.parser",
+    "IncrementalParser": "plotql.core.parser",
+    "ParseResult": "plotql.core.parser",
+    "PlotResult": "plotql.core.result",
+    "get_engine": "plotql.core.engines",
+    "set_engine": "plotql.core.engines",
+    "available_engines": "plotql.core.engines",
+    "register_engine": "plotql.core.engines",
+    "Engine": "plotql.core.engines",
+    "MatplotlibEngine": "plotql.core.engines",
+    "RasterEngine": "plotql.core.engines",
+    "render_script": "plotql.core.batch",
+    "BatchResult": "plotql.core.batch",
+    "RenderService": "plotql.core.render_service",
+    "RenderedChart": "plotql.core.render_service",
+}
+
+if TYPE_CHECKING:
+    from plotql.core.ast import (
+        AggregateFunc,
+        ColumnRef,
+        Condition,
+        ComparisonOp,
+        FormatOptions,
+        LogicalOp,
+        PlotQuery,
+        PlotType,
+        WhereClause,
+    )
+    from plotql.core.config import CONFIG_PATH
+    from plotql.core.executor import (
+        execute,
+        CancelToken,
+        ExecutionCancelled,
+        ExecutionError,
+        PlotData,
+        SourceCache,
+        SeriesCache,
+        restyle,
+        TileCache,
+        XRange,
+        x_extent,
+    )
+    from plotql.core.pyramid import PyramidStore
+    from plotql.core.refresh import Refresher
+    from plotql.core.parser import (
+        parse,
+        parse_script,
+        ParseError,
+        Diagnostic,
+        IncrementalParser,
+        ParseResult,
+    )
+    from plotql.core.result import PlotResult
+    from plotql.core.engines import (
+        get_engine,
+        set_engine,
+        available_engines,
+        register_engine,
+        Engine,
+        MatplotlibEngine,
+        RasterEngine,
+    )
+    from plotql.core.batch import render_script, BatchResult
+    from plotql.core.render_service import RenderService, RenderedChart
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 def render(data: PlotData, width: int = 800, height: int = 600) -> PlotResult:
     """
@@ -57,6 +152,8 @@ def render(data: PlotData, width: int = 800, height: int = 600) -> PlotResult:
         result = render(execute(parse("WITH 'data.csv' PLOT y AGAINST x")))
         result.save("output.png")
     """
+    from plotql.core.engines import get_engine
+
     return get_engine().render(data, width, height)
 
 
@@ -81,11 +178,39 @@ __all__ = [
     # Errors
     "ParseError",
     "ExecutionError",
+    "ExecutionCancelled",
+    # Cancellation
+    "CancelToken",
+    # Batch rendering
+    "parse_script",
+    "render_script",
+    "BatchResult",
+    "SourceCache",
+    # Live editing
+    "SeriesCache",
+    "restyle",
+    # Panning and zooming
+    "TileCache",
+    "XRange",
+    "x_extent",
+    "PyramidStore",
+    # Auto-refresh
+    "Refresher",
+    # Parallel rendering
+    "RenderService",
+    "RenderedChart",
+    # Live validation
+    "IncrementalParser",
+    "ParseResult",
+    "Diagnostic",
     # Engine management
     "get_engine",
     "set_engine",
+    "available_engines",
+    "register_engine",
     "Engine",
     "MatplotlibEngine",
+    "RasterEngine",
     # Configuration
     "CONFIG_PATH",
 ]
@@ -150,6 +150,7 @@ class FormatOptions:
     marker: Optional[str] = "default"  # Marker type for line plots, "default" enables, None/NULL disables
     line_color: Optional[str] = None
     line_style: Optional[str] = None  # solid, dashed, dotted
+    bins: Optional[str] = None  # Histogram bin count
     title: Optional[str] = None
     xlabel: Optional[str] = None
     ylabel: Optional[str] = None
@@ -196,9 +197,14 @@ class PlotQuery:
     Example with sources:
         WITH source(trades) PLOT price AGAINST time           # file alias
         WITH source(pump_fun, trades) PLOT price AGAINST time # db alias + table
+
+    Example kept up to date as the source grows:
+        WITH source(pump_fun, trades) REFRESH EVERY 5s
+        PLOT price AGAINST time AS 'line'
     """
     source: Union[SourceRef, DataSource]  # SourceRef preferred, DataSource for backward compat
     series: List[PlotSeries] = field(default_factory=list)
+    refresh: Optional[float] = None  # Seconds between re-executions (REFRESH EVERY), if any
 
     @property
     def is_aggregate(self) -> bool:
@@ -219,6 +225,9 @@ class PlotQuery:
         else:
             source_str = f"WITH {self.source}"
 
+        if self.refresh is not None:
+            source_str += f" REFRESH EVERY {self.refresh:g}s"
+
         parts = [source_str]
         for s in self.series:
             parts.append(f"PLOT {s.y_column} AGAINST {s.x_column} AS '{s.plot_type.value}'")
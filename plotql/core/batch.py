@@ -0,0 +1,235 @@
+"""
+Headless batch rendering of PlotQL scripts.
+
+A script holds any number of queries. They are parsed and executed in the
+calling process, sharing loaded sources through a SourceCache so a file
+referenced by many queries is read once. Rendering is the CPU-heavy part,
+so it is spread over a pool of worker processes that each start once and
+render many charts, overlapping with execution of the remaining queries.
+
+With a column count, the charts are instead tiled into one dashboard image
+by a RenderService.
+
+Usage:
+    from plotql.core.batch import render_script
+
+    results = render_script(Path("report.pql").read_text(), "out/")
+    failed = [r for r in results if not r.ok]
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from plotql.core.connectors import ConnectorError
+from plotql.core.engines import get_engine
+from plotql.core.executor import ExecutionError, PlotData, SourceCache, execute
+from plotql.core.parser import ParseError, parse, split_script
+from plotql.core.render_service import RenderService, create_render_pool
+
+# Output formats supported by batch rendering
+OUTPUT_FORMATS = ("png", "svg")
+
+# Output formats supported when tiling charts into one image
+GRID_FORMATS = ("png",)
+
+# Sources kept loaded at once while executing a script
+BATCH_SOURCE_CACHE_SIZE = 64
+
+
+@dataclass
+class BatchResult:
+    """Outcome of rendering one query from a script."""
+    index: int  # Position of the query in the script (0-based)
+    offset: int  # Character offset of the query in the script
+    path: Optional[Path] = None  # Written file, if rendering succeeded
+    error: Optional[str] = None  # Error message, if any stage failed
+
+    @property
+    def ok(self) -> bool:
+        """True if the chart was written."""
+        return self.error is None
+
+
+def output_path(
+    output_dir: Union[str, Path],
+    name: str,
+    index: int,
+    total: int,
+    format: str,
+) -> Path:
+    """
+    Build the output file path for a query.
+
+    Files are numbered from 1 in script order, zero-padded so they sort
+    correctly: ``report_001.png``, ``report_002.png``, ...
+    """
+    width = max(3, len(str(total)))
+    return Path(output_dir) / f"{name}_{index + 1:0{width}d}.{format}"
+
+
+def _execute_query(
+    result: BatchResult,
+    query_text: str,
+    cache: SourceCache,
+) -> Optional[List[PlotData]]:
+    """Parse and execute one query, recording any error in its result."""
+    try:
+        return execute(parse(query_text), cache=cache)
+    except ParseError as e:
+        result.error = f"Parse error: {e.message}"
+    except (ExecutionError, ConnectorError) as e:
+        result.error = f"Execution error: {e}"
+    return None
+
+
+def _render_to_file(
+    data: List[PlotData],
+    path: Path,
+    format: str,
+    width: int,
+    height: int,
+) -> Path:
+    """Render one query's data and write it to disk."""
+    with get_engine().render(data, width, height) as result:
+        result.save(str(path), format)
+    return path
+
+
+def render_script(
+    text: str,
+    output_dir: Union[str, Path],
+    name: str = "plot",
+    format: str = "png",
+    width: int = 800,
+    height: int = 600,
+    workers: Optional[int] = None,
+    columns: Optional[int] = None,
+) -> List[BatchResult]:
+    """
+    Parse, execute and render every query in a script.
+
+    A failing query doesn't stop the batch: its error is recorded in its
+    BatchResult and the remaining queries are still rendered.
+
+    Args:
+        text: Script text containing one or more queries
+        output_dir: Directory for the output files (created if missing)
+        name: Prefix for output file names
+        format: Output format, one of OUTPUT_FORMATS
+        width: Chart width in pixels
+        height: Chart height in pixels
+        workers: Number of render processes. Defaults to the CPU count;
+            1 renders in the calling process.
+        columns: If given, tile all charts into one ``<name>.<format>``
+            image with this many charts per row, each width x height.
+
+    Returns:
+        One BatchResult per query, in script order.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    formats = OUTPUT_FORMATS if columns is None else GRID_FORMATS
+    if format not in formats:
+        raise ValueError(
+            f"Unsupported output format '{format}'. "
+            f"Expected one of: {', '.join(formats)}"
+        )
+    if columns is not None and columns < 1:
+        raise ValueError(f"columns must be a positive integer, got {columns}")
+
+    chunks = split_script(text)
+    results = [
+        BatchResult(index=i, offset=offset)
+        for i, (offset, _) in enumerate(chunks)
+    ]
+    if not chunks:
+        return results
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(chunks)))
+
+    cache = SourceCache(
+        cache_unfingerprinted=True,
+        max_entries=BATCH_SOURCE_CACHE_SIZE,
+    )
+    if columns is not None:
+        return _render_grid(
+            results, chunks, cache, output_dir / f"{name}.{format}",
+            columns, width, height, workers,
+        )
+
+    pool: Optional[ProcessPoolExecutor] = None
+    if workers > 1:
+        pool = create_render_pool(workers, get_engine())
+
+    pending: List[Tuple[BatchResult, Future]] = []
+    try:
+        for result, (_, query_text) in zip(results, chunks):
+            data = _execute_query(result, query_text, cache)
+            if data is None:
+                continue
+
+            path = output_path(output_dir, name, result.index, len(chunks), format)
+            if pool is None:
+                try:
+                    result.path = _render_to_file(data, path, format, width, height)
+                except Exception as e:
+                    result.error = f"Render error: {e}"
+            else:
+                future = pool.submit(
+                    _render_to_file, data, path, format, width, height
+                )
+                pending.append((result, future))
+
+        for result, future in pending:
+            try:
+                result.path = future.result()
+            except Exception as e:
+                result.error = f"Render error: {e}"
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return results
+
+
+def _render_grid(
+    results: List[BatchResult],
+    chunks: List[Tuple[int, str]],
+    cache: SourceCache,
+    path: Path,
+    columns: int,
+    width: int,
+    height: int,
+    workers: int,
+) -> List[BatchResult]:
+    """Execute every query, then tile all charts into one image."""
+    rendered: List[BatchResult] = []
+    data_sets: List[List[PlotData]] = []
+    for result, (_, query_text) in zip(results, chunks):
+        data = _execute_query(result, query_text, cache)
+        if data is not None:
+            rendered.append(result)
+            data_sets.append(data)
+    if not data_sets:
+        return results
+
+    with RenderService(workers=workers, engine=get_engine()) as service:
+        image, errors = service.render_grid(data_sets, columns, width, height)
+    image.save(path)
+
+    for result, error in zip(rendered, errors):
+        if error is None:
+            result.path = path
+        else:
+            result.error = f"Render error: {error}"
+    return results
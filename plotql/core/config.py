@@ -19,6 +19,8 @@ Config format:
     database = "pump_fun"
     limit = 10000
 
+A top-level `engine = "raster"` entry selects the default rendering engine.
+
 Usage:
     WITH source(trades) PLOT ...              # file type
     WITH source(local_data, trades.csv) PLOT ...  # folder type
@@ -90,8 +92,9 @@ def get_source_config(
     """
     config = load_config(config_path)
 
-    if alias not in config:
-        available = list(config.keys())
+    # Top-level settings (e.g. engine = "raster") aren't sources
+    if not isinstance(config.get(alias), dict):
+        available = [k for k, v in config.items() if isinstance(v, dict)]
         raise ConfigError(
             f"Source '{alias}' not found in config. "
             f"Available: {', '.join(available) if available else 'none'}. "
@@ -112,6 +115,30 @@ def get_source_config(
     )
 
 
+def get_engine_name(config_path: Optional[Path] = None) -> Optional[str]:
+    """
+    Get the rendering engine named in the config file.
+
+    Set with a top-level entry, before any source sections:
+
+        engine = "raster"
+
+    Args:
+        config_path: Path to config file. Uses CONFIG_PATH if not specified.
+
+    Returns:
+        The engine name, or None if not configured.
+
+    Raises:
+        ConfigError: If the config file cannot be parsed or the entry
+            isn't a string.
+    """
+    engine = load_config(config_path).get("engine")
+    if engine is not None and not isinstance(engine, str):
+        raise ConfigError(f"'engine' in config must be a string, got {engine!r}")
+    return engine
+
+
 def list_sources(config_path: Optional[Path] = None) -> list[str]:
     """
     List all configured source aliases.
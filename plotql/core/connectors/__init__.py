@@ -8,10 +8,12 @@ from __future__ import annotations
 from typing import Type
 
 from plotql.core.connectors.base import (
+    ColumnStats,
     Connector,
     ConnectorError,
     ConfigError,
     ConnectionError,
+    Increment,
 )
 from plotql.core.connectors.literal import LiteralConnector
 from plotql.core.connectors.file import FileConnector
@@ -52,10 +54,12 @@ def get_connector(connector_type: str) -> Connector:
 
 __all__ = [
     # Base classes
+    "ColumnStats",
     "Connector",
     "ConnectorError",
     "ConfigError",
     "ConnectionError",
+    "Increment",
     # Implementations
     "LiteralConnector",
     "FileConnector",
@@ -7,7 +7,8 @@ into a common interface that returns Polars DataFrames.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import polars as pl
 
@@ -15,6 +16,10 @@ if TYPE_CHECKING:
     from plotql.core.ast import WhereClause
 
 
+# Rows read from the start of a source to compute column statistics
+STATS_SAMPLE_ROWS = 100_000
+
+
 class ConnectorError(Exception):
     """Base exception for connector-related errors."""
     pass
@@ -30,6 +35,25 @@ class ConnectionError(ConnectorError):
     pass
 
 
+@dataclass
+class ColumnStats:
+    """Summary of a column's values, for suggesting filter values."""
+    values: List[Any] = field(default_factory=list)  # Most frequent first
+    min: Any = None  # Smallest value, for numeric columns
+    max: Any = None  # Largest value, for numeric columns
+    sampled: bool = True  # True if computed from part of the source
+
+
+@dataclass
+class Increment:
+    """Rows fetched by Connector.load_increment since the previous fetch."""
+    rows: pl.DataFrame  # New rows, or every row if replace is set
+    cursor: Any  # Passed to the next load_increment to continue from here
+    replace: bool = False  # True if rows replace everything fetched before
+    retract: int = 0  # Rows at the end of the previous fetch to drop first
+    max_rows: Optional[int] = None  # Newest rows to keep in total, if bounded
+
+
 class Connector(ABC):
     """
     Abstract base class for data connectors.
@@ -80,3 +104,151 @@ class Connector(ABC):
             ConfigError: If configuration is invalid.
         """
         pass
+
+    def fingerprint(self, config: dict) -> Optional[str]:
+        """
+        Cheaply identify the current content of the source.
+
+        The fingerprint must change whenever the loaded data would change,
+        so callers can use it as a cache key. Connectors that cannot tell
+        cheaply return None (the default), which disables caching.
+
+        Args:
+            config: Configuration dict, as passed to load().
+
+        Returns:
+            Fingerprint string, or None if the source can't be fingerprinted.
+        """
+        return None
+
+    def schema(self, config: dict) -> pl.Schema:
+        """
+        Get the column names and types of the source without loading it.
+
+        The default loads the source; connectors override it with a
+        cheaper lookup (a file header, a table description, ...).
+
+        Args:
+            config: Configuration dict, as passed to load().
+
+        Returns:
+            The source's schema.
+
+        Raises:
+            ConfigError: If required configuration is missing or invalid.
+            ConnectorError: If the schema can't be read.
+        """
+        return self.load(config).schema
+
+    def load_range(
+        self,
+        config: dict,
+        column: str,
+        low: Any,
+        high: Any,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> pl.DataFrame:
+        """
+        Load the rows whose column lies between low and high (inclusive).
+
+        Used to fetch the visible part of a plot's x axis. Implementations
+        push the range down (a SQL WHERE, Parquet row-group statistics) so
+        rows outside it are never read. The default loads the source and
+        filters it.
+
+        Args:
+            config: Configuration dict, as passed to load().
+            column: Column to restrict.
+            low: Lower bound, in the column's own type (number, date,
+                 datetime, or string).
+            high: Upper bound, in the same type.
+            filters: Optional list of WhereClause filters to push down,
+                     as for load().
+
+        Returns:
+            A Polars DataFrame with the rows in range.
+
+        Raises:
+            ConfigError: If required configuration is missing or invalid.
+            ConnectorError: If the source can't be loaded.
+        """
+        if self.supports_filter_pushdown and filters:
+            df = self.load(config, filters=filters)
+        else:
+            df = self.load(config)
+        return df.filter(pl.col(column).is_between(pl.lit(low), pl.lit(high)))
+
+    def load_increment(
+        self,
+        config: dict,
+        cursor: Any = None,
+        column: Optional[str] = None,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> Increment:
+        """
+        Load the rows added to the source since a previous increment.
+
+        Used to keep a plot of a growing source up to date without
+        fetching it all again. Implementations fetch only what's new where
+        they can (rows past the last value of an increasing column, bytes
+        past the end of a file). The default reloads the source, skipping
+        the load entirely while its fingerprint is unchanged.
+
+        Args:
+            config: Configuration dict, as passed to load().
+            cursor: The cursor of the previous increment, or None for the
+                    first fetch.
+            column: A column whose values only increase as rows are added
+                    (e.g. the plot's timestamp axis), if there is one.
+            filters: Optional list of WhereClause filters to push down,
+                     as for load().
+
+        Returns:
+            The new rows and the cursor to continue from. Rows that replace
+            everything fetched before have replace set.
+
+        Raises:
+            ConfigError: If required configuration is missing or invalid.
+            ConnectorError: If the source can't be loaded.
+        """
+        fingerprint = self.fingerprint(config)
+        if cursor is not None and fingerprint is not None and cursor[0] == fingerprint:
+            return Increment(rows=cursor[1].to_frame(), cursor=cursor)
+        if self.supports_filter_pushdown and filters:
+            rows = self.load(config, filters=filters)
+        else:
+            rows = self.load(config)
+        return Increment(rows=rows, cursor=(fingerprint, rows.schema), replace=True)
+
+    def column_stats(self, config: dict, column: str, k: int = 10) -> Optional[ColumnStats]:
+        """
+        Summarize a column's values without scanning the whole source.
+
+        Used to suggest filter values, so implementations must stay cheap:
+        sample the start of the source, or push an approximate query down
+        to the database. The default returns None (no statistics), since
+        loading the source would be a full scan.
+
+        Args:
+            config: Configuration dict, as passed to load().
+            column: Column to summarize.
+            k: Number of most frequent values to return.
+
+        Returns:
+            The column's statistics, or None if not supported.
+
+        Raises:
+            ConfigError: If required configuration is missing or invalid.
+            ConnectorError: If the column can't be read.
+        """
+        return None
+
+    def cancel(self) -> None:
+        """
+        Abort a load() in progress on this connector instance.
+
+        Called from another thread while load() is running. Connectors that
+        can't interrupt a load ignore it (the default); the executor then
+        discards the result once load() returns.
+        """
+        pass
@@ -5,16 +5,73 @@ Handles ClickHouse database queries: WITH source(pump_fun, trades)
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+import re
+import threading
+import uuid
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 import polars as pl
 
-from plotql.core.connectors.base import Connector, ConfigError, ConnectionError
+from plotql.core.connectors.base import (
+    STATS_SAMPLE_ROWS,
+    ColumnStats,
+    Connector,
+    ConfigError,
+    ConnectionError,
+    Increment,
+)
 
 if TYPE_CHECKING:
     from plotql.core.ast import WhereClause
 
 
+# Polars types of ClickHouse column types, as load() returns them: values
+# arrive as Python objects, so every integer width becomes Int64
+_CLICKHOUSE_TYPES = {
+    **{f"Int{bits}": pl.Int64 for bits in (8, 16, 32, 64)},
+    **{f"UInt{bits}": pl.Int64 for bits in (8, 16, 32, 64)},
+    "Float32": pl.Float64,
+    "Float64": pl.Float64,
+    "Bool": pl.Boolean,
+    "String": pl.String,
+    "FixedString": pl.String,
+    "UUID": pl.String,
+    "Enum8": pl.String,
+    "Enum16": pl.String,
+    "Date": pl.Date,
+    "Date32": pl.Date,
+    "DateTime": pl.Datetime("us"),
+    "DateTime64": pl.Datetime("us"),
+}
+
+# Type wrappers that don't change how values are returned
+_WRAPPER = re.compile(r"(?:Nullable|LowCardinality)\((.*)\)")
+
+
+def clickhouse_dtype(type_name: str) -> pl.DataType:
+    """
+    Map a ClickHouse column type to a Polars type.
+
+    Nullable and LowCardinality wrappers are ignored; types without a
+    Polars equivalent map to pl.Unknown.
+    """
+    while match := _WRAPPER.fullmatch(type_name):
+        type_name = match.group(1)
+    base = type_name.split("(", 1)[0]
+    return _CLICKHOUSE_TYPES.get(base, pl.Unknown)
+
+
+def _sql_literal(value: Any) -> str:
+    """Format a Python value as a ClickHouse SQL literal."""
+    if isinstance(value, datetime):
+        # DateTime columns parse whole seconds only
+        return f"'{value:%Y-%m-%d %H:%M:%S}'"
+    if isinstance(value, (str, date)):
+        return f"'{value}'"
+    return str(value)
+
+
 class ClickHouseConnector(Connector):
     """
     Connector for ClickHouse databases.
@@ -39,6 +96,11 @@ class ClickHouseConnector(Connector):
 
     supports_filter_pushdown: bool = True
 
+    def __init__(self) -> None:
+        # (config, query_id) of the query currently running in load()
+        self._running: Optional[Tuple[dict, str]] = None
+        self._lock = threading.Lock()
+
     def validate_config(self, config: dict) -> None:
         """Validate ClickHouse configuration."""
         required = ["host", "table"]
@@ -81,6 +143,175 @@ class ClickHouseConnector(Connector):
         """
         self.validate_config(config)
 
+        client = self._get_client(config)
+        table = config["table"]
+        limit = config.get("limit", 10000)
+
+        # Build the query
+        query = self._build_query(table, filters, limit)
+        return self._fetch(client, config, query)
+
+    def load_range(
+        self,
+        config: dict,
+        column: str,
+        low: Any,
+        high: Any,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> pl.DataFrame:
+        """
+        Load the rows whose column lies between low and high.
+
+        The range is added to the WHERE clause, ANDed with any pushed-down
+        filters, so the row limit applies within the range.
+
+        Raises:
+            ConfigError: If required config is missing.
+            ConnectionError: If connection or query fails.
+        """
+        self.validate_config(config)
+
+        client = self._get_client(config)
+        query = self._build_query(
+            config["table"],
+            filters,
+            config.get("limit", 10000),
+            x_range=(column, low, high),
+        )
+        return self._fetch(client, config, query)
+
+    def load_increment(
+        self,
+        config: dict,
+        cursor: Any = None,
+        column: Optional[str] = None,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> Increment:
+        """
+        Load the rows whose column is past the largest value fetched so far.
+
+        The first fetch takes the newest `limit` rows by the column; later
+        fetches add `WHERE column > <last value>`, so only new rows cross
+        the network. The cursor is the largest value of the column seen.
+        Rows inserted later with a value no larger than it are not picked
+        up. Without a column, the table is fetched in full every time.
+
+        Raises:
+            ConfigError: If required config is missing.
+            ConnectionError: If connection or query fails.
+        """
+        if column is None:
+            return super().load_increment(config, cursor, column, filters)
+        self.validate_config(config)
+
+        client = self._get_client(config)
+        limit = config.get("limit", 10000)
+        if cursor is None:
+            query = self._build_query(
+                config["table"], filters, limit, order_by=f"{column} DESC"
+            )
+            rows = self._fetch(client, config, query).reverse()
+        else:
+            query = self._build_query(
+                config["table"], filters, limit, after=(column, cursor), order_by=column
+            )
+            rows = self._fetch(client, config, query)
+            if len(rows):
+                # The literal may have lost precision (see _sql_literal)
+                rows = rows.filter(pl.col(column) > cursor)
+
+        if len(rows):
+            cursor = rows[column].max()
+        return Increment(rows=rows, cursor=cursor, max_rows=limit)
+
+    def schema(self, config: dict) -> pl.Schema:
+        """
+        Get the table's columns from DESCRIBE TABLE, without reading rows.
+
+        Args:
+            config: Connection config and table, as for load().
+
+        Returns:
+            The table's schema, with types as load() returns them.
+
+        Raises:
+            ConfigError: If required config is missing.
+            ConnectionError: If connection or query fails.
+        """
+        self.validate_config(config)
+        client = self._get_client(config)
+
+        try:
+            result = client.query(f"DESCRIBE TABLE {config['table']}")
+        except Exception as e:
+            raise ConnectionError(f"ClickHouse query failed: {e}")
+
+        # Rows are (name, type, default_type, default_expression, ...)
+        return pl.Schema(
+            [(row[0], clickhouse_dtype(row[1])) for row in result.result_set]
+        )
+
+    def column_stats(self, config: dict, column: str, k: int = 10) -> Optional[ColumnStats]:
+        """
+        Summarize a column with an approximate query run by the server.
+
+        topK and min/max are computed in ClickHouse over at most
+        STATS_SAMPLE_ROWS rows, so only the summary crosses the network
+        and large tables are never scanned in full.
+
+        Raises:
+            ConfigError: If required config is missing.
+            ConnectionError: If connection or query fails.
+        """
+        self.validate_config(config)
+        client = self._get_client(config)
+
+        try:
+            result = client.query(
+                f"SELECT topK({int(k)})({column}), min({column}), max({column}) "
+                f"FROM {config['table']}",
+                settings={
+                    "max_rows_to_read": STATS_SAMPLE_ROWS,
+                    "read_overflow_mode": "break",
+                },
+            )
+        except Exception as e:
+            raise ConnectionError(f"ClickHouse query failed: {e}")
+
+        values, low, high = result.result_set[0]
+        stats = ColumnStats(values=list(values))
+        # min/max of strings are alphabetical, not a useful range
+        if isinstance(low, (int, float)) and not isinstance(low, bool):
+            stats.min, stats.max = low, high
+        return stats
+
+    def cancel(self) -> None:
+        """
+        Kill the query currently running in load(), if any.
+
+        Uses a separate connection, since the loading client is blocked
+        waiting on the query.
+        """
+        with self._lock:
+            running = self._running
+        if running is None:
+            return
+        config, query_id = running
+
+        try:
+            client = self._get_client(config)
+            client.command(f"KILL QUERY WHERE query_id = '{query_id}' ASYNC")
+        except Exception:
+            pass  # Best effort - the result is discarded either way
+
+    def _get_client(self, config: dict):
+        """
+        Open a client for the configured server.
+
+        Raises:
+            ConfigError: If clickhouse-connect isn't installed.
+            ConnectionError: If the server can't be reached.
+        """
         try:
             import clickhouse_connect
         except ImportError:
@@ -90,27 +321,34 @@ class ClickHouseConnector(Connector):
                 "or: pip install clickhouse-connect"
             )
 
-        host = config["host"]
-        port = config.get("port", 8123)
-        username = config.get("username")
-        password = config.get("password")
-        database = config.get("database")
-        table = config["table"]
-        limit = config.get("limit", 10000)
-
-        # Build the query
-        query = self._build_query(table, filters, limit)
-
         try:
-            client = clickhouse_connect.get_client(
-                host=host,
-                port=port,
-                username=username,
-                password=password,
-                database=database,
+            return clickhouse_connect.get_client(
+                host=config["host"],
+                port=config.get("port", 8123),
+                username=config.get("username"),
+                password=config.get("password"),
+                database=config.get("database"),
             )
+        except Exception as e:
+            raise ConnectionError(f"ClickHouse connection failed: {e}")
 
-            result = client.query(query)
+    def _fetch(self, client, config: dict, query: str) -> pl.DataFrame:
+        """
+        Run a query, tracking it so cancel() can kill it.
+
+        Raises:
+            ConnectionError: If the query fails.
+        """
+        query_id = uuid.uuid4().hex
+
+        try:
+            with self._lock:
+                self._running = (config, query_id)
+            try:
+                result = client.query(query, settings={"query_id": query_id})
+            finally:
+                with self._lock:
+                    self._running = None
 
             # Convert to Polars DataFrame
             # clickhouse-connect returns column_names and result_set
@@ -129,18 +367,38 @@ class ClickHouseConnector(Connector):
         table: str,
         filters: Optional[List["WhereClause"]],
         limit: int,
+        x_range: Optional[Tuple[str, Any, Any]] = None,
+        after: Optional[Tuple[str, Any]] = None,
+        order_by: Optional[str] = None,
     ) -> str:
         """
-        Build SQL query from table name, filters, and limit.
+        Build SQL query from table name, filters, range, and limit.
+
+        Generates: SELECT * FROM {table} [WHERE ...] [ORDER BY ...] LIMIT {limit}
 
-        Generates: SELECT * FROM {table} [WHERE ...] LIMIT {limit}
+        x_range is a (column, low, high) restriction and after a
+        (column, value) lower bound (exclusive), both ANDed with the filters.
         """
         query = f"SELECT * FROM {table}"
 
+        conditions = []
         if filters:
-            where_clause = self._build_where_clause(filters)
-            query += f" WHERE {where_clause}"
-
+            conditions.append(self._build_where_clause(filters))
+        if x_range is not None:
+            column, low, high = x_range
+            conditions.append(
+                f"{column} >= {_sql_literal(low)} AND {column} <= {_sql_literal(high)}"
+            )
+        if after is not None:
+            column, value = after
+            conditions.append(f"{column} > {_sql_literal(value)}")
+        if len(conditions) == 1:
+            query += f" WHERE {conditions[0]}"
+        elif conditions:
+            query += " WHERE " + " AND ".join(f"({sql})" for sql in conditions)
+
+        if order_by is not None:
+            query += f" ORDER BY {order_by}"
         query += f" LIMIT {limit}"
         return query
 
@@ -165,11 +423,7 @@ class ClickHouseConnector(Connector):
 
         conditions = []
         for i, cond in enumerate(where.conditions):
-            # Format value for SQL
-            if isinstance(cond.value, str):
-                sql_value = f"'{cond.value}'"
-            else:
-                sql_value = str(cond.value)
+            sql_value = _sql_literal(cond.value)
 
             # Map comparison operator
             op_map = {
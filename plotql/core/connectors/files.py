@@ -0,0 +1,319 @@
+"""
+Data file IO shared by the file, folder and literal connectors.
+
+Reads CSV, NDJSON, JSON and Parquet files: schemas without loading rows,
+lazy scans with pushed-down filters, sampled column statistics, and the
+rows appended to a file since it was last read.
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional
+
+import polars as pl
+
+from plotql.core.connectors.base import (
+    STATS_SAMPLE_ROWS,
+    ColumnStats,
+    ConnectorError,
+    Increment,
+)
+
+
+# Bytes read from the start of a JSON file to infer its schema
+JSON_SCHEMA_PREFIX = 64 * 1024
+
+# Records sampled from that prefix
+JSON_SCHEMA_RECORDS = 100
+
+# Bytes at the start of a followed file compared to tell an append from a rewrite
+TAIL_HEAD_BYTES = 4096
+
+
+def column_stats(values: pl.Series, k: int, sampled: bool = True) -> ColumnStats:
+    """
+    Summarize a column: its k most frequent values and its range.
+
+    Float columns get no frequent values, since their values rarely repeat.
+    Only numeric columns get a range: FILTER can't compare a temporal
+    column with a literal, so a date range couldn't be suggested.
+    """
+    values = values.drop_nulls()
+    stats = ColumnStats(sampled=sampled)
+    if not values.dtype.is_float():
+        counts = values.value_counts(sort=True).head(k)
+        stats.values = counts[values.name].to_list()
+    if values.dtype.is_numeric():
+        stats.min = values.min()
+        stats.max = values.max()
+    return stats
+
+
+@dataclass
+class FileCursor:
+    """Position reached in a followed file (see file_load_increment)."""
+    fingerprint: Optional[str]  # File fingerprint when it was read
+    offset: int  # Bytes read up to the end of the last complete line
+    head: bytes  # First bytes of the file, to detect rewrites
+    schema: pl.Schema  # Schema of the rows read so far
+    pending: int = 0  # Rows read from an unterminated last line
+
+
+def file_fingerprint(path: Path) -> Optional[str]:
+    """
+    Fingerprint a file by its resolved path, size, and modification time.
+
+    Returns None if the file cannot be stat'ed.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def file_schema(path: Path) -> pl.Schema:
+    """
+    Read the column names and types of a data file without loading it.
+
+    Parquet schemas come from the file footer. CSV and NDJSON types are
+    inferred from the first rows, and JSON arrays from the records in the
+    first JSON_SCHEMA_PREFIX bytes.
+
+    Raises:
+        ConnectorError: If the file can't be read.
+    """
+    suffix = path.suffix.lower()
+    try:
+        if suffix == ".parquet":
+            return pl.read_parquet_schema(path)
+        elif suffix == ".json":
+            return _json_schema(path)
+        elif suffix == ".ndjson":
+            return pl.scan_ndjson(path).collect_schema()
+        else:
+            # CSV, and the default for unknown extensions
+            return pl.scan_csv(path).collect_schema()
+    except Exception as e:
+        raise ConnectorError(f"Failed to read schema of {path}: {e}")
+
+
+def file_scan(path: Path) -> pl.LazyFrame:
+    """
+    Open a data file for a lazy query.
+
+    Predicates and projections on the result are pushed into the reader,
+    so Parquet row groups whose statistics rule them out are skipped and
+    CSV/NDJSON rows are filtered as they stream in. JSON arrays can't be
+    scanned and are read in full.
+    """
+    suffix = path.suffix.lower()
+    if suffix == ".parquet":
+        return pl.scan_parquet(path)
+    elif suffix == ".json":
+        return pl.read_json(path).lazy()
+    elif suffix == ".ndjson":
+        return pl.scan_ndjson(path)
+    else:
+        # CSV, and the default for unknown extensions
+        return pl.scan_csv(path)
+
+
+def file_load_range(path: Path, column: str, low: Any, high: Any) -> pl.DataFrame:
+    """
+    Load the rows of a data file whose column lies between low and high.
+
+    Raises:
+        ConnectorError: If the file or column can't be read.
+    """
+    try:
+        # Literals, since Polars reads bare strings as column names
+        return file_scan(path).filter(
+            pl.col(column).is_between(pl.lit(low), pl.lit(high))
+        ).collect()
+    except Exception as e:
+        raise ConnectorError(f"Failed to load {path}: {e}")
+
+
+def file_load_increment(path: Path, cursor: Optional[FileCursor]) -> Increment:
+    """
+    Load the rows added to a data file since the cursor.
+
+    CSV and NDJSON files are followed by byte offset: when the file has
+    only grown, just the bytes after the last complete line read are
+    parsed. A line still being written is included but read again next
+    time, in case it was cut short. A file that shrank, was rewritten or
+    no longer parses with the same schema is read in full, as are Parquet
+    and JSON files whenever they change.
+
+    Args:
+        path: File to read
+        cursor: Cursor of the previous increment, or None to read it all
+
+    Returns:
+        The new rows and the cursor to continue from.
+
+    Raises:
+        ConnectorError: If the file can't be read.
+    """
+    fingerprint = file_fingerprint(path)
+    if cursor is not None and fingerprint is not None and cursor.fingerprint == fingerprint:
+        return Increment(rows=cursor.schema.to_frame(), cursor=cursor)
+
+    suffix = path.suffix.lower()
+    try:
+        if suffix in (".parquet", ".json"):
+            rows = file_scan(path).collect()
+            return Increment(
+                rows=rows,
+                cursor=FileCursor(fingerprint, 0, b"", rows.schema),
+                replace=True,
+            )
+
+        with open(path, "rb") as f:
+            head = f.read(TAIL_HEAD_BYTES)
+            size = os.fstat(f.fileno()).st_size
+            appended = (
+                cursor is not None
+                and 0 < cursor.offset <= size
+                and head.startswith(cursor.head)
+            )
+            offset = cursor.offset if appended else 0
+            f.seek(offset)
+            data = f.read()
+        complete = data.rfind(b"\n") + 1
+        ndjson = suffix == ".ndjson"
+
+        if appended:
+            try:
+                rows = _parse_lines(data[:complete], ndjson, cursor.schema)
+            except Exception:
+                # Appended rows don't fit the schema read before
+                return file_load_increment(path, None)
+            schema = cursor.schema
+        else:
+            rows = _parse_lines(data[:complete], ndjson) if complete else None
+            if rows is None or not len(rows):
+                # Not one complete row yet, so no types to parse appended
+                # rows with (a header alone reads as all strings): read
+                # what's there, and all of it again next time
+                rows = _parse_lines(data, ndjson)
+                return Increment(
+                    rows=rows,
+                    cursor=FileCursor(fingerprint, 0, b"", rows.schema),
+                    replace=True,
+                )
+            schema = rows.schema
+        partial = _parse_partial_line(data[complete:], ndjson, schema)
+        if len(partial):
+            rows = pl.concat([rows, partial], how="vertical_relaxed")
+
+        end = offset + complete
+        return Increment(
+            rows=rows,
+            cursor=FileCursor(
+                fingerprint=fingerprint,
+                offset=end,
+                head=head[:end],
+                schema=schema,
+                pending=len(partial),
+            ),
+            replace=not appended,
+            retract=cursor.pending if appended else 0,
+        )
+    except ConnectorError:
+        raise
+    except Exception as e:
+        raise ConnectorError(f"Failed to load {path}: {e}")
+
+
+def _parse_lines(data: bytes, ndjson: bool, schema: Optional[pl.Schema] = None) -> pl.DataFrame:
+    """Parse complete CSV or NDJSON lines; CSV lines have a header unless a schema is given."""
+    if ndjson:
+        if not data.strip():
+            return (schema or pl.Schema()).to_frame()
+        return pl.read_ndjson(io.BytesIO(data), schema=schema)
+    if schema is None:
+        return pl.read_csv(io.BytesIO(data))
+    if not data.strip():
+        return schema.to_frame()
+    return pl.read_csv(io.BytesIO(data), has_header=False, schema=schema)
+
+
+def _parse_partial_line(data: bytes, ndjson: bool, schema: pl.Schema) -> pl.DataFrame:
+    """Parse an unterminated last line, or return no rows if it's incomplete."""
+    if not data.strip():
+        return schema.to_frame()
+    try:
+        return _parse_lines(data + b"\n", ndjson, schema)
+    except Exception:
+        return schema.to_frame()  # Cut off mid-value; read again once finished
+
+
+def file_column_stats(path: Path, column: str, k: int) -> ColumnStats:
+    """
+    Summarize a column of a data file from its first STATS_SAMPLE_ROWS rows.
+
+    Only the one column is read, and only up to the sample size, so large
+    files are never scanned in full. JSON arrays are sampled from the
+    records in the first JSON_SCHEMA_PREFIX bytes.
+
+    Raises:
+        ConnectorError: If the file or column can't be read.
+    """
+    suffix = path.suffix.lower()
+    try:
+        if suffix == ".json":
+            records = _json_records(path, STATS_SAMPLE_ROWS)
+            if not records:
+                raise ConnectorError("not an array of records")
+            sample = pl.DataFrame(records).select(column)
+        else:
+            sample = file_scan(path).select(column).head(STATS_SAMPLE_ROWS).collect()
+        return column_stats(
+            sample.to_series(), k, sampled=len(sample) >= STATS_SAMPLE_ROWS
+        )
+    except Exception as e:
+        raise ConnectorError(f"Failed to read {column} from {path}: {e}")
+
+
+def _json_records(path: Path, max_records: int) -> List[dict]:
+    """
+    Parse the records at the start of a JSON array file.
+
+    Returns:
+        The complete records within the first JSON_SCHEMA_PREFIX bytes,
+        or an empty list if the file isn't an array of records.
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(JSON_SCHEMA_PREFIX).decode("utf-8", errors="ignore")
+
+    records: List[dict] = []
+    decoder = json.JSONDecoder()
+    pos = len(prefix) - len(prefix.lstrip())
+    if prefix[pos:pos + 1] == "[":
+        pos += 1
+        while len(records) < max_records:
+            while pos < len(prefix) and prefix[pos] in " \t\r\n,":
+                pos += 1
+            try:
+                record, pos = decoder.raw_decode(prefix, pos)
+            except json.JSONDecodeError:
+                break  # End of the array, or a record cut off by the prefix
+            if not isinstance(record, dict):
+                break
+            records.append(record)
+    return records
+
+
+def _json_schema(path: Path) -> pl.Schema:
+    """Infer a JSON file's schema from the records at its start."""
+    records = _json_records(path, JSON_SCHEMA_RECORDS)
+    if not records:
+        # Not an array of records: let Polars read the whole document
+        return pl.read_json(path).schema
+    return pl.DataFrame(records).schema
@@ -7,11 +7,24 @@ Config defines root directory, query args define path segments.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import polars as pl
 
-from plotql.core.connectors.base import Connector, ConfigError, ConnectorError
+from plotql.core.connectors.base import (
+    ColumnStats,
+    Connector,
+    ConfigError,
+    ConnectorError,
+    Increment,
+)
+from plotql.core.connectors.files import (
+    file_column_stats,
+    file_fingerprint,
+    file_load_increment,
+    file_load_range,
+    file_schema,
+)
 
 if TYPE_CHECKING:
     from plotql.core.ast import WhereClause
@@ -68,6 +81,94 @@ class FolderConnector(Connector):
             ConfigError: If path or segments are missing.
             ConnectorError: If file doesn't exist or can't be loaded.
         """
+        full_path = self._resolve_path(config)
+
+        suffix = full_path.suffix.lower()
+
+        try:
+            if suffix == ".csv":
+                return pl.read_csv(full_path)
+            elif suffix == ".parquet":
+                return pl.read_parquet(full_path)
+            elif suffix == ".json":
+                return pl.read_json(full_path)
+            elif suffix == ".ndjson":
+                return pl.read_ndjson(full_path)
+            else:
+                # Try CSV as default
+                return pl.read_csv(full_path)
+        except Exception as e:
+            raise ConnectorError(f"Failed to load {full_path}: {e}")
+
+    def schema(self, config: dict) -> pl.Schema:
+        """
+        Read the schema of a file within the directory without loading its rows.
+
+        Raises:
+            ConfigError: If path or segments are missing.
+            ConnectorError: If file doesn't exist or can't be read.
+        """
+        return file_schema(self._resolve_path(config))
+
+    def load_range(
+        self,
+        config: dict,
+        column: str,
+        low: Any,
+        high: Any,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> pl.DataFrame:
+        """
+        Load the rows of a file within the directory whose column lies
+        between low and high.
+
+        Raises:
+            ConfigError: If path or segments are missing.
+            ConnectorError: If file doesn't exist or can't be loaded.
+        """
+        return file_load_range(self._resolve_path(config), column, low, high)
+
+    def load_increment(
+        self,
+        config: dict,
+        cursor: Any = None,
+        column: Optional[str] = None,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> Increment:
+        """
+        Load the rows appended to a file within the directory since the cursor.
+
+        See file_load_increment.
+
+        Raises:
+            ConfigError: If path or segments are missing.
+            ConnectorError: If file doesn't exist or can't be loaded.
+        """
+        return file_load_increment(self._resolve_path(config), cursor)
+
+    def column_stats(self, config: dict, column: str, k: int = 10) -> Optional[ColumnStats]:
+        """
+        Summarize a column from a sample at the start of a file within the directory.
+
+        Raises:
+            ConfigError: If path or segments are missing.
+            ConnectorError: If file doesn't exist or can't be read.
+        """
+        return file_column_stats(self._resolve_path(config), column, k)
+
+    def fingerprint(self, config: dict) -> Optional[str]:
+        """Fingerprint the resolved file by path, size, and modification time."""
+        self.validate_config(config)
+        return file_fingerprint(Path(config["path"]).joinpath(*config["segments"]))
+
+    def _resolve_path(self, config: dict) -> Path:
+        """
+        Join the root directory and path segments into the file's path.
+
+        Raises:
+            ConfigError: If path or segments are missing.
+            ConnectorError: If the file doesn't exist or escapes the root.
+        """
         self.validate_config(config)
 
         root = Path(config["path"])
@@ -88,19 +189,4 @@ class FolderConnector(Connector):
                 f"escapes root directory {root}"
             )
 
-        suffix = full_path.suffix.lower()
-
-        try:
-            if suffix == ".csv":
-                return pl.read_csv(full_path)
-            elif suffix == ".parquet":
-                return pl.read_parquet(full_path)
-            elif suffix == ".json":
-                return pl.read_json(full_path)
-            elif suffix == ".ndjson":
-                return pl.read_ndjson(full_path)
-            else:
-                # Try CSV as default
-                return pl.read_csv(full_path)
-        except Exception as e:
-            raise ConnectorError(f"Failed to load {full_path}: {e}")
+        return full_path
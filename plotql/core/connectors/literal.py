@@ -6,11 +6,24 @@ Handles raw file paths (the default case): WITH 'path/to/file.csv'
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import polars as pl
 
-from plotql.core.connectors.base import Connector, ConfigError, ConnectorError
+from plotql.core.connectors.base import (
+    ColumnStats,
+    Connector,
+    ConfigError,
+    ConnectorError,
+    Increment,
+)
+from plotql.core.connectors.files import (
+    file_column_stats,
+    file_fingerprint,
+    file_load_increment,
+    file_load_range,
+    file_schema,
+)
 
 if TYPE_CHECKING:
     from plotql.core.ast import WhereClause
@@ -71,3 +84,86 @@ class LiteralConnector(Connector):
                 return pl.read_csv(path)
         except Exception as e:
             raise ConnectorError(f"Failed to load {path}: {e}")
+
+    def schema(self, config: dict) -> pl.Schema:
+        """
+        Read the file's schema without loading its rows.
+
+        Raises:
+            ConfigError: If path is missing from config.
+            ConnectorError: If file doesn't exist or can't be read.
+        """
+        self.validate_config(config)
+
+        path = Path(config["path"])
+        if not path.exists():
+            raise ConnectorError(f"File not found: {path}")
+        return file_schema(path)
+
+    def load_range(
+        self,
+        config: dict,
+        column: str,
+        low: Any,
+        high: Any,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> pl.DataFrame:
+        """
+        Load the rows of the file whose column lies between low and high.
+
+        The range is pushed into a lazy scan, so Parquet row groups outside
+        it are skipped.
+
+        Raises:
+            ConfigError: If path is missing from config.
+            ConnectorError: If file doesn't exist or can't be loaded.
+        """
+        self.validate_config(config)
+
+        path = Path(config["path"])
+        if not path.exists():
+            raise ConnectorError(f"File not found: {path}")
+        return file_load_range(path, column, low, high)
+
+    def load_increment(
+        self,
+        config: dict,
+        cursor: Any = None,
+        column: Optional[str] = None,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> Increment:
+        """
+        Load the rows appended to the file since the cursor.
+
+        See file_load_increment.
+
+        Raises:
+            ConfigError: If path is missing from config.
+            ConnectorError: If file doesn't exist or can't be loaded.
+        """
+        self.validate_config(config)
+
+        path = Path(config["path"])
+        if not path.exists():
+            raise ConnectorError(f"File not found: {path}")
+        return file_load_increment(path, cursor)
+
+    def column_stats(self, config: dict, column: str, k: int = 10) -> Optional[ColumnStats]:
+        """
+        Summarize a column from a sample at the start of the file.
+
+        Raises:
+            ConfigError: If path is missing from config.
+            ConnectorError: If file doesn't exist or can't be read.
+        """
+        self.validate_config(config)
+
+        path = Path(config["path"])
+        if not path.exists():
+            raise ConnectorError(f"File not found: {path}")
+        return file_column_stats(path, column, k)
+
+    def fingerprint(self, config: dict) -> Optional[str]:
+        """Fingerprint the file by path, size, and modification time."""
+        self.validate_config(config)
+        return file_fingerprint(Path(config["path"]))
@@ -11,47 +11,135 @@ Usage:
     result = engine.render(plot_data, width, height)
     result.save("output.png")
 
-To use a different engine:
+Engines are registered by name. To use a different engine:
     from plotql.core.engines import set_engine
-    from plotql.core.engines.matplotlib import MatplotlibEngine
 
-    set_engine(MatplotlibEngine())
+    set_engine("raster")           # By name
+    set_engine(MatplotlibEngine())  # Or as an instance
+
+The default engine can also be chosen with `plotql --engine NAME` or a
+top-level `engine = "NAME"` entry in the sources config file.
 """
 from __future__ import annotations
 
-from typing import Optional
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from plotql.core.engines.base import Engine
-from plotql.core.engines.matplotlib import MatplotlibEngine
 
-__all__ = ["Engine", "MatplotlibEngine", "get_engine", "set_engine"]
+if TYPE_CHECKING:
+    from plotql.core.engines.matplotlib import MatplotlibEngine
+    from plotql.core.engines.raster import RasterEngine
+
+__all__ = [
+    "Engine",
+    "MatplotlibEngine",
+    "RasterEngine",
+    "DEFAULT_ENGINE",
+    "available_engines",
+    "create_engine",
+    "get_engine",
+    "register_engine",
+    "set_engine",
+]
+
+# Engine used when none is configured
+DEFAULT_ENGINE = "matplotlib"
+
+# Engine factories by name. Built-ins are "module:Class" paths, imported
+# only when the engine is created.
+_engines: Dict[str, Union[str, Callable[[], Engine]]] = {
+    "matplotlib": "plotql.core.engines.matplotlib:MatplotlibEngine",
+    "raster": "plotql.core.engines.raster:RasterEngine",
+}
 
 _default_engine: Optional[Engine] = None
 
 
+def __getattr__(name: str) -> Any:
+    """Import the built-in engine classes on first access."""
+    if name == "MatplotlibEngine":
+        from plotql.core.engines.matplotlib import MatplotlibEngine
+        return MatplotlibEngine
+    if name == "RasterEngine":
+        from plotql.core.engines.raster import RasterEngine
+        return RasterEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def register_engine(name: str, factory: Callable[[], Engine]) -> None:
+    """
+    Register an engine so it can be selected by name.
+
+    Args:
+        name: Engine name (case-insensitive), e.g. for `plotql --engine`
+        factory: Callable returning a new engine, typically the class
+    """
+    _engines[name.lower()] = factory
+
+
+def available_engines() -> List[str]:
+    """Names of all registered engines."""
+    return sorted(_engines)
+
+
+def create_engine(name: str) -> Engine:
+    """
+    Create a new instance of a registered engine.
+
+    Raises:
+        ValueError: If no engine is registered under the name.
+    """
+    factory = _engines.get(name.lower())
+    if factory is None:
+        raise ValueError(
+            f"Unknown engine '{name}'. Available: {', '.join(available_engines())}"
+        )
+    if isinstance(factory, str):
+        module_name, class_name = factory.split(":")
+        factory = getattr(importlib.import_module(module_name), class_name)
+    return factory()
+
+
 def get_engine() -> Engine:
     """
     Get the default rendering engine.
 
-    Returns a cached singleton instance of the default engine
-    (MatplotlibEngine unless changed via set_engine).
+    Returns a cached singleton instance of the default engine: the one set
+    via set_engine, else the engine named in the config file, else
+    DEFAULT_ENGINE.
     """
     global _default_engine
     if _default_engine is None:
-        _default_engine = MatplotlibEngine()
+        from plotql.core.config import ConfigError, get_engine_name
+
+        try:
+            name = get_engine_name() or DEFAULT_ENGINE
+        except ConfigError:
+            # An unreadable config is reported when sources are loaded
+            name = DEFAULT_ENGINE
+        _default_engine = create_engine(name)
     return _default_engine
 
 
-def set_engine(engine: Engine) -> None:
+def set_engine(engine: Union[Engine, str]) -> None:
     """
     Set the default rendering engine.
 
     Use this to swap to a different rendering backend:
 
-        from plotql.engines import set_engine
-        from my_engines import PlotlyEngine
+        from plotql.core.engines import set_engine
 
+        set_engine("raster")
         set_engine(PlotlyEngine())
+
+    Args:
+        engine: An engine instance, or the name of a registered engine
+
+    Raises:
+        ValueError: If the name isn't a registered engine.
     """
     global _default_engine
+    if isinstance(engine, str):
+        engine = create_engine(engine)
     _default_engine = engine
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional
 
 if TYPE_CHECKING:
     from plotql.core.executor import PlotData
@@ -102,6 +102,35 @@ class Engine(ABC):
         """
         pass
 
+    def render_view(
+        self,
+        data: "PlotData",
+        width: int,
+        height: int,
+        view: Hashable = "default",
+    ) -> "PlotResult":
+        """
+        Render for a long-lived view, such as a TUI panel.
+
+        Engines may keep state per view (e.g. a styled figure) so repeated
+        renders of the same view are cheaper. The default simply calls
+        render(). Callers should close() the result as usual.
+
+        Args:
+            data: The plot data from query execution
+            width: Width in pixels
+            height: Height in pixels
+            view: Identifies the view across calls
+
+        Returns:
+            PlotResult wrapper providing multiple output formats
+        """
+        return self.render(data, width, height)
+
+    def close_view(self, view: Hashable = "default") -> None:
+        """Release any state kept for a view by render_view()."""
+        pass
+
     def render_to_bytes(
         self,
         data: "PlotData",
@@ -112,7 +141,8 @@ class Engine(ABC):
         """
         Convenience method: Render PlotData directly to PNG bytes.
 
-        This is a shorthand for render().to_bytes().
+        This is a shorthand for render().to_bytes(), closing the result
+        afterwards so no figure outlives the call.
 
         Args:
             data: The plot data from query execution
@@ -123,5 +153,5 @@ class Engine(ABC):
         Returns:
             PNG image as bytes
         """
-        result = self.render(data, int(width * scale), int(height * scale))
-        return result.to_bytes()
+        with self.render(data, int(width * scale), int(height * scale)) as result:
+            return result.to_bytes()
@@ -6,21 +6,38 @@ in the terminal via textual-image or saved to files.
 """
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Union
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
 import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend - must be before pyplot import
+matplotlib.use('Agg')  # Non-interactive backend, should anything import pyplot
 # Disable antialiasing for crisp pixel-perfect rendering
 matplotlib.rcParams['lines.antialiased'] = False
 matplotlib.rcParams['patch.antialiased'] = False
 matplotlib.rcParams['text.antialiased'] = True  # Keep text antialiased for readability
-import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+from matplotlib.artist import setp  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.cm import ScalarMappable  # noqa: E402
+from matplotlib.colors import Normalize  # noqa: E402
 from matplotlib.figure import Figure  # noqa: E402
+from matplotlib.ticker import MaxNLocator  # noqa: E402
 
 from plotql.core.ast import PlotType  # noqa: E402
 from plotql.core.executor import PlotData  # noqa: E402
 from plotql.core.engines.base import Engine, format_datetime_tick  # noqa: E402
 from plotql.core.result import PlotResult  # noqa: E402
+from plotql.core.utils import (  # noqa: E402
+    ENGINE_COLORS,
+    LINE_DECIMATE_FACTOR,
+    bin_points,
+    decimate_line,
+    gradient_rgb,
+    histogram_bins,
+    palette_color,
+    to_datetime_array,
+    to_numeric_array,
+)
 from plotql.themes import THEME  # noqa: E402
 
 # Configure fonts from theme
@@ -30,27 +47,66 @@ matplotlib.rcParams['font.monospace'] = THEME.font_stack
 # Type alias for render input - single PlotData or list of PlotData
 PlotDataInput = Union[PlotData, List[PlotData]]
 
+# Font sizes for terminal rendering
+TITLE_SIZE = 12
+LABEL_SIZE = 10
+TICK_SIZE = 8
+
+# Scatter series with more points than this are drawn as an aggregate raster
+RASTER_THRESHOLD = 100_000
+
+# Path settings applied while this engine draws a figure: long paths are drawn
+# in chunks so they can't overflow Agg's cell buffer, and vertices that don't
+# move the line by a noticeable fraction of a pixel are dropped. Both are read
+# at draw time, so they're scoped to each draw rather than set globally.
+DRAW_RC = {
+    'agg.path.chunksize': 10000,
+    'path.simplify': True,
+    'path.simplify_threshold': 1 / 9,
+}
+
+@dataclass
+class _SeriesArtists:
+    """Artists drawn for one series, kept for in-place updates."""
+    artist: Any  # PathCollection, AxesImage, Line2D or BarContainer
+    mappable: Any = None  # ScalarMappable behind a colorbar, if any
+    raster: bool = False  # Scatter drawn as an aggregate image
+
+
+@dataclass
+class _FigureView:
+    """A styled figure retained between renders of the same view."""
+    figure: Figure
+    ax: Any
+    series: List[_SeriesArtists]
+    size: Tuple[int, int]
+    layout: Tuple = ()
+
 
 class MatplotlibEngine(Engine):
     """Matplotlib-based rendering engine with theme support."""
 
     # Colors derived from centralized theme
-    _COLORS: Dict[str, str] = {
-        "background": THEME.background,
-        "paper": THEME.background,
-        "text": THEME.text,
-        "grid": THEME.grid,
-        "axes": THEME.axes,
-        # Chart colors for programmatic access
-        "primary": THEME.chart_colors["primary"],
-        "secondary": THEME.chart_colors["secondary"],
-        "tertiary": THEME.chart_colors["tertiary"],
-        "quaternary": THEME.chart_colors["quaternary"],
-        "accent": THEME.chart_colors["accent"],
-    }
-
-    # Map user color names to theme palette
-    _COLOR_MAP: Dict[str, str] = THEME.color_map
+    _COLORS: Dict[str, str] = ENGINE_COLORS
+
+    def __init__(self, raster_threshold: Optional[int] = RASTER_THRESHOLD) -> None:
+        """
+        Args:
+            raster_threshold: Scatter series with more points than this are
+                binned into a pixel grid and drawn as one image, so render
+                cost scales with pixels rather than points. None always
+                draws individual markers.
+        """
+        self.raster_threshold = raster_threshold
+        # Figures retained between render_view() calls, by view
+        self._views: Dict[Hashable, _FigureView] = {}
+
+    def __getstate__(self) -> dict:
+        # Retained figures stay with this process (e.g. when the engine is
+        # sent to batch render workers)
+        state = self.__dict__.copy()
+        state["_views"] = {}
+        return state
 
     @property
     def COLORS(self) -> Dict[str, str]:
@@ -59,9 +115,7 @@ class MatplotlibEngine(Engine):
 
     def get_color(self, color_name: Optional[str]) -> str:
         """Convert a color name to our theme palette color."""
-        if not color_name:
-            return self._COLORS["primary"]
-        return self._COLOR_MAP.get(color_name.lower(), self._COLORS["primary"])
+        return palette_color(color_name)
 
     def _create_figure(
         self,
@@ -82,22 +136,38 @@ class MatplotlibEngine(Engine):
         """
         # Normalize to list
         data_list: List[PlotData] = data if isinstance(data, list) else [data]
+        return self._build_view(data_list, width, height).figure
 
-        # Use first series for chart-level settings (title, labels)
-        first_data = data_list[0]
+    def _chart_labels(self, first_data: PlotData) -> Tuple[str, str, str]:
+        """Title and axis labels, taken from the first series."""
         first_series = first_data.series
         fmt = first_series.format
-
-        # Labels - use first series
         x_label = str(first_series.x_column)
         y_label = str(first_series.y_column)
         title = fmt.title or f"{y_label} vs {x_label}"
         xlabel = fmt.xlabel or x_label
         ylabel = fmt.ylabel or y_label
+        return title, xlabel, ylabel
 
-        # Default color for first series
+    def _default_marker_color(self, first_data: PlotData) -> str:
+        """Marker color for series without their own, from the first series."""
+        fmt = first_data.series.format
         line_color = self.get_color(fmt.line_color)
-        marker_color = self.get_color(fmt.marker_color) if fmt.marker_color else line_color
+        return self.get_color(fmt.marker_color) if fmt.marker_color else line_color
+
+    def _build_view(
+        self,
+        data_list: List[PlotData],
+        width: int,
+        height: int,
+    ) -> _FigureView:
+        """Create and style a figure, keeping its artists for later updates."""
+        # Use first series for chart-level settings (title, labels)
+        first_data = data_list[0]
+        title, xlabel, ylabel = self._chart_labels(first_data)
+
+        # Default color for first series
+        marker_color = self._default_marker_color(first_data)
 
         # Convert pixels to inches (matplotlib uses inches with DPI)
         # Use 100 DPI for cleaner 1:1 pixel mapping
@@ -105,18 +175,17 @@ class MatplotlibEngine(Engine):
         fig_width = width / dpi
         fig_height = height / dpi
 
-        # Create figure with dark theme
-        fig, ax = plt.subplots(figsize=(fig_width, fig_height), dpi=dpi)
+        # Create figure with dark theme. Built with the object-oriented API
+        # on its own Agg canvas rather than pyplot, so it isn't kept alive by
+        # pyplot's global figure manager and is freed once unreferenced.
+        fig = Figure(figsize=(fig_width, fig_height), dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
 
         # Apply dark theme styling
         fig.patch.set_facecolor(self._COLORS["background"])
         ax.set_facecolor(self._COLORS["background"])
 
-        # Font sizes for terminal rendering
-        TITLE_SIZE = 12
-        LABEL_SIZE = 10
-        TICK_SIZE = 8
-
         # Style axes - thick blocky terminal style
         for spine in ['bottom', 'top', 'left', 'right']:
             ax.spines[spine].set_color(self._COLORS["axes"])
@@ -132,8 +201,10 @@ class MatplotlibEngine(Engine):
         ax.set_axisbelow(True)
 
         # Plot each series (later series render on top via zorder)
-        for idx, plot_data in enumerate(data_list):
+        series_artists = [
             self._plot_series(ax, plot_data, fig, LABEL_SIZE, TICK_SIZE, marker_color, zorder=idx + 1)
+            for idx, plot_data in enumerate(data_list)
+        ]
 
         # Set labels and title
         ax.set_xlabel(xlabel, fontsize=LABEL_SIZE, color=self._COLORS["text"])
@@ -141,7 +212,7 @@ class MatplotlibEngine(Engine):
         ax.set_title(title, fontsize=TITLE_SIZE, color=self._COLORS["text"], pad=10)
 
         # Limit x-axis ticks to max 5 for cleaner look
-        ax.yaxis.set_major_locator(plt.MaxNLocator(nbins=6))
+        ax.yaxis.set_major_locator(MaxNLocator(nbins=6))
 
         # Check if x-axis contains datetime values using x_timestamp info from PlotData
         first_data = data_list[0] if data_list else None
@@ -161,10 +232,10 @@ class MatplotlibEngine(Engine):
             ax.xaxis.set_major_formatter(FuncFormatter(smart_date_formatter))
             ax.xaxis.set_major_locator(mdates.AutoDateLocator(maxticks=5))
         else:
-            ax.xaxis.set_major_locator(plt.MaxNLocator(nbins=5))
+            ax.xaxis.set_major_locator(MaxNLocator(nbins=5))
 
         # Rotate labels for readability
-        plt.setp(ax.get_xticklabels(), rotation=10, ha='right')
+        setp(ax.get_xticklabels(), rotation=10, ha='right')
 
         # Layout with proper margins to prevent overflow
         fig.tight_layout(pad=1.5)
@@ -175,7 +246,23 @@ class MatplotlibEngine(Engine):
         right_margin = 0.85 if has_colorbar else 0.92
         fig.subplots_adjust(left=0.12, right=right_margin, top=0.88, bottom=0.15)
 
-        return fig
+        # Rasters are binned at the axes' final pixel size, known only now
+        rasters = [
+            (artists, plot_data)
+            for artists, plot_data in zip(series_artists, data_list)
+            if artists.raster
+        ]
+        for artists, plot_data in rasters:
+            self._shade_raster(ax, artists.artist, plot_data, marker_color)
+        if rasters:
+            ax.autoscale_view()
+
+        return _FigureView(
+            figure=fig,
+            ax=ax,
+            series=series_artists,
+            size=(width, height),
+        )
 
     def _plot_series(
         self,
@@ -186,55 +273,48 @@ class MatplotlibEngine(Engine):
         tick_size: int,
         default_marker_color: str,
         zorder: int = 1,
-    ) -> None:
+    ) -> _SeriesArtists:
         """Plot a single series on the given axes."""
         series = data.series
         fmt = series.format
-
-        # Convert x values to datetime if x_timestamp info is present
-        x_values = data.x
-        if data.x_timestamp is not None:
-            from datetime import datetime
-            from dateutil import parser as date_parser
-            x_values = [
-                date_parser.parse(str(v)) if not isinstance(v, datetime) else v
-                for v in data.x
-            ]
+        if series.plot_type == PlotType.LINE:
+            x_values, y_values = self._line_values(data, int(fig.bbox.width))
+        else:
+            x_values, y_values = self._axis_values(data)
 
         # Determine colors for this series
         line_color = self.get_color(fmt.line_color)
         marker_color = self.get_color(fmt.marker_color) if fmt.marker_color else default_marker_color
 
         if series.plot_type == PlotType.SCATTER:
-            # Handle per-point colors if available
-            colors: Union[str, List[str]] = marker_color
-            if data.marker_colors:
-                # Check if colors are hex values (continuous) or names (categorical)
-                if data.marker_colors[0].startswith('#'):
-                    # Continuous - use hex values directly
-                    colors = data.marker_colors
-                else:
-                    # Categorical - convert names to hex
-                    colors = [self.get_color(c) for c in data.marker_colors]
-
-            # Handle marker sizes (input is 1-5, map to matplotlib point sizes)
-            # Size 1 -> 20pt, Size 5 -> 100pt - smaller with wider spacing
-            sizes = None
-            if data.marker_sizes:
-                sizes = [20 + (s - 1) * 20 for s in data.marker_sizes]
-
-            scatter = ax.scatter(
-                x_values,
-                data.y,
-                c=colors,
-                s=sizes if sizes else 40,  # Default size=2 (20 + 1*20 = 40)
-                alpha=1.0,
-                edgecolors='none',
-                marker='s',  # Square marker - no antialiasing needed for straight edges
-                linewidths=0,
-                zorder=zorder,
-            )
-            scatter.set_antialiased(False)
+            mappable = None
+            raster = self._use_raster(data)
+
+            if raster:
+                # Placeholder spanning the data; _shade_raster() fills in the
+                # pixels once the figure layout is final
+                x, y, _ = self._raster_points(ax, data)
+                scatter = ax.imshow(
+                    np.zeros((1, 1, 4)),
+                    extent=self._raster_extent(x, y),
+                    origin='lower',
+                    aspect='auto',
+                    interpolation='nearest',
+                    zorder=zorder,
+                )
+            else:
+                scatter = ax.scatter(
+                    x_values,
+                    y_values,
+                    c=self._scatter_colors(data, marker_color),
+                    s=self._scatter_sizes(data),
+                    alpha=1.0,
+                    edgecolors='none',
+                    marker='s',  # Square marker - no antialiasing needed for straight edges
+                    linewidths=0,
+                    zorder=zorder,
+                )
+                scatter.set_antialiased(False)
 
             # Add legend/colorbar if color_info is available
             if data.color_info:
@@ -247,14 +327,15 @@ class MatplotlibEngine(Engine):
                         'plotql_gradient',
                         THEME.gradient
                     )
-                    sm = plt.cm.ScalarMappable(
+                    sm = ScalarMappable(
                         cmap=cmap,
-                        norm=plt.Normalize(
+                        norm=Normalize(
                             vmin=data.color_info.min_value,
                             vmax=data.color_info.max_value
                         )
                     )
                     sm.set_array([])
+                    mappable = sm
                     cbar = fig.colorbar(sm, ax=ax, shrink=0.8, pad=0.02)
                     cbar.set_label(
                         data.color_info.column_name,
@@ -263,8 +344,8 @@ class MatplotlibEngine(Engine):
                     )
                     cbar.ax.yaxis.set_tick_params(color=self._COLORS["text"])
                     cbar.outline.set_edgecolor(self._COLORS["grid"])
-                    plt.setp(
-                        plt.getp(cbar.ax.axes, 'yticklabels'),
+                    setp(
+                        cbar.ax.get_yticklabels(),
                         color=self._COLORS["text"],
                         fontsize=tick_size
                     )
@@ -351,10 +432,12 @@ class MatplotlibEngine(Engine):
                 if data.color_info and not data.color_info.is_continuous:
                     ax.add_artist(size_legend)
 
+            return _SeriesArtists(scatter, mappable, raster)
+
         elif series.plot_type == PlotType.LINE:
-            ax.plot(
+            (line,) = ax.plot(
                 x_values,
-                data.y,
+                y_values,
                 color=line_color,
                 linewidth=2.5,  # Thick retro line for terminal aesthetic
                 alpha=1.0,  # Full opacity for crisp line
@@ -363,26 +446,224 @@ class MatplotlibEngine(Engine):
                 antialiased=False,  # Crisp blocky lines
                 zorder=zorder,
             )
+            return _SeriesArtists(line)
 
         elif series.plot_type == PlotType.BAR:
-            ax.bar(
+            bars = ax.bar(
                 x_values,
-                data.y,
+                y_values,
                 color=line_color,
                 alpha=0.8,
                 edgecolor='none',
                 zorder=zorder,
             )
-
-        elif series.plot_type == PlotType.HIST:
-            ax.hist(
-                data.y,
+            return _SeriesArtists(bars)
+
+        else:  # PlotType.HIST
+            edges, counts = self._hist_bins(data)
+            hist_bars = ax.bar(
+                edges[:-1],
+                counts,
+                width=np.diff(edges),
+                align='edge',
                 color=line_color,
                 alpha=0.8,
                 edgecolor=self._COLORS["background"],
                 linewidth=0.5,
                 zorder=zorder,
             )
+            return _SeriesArtists(hist_bars)
+
+    @staticmethod
+    def _axis_values(data: PlotData) -> Tuple[Any, Any]:
+        """X/Y values for plotting, with timestamp axes as datetime64."""
+        # Timestamp axes arrive as epoch ints from the executor
+        x_values = data.x
+        y_values = data.y
+        if data.x_timestamp is not None:
+            x_values = to_datetime_array(data.x)
+        if data.y_timestamp is not None:
+            y_values = to_datetime_array(data.y)
+        return x_values, y_values
+
+    @staticmethod
+    def _line_values(data: PlotData, width: int) -> Tuple[Any, Any]:
+        """
+        X/Y values for a line, decimated when it has far more points than
+        the plot has pixel columns.
+
+        Lines sorted by x (as the executor returns them) with no gaps keep
+        only the points that change what is drawn at this width (see
+        decimate_line), so drawing cost is bounded by the width rather than
+        the row count. Other lines are drawn in full.
+        """
+        if len(data.x) <= LINE_DECIMATE_FACTOR * width:
+            return MatplotlibEngine._axis_values(data)
+
+        x = to_numeric_array(data.x)
+        y = to_numeric_array(data.y) if x is not None else None
+        if not (
+            y is not None
+            and np.isfinite(x).all()
+            and np.isfinite(y).all()
+            and (x[1:] >= x[:-1]).all()
+        ):
+            return MatplotlibEngine._axis_values(data)
+
+        keep = decimate_line(x, y, width)
+        x, y = x[keep], y[keep]
+        # Timestamp axes arrive as epoch ints from the executor
+        x_values = to_datetime_array(x) if data.x_timestamp is not None else x
+        y_values = to_datetime_array(y) if data.y_timestamp is not None else y
+        return x_values, y_values
+
+    @staticmethod
+    def _hist_bins(data: PlotData) -> Tuple[np.ndarray, List[int]]:
+        """
+        Histogram bin edges and counts.
+
+        Executor output is already binned; raw values (PlotData built by
+        hand) are binned here the same way.
+        """
+        if data.bin_edges is not None:
+            edges, counts = data.bin_edges, data.y
+        else:
+            edges, counts = histogram_bins(data.y)
+        edges = np.asarray(edges, dtype=float)
+        if data.y_timestamp is not None and len(edges):
+            # Edges of epoch timestamps, as dates on the value axis
+            edges = to_datetime_array(np.round(edges).astype(np.int64))
+        return edges, counts
+
+    def _scatter_colors(
+        self,
+        data: PlotData,
+        marker_color: str,
+    ) -> Union[str, List[str]]:
+        """Per-point colors if available, else the series marker color."""
+        if not data.marker_colors:
+            return marker_color
+        # Check if colors are hex values (continuous) or names (categorical)
+        if data.marker_colors[0].startswith('#'):
+            # Continuous - use hex values directly
+            return data.marker_colors
+        # Categorical - convert names to hex
+        return [self.get_color(c) for c in data.marker_colors]
+
+    def _use_raster(self, data: PlotData) -> bool:
+        """Whether a series is drawn as an aggregate raster instead of markers."""
+        return (
+            data.series.plot_type == PlotType.SCATTER
+            and self.raster_threshold is not None
+            and len(data.x) > self.raster_threshold
+        )
+
+    def _raster_points(self, ax, data: PlotData) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Scatter coordinates in axis units, for binning.
+
+        Returns:
+            (x, y, finite): finite coordinates and the mask selecting them
+            from the series' points.
+        """
+        x_values, y_values = self._axis_values(data)
+        # Register units (dates, categories) as ax.scatter() would
+        ax.xaxis.update_units(x_values)
+        ax.yaxis.update_units(y_values)
+        x = np.asarray(ax.convert_xunits(x_values), dtype=float).reshape(-1)
+        y = np.asarray(ax.convert_yunits(y_values), dtype=float).reshape(-1)
+        finite = np.isfinite(x) & np.isfinite(y)
+        return x[finite], y[finite], finite
+
+    @staticmethod
+    def _raster_extent(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float]:
+        """Bounds of the raster grid: the data range, widened if empty."""
+        if not len(x):
+            return (0.0, 1.0, 0.0, 1.0)
+        xmin, xmax = float(x.min()), float(x.max())
+        ymin, ymax = float(y.min()), float(y.max())
+        if xmin == xmax:
+            xmin, xmax = xmin - 0.5, xmax + 0.5
+        if ymin == ymax:
+            ymin, ymax = ymin - 0.5, ymax + 0.5
+        return (xmin, xmax, ymin, ymax)
+
+    def _shade_raster(
+        self,
+        ax,
+        image,
+        data: PlotData,
+        default_marker_color: str,
+    ) -> None:
+        """Bin a scatter series at the axes' pixel size and draw it into image."""
+        x, y, finite = self._raster_points(ax, data)
+        extent = self._raster_extent(x, y)
+        bbox = ax.get_window_extent()
+        shape = (max(1, int(round(bbox.height))), max(1, int(round(bbox.width))))
+
+        fmt = data.series.format
+        marker_color = self.get_color(fmt.marker_color) if fmt.marker_color else default_marker_color
+        image.set_data(self._raster_pixels(data, x, y, finite, shape, extent, marker_color))
+        image.set_extent(extent)
+
+    def _raster_pixels(
+        self,
+        data: PlotData,
+        x: np.ndarray,
+        y: np.ndarray,
+        finite: np.ndarray,
+        shape: Tuple[int, int],
+        extent: Tuple[float, float, float, float],
+        marker_color: str,
+    ) -> np.ndarray:
+        """
+        Aggregate points into an RGBA image; empty pixels are transparent.
+
+        - Continuous color column: mean value per pixel on the colorbar scale
+        - Categorical/literal colors: blend of point colors, weighted by count
+        - No color column: point density (log scale) along the theme gradient
+        """
+        info = data.color_info
+        if info is not None and info.is_continuous and data.color_values is not None:
+            values = np.asarray(data.color_values, dtype=float)[finite]
+            valid = np.isfinite(values)
+            counts, sums = bin_points(
+                x[valid], y[valid], shape, extent, weights=values[valid]
+            )
+            mean = sums / np.maximum(counts, 1)
+            span = info.max_value - info.min_value
+            t = (mean - info.min_value) / span if span else np.full(shape, 0.5)
+            rgb = gradient_rgb(t)
+        elif data.marker_colors:
+            from matplotlib.colors import to_rgb
+
+            names = np.asarray(data.marker_colors, dtype=object)[finite]
+            counts = np.zeros(shape, dtype=np.int64)
+            rgb = np.zeros(shape + (3,))
+            # Few distinct colors: one pass over the points per color
+            for name in np.unique(names):
+                mask = names == name
+                cell_counts, _ = bin_points(x[mask], y[mask], shape, extent)
+                color = name if name.startswith('#') else self.get_color(name)
+                counts += cell_counts
+                rgb += cell_counts[..., None] * np.array(to_rgb(color))
+            rgb /= np.maximum(counts, 1)[..., None]
+        else:
+            counts, _ = bin_points(x, y, shape, extent)
+            peak = counts.max() if counts.size else 0
+            t = np.log1p(counts) / np.log1p(peak) if peak else np.zeros(shape)
+            rgb = gradient_rgb(t)
+
+        alpha = (counts > 0).astype(float)
+        return np.dstack([rgb, alpha])
+
+    @staticmethod
+    def _scatter_sizes(data: PlotData) -> Union[int, List[float]]:
+        """Marker sizes in points^2 (input is 1-5)."""
+        # Size 1 -> 20pt, Size 5 -> 100pt - smaller with wider spacing
+        if data.marker_sizes:
+            return [20 + (s - 1) * 20 for s in data.marker_sizes]
+        return 40  # Default size=2 (20 + 1*20 = 40)
 
     def render(
         self,
@@ -402,24 +683,229 @@ class MatplotlibEngine(Engine):
             PlotResult wrapper providing multiple output formats
         """
         fig = self._create_figure(data, width, height)
+        return self._make_result(fig, close_func=self._release_figure)
+
+    def render_view(
+        self,
+        data: PlotDataInput,
+        width: int,
+        height: int,
+        view: Hashable = "default",
+    ) -> PlotResult:
+        """
+        Render into a figure retained for the view between calls.
+
+        The first render of a view builds and styles a figure as render()
+        does. Later renders at the same size with the same series layout
+        (plot types, legends, colorbars, axis kinds) only update artist data,
+        colors, labels and axis limits, which is much cheaper than rebuilding.
+        Anything else rebuilds the figure.
+
+        The figure belongs to the engine: closing the returned result is a
+        no-op; use close_view() to release it. Not thread-safe - render each
+        view from one thread at a time.
+        """
+        data_list: List[PlotData] = data if isinstance(data, list) else [data]
+        layout = self._layout_key(data_list)
+
+        current = self._views.get(view)
+        if current is not None and current.size == (width, height) and current.layout == layout:
+            self._update_view(current, data_list)
+        else:
+            if current is not None:
+                self._release_figure(current.figure)
+            current = self._build_view(data_list, width, height)
+            current.layout = layout
+            self._views[view] = current
+
+        return self._make_result(current.figure, close_func=lambda f: None)
+
+    def close_view(self, view: Hashable = "default") -> None:
+        """Release the figure retained for a view."""
+        current = self._views.pop(view, None)
+        if current is not None:
+            self._release_figure(current.figure)
+
+    def _make_result(self, fig: Figure, close_func) -> PlotResult:
+        """Wrap a figure in a PlotResult."""
         bg_color = self._COLORS["background"]
 
         return PlotResult(
             figure=fig,
-            save_func=lambda f, path, fmt: f.savefig(
-                path, format=fmt, facecolor=bg_color, edgecolor='none'
-            ),
+            save_func=lambda f, path, fmt: self._save_figure(f, path, fmt, bg_color),
             to_bytes_func=lambda f, fmt: self._figure_to_bytes(f, fmt, bg_color),
-            show_func=lambda f: plt.show(),
-            close_func=lambda f: plt.close(f),
+            show_func=self._show_figure,
+            close_func=close_func,
+            to_rgba_func=self._figure_to_rgba,
         )
 
     @staticmethod
-    def _figure_to_bytes(fig: Figure, format: str, bg_color: str) -> bytes:
+    def _figure_to_rgba(fig: Figure) -> Tuple[memoryview, int, int]:
+        """Draw a figure and expose the Agg canvas's RGBA buffer (no copy)."""
+        canvas = fig.canvas
+        with matplotlib.rc_context(DRAW_RC):
+            canvas.draw()
+        buffer = canvas.buffer_rgba()
+        height, width = buffer.shape[:2]
+        return buffer, width, height
+
+    @staticmethod
+    def _release_figure(fig: Figure) -> None:
+        """
+        Free a figure's artists and data.
+
+        Figures aren't registered with pyplot, so there is no global state to
+        clean up; clearing releases the plotted arrays even if the figure
+        object itself is still referenced somewhere.
+        """
+        fig.clear()
+
+    @staticmethod
+    def _show_figure(fig: Figure) -> None:
+        """Display a figure inline in Jupyter/IPython."""
+        try:
+            from IPython.display import display
+        except ImportError:
+            return  # Agg is non-interactive: there is nowhere else to show it
+        with matplotlib.rc_context(DRAW_RC):
+            display(fig)
+
+    def _layout_key(self, data_list: List[PlotData]) -> Tuple:
+        """
+        Everything about the series that decides which artists a figure has.
+
+        Figures whose layout key matches can be updated in place.
+        """
+        key = []
+        for data in data_list:
+            color_key = None
+            if data.color_info is not None:
+                if data.color_info.is_continuous:
+                    # Colorbar range is updated in place
+                    color_key = ("continuous", data.color_info.column_name)
+                else:
+                    # Legend entries are fixed at build time
+                    color_key = (
+                        "categorical",
+                        data.color_info.column_name,
+                        tuple(data.color_info.category_colors.items()),
+                    )
+            key.append((
+                data.series.plot_type,
+                data.x_timestamp is not None,
+                data.y_timestamp is not None,
+                color_key,
+                data.size_info,
+                self._use_raster(data),
+                # Bars are updated by height only, so positions must match
+                tuple(data.x) if data.series.plot_type == PlotType.BAR else None,
+                # Histogram bars are moved in place, so their number must match
+                len(self._hist_bins(data)[1]) if data.series.plot_type == PlotType.HIST else None,
+            ))
+        return tuple(key)
+
+    def _update_view(self, view: _FigureView, data_list: List[PlotData]) -> None:
+        """Update a retained figure's artists in place for new data."""
+        ax = view.ax
+        first_data = data_list[0]
+        title, xlabel, ylabel = self._chart_labels(first_data)
+        # set_text rather than set_title/set_xlabel, which reset font styling
+        ax.title.set_text(title)
+        ax.xaxis.label.set_text(xlabel)
+        ax.yaxis.label.set_text(ylabel)
+
+        marker_color = self._default_marker_color(first_data)
+        offsets = []
+        for artists, data in zip(view.series, data_list):
+            points = self._update_series(ax, artists, data, marker_color)
+            if points is not None:
+                offsets.append(points)
+
+        # relim() only sees lines and patches; add scatter points explicitly
+        ax.relim()
+        for points in offsets:
+            if len(points):
+                ax.update_datalim(points)
+        ax.autoscale_view()
+
+    def _update_series(
+        self,
+        ax,
+        artists: _SeriesArtists,
+        data: PlotData,
+        default_marker_color: str,
+    ) -> Optional[np.ndarray]:
+        """
+        Update one series' artists in place.
+
+        Returns:
+            The scatter offsets for scatter series (for axis limits), else None.
+        """
+        fmt = data.series.format
+        if data.series.plot_type == PlotType.LINE:
+            x_values, y_values = self._line_values(data, int(ax.figure.bbox.width))
+        else:
+            x_values, y_values = self._axis_values(data)
+        # Register any new categories/units, as the plotting functions do
+        ax.xaxis.update_units(x_values)
+        ax.yaxis.update_units(y_values)
+
+        line_color = self.get_color(fmt.line_color)
+        marker_color = self.get_color(fmt.marker_color) if fmt.marker_color else default_marker_color
+        plot_type = data.series.plot_type
+
+        if plot_type == PlotType.SCATTER and artists.raster:
+            self._shade_raster(ax, artists.artist, data, default_marker_color)
+            if artists.mappable is not None:
+                artists.mappable.set_clim(
+                    data.color_info.min_value, data.color_info.max_value
+                )
+            return None
+
+        if plot_type == PlotType.SCATTER:
+            scatter = artists.artist
+            points = np.column_stack([
+                np.asarray(ax.convert_xunits(x_values), dtype=float).reshape(-1),
+                np.asarray(ax.convert_yunits(y_values), dtype=float).reshape(-1),
+            ])
+            scatter.set_offsets(points)
+            scatter.set_facecolor(self._scatter_colors(data, marker_color))
+            scatter.set_sizes(np.atleast_1d(self._scatter_sizes(data)))
+            if artists.mappable is not None:
+                artists.mappable.set_clim(
+                    data.color_info.min_value, data.color_info.max_value
+                )
+            return points
+
+        if plot_type == PlotType.LINE:
+            artists.artist.set_data(x_values, y_values)
+            artists.artist.set_color(line_color)
+        elif plot_type == PlotType.BAR:
+            for rect, height in zip(artists.artist.patches, y_values):
+                rect.set_height(height)
+                rect.set_facecolor(line_color)
+        else:  # PlotType.HIST
+            edges, counts = self._hist_bins(data)
+            patches = artists.artist.patches
+            for rect, count, left, right in zip(patches, counts, edges[:-1], edges[1:]):
+                rect.set_x(left)
+                rect.set_width(right - left)
+                rect.set_height(count)
+                rect.set_facecolor(line_color)
+        return None
+
+    @staticmethod
+    def _save_figure(fig: Figure, target: Any, format: str, bg_color: str) -> None:
+        """Save a figure to a path or file object."""
+        with matplotlib.rc_context(DRAW_RC):
+            fig.savefig(target, format=format, facecolor=bg_color, edgecolor='none')
+
+    @classmethod
+    def _figure_to_bytes(cls, fig: Figure, format: str, bg_color: str) -> bytes:
         """Convert a matplotlib figure to bytes."""
         from io import BytesIO
         buf = BytesIO()
-        fig.savefig(buf, format=format, facecolor=bg_color, edgecolor='none')
+        cls._save_figure(fig, buf, format, bg_color)
         buf.seek(0)
         return buf.read()
 
@@ -0,0 +1,748 @@
+"""
+Lightweight raster rendering engine for PlotQL.
+
+Draws plots straight into a Pillow RGBA image with NumPy and ImageDraw,
+without matplotlib. Markers, lines and bars are drawn without
+antialiasing, matching the TUI's blocky look, and a terminal-sized render
+takes a few milliseconds.
+
+All plot types, multiple series, datetime and categorical axes, and
+color/size mapping are supported. The layout is simpler than
+MatplotlibEngine's (no size legend) and output formats are raster only.
+
+Usage:
+    from plotql.core.engines import set_engine
+
+    set_engine("raster")
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import polars as pl
+from PIL import Image, ImageDraw, ImageFont
+
+from plotql.core.ast import PlotType
+from plotql.core.engines.base import Engine, format_datetime_tick
+from plotql.core.executor import PlotData
+from plotql.core.result import PlotResult
+from plotql.core.utils import (
+    ENGINE_COLORS,
+    LINE_DECIMATE_FACTOR,
+    TIMESTAMP_UNIT,
+    decimate_line,
+    gradient_rgb,
+    hex_to_rgb,
+    histogram_bins,
+    palette_color,
+    to_numeric_array,
+)
+
+# Type alias for render input - single PlotData or list of PlotData
+PlotDataInput = Union[PlotData, List[PlotData]]
+
+# Font sizes in pixels, matching MatplotlibEngine at 100 DPI
+TITLE_SIZE = 16
+LABEL_SIZE = 13
+TICK_SIZE = 11
+
+# Spacing around the plot area, in pixels
+PAD = 12
+TICK_LENGTH = 6
+COLORBAR_WIDTH = 14
+
+LINE_WIDTH = 3
+# Bar width as a fraction of the spacing between bars
+BAR_WIDTH = 0.8
+
+# Target number of ticks per axis
+X_TICKS = 5
+Y_TICKS = 6
+
+# Candidate tick spacings for datetime axes, in seconds
+_TIME_STEPS = [
+    1, 2, 5, 10, 15, 30,
+    60, 2 * 60, 5 * 60, 10 * 60, 15 * 60, 30 * 60,
+    3600, 2 * 3600, 3 * 3600, 6 * 3600, 12 * 3600,
+    86400, 2 * 86400, 7 * 86400, 14 * 86400, 30 * 86400, 91 * 86400, 365 * 86400,
+]
+# Timestamp ticks per second (epoch values from the executor use TIMESTAMP_UNIT)
+_UNITS_PER_SECOND = int(np.timedelta64(1, "s") / np.timedelta64(1, TIMESTAMP_UNIT))
+
+
+@lru_cache(maxsize=None)
+def _font(size: int) -> ImageFont.ImageFont:
+    """Pillow's bundled font at a pixel size."""
+    return ImageFont.load_default(size=size)
+
+
+def _text_size(text: str, size: int) -> Tuple[int, int]:
+    """Width and height of rendered text."""
+    left, top, right, bottom = _font(size).getbbox(text)
+    return right - left, bottom - top
+
+
+def _blend(color: str, background: str, alpha: float) -> Tuple[int, int, int]:
+    """A color drawn at partial opacity over the background, as opaque RGB."""
+    fg = np.array(hex_to_rgb(color), dtype=float)
+    bg = np.array(hex_to_rgb(background), dtype=float)
+    return tuple(int(c) for c in np.round(bg + alpha * (fg - bg)))
+
+
+# =============================================================================
+# Axes
+# =============================================================================
+
+@dataclass
+class Axis:
+    """Data range of an axis, its ticks and how values map to it."""
+    kind: str  # "numeric", "time" or "category"
+    lo: float
+    hi: float
+    ticks: List[float]
+    labels: List[str]
+    categories: Optional[Dict[object, int]] = None
+
+    def to_pixels(self, values: np.ndarray, start: float, end: float) -> np.ndarray:
+        """Map values onto the pixel range [start, end]."""
+        return start + (values - self.lo) * ((end - start) / (self.hi - self.lo))
+
+
+def _nice_step(span: float, max_ticks: int) -> float:
+    """Tick spacing of 1, 2, 2.5 or 5 times a power of ten."""
+    raw = span / max_ticks
+    magnitude = 10 ** np.floor(np.log10(raw))
+    for multiple in (1, 2, 2.5, 5, 10):
+        step = multiple * magnitude
+        if span / step <= max_ticks:
+            return step
+    return 10 * magnitude
+
+
+def _ticks_between(lo: float, hi: float, step: float) -> List[float]:
+    """Multiples of step within [lo, hi]."""
+    first = np.ceil(lo / step - 1e-9)
+    last = np.floor(hi / step + 1e-9)
+    return [float(i * step) for i in np.arange(first, last + 1)]
+
+
+def _format_number(value: float, step: float) -> str:
+    """Tick label with as many decimals as the tick spacing needs."""
+    if value == 0:
+        return "0"
+    if abs(value) >= 1e6 or abs(value) < 1e-4:
+        return f"{value:.3g}"
+    decimals = max(0, int(-np.floor(np.log10(step) + 1e-9)))
+    if decimals and step * 10 ** decimals % 1:
+        decimals += 1  # e.g. 2.5 spacing
+    return f"{value:.{decimals}f}"
+
+
+def _to_datetime(value: float) -> datetime:
+    """Epoch timestamp (TIMESTAMP_UNIT) to a naive datetime."""
+    return np.datetime64(int(round(value)), TIMESTAMP_UNIT).astype(datetime)
+
+
+def _numeric_axis(lo: float, hi: float, max_ticks: int) -> Axis:
+    step = _nice_step(hi - lo, max_ticks)
+    ticks = _ticks_between(lo, hi, step)
+    return Axis("numeric", lo, hi, ticks, [_format_number(t, step) for t in ticks])
+
+
+def _time_axis(lo: float, hi: float, max_ticks: int) -> Axis:
+    span = (hi - lo) / _UNITS_PER_SECOND
+    seconds = next((s for s in _TIME_STEPS if span / s <= max_ticks), _TIME_STEPS[-1])
+    step = seconds * _UNITS_PER_SECOND
+    ticks = _ticks_between(lo, hi, step)
+    dates = [_to_datetime(t) for t in ticks]
+    labels = [format_datetime_tick(dt, pos, dates) for pos, dt in enumerate(dates)]
+    return Axis("time", lo, hi, ticks, labels)
+
+
+def _category_axis(categories: Dict[object, int], max_ticks: int) -> Axis:
+    count = len(categories)
+    every = max(1, int(np.ceil(count / max(max_ticks, 1))))
+    names = list(categories)[::every]
+    ticks = [float(categories[name]) for name in names]
+    return Axis(
+        "category", -0.5, count - 0.5, ticks, [str(n) for n in names], categories
+    )
+
+
+def _padded(lo: float, hi: float, margin: float = 0.05) -> Tuple[float, float]:
+    """Widen a data range by a margin on both sides (never empty)."""
+    if not np.isfinite(lo) or not np.isfinite(hi):
+        return 0.0, 1.0
+    if lo == hi:
+        return lo - 0.5, hi + 0.5
+    pad = (hi - lo) * margin
+    return lo - pad, hi + pad
+
+
+# =============================================================================
+# Series values
+# =============================================================================
+
+@dataclass
+class AxisSeries:
+    """One series reduced to the arrays that get drawn."""
+    data: PlotData
+    x: np.ndarray  # Axis units: numbers, epoch timestamps or category indices
+    y: np.ndarray
+    widths: Optional[np.ndarray] = None  # Bar widths (bar/hist only)
+
+
+def _values(values: Sequence) -> Tuple[Optional[np.ndarray], Optional[pl.Series]]:
+    """
+    Axis values as floats, or as a Series of labels if not numeric.
+
+    Returns:
+        (floats, None) for numeric values (missing values become NaN),
+        (None, labels) otherwise.
+    """
+    floats = to_numeric_array(values)
+    if floats is not None:
+        return floats.astype(float, copy=False), None
+    series = pl.Series(values, strict=False)
+    if series.dtype.is_numeric() or series.dtype == pl.Null:
+        return series.cast(pl.Float64).fill_null(float("nan")).to_numpy(), None
+    return None, series.cast(pl.String)
+
+
+def _category_index(labels: pl.Series, categories: Dict[object, int]) -> np.ndarray:
+    """Positions of labels on a category axis, adding new categories in order."""
+    for label in labels.unique(maintain_order=True).to_list():
+        categories.setdefault(label, len(categories))
+    return labels.replace_strict(categories, return_dtype=pl.Float64).to_numpy()
+
+
+def _x_extent(series: AxisSeries) -> Tuple[np.ndarray, np.ndarray]:
+    """Left and right x of each point or bar."""
+    if series.widths is None:
+        return series.x, series.x
+    if series.data.series.plot_type == PlotType.HIST:
+        return series.x, series.x + series.widths
+    return series.x - series.widths / 2, series.x + series.widths / 2
+
+
+def _x_is_time(data: PlotData) -> bool:
+    # Histograms put their values (the y column) on the x axis
+    if data.series.plot_type == PlotType.HIST:
+        return data.y_timestamp is not None
+    return data.x_timestamp is not None
+
+
+def _hist_bins(data: PlotData) -> Tuple[np.ndarray, List[int]]:
+    """Histogram bin edges and counts, binning raw values if needed."""
+    if data.bin_edges is not None:
+        edges, counts = data.bin_edges, data.y
+    else:
+        edges, counts = histogram_bins(data.y)
+    return np.asarray(edges, dtype=float), counts
+
+
+def _bar_spacing(x: np.ndarray) -> float:
+    """Smallest gap between distinct bar positions (1 for a single bar)."""
+    positions = np.unique(x[np.isfinite(x)])
+    if len(positions) < 2:
+        return 1.0
+    return float(np.diff(positions).min())
+
+
+def _build_axis(
+    extents: List[Tuple[np.ndarray, np.ndarray]],
+    is_time: bool,
+    categories: Dict[object, int],
+    max_ticks: int,
+    sticky_zero: bool,
+) -> Axis:
+    """Axis covering every series' (low, high) extents."""
+    if categories:
+        return _category_axis(categories, max_ticks)
+
+    lows, highs = [], []
+    for low, high in extents:
+        finite = np.isfinite(low) & np.isfinite(high)
+        if finite.any():
+            lows.append(np.min(low[finite]))
+            highs.append(np.max(high[finite]))
+    lo = float(min(lows)) if lows else 0.0
+    hi = float(max(highs)) if highs else 1.0
+    if sticky_zero:
+        # Bars grow from zero, so zero sits on the axis edge
+        lo, hi = min(lo, 0.0), max(hi, 0.0)
+        pad_lo, pad_hi = _padded(lo, hi)
+        lo = lo if lo == 0 else pad_lo
+        hi = hi if hi == 0 else pad_hi
+    else:
+        lo, hi = _padded(lo, hi)
+    if is_time:
+        return _time_axis(lo, hi, max_ticks)
+    return _numeric_axis(lo, hi, max_ticks)
+
+
+def prepare_axes(data_list: List[PlotData]) -> Tuple[List[AxisSeries], Axis, Axis]:
+    """
+    Convert every series to axis units and build both axes.
+
+    Datetimes become epoch timestamps, text becomes category positions
+    shared by all series, histograms are binned and bars get widths. Any
+    renderer drawing onto these axes matches RasterEngine's layout.
+
+    Args:
+        data_list: Results of executing a query
+
+    Returns:
+        (series, x_axis, y_axis)
+    """
+    x_time = any(_x_is_time(d) for d in data_list)
+    y_time = any(d.y_timestamp is not None and d.series.plot_type != PlotType.HIST for d in data_list)
+    x_categories: Dict[object, int] = {}
+    y_categories: Dict[object, int] = {}
+
+    series: List[AxisSeries] = []
+    for data in data_list:
+        plot_type = data.series.plot_type
+        if plot_type == PlotType.HIST:
+            edges, counts = _hist_bins(data)
+            series.append(AxisSeries(
+                data,
+                x=edges[:-1],
+                y=np.asarray(counts, dtype=float),
+                widths=np.diff(edges),
+            ))
+            continue
+
+        x, x_labels = _values(data.x)
+        if x is None:
+            x = _category_index(x_labels, x_categories)
+        y, y_labels = _values(data.y)
+        if y is None:
+            y = _category_index(y_labels, y_categories)
+        widths = None
+        if plot_type == PlotType.BAR:
+            widths = np.full(len(x), BAR_WIDTH * _bar_spacing(x))
+        series.append(AxisSeries(data, x, y, widths))
+
+    x_axis = _build_axis(
+        [_x_extent(s) for s in series], x_time, x_categories, X_TICKS, sticky_zero=False
+    )
+    y_axis = _build_axis(
+        [(s.y, s.y) for s in series], y_time, y_categories, Y_TICKS,
+        sticky_zero=any(s.widths is not None for s in series),
+    )
+    return series, x_axis, y_axis
+
+
+# =============================================================================
+# Engine
+# =============================================================================
+
+class RasterEngine(Engine):
+    """NumPy/Pillow rendering engine for fast, blocky terminal plots."""
+
+    # Colors derived from centralized theme
+    _COLORS: Dict[str, str] = ENGINE_COLORS
+
+    @property
+    def COLORS(self) -> Dict[str, str]:
+        """Color palette used by this engine."""
+        return self._COLORS
+
+    def get_color(self, color_name: Optional[str]) -> str:
+        """Convert a color name to our theme palette color."""
+        return palette_color(color_name)
+
+    def render(
+        self,
+        data: PlotDataInput,
+        width: int,
+        height: int,
+    ) -> PlotResult:
+        """
+        Render PlotData (or list of PlotData) to a PlotResult wrapper.
+
+        The result's figure is the rendered PIL image.
+
+        Args:
+            data: The plot data from query execution (single or list)
+            width: Width in pixels
+            height: Height in pixels
+
+        Returns:
+            PlotResult wrapper providing raster output formats
+        """
+        data_list: List[PlotData] = data if isinstance(data, list) else [data]
+        image = self._draw(data_list, width, height)
+        return PlotResult(
+            figure=image,
+            save_func=self._save_image,
+            to_bytes_func=self._image_to_bytes,
+            show_func=self._show_image,
+            close_func=lambda image: None,
+            to_rgba_func=lambda image: (memoryview(image.tobytes()), image.width, image.height),
+        )
+
+    # -------------------------------------------------------------------------
+    # Layout
+    # -------------------------------------------------------------------------
+
+    def _draw(self, data_list: List[PlotData], width: int, height: int) -> Image.Image:
+        """Draw a complete chart."""
+        image = Image.new("RGBA", (width, height), self._COLORS["background"])
+        draw = ImageDraw.Draw(image)
+
+        first = data_list[0]
+        fmt = first.series.format
+        x_label = fmt.xlabel or str(first.series.x_column)
+        y_label = fmt.ylabel or str(first.series.y_column)
+        title = fmt.title or f"{y_label} vs {x_label}"
+
+        series, x_axis, y_axis = prepare_axes(data_list)
+        colorbar = next(
+            (d for d in data_list if d.color_info and d.color_info.is_continuous), None
+        )
+
+        # Plot area, leaving room for the title, labels, ticks and colorbar
+        tick_height = _text_size("0123456789", TICK_SIZE)[1]
+        y_tick_width = max((_text_size(label, TICK_SIZE)[0] for label in y_axis.labels), default=0)
+        left = PAD + _text_size(y_label, LABEL_SIZE)[1] + PAD + y_tick_width + TICK_LENGTH + 4
+        right = width - PAD
+        if colorbar is not None:
+            right -= COLORBAR_WIDTH + 3 * PAD + self._colorbar_label_width(colorbar)
+        top = PAD + _text_size(title, TITLE_SIZE)[1] + PAD
+        bottom = height - (PAD + _text_size(x_label, LABEL_SIZE)[1] + PAD + tick_height + TICK_LENGTH + 4)
+        if right - left < 10 or bottom - top < 10:
+            # Too small for a chart: background only
+            return image
+        area = (left, top, right, bottom)
+
+        self._draw_grid(draw, area, x_axis, y_axis)
+
+        # Series are clipped to the plot area by drawing on a layer
+        layer = Image.new("RGBA", (right - left + 1, bottom - top + 1), (0, 0, 0, 0))
+        default_marker = self.marker_color(first, self._COLORS["primary"])
+        for s in series:
+            self._draw_series(layer, s, x_axis, y_axis, default_marker)
+        image.alpha_composite(layer, (left, top))
+
+        self._draw_axes(draw, area, x_axis, y_axis)
+        self._draw_labels(image, draw, area, title, x_label, y_label)
+        if colorbar is not None:
+            self._draw_colorbar(image, draw, area, colorbar)
+        legend = next(
+            (d for d in data_list if d.color_info and not d.color_info.is_continuous), None
+        )
+        if legend is not None:
+            self._draw_legend(draw, area, legend)
+        return image
+
+    # -------------------------------------------------------------------------
+    # Series
+    # -------------------------------------------------------------------------
+
+    def marker_color(self, data: PlotData, default: str) -> str:
+        """Palette color of a series' markers: its marker color, else its line color."""
+        fmt = data.series.format
+        if fmt.marker_color:
+            return self.get_color(fmt.marker_color)
+        if fmt.line_color:
+            return self.get_color(fmt.line_color)
+        return default
+
+    def _draw_series(
+        self,
+        layer: Image.Image,
+        series: AxisSeries,
+        x_axis: Axis,
+        y_axis: Axis,
+        default_marker: str,
+    ) -> None:
+        """Draw one series onto the plot-area layer."""
+        data = series.data
+        plot_type = data.series.plot_type
+        w, h = layer.size
+        line_color = self.get_color(data.series.format.line_color)
+
+        if plot_type == PlotType.SCATTER:
+            marker = self.get_color(data.series.format.marker_color) if data.series.format.marker_color else default_marker
+            px = x_axis.to_pixels(series.x, 0, w - 1)
+            py = y_axis.to_pixels(series.y, h - 1, 0)
+            self._draw_markers(layer, px, py, self._point_colors(data, marker), self._point_sizes(data))
+            return
+
+        draw = ImageDraw.Draw(layer, "RGBA")
+        if plot_type == PlotType.LINE:
+            x, y = series.x, series.y
+            if len(x) > LINE_DECIMATE_FACTOR * w and np.isfinite(x).all() and np.isfinite(y).all() and (x[1:] >= x[:-1]).all():
+                keep = decimate_line(x, y, w)
+                x, y = x[keep], y[keep]
+            px = x_axis.to_pixels(x, 0, w - 1)
+            py = y_axis.to_pixels(y, h - 1, 0)
+            finite = np.isfinite(px) & np.isfinite(py)
+            # Missing values break the line, as in matplotlib
+            breaks = np.flatnonzero(~finite)
+            for run in np.split(np.arange(len(px)), breaks):
+                run = run[finite[run]]
+                if len(run) == 1:
+                    draw.point((float(px[run[0]]), float(py[run[0]])), fill=line_color)
+                elif len(run) > 1:
+                    points = np.column_stack([px[run], py[run]]).ravel().tolist()
+                    draw.line(points, fill=line_color, width=LINE_WIDTH)
+            return
+
+        # Bars: centered on x for bar charts, starting at the left edge for hist
+        fill = hex_to_rgb(line_color) + (int(255 * 0.8),)
+        outline = self._COLORS["background"] if plot_type == PlotType.HIST else None
+        left = series.x if plot_type == PlotType.HIST else series.x - series.widths / 2
+        x0 = x_axis.to_pixels(left, 0, w - 1)
+        x1 = x_axis.to_pixels(left + series.widths, 0, w - 1)
+        base = y_axis.to_pixels(np.zeros(1), h - 1, 0)[0]
+        tops = y_axis.to_pixels(series.y, h - 1, 0)
+        for a, b, top in zip(x0, x1, tops):
+            if not (np.isfinite(a) and np.isfinite(top)):
+                continue
+            y0, y1 = sorted((float(top), float(base)))
+            draw.rectangle((float(a), y0, max(float(a), float(b) - 1), y1), fill=fill, outline=outline)
+
+    def _point_colors(self, data: PlotData, marker_color: str) -> np.ndarray:
+        """Per-point RGB colors (uint8, shape (n, 3))."""
+        n = len(data.x)
+        info = data.color_info
+        if info is not None and info.is_continuous and data.color_values is not None:
+            values = np.asarray(data.color_values, dtype=float)
+            span = info.max_value - info.min_value
+            t = (values - info.min_value) / span if span else np.full(n, 0.5)
+            return np.round(gradient_rgb(np.nan_to_num(t)) * 255).astype(np.uint8)
+        if not data.marker_colors:
+            return np.tile(np.array(hex_to_rgb(marker_color), dtype=np.uint8), (n, 1))
+        # Few distinct colors: resolve each once
+        names = pl.Series(data.marker_colors, dtype=pl.String)
+        distinct = names.unique(maintain_order=True).to_list()
+        palette = np.array([
+            hex_to_rgb(name if name.startswith("#") else self.get_color(name))
+            for name in distinct
+        ], dtype=np.uint8)
+        codes = names.replace_strict(distinct, range(len(distinct)), return_dtype=pl.Int64)
+        return palette[codes.to_numpy()]
+
+    @staticmethod
+    def _point_sizes(data: PlotData) -> np.ndarray:
+        """Marker side lengths in pixels, matching MatplotlibEngine's areas."""
+        if data.marker_sizes:
+            sizes = np.asarray(data.marker_sizes, dtype=float)
+        else:
+            sizes = np.full(len(data.x), 2.0)
+        # Size 1-5 -> 20-100 pt^2 squares; 1pt = 100/72 px at 100 DPI
+        area = 20 + (sizes - 1) * 20
+        return np.maximum(1, np.round(np.sqrt(area) * 100 / 72)).astype(int)
+
+    @staticmethod
+    def _draw_markers(
+        layer: Image.Image,
+        px: np.ndarray,
+        py: np.ndarray,
+        colors: np.ndarray,
+        sizes: np.ndarray,
+    ) -> None:
+        """
+        Stamp square markers onto a layer.
+
+        Every pixel is owned by the last point (in draw order) whose marker
+        covers it. With few points each square is stamped directly; with
+        many, each point is written at its center pixel and spread over its
+        square with a separable running maximum, at a cost that depends on
+        the layer size rather than the number of points.
+        """
+        w, h = layer.size
+        finite = np.isfinite(px) & np.isfinite(py)
+        pixels = np.asarray(layer).copy()
+
+        # Largest markers first, so smaller ones stay visible on top
+        for side in sorted(np.unique(sizes[finite]), reverse=True):
+            points = np.flatnonzero(finite & (sizes == side))
+            col = np.clip(np.round(px[points]).astype(int), 0, w - 1)
+            row = np.clip(np.round(py[points]).astype(int), 0, h - 1)
+            owner = np.full((h, w), -1, dtype=np.int64)
+            # Squares cover [center - lo, center + hi] in both directions
+            lo = (side - 1) // 2
+            hi = side - 1 - lo
+
+            if len(points) * side * side <= h * w:
+                for dy in range(-lo, hi + 1):
+                    for dx in range(-lo, hi + 1):
+                        r, c = row + dy, col + dx
+                        inside = (r >= 0) & (r < h) & (c >= 0) & (c < w)
+                        np.maximum.at(owner, (r[inside], c[inside]), points[inside])
+            else:
+                # Assignment keeps the last point per pixel
+                owner[row, col] = points
+                for axis, length in ((0, h), (1, w)):
+                    spread = owner.copy()
+                    for shift in range(-hi, lo + 1):
+                        if shift == 0:
+                            continue
+                        src = slice(max(0, shift), length + min(0, shift))
+                        dst = slice(max(0, -shift), length - max(0, shift))
+                        if axis == 0:
+                            np.maximum(spread[dst], owner[src], out=spread[dst])
+                        else:
+                            np.maximum(spread[:, dst], owner[:, src], out=spread[:, dst])
+                    owner = spread
+
+            covered = owner >= 0
+            pixels[covered, :3] = colors[owner[covered]]
+            pixels[covered, 3] = 255
+
+        layer.paste(Image.fromarray(pixels, "RGBA"))
+
+    # -------------------------------------------------------------------------
+    # Decorations
+    # -------------------------------------------------------------------------
+
+    def _draw_grid(self, draw: ImageDraw.ImageDraw, area, x_axis: Axis, y_axis: Axis) -> None:
+        left, top, right, bottom = area
+        grid = _blend(self._COLORS["grid"], self._COLORS["background"], 0.5)
+        for px in x_axis.to_pixels(np.array(x_axis.ticks), left, right):
+            draw.line((float(px), top, float(px), bottom), fill=grid, width=1)
+        for py in y_axis.to_pixels(np.array(y_axis.ticks), bottom, top):
+            draw.line((left, float(py), right, float(py)), fill=grid, width=1)
+
+    def _draw_axes(self, draw: ImageDraw.ImageDraw, area, x_axis: Axis, y_axis: Axis) -> None:
+        left, top, right, bottom = area
+        axes, text = self._COLORS["axes"], self._COLORS["text"]
+        font = _font(TICK_SIZE)
+        draw.rectangle(area, outline=axes, width=2)
+
+        for px, label in zip(x_axis.to_pixels(np.array(x_axis.ticks), left, right), x_axis.labels):
+            px = float(px)
+            draw.line((px, bottom, px, bottom + TICK_LENGTH), fill=text, width=2)
+            draw.text((px, bottom + TICK_LENGTH + 3), label, fill=text, font=font, anchor="mt")
+        for py, label in zip(y_axis.to_pixels(np.array(y_axis.ticks), bottom, top), y_axis.labels):
+            py = float(py)
+            draw.line((left - TICK_LENGTH, py, left, py), fill=text, width=2)
+            draw.text((left - TICK_LENGTH - 3, py), label, fill=text, font=font, anchor="rm")
+
+    def _draw_labels(
+        self,
+        image: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        area,
+        title: str,
+        x_label: str,
+        y_label: str,
+    ) -> None:
+        left, top, right, bottom = area
+        text = self._COLORS["text"]
+        center = (left + right) / 2
+        draw.text((center, top - PAD), title, fill=text, font=_font(TITLE_SIZE), anchor="mb")
+        draw.text((center, image.height - PAD), x_label, fill=text, font=_font(LABEL_SIZE), anchor="mb")
+
+        self._draw_vertical_text(image, y_label, PAD, (top + bottom) / 2)
+
+    def _draw_vertical_text(self, image: Image.Image, text: str, x: int, center_y: float) -> None:
+        """Label reading bottom to top, its left edge at x."""
+        w, h = _text_size(text, LABEL_SIZE)
+        if not (w and h):
+            return
+        # Draw horizontally, then rotate into place
+        label = Image.new("RGBA", (w + 2, h + 4), (0, 0, 0, 0))
+        ImageDraw.Draw(label).text(
+            (1, 0), text, fill=self._COLORS["text"], font=_font(LABEL_SIZE), anchor="lt"
+        )
+        label = label.rotate(90, expand=True)
+        image.alpha_composite(label, (int(x), max(0, int(center_y - label.height / 2))))
+
+    @staticmethod
+    def _colorbar_tick_width(data: PlotData) -> int:
+        info = data.color_info
+        labels = [f"{info.min_value:.3g}", f"{info.max_value:.3g}"]
+        return max(_text_size(label, TICK_SIZE)[0] for label in labels)
+
+    def _colorbar_label_width(self, data: PlotData) -> int:
+        """Room taken by the colorbar's tick labels and vertical title."""
+        title_height = _text_size(data.color_info.column_name, LABEL_SIZE)[1]
+        return self._colorbar_tick_width(data) + PAD // 2 + title_height + 4
+
+    def _draw_colorbar(self, image: Image.Image, draw: ImageDraw.ImageDraw, area, data: PlotData) -> None:
+        """Gradient strip right of the plot area for a continuous color column."""
+        info = data.color_info
+        _, top, right, bottom = area
+        x0 = right + 2 * PAD
+        height = bottom - top
+        t = np.linspace(1.0, 0.0, height)[:, None].repeat(COLORBAR_WIDTH, axis=1)
+        strip = np.round(gradient_rgb(t) * 255).astype(np.uint8)
+        image.paste(Image.fromarray(strip, "RGB"), (x0, top))
+        draw.rectangle((x0, top, x0 + COLORBAR_WIDTH, bottom), outline=self._COLORS["grid"])
+
+        text = self._COLORS["text"]
+        font = _font(TICK_SIZE)
+        draw.text((x0 + COLORBAR_WIDTH + 4, top), f"{info.max_value:.3g}", fill=text, font=font, anchor="lt")
+        draw.text((x0 + COLORBAR_WIDTH + 4, bottom), f"{info.min_value:.3g}", fill=text, font=font, anchor="lb")
+        label_x = x0 + COLORBAR_WIDTH + 4 + self._colorbar_tick_width(data) + PAD // 2
+        self._draw_vertical_text(image, info.column_name, label_x, (top + bottom) / 2)
+
+    def _draw_legend(self, draw: ImageDraw.ImageDraw, area, data: PlotData) -> None:
+        """Category color legend in the top-right corner of the plot area."""
+        info = data.color_info
+        _, top, right, _ = area
+        font = _font(TICK_SIZE)
+        entries = [(str(value), self.get_color(color)) for value, color in info.category_colors.items()]
+        row = max(_text_size("Ag", TICK_SIZE)[1], 8) + 6
+        title_width = _text_size(info.column_name, LABEL_SIZE)[0]
+        width = max([title_width] + [_text_size(label, TICK_SIZE)[0] + 16 for label, _ in entries]) + 12
+        height = row * (len(entries) + 1) + 6
+        x0, y0 = right - width - 6, top + 6
+        draw.rectangle((x0, y0, x0 + width, y0 + height), fill=self._COLORS["background"], outline=self._COLORS["grid"])
+
+        text = self._COLORS["text"]
+        draw.text((x0 + 6, y0 + 4), info.column_name, fill=text, font=_font(LABEL_SIZE), anchor="lt")
+        for i, (label, color) in enumerate(entries, start=1):
+            y = y0 + 4 + i * row
+            draw.rectangle((x0 + 6, y + 1, x0 + 14, y + 9), fill=color)
+            draw.text((x0 + 20, y), label, fill=text, font=font, anchor="lt")
+
+    # -------------------------------------------------------------------------
+    # Output
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _pil_format(format: Optional[str]) -> Optional[str]:
+        """Map a file format name to Pillow's, rejecting vector formats."""
+        if not format:
+            return None
+        pil_format = {"jpg": "JPEG"}.get(format.lower(), format.upper())
+        Image.init()
+        if pil_format not in Image.SAVE:
+            raise ValueError(f"RasterEngine cannot write '{format}' output")
+        return pil_format
+
+    @classmethod
+    def _save_image(cls, image: Image.Image, path: str, format: Optional[str]) -> None:
+        pil_format = cls._pil_format(format)
+        if pil_format == "JPEG":
+            image = image.convert("RGB")
+        image.save(path, format=pil_format)
+
+    @classmethod
+    def _image_to_bytes(cls, image: Image.Image, format: str) -> bytes:
+        pil_format = cls._pil_format(format)
+        if pil_format == "JPEG":
+            image = image.convert("RGB")
+        buf = BytesIO()
+        image.save(buf, format=pil_format)
+        return buf.getvalue()
+
+    @staticmethod
+    def _show_image(image: Image.Image) -> None:
+        """Display an image inline in Jupyter/IPython."""
+        try:
+            from IPython.display import display
+        except ImportError:
+            return
+        display(image)
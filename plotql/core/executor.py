@@ -3,10 +3,15 @@ Query executor - loads data with Polars and prepares it for plotting.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any, List, Optional, Union
-
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 import polars as pl
 
 from plotql.core.ast import (
@@ -24,8 +29,26 @@ from plotql.core.ast import (
     WhereClause,
 )
 from plotql.core.config import get_source_config
-from plotql.core.connectors import get_connector, LiteralConnector, ConnectorError
-from plotql.core.utils import map_to_sizes, map_to_colors, TimestampInfo, detect_timestamp_columns
+from plotql.core.connectors import (
+    get_connector,
+    ColumnStats,
+    Connector,
+    ConfigError,
+    ConnectorError,
+    LiteralConnector,
+)
+from plotql.core.pyramid import PyramidStore
+from plotql.core.utils import (
+    LINE_DECIMATE_FACTOR,
+    TIMESTAMP_UNIT,
+    map_to_sizes,
+    map_to_colors,
+    TimestampInfo,
+    decimate_line,
+    detect_timestamp_columns,
+    histogram_bins,
+    timestamps_to_epoch,
+)
 
 
 # Valid color names that can be used as literal marker_color values
@@ -34,12 +57,79 @@ VALID_COLORS = {
     "purple", "cyan", "teal", "magenta", "white", "gray", "grey"
 }
 
+# Deepest zoom, as a fraction of the full x extent
+MAX_ZOOM = 2 ** 32
+
+# Levels above a missing tile searched for a cached tile that contains it
+TILE_SEARCH_LEVELS = 8
+
+# Seconds between cancellation checks while waiting for another caller's load
+SOURCE_WAIT_POLL = 0.05
+
 
 class ExecutionError(Exception):
     """Raised when query execution fails."""
     pass
 
 
+class ExecutionCancelled(ExecutionError):
+    """Raised when a query is cancelled before it completes."""
+    pass
+
+
+class CancelToken:
+    """
+    Cooperative cancellation for an in-flight execute() call.
+
+    Cancel from any thread. The executor checks the token between stages
+    (after loading, between series) and asks the active connector to abort
+    its load; connectors that can't interrupt a load (e.g. local files read
+    by Polars) finish it and the result is discarded.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._callbacks: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() has been called."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Request cancellation and run abort callbacks."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Register an abort callback; runs now if already cancelled."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister an abort callback once its work has finished."""
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises:
+            ExecutionCancelled: If cancel() has been called.
+        """
+        if self._event.is_set():
+            raise ExecutionCancelled("Query cancelled")
+
+
 @dataclass
 class SizeInfo:
     """Information about marker sizes for legend display."""
@@ -66,8 +156,13 @@ class ColorInfo:
 
 @dataclass
 class PlotData:
-    """Result of executing a single series - ready for plotting."""
-    x: List[Any]  # Can be float, datetime, or string depending on data
+    """
+    Result of executing a single series - ready for plotting.
+
+    Histograms are binned here: x holds the left bin edges, y the counts,
+    and bin_edges all len(y) + 1 edges.
+    """
+    x: List[Any]  # Can be float or string; epoch ints (TIMESTAMP_UNIT) for timestamp axes
     y: List[Any]
     series: PlotSeries  # The series this data came from
     row_count: int
@@ -75,61 +170,22 @@ class PlotData:
     # Optional columns for dynamic formatting
     marker_sizes: Optional[List[float]] = None
     marker_colors: Optional[List[str]] = None
+    # Raw values behind continuous marker_colors (for engines that aggregate)
+    color_values: Optional[List[Optional[float]]] = None
     size_info: Optional[SizeInfo] = None
     color_info: Optional[ColorInfo] = None
     # Timestamp info for datetime axes
     x_timestamp: Optional[TimestampInfo] = None
     y_timestamp: Optional[TimestampInfo] = None
+    # Bin edges for histograms
+    bin_edges: Optional[List[float]] = None
 
 
-def load_data(
+def resolve_source(
     source: Union[SourceRef, DataSource],
-    filters: Optional[List[WhereClause]] = None,
-) -> tuple[pl.DataFrame, bool]:
+) -> tuple[Connector, dict]:
     """
-    Load data from any data source type.
-
-    Args:
-        source: A SourceRef or legacy DataSource
-        filters: Optional list of WhereClause filters to push down.
-                 Only used if the connector supports filter pushdown.
-                 The connector is responsible for combining them appropriately.
-
-    Returns:
-        Tuple of (DataFrame, filter_applied) where filter_applied is True
-        if filters were pushed down to the connector.
-
-    Raises:
-        ExecutionError: If data loading fails.
-    """
-    try:
-        if isinstance(source, SourceRef):
-            return _load_from_source_ref(source, filters)
-        elif isinstance(source, LiteralSource):
-            # Legacy: Literal file path - use LiteralConnector (no pushdown)
-            connector = LiteralConnector()
-            return connector.load({"path": source.path}), False
-        elif isinstance(source, ConnectorSource):
-            # Legacy: Connector function call - look up config and dispatch
-            source_config = get_source_config(source.alias)
-            connector = get_connector(source_config.type)
-            # Pass filters if connector supports pushdown
-            if connector.supports_filter_pushdown and filters:
-                return connector.load(source_config.config, filters=filters), True
-            else:
-                return connector.load(source_config.config), False
-        else:
-            raise ExecutionError(f"Unknown data source type: {type(source)}")
-    except ConnectorError as e:
-        raise ExecutionError(str(e))
-
-
-def _load_from_source_ref(
-    source: SourceRef,
-    filters: Optional[List[WhereClause]] = None,
-) -> tuple[pl.DataFrame, bool]:
-    """
-    Load data from a SourceRef.
+    Resolve a data source to the connector that loads it and its config.
 
     Handles:
     - source('path.csv') -> literal file path (single arg, looks like file path)
@@ -139,8 +195,20 @@ def _load_from_source_ref(
 
     For single-arg sources, we try config alias lookup first, falling back to
     literal file path if not found.
+
+    Raises:
+        ConnectorError: If the source alias or connector type is invalid.
+        ExecutionError: If the source type is unknown.
     """
-    from plotql.core.config import ConfigError
+    if isinstance(source, LiteralSource):
+        # Legacy: Literal file path - use LiteralConnector (no pushdown)
+        return LiteralConnector(), {"path": source.path}
+    if isinstance(source, ConnectorSource):
+        # Legacy: Connector function call - look up config and dispatch
+        source_config = get_source_config(source.alias)
+        return get_connector(source_config.type), source_config.config
+    if not isinstance(source, SourceRef):
+        raise ExecutionError(f"Unknown data source type: {type(source)}")
 
     if len(source.args) == 1:
         # Single arg: try config alias first, fall back to file path
@@ -148,15 +216,10 @@ def _load_from_source_ref(
         try:
             source_config = get_source_config(arg)
             connector = get_connector(source_config.type)
-            config = dict(source_config.config)
-            if connector.supports_filter_pushdown and filters:
-                return connector.load(config, filters=filters), True
-            else:
-                return connector.load(config), False
         except ConfigError:
             # Not a config alias, treat as literal file path
-            connector = LiteralConnector()
-            return connector.load({"path": arg}), False
+            return LiteralConnector(), {"path": arg}
+        return connector, dict(source_config.config)
 
     # Multi-arg: always a config alias with additional args
     alias = source.args[0]
@@ -174,12 +237,841 @@ def _load_from_source_ref(
         # Other connectors (clickhouse): first extra arg is table
         config["table"] = extra_args[0]
 
-    # Pass filters if connector supports pushdown
-    if connector.supports_filter_pushdown and filters:
-        return connector.load(config, filters=filters), True
-    else:
+    return connector, config
+
+
+def load_data(
+    source: Union[SourceRef, DataSource],
+    filters: Optional[List[WhereClause]] = None,
+    cancel: Optional[CancelToken] = None,
+) -> tuple[pl.DataFrame, bool]:
+    """
+    Load data from any data source type.
+
+    Args:
+        source: A SourceRef or legacy DataSource
+        filters: Optional list of WhereClause filters to push down.
+                 Only used if the connector supports filter pushdown.
+                 The connector is responsible for combining them appropriately.
+        cancel: Optional token; cancelling it aborts the connector's load
+                where supported.
+
+    Returns:
+        Tuple of (DataFrame, filter_applied) where filter_applied is True
+        if filters were pushed down to the connector.
+
+    Raises:
+        ExecutionError: If data loading fails.
+        ExecutionCancelled: If the token is cancelled during the load.
+    """
+    def load(connector: Connector, config: dict) -> tuple[pl.DataFrame, bool]:
+        # Pass filters if connector supports pushdown
+        if connector.supports_filter_pushdown and filters:
+            return connector.load(config, filters=filters), True
         return connector.load(config), False
 
+    return _call_connector(source, load, cancel)
+
+
+def _call_connector(
+    source: Union[SourceRef, DataSource],
+    load: Callable[[Connector, dict], Any],
+    cancel: Optional[CancelToken] = None,
+) -> Any:
+    """
+    Resolve a source and call load(connector, config), cancellably.
+
+    Raises:
+        ExecutionError: If resolving or loading fails.
+        ExecutionCancelled: If the token is cancelled during the load.
+    """
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+    try:
+        connector, config = resolve_source(source)
+        if cancel is not None:
+            cancel.on_cancel(connector.cancel)
+        try:
+            result = load(connector, config)
+        finally:
+            if cancel is not None:
+                cancel.remove_callback(connector.cancel)
+    except ConnectorError as e:
+        # An aborted load surfaces as a connector error
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        raise ExecutionError(str(e))
+
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+    return result
+
+
+def source_fingerprint(source: Union[SourceRef, DataSource]) -> Optional[str]:
+    """
+    Get a fingerprint of the source's current content for cache keys.
+
+    Returns None if the source can't be resolved or fingerprinted.
+    """
+    try:
+        connector, config = resolve_source(source)
+        return connector.fingerprint(config)
+    except (ConnectorError, ExecutionError):
+        return None
+
+
+def _source_key(connector: Connector, config: dict) -> tuple:
+    """Identify a resolved source for cache keys."""
+    return type(connector).__name__, repr(sorted(config.items()))
+
+
+class SourceCache:
+    """
+    Loaded source data shared between queries.
+
+    Queries that reference the same source reuse one loaded DataFrame
+    instead of reading the source again. Entries are keyed by the resolved
+    connector config and the source fingerprint, so a changed file is
+    reloaded. Sources with filter pushdown are only shared between queries
+    with identical filters, since the loaded rows depend on them.
+
+    Sources without a fingerprint (e.g. databases) can't be checked for
+    changes, so they are only cached when ``cache_unfingerprinted`` is set -
+    suitable for one-off batch runs, not long-lived sessions.
+
+    Thread-safe. Concurrent loads of the same source share one read: the
+    first caller loads it while the others wait for its result.
+    """
+
+    def __init__(
+        self,
+        cache_unfingerprinted: bool = False,
+        max_entries: int = 16,
+    ) -> None:
+        self.cache_unfingerprinted = cache_unfingerprinted
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, pl.DataFrame] = OrderedDict()
+        # Loads in progress, set once their result is cached (or failed)
+        self._loading: Dict[tuple, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        source: Union[SourceRef, DataSource],
+        filters: Optional[List[WhereClause]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> tuple[pl.DataFrame, Optional[str]]:
+        """
+        Load a source, reusing a cached DataFrame when possible.
+
+        Returns:
+            Tuple of (DataFrame, fingerprint), where fingerprint is the
+            source fingerprint taken before loading (None if unavailable).
+
+        Raises:
+            ExecutionError: If data loading fails.
+            ExecutionCancelled: If the token is cancelled during the load.
+        """
+        try:
+            connector, config = resolve_source(source)
+            # Fingerprint before loading so a concurrent file change can't be
+            # cached under the old content's key
+            fingerprint = connector.fingerprint(config)
+        except ConnectorError as e:
+            raise ExecutionError(str(e))
+
+        pushdown = connector.supports_filter_pushdown and bool(filters)
+        if fingerprint is None and not self.cache_unfingerprinted:
+            df, _ = load_data(source, filters=filters, cancel=cancel)
+            return df, fingerprint
+
+        key = (
+            *_source_key(connector, config),
+            fingerprint,
+            repr(filters) if pushdown else None,
+        )
+        while True:
+            with self._lock:
+                df = self._entries.get(key)
+                if df is not None:
+                    self._entries.move_to_end(key)
+                    return df, fingerprint
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    break
+            # Another caller is reading this source; if its load fails or
+            # is cancelled, the next loop iteration loads it here instead
+            while not loading.wait(SOURCE_WAIT_POLL):
+                if cancel is not None:
+                    cancel.raise_if_cancelled()
+
+        try:
+            df, _ = load_data(source, filters=filters, cancel=cancel)
+            with self._lock:
+                self._entries[key] = df
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        finally:
+            with self._lock:
+                del self._loading[key]
+            loading.set()
+        return df, fingerprint
+
+    def clear(self) -> None:
+        """Drop all cached DataFrames."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SchemaCache:
+    """
+    Schemas and column statistics of sources, shared by the executor and
+    editor tooling.
+
+    Executing a query records the schema of the source it loaded, and
+    lookups for sources not seen yet ask the connector for its schema
+    (a file header, a table description, ...), so asking for a source's
+    columns never loads its rows. Column statistics come from the
+    connector's sampled or pushed-down summary in the same way. Sources
+    with a fingerprint are keyed by it alone - a file reached through a
+    literal path, a file alias or a folder alias shares one entry, and a
+    changed file is re-read. Other sources are keyed by their resolved
+    config and kept until cleared.
+
+    Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, pl.Schema] = OrderedDict()
+        self._stats: OrderedDict[tuple, ColumnStats] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def schema(self, source: Union[SourceRef, DataSource]) -> Optional[pl.Schema]:
+        """
+        Get the schema of a source.
+
+        Returns:
+            Column names and types, or None if the source can't be
+            resolved or read.
+        """
+        try:
+            connector, config = resolve_source(source)
+            key = self._key(connector, config, connector.fingerprint(config))
+        except (ConnectorError, ExecutionError):
+            return None
+
+        with self._lock:
+            schema = self._entries.get(key)
+            if schema is not None:
+                self._entries.move_to_end(key)
+                return schema
+
+        try:
+            schema = connector.schema(config)
+        except ConnectorError:
+            return None
+        if not schema:
+            return None
+        self._store(key, schema)
+        return schema
+
+    def columns(self, source: Union[SourceRef, DataSource]) -> List[str]:
+        """
+        Get the column names of a source.
+
+        Returns:
+            Column names, or an empty list if the source can't be resolved
+            or read.
+        """
+        schema = self.schema(source)
+        return schema.names() if schema is not None else []
+
+    def column_stats(
+        self,
+        source: Union[SourceRef, DataSource],
+        column: str,
+        k: int = 10,
+    ) -> Optional[ColumnStats]:
+        """
+        Get a summary of a column's values: its most frequent values and range.
+
+        Args:
+            source: Source containing the column
+            column: Column to summarize
+            k: Number of most frequent values
+
+        Returns:
+            The column's statistics, or None if the source or column can't
+            be read or the connector doesn't provide statistics.
+        """
+        if column not in self.columns(source):
+            return None
+        try:
+            connector, config = resolve_source(source)
+            key = (*self._key(connector, config, connector.fingerprint(config)), column, k)
+        except (ConnectorError, ExecutionError):
+            return None
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is not None:
+                self._stats.move_to_end(key)
+                return stats
+
+        try:
+            stats = connector.column_stats(config, column, k)
+        except ConnectorError:
+            return None
+        if stats is None:
+            return None
+        with self._lock:
+            self._stats[key] = stats
+            self._stats.move_to_end(key)
+            # A few columns per source
+            while len(self._stats) > self.max_entries * 4:
+                self._stats.popitem(last=False)
+        return stats
+
+    def record(
+        self,
+        source: Union[SourceRef, DataSource],
+        schema: pl.Schema,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        """
+        Remember the schema of a loaded source.
+
+        Args:
+            source: The source that was loaded
+            schema: Its schema
+            fingerprint: Source fingerprint taken before loading, if any
+        """
+        if fingerprint is not None:
+            key: tuple = ("fingerprint", fingerprint)
+        else:
+            try:
+                connector, config = resolve_source(source)
+            except (ConnectorError, ExecutionError):
+                return
+            key = self._key(connector, config, None)
+        self._store(key, pl.Schema(schema))
+
+    def clear(self) -> None:
+        """Drop all cached schemas and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(connector: Connector, config: dict, fingerprint: Optional[str]) -> tuple:
+        if fingerprint is not None:
+            return ("fingerprint", fingerprint)
+        return _source_key(connector, config)
+
+    def _store(self, key: tuple, schema: pl.Schema) -> None:
+        with self._lock:
+            self._entries[key] = schema
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _series_data_key(series: PlotSeries) -> str:
+    """Identify the parts of a series that determine its data (not its styling)."""
+    fmt = series.format
+    return repr((
+        series.x_column,
+        series.y_column,
+        series.plot_type,
+        series.filter,
+        fmt.marker_size,
+        fmt.marker_color,
+        fmt.bins,
+    ))
+
+
+class SeriesCache:
+    """
+    Executed series shared between runs of a query that is being edited.
+
+    Entries are keyed by the source fingerprint, the resolution lines were
+    reduced to, and the parts of a series that determine its data -
+    columns, plot type, filter, and the data-driven format options
+    (marker_size, marker_color, bins). Editing
+    one series of a query therefore only recomputes that series, and
+    styling changes (title, colors, line style) recompute nothing. Sources
+    without a fingerprint are never cached, since their data can change
+    unseen.
+
+    Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, PlotData] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        fingerprint: str,
+        series: PlotSeries,
+        resolution: Optional[int] = None,
+    ) -> Optional[PlotData]:
+        """
+        Get a series' data computed in an earlier run.
+
+        Returns:
+            The cached PlotData, carrying this series' formatting, or None.
+        """
+        key = (fingerprint, _series_data_key(series), resolution)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                return None
+            self._entries.move_to_end(key)
+        return replace(data, series=series)
+
+    def put(
+        self,
+        fingerprint: str,
+        series: PlotSeries,
+        data: PlotData,
+        resolution: Optional[int] = None,
+    ) -> None:
+        """Remember a series' data."""
+        key = (fingerprint, _series_data_key(series), resolution)
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached series."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def restyle(
+    previous: PlotQuery,
+    data: List[PlotData],
+    query: PlotQuery,
+) -> Optional[List[PlotData]]:
+    """
+    Reuse a query's results for an edit that only changes styling.
+
+    Args:
+        previous: The query that produced data
+        data: Its results, one PlotData per series
+        query: The edited query
+
+    Returns:
+        The results with each series' styling taken from the edited query,
+        or None if the edit changes the source or any series' data, so the
+        query must be executed.
+    """
+    if query.source != previous.source or len(query.series) != len(data):
+        return None
+    for series, old in zip(query.series, data):
+        if _series_data_key(series) != _series_data_key(old.series):
+            return None
+    # Format validation depends only on the data-driven options, so the
+    # edited series are as valid as the ones they replace
+    return [replace(old, series=series) for series, old in zip(query.series, data)]
+
+
+# Shared schema cache used by the executor
+_schema_cache = SchemaCache()
+
+
+def get_schema_cache() -> SchemaCache:
+    """Get the shared schema cache."""
+    return _schema_cache
+
+
+@dataclass(frozen=True)
+class XRange:
+    """
+    A window of the x axis.
+
+    Bounds are in plotted units - the values of PlotData.x, which are
+    epoch integers (TIMESTAMP_UNIT) on timestamp axes.
+    """
+    low: float
+    high: float
+    # TimestampInfo.input_format of a timestamp axis, None for numbers
+    input_format: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not self.low < self.high:
+            raise ValueError(f"XRange low must be below high, got {self.low}, {self.high}")
+
+    def zoom(self, factor: float, bounds: "XRange") -> "XRange":
+        """
+        Scale the window about its centre, staying within bounds.
+
+        Args:
+            factor: Scale of the window's width; below 1 zooms in
+            bounds: The full extent of the axis
+
+        Returns:
+            The scaled window.
+        """
+        full = bounds.high - bounds.low
+        span = min(max((self.high - self.low) * factor, full / MAX_ZOOM), full)
+        centre = (self.low + self.high) / 2
+        return XRange(centre - span / 2, centre + span / 2, self.input_format)._within(bounds)
+
+    def pan(self, fraction: float, bounds: "XRange") -> "XRange":
+        """
+        Move the window by a fraction of its width, staying within bounds.
+
+        Args:
+            fraction: Distance to move; negative moves left
+            bounds: The full extent of the axis
+
+        Returns:
+            The moved window.
+        """
+        shift = (self.high - self.low) * fraction
+        return XRange(self.low + shift, self.high + shift, self.input_format)._within(bounds)
+
+    def _within(self, bounds: "XRange") -> "XRange":
+        """Shift the window inside bounds, keeping its width."""
+        span = self.high - self.low
+        low = min(max(self.low, bounds.low), bounds.high - span)
+        return XRange(low, low + span, self.input_format)
+
+
+def x_extent(data: List[PlotData]) -> Optional[XRange]:
+    """
+    Get the x range covered by query results, for panning and zooming.
+
+    Returns:
+        The range spanning every series' x values, or None if the results
+        can't be windowed: a series isn't a line or scatter plot, has
+        non-numeric x values, or the series mix timestamp and numeric axes.
+    """
+    low = high = None
+    formats = set()
+    for item in data:
+        if item.series.plot_type not in (PlotType.LINE, PlotType.SCATTER):
+            return None
+        values = pl.Series(item.x, strict=False)
+        if not values.dtype.is_numeric() or values.null_count() == len(values):
+            return None
+        formats.add(item.x_timestamp.input_format if item.x_timestamp else None)
+        low = values.min() if low is None else min(low, values.min())
+        high = values.max() if high is None else max(high, values.max())
+    if len(formats) != 1 or low is None or not low < high:
+        return None
+    return XRange(low, high, formats.pop())
+
+
+def _epoch_to_datetime(value: float) -> datetime:
+    """Convert an epoch value (TIMESTAMP_UNIT) to a naive datetime."""
+    return pl.Series([int(value)]).cast(pl.Datetime(TIMESTAMP_UNIT)).item()
+
+
+def _range_bounds(dtype: pl.DataType, x_range: XRange) -> Optional[Tuple[Any, Any]]:
+    """
+    Express an x range in a source column's own type, for pushdown.
+
+    The bounds may be wider than the range (whole seconds, whole days);
+    rows are filtered exactly once loaded.
+
+    Returns:
+        (low, high) bounds, or None if the column can't be compared with
+        the range at the source (e.g. strings in a day-first format).
+    """
+    if x_range.input_format is None:
+        return (x_range.low, x_range.high) if dtype.is_numeric() else None
+    low = _epoch_to_datetime(x_range.low)
+    high = _epoch_to_datetime(x_range.high)
+    if isinstance(dtype, pl.Datetime):
+        if dtype.time_zone is not None:
+            return None
+        # Whole seconds, which every database timestamp type can parse
+        return low.replace(microsecond=0), high.replace(microsecond=0) + timedelta(seconds=1)
+    if dtype == pl.Date:
+        return low.date(), high.date()
+    if dtype == pl.String and x_range.input_format.startswith("Y-m-d"):
+        # Year-first strings sort chronologically; a bare date sorts before
+        # every timestamp on that day
+        return low.date().isoformat(), (high.date() + timedelta(days=1)).isoformat()
+    return None
+
+
+def _filter_x(
+    df: pl.DataFrame,
+    column: str,
+    x_range: XRange,
+    closed: str = "both",
+) -> pl.DataFrame:
+    """Keep the rows whose x value, in plotted units, lies in the range."""
+    if column not in df.columns:
+        return df  # Reported when the series runs
+    values = df[column]
+    if x_range.input_format is not None:
+        values = timestamps_to_epoch(values, x_range.input_format)
+    elif not values.dtype.is_numeric():
+        return df
+    return df.filter(values.is_between(x_range.low, x_range.high, closed=closed))
+
+
+def load_x_range(
+    source: Union[SourceRef, DataSource],
+    column: str,
+    x_range: XRange,
+    filters: Optional[List[WhereClause]] = None,
+    cache: Optional[SourceCache] = None,
+    cancel: Optional[CancelToken] = None,
+    closed: str = "both",
+) -> pl.DataFrame:
+    """
+    Load the rows of a source whose x value lies in a range.
+
+    The range is pushed down to the connector (see Connector.load_range)
+    when the column's type allows it. Otherwise the whole source is
+    loaded - through the cache, if given - and filtered here.
+
+    Args:
+        source: A SourceRef or legacy DataSource
+        column: The x column
+        x_range: The window, in plotted units
+        filters: Optional list of WhereClause filters to push down
+        cache: Optional SourceCache for sources loaded in full
+        cancel: Optional token; cancelling it aborts the load
+        closed: Which bounds are inclusive ("both", "left", ...)
+
+    Returns:
+        The rows in range.
+
+    Raises:
+        ExecutionError: If data loading fails.
+        ExecutionCancelled: If the token is cancelled during the load.
+    """
+    schema = _schema_cache.schema(source)
+    dtype = schema.get(column) if schema is not None else None
+    bounds = _range_bounds(dtype, x_range) if dtype is not None else None
+
+    if bounds is None:
+        if cache is not None:
+            df, _ = cache.load(source, filters=filters, cancel=cancel)
+        else:
+            df, _ = load_data(source, filters=filters, cancel=cancel)
+    else:
+        def load(connector: Connector, config: dict) -> pl.DataFrame:
+            pushed = filters if connector.supports_filter_pushdown and filters else None
+            return connector.load_range(config, column, *bounds, filters=pushed)
+
+        df = _call_connector(source, load, cancel)
+    return _filter_x(df, column, x_range, closed)
+
+
+class TileCache:
+    """
+    Source rows fetched for windows of the x axis, kept as tiles.
+
+    A window of width w is covered by tiles of width 2**ceil(log2(w)),
+    aligned to multiples of their width - at most two - so panning reuses
+    the tiles already fetched. Zooming in needs narrower tiles, which are
+    cut from a cached wider tile containing them instead of being fetched.
+    Tiles are keyed by source, fingerprint and x column; sources without
+    a fingerprint are loaded for every window, uncached.
+
+    Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, pl.DataFrame] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        source: Union[SourceRef, DataSource],
+        column: str,
+        x_range: XRange,
+        filters: Optional[List[WhereClause]] = None,
+        cache: Optional[SourceCache] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> pl.DataFrame:
+        """
+        Load the rows of a source whose x value lies in a range.
+
+        Args are as for load_x_range().
+
+        Raises:
+            ExecutionError: If data loading fails.
+            ExecutionCancelled: If the token is cancelled during the load.
+        """
+        try:
+            connector, config = resolve_source(source)
+            fingerprint = connector.fingerprint(config)
+        except ConnectorError as e:
+            raise ExecutionError(str(e))
+        if fingerprint is None:
+            return load_x_range(source, column, x_range, filters, cache, cancel)
+
+        pushdown = connector.supports_filter_pushdown and bool(filters)
+        base = (
+            *_source_key(connector, config),
+            fingerprint,
+            column,
+            x_range.input_format,
+            repr(filters) if pushdown else None,
+        )
+        level = math.ceil(math.log2(x_range.high - x_range.low))
+        width = 2.0 ** level
+        frames = []
+        for index in range(math.floor(x_range.low / width), math.floor(x_range.high / width) + 1):
+            tile = XRange(index * width, (index + 1) * width, x_range.input_format)
+            key = (*base, level, index)
+            df = self._cut(base, level, index, column, tile)
+            if df is None:
+                df = load_x_range(source, column, tile, filters, cache, cancel, closed="left")
+            with self._lock:
+                self._entries[key] = df
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            frames.append(df)
+        df = frames[0] if len(frames) == 1 else pl.concat(frames)
+        return _filter_x(df, column, x_range)
+
+    def clear(self) -> None:
+        """Drop all cached tiles."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _cut(
+        self,
+        base: tuple,
+        level: int,
+        index: int,
+        column: str,
+        tile: XRange,
+    ) -> Optional[pl.DataFrame]:
+        """Get a tile from the cache, or cut it from a cached wider tile."""
+        with self._lock:
+            for up in range(TILE_SEARCH_LEVELS + 1):
+                wider = self._entries.get((*base, level + up, index >> up))
+                if wider is not None:
+                    break
+        if wider is None:
+            return None
+        return wider if up == 0 else _filter_x(wider, column, tile, closed="left")
+
+
+def _build_pyramid(
+    pyramids: PyramidStore,
+    key: str,
+    fingerprint: str,
+    row_count: int,
+    line: pl.DataFrame,
+    x: str,
+    y: str,
+    x_timestamp: Optional[TimestampInfo],
+) -> None:
+    """Store the pyramid of a line just loaded from its source (see PyramidStore.build)."""
+    pyramids.build(key, fingerprint, line[x], line[y], row_count, x_timestamp)
+
+
+def _decimate_line_frame(df: pl.DataFrame, x: str, y: str, buckets: int) -> pl.DataFrame:
+    """
+    Keep the rows of a line, sorted by x, that are visible `buckets` pixels wide.
+
+    Lines with non-numeric or missing values are returned in full.
+    """
+    if len(df) <= LINE_DECIMATE_FACTOR * buckets or not (df[x].dtype.is_numeric() and df[y].dtype.is_numeric()):
+        return df
+    xs = np.asarray(df[x].to_numpy(), dtype=float)
+    ys = np.asarray(df[y].to_numpy(), dtype=float)
+    if not (np.isfinite(xs).all() and np.isfinite(ys).all()):
+        return df
+    return df[decimate_line(xs, ys, buckets)]
+
+
+def _pyramid_key(source: Union[SourceRef, DataSource], series: PlotSeries) -> Optional[str]:
+    """
+    Identify the line a series draws, for PyramidStore.
+
+    Returns:
+        The key, or None if the series can't be drawn from a pyramid
+        (not a line, or aggregated).
+    """
+    if series.plot_type != PlotType.LINE or series.is_aggregate:
+        return None
+    try:
+        connector, config = resolve_source(source)
+    except (ConnectorError, ExecutionError):
+        return None
+    return repr((
+        _source_key(connector, config),
+        series.x_column.name,
+        series.y_column.name,
+        series.filter,
+    ))
+
+
+def _pyramid_series(
+    pyramids: PyramidStore,
+    key: str,
+    fingerprint: str,
+    series: PlotSeries,
+    x_range: Optional[XRange],
+    resolution: int,
+) -> Optional[PlotData]:
+    """
+    Draw a line from its pyramid, without loading the source.
+
+    Returns:
+        The series' PlotData, or None if there's no up-to-date pyramid or
+        the resolution needs finer detail than it holds.
+    """
+    pyramid = pyramids.get(key, fingerprint)
+    if pyramid is None:
+        return None
+    input_format = pyramid.x_timestamp.input_format if pyramid.x_timestamp else None
+    if x_range is None:
+        low, high = pyramid.low, pyramid.high
+    elif x_range.input_format == input_format:
+        low, high = x_range.low, x_range.high
+    else:
+        return None
+    line = pyramid.line(low, high, resolution)
+    if line is None:
+        return None
+
+    validate_series_format_options(series)
+    x, y, count = line
+    # Timestamp axes are epoch integers everywhere else
+    if pyramid.x_timestamp is not None:
+        x = x.astype(np.int64)
+    return PlotData(
+        x=x.tolist(),
+        y=y.tolist(),
+        series=series,
+        row_count=pyramid.row_count,
+        filtered_count=count,
+        x_timestamp=pyramid.x_timestamp,
+    )
+
 
 def apply_where(df: pl.DataFrame, where: WhereClause) -> pl.DataFrame:
     """Apply WHERE clause filters to DataFrame."""
@@ -283,12 +1175,39 @@ def validate_series_format_options(series: PlotSeries) -> None:
         raise ExecutionError(
             f"marker_size is only valid for scatter plots, not {plot_type.value}"
         )
+    if fmt.bins is not None:
+        if plot_type != PlotType.HIST:
+            raise ExecutionError(
+                f"bins is only valid for histograms, not {plot_type.value}"
+            )
+        parse_bins(fmt.bins)
+
+
+def parse_bins(value: Optional[str]) -> Optional[int]:
+    """
+    Parse the bins format option.
+
+    Raises:
+        ExecutionError: If the value is not a positive integer.
+    """
+    if value is None:
+        return None
+    try:
+        bins = int(value)
+    except ValueError:
+        bins = 0
+    if bins < 1:
+        raise ExecutionError(f"bins must be a positive integer, got '{value}'")
+    return bins
 
 
 def _execute_series(
     series: PlotSeries,
     base_df: pl.DataFrame,
     row_count: int,
+    fingerprint: Optional[str] = None,
+    resolution: Optional[int] = None,
+    on_line: Optional[Callable[[pl.DataFrame, str, str, Optional[TimestampInfo]], None]] = None,
 ) -> PlotData:
     """
     Execute a single series against a base dataframe.
@@ -297,6 +1216,11 @@ def _execute_series(
         series: The series definition
         base_df: The loaded dataframe (before any series-specific filtering)
         row_count: Total row count of the base dataframe
+        fingerprint: Source fingerprint used to cache timestamp detection
+        resolution: Plot width in pixels; lines are reduced to the points
+                    visible at that width
+        on_line: Called with a numeric line before it is reduced - the
+                 sorted frame, x and y column names, and x timestamp info
 
     Returns:
         PlotData for this series
@@ -318,6 +1242,12 @@ def _execute_series(
                 f"Column '{col}' not found. Available: {available}"
             )
 
+    # Detect timestamp columns on the unfiltered frame so every series
+    # sharing a column reaches the same (cached) decision
+    x_timestamp, y_timestamp = detect_timestamp_columns(
+        base_df, x_col_name, y_col_name, fingerprint=fingerprint
+    )
+
     # Apply filters (before aggregation)
     if series.filter:
         for cond in series.filter.conditions:
@@ -335,26 +1265,50 @@ def _execute_series(
         df = apply_aggregation(df, series.x_column, series.y_column)
         # After aggregation, the counts change
         filtered_count = len(df)
-
-    # Detect timestamp columns before extracting values
-    x_timestamp, y_timestamp = detect_timestamp_columns(df, x_col_name, y_col_name)
+        # count()/sum()/avg() turn a timestamp column into plain numbers
+        if x_timestamp and df[x_col_name].dtype.is_numeric():
+            x_timestamp = None
+        if y_timestamp and df[y_col_name].dtype.is_numeric():
+            y_timestamp = None
+
+    # Parse timestamp columns to epoch integers in one vectorized pass so
+    # engines receive numeric arrays (and sorting is chronological)
+    for ts_info in (x_timestamp, y_timestamp):
+        if ts_info is not None:
+            df = df.with_columns(
+                timestamps_to_epoch(df[ts_info.column_name], ts_info.input_format)
+                .alias(ts_info.column_name)
+            )
 
     # Sort data based on plot type:
     # - LINE/SCATTER: sort ascending by x for proper visualization
-    # - BAR/HIST: sort ascending by y (smallest bar first, largest last)
+    # - BAR: sort ascending by y (smallest bar first, largest last)
+    # - HIST: binned below, order doesn't matter
     if series.plot_type in (PlotType.LINE, PlotType.SCATTER):
         df = df.sort(x_col_name)
-    elif series.plot_type in (PlotType.BAR, PlotType.HIST):
+    elif series.plot_type == PlotType.BAR:
         df = df.sort(y_col_name)
 
+    if resolution and series.plot_type == PlotType.LINE:
+        if on_line is not None and y_timestamp is None and not series.is_aggregate:
+            on_line(df, x_col_name, y_col_name, x_timestamp)
+        df = _decimate_line_frame(df, x_col_name, y_col_name, resolution)
+
     # Extract plot data
-    x = df[x_col_name].to_list()
-    y = df[y_col_name].to_list()
+    bin_edges = None
+    if series.plot_type == PlotType.HIST:
+        # Only the bins leave the executor, not the raw values
+        bin_edges, y = histogram_bins(df[y_col_name], parse_bins(series.format.bins))
+        x = bin_edges[:-1]
+    else:
+        x = df[x_col_name].to_list()
+        y = df[y_col_name].to_list()
 
     # Extract dynamic format columns if they reference columns
     # (only valid for non-aggregated queries)
     marker_sizes = None
     marker_colors = None
+    color_values = None
     size_info = None
     color_info = None
 
@@ -418,6 +1372,7 @@ def _execute_series(
                 # Build color info for legend
                 if is_continuous:
                     valid_values = [float(v) for v in raw_colors if v is not None]
+                    color_values = raw_colors
                     color_info = ColorInfo(
                         is_continuous=True,
                         column_name=fmt.marker_color,
@@ -457,14 +1412,25 @@ def _execute_series(
         filtered_count=filtered_count,
         marker_sizes=marker_sizes,
         marker_colors=marker_colors,
+        color_values=color_values,
         size_info=size_info,
         color_info=color_info,
         x_timestamp=x_timestamp,
         y_timestamp=y_timestamp,
+        bin_edges=bin_edges,
     )
 
 
-def execute(query: PlotQuery) -> List[PlotData]:
+def execute(
+    query: PlotQuery,
+    cache: Optional[SourceCache] = None,
+    cancel: Optional[CancelToken] = None,
+    series_cache: Optional[SeriesCache] = None,
+    x_range: Optional[XRange] = None,
+    resolution: Optional[int] = None,
+    tiles: Optional[TileCache] = None,
+    pyramids: Optional[PyramidStore] = None,
+) -> List[PlotData]:
     """
     Execute a PlotQL query and return data ready for plotting.
 
@@ -477,19 +1443,96 @@ def execute(query: PlotQuery) -> List[PlotData]:
 
     For connectors that support filter pushdown (like ClickHouse), filters
     are passed to the connector which handles combining and pushing them down.
+
+    Pass a SourceCache to share loaded sources between queries, e.g. when
+    executing every query in a script. Pass a CancelToken to allow aborting
+    the query from another thread; execution then raises ExecutionCancelled.
+    Pass a SeriesCache to reuse series computed by earlier runs, e.g. while
+    a query is edited live.
+
+    Pass an XRange to execute over a window of the x axis: only the rows
+    whose x value lies in it are loaded, with the range pushed down to the
+    connector where possible, and through a TileCache if given. Pass a
+    resolution (the plot width in pixels) to reduce lines to the points
+    visible at that width.
+
+    Pass a PyramidStore with a resolution to draw large lines from
+    pre-aggregated buckets: lines whose pyramid is coarse enough for the
+    resolution skip loading the source, and full-range runs build the
+    pyramids of lines with many points for next time.
     """
     # Collect all series filters for potential pushdown
     filters = [s.filter for s in query.series if s.filter is not None]
 
-    # Load data via connector abstraction, with filters for potential pushdown
-    df, _ = load_data(query.source, filters=filters)
-    row_count = len(df)
+    # Lines drawn from their pyramids, by position in the query
+    served = {}
+    pyramid_keys: List[Optional[str]] = [None] * len(query.series)
+    if pyramids is not None and resolution:
+        fingerprint = source_fingerprint(query.source)
+        if fingerprint is not None:
+            for i, series in enumerate(query.series):
+                pyramid_keys[i] = _pyramid_key(query.source, series)
+                if pyramid_keys[i] is not None:
+                    data = _pyramid_series(
+                        pyramids, pyramid_keys[i], fingerprint, series, x_range, resolution
+                    )
+                    if data is not None:
+                        served[i] = data
+        if len(served) == len(query.series):
+            return [served[i] for i in range(len(query.series))]
+
+    frames = None
+    if x_range is not None:
+        fingerprint = source_fingerprint(query.source)
+        # Series on different x columns select different rows
+        frames = {}
+        for series in query.series:
+            column = series.x_column.name
+            if column in frames:
+                continue
+            if tiles is not None:
+                frames[column] = tiles.load(query.source, column, x_range, filters, cache, cancel)
+            else:
+                frames[column] = load_x_range(query.source, column, x_range, filters, cache, cancel)
+    elif cache is not None:
+        df, fingerprint = cache.load(query.source, filters=filters, cancel=cancel)
+    else:
+        # Fingerprint before loading so a concurrent file change can't be
+        # cached under the old content's key
+        fingerprint = source_fingerprint(query.source)
+
+        # Load data via connector abstraction, with filters for pushdown
+        df, _ = load_data(query.source, filters=filters, cancel=cancel)
+    if frames is None:
+        _schema_cache.record(query.source, df.schema, fingerprint)
+        row_count = len(df)
+    # Windowed series depend on more than the series itself
+    if frames is not None:
+        series_cache = None
 
     # Execute each series
     # Series still apply their own filters (pushdown is optimization only)
     results = []
-    for series in query.series:
-        plot_data = _execute_series(series, df, row_count)
+    for i, series in enumerate(query.series):
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        if i in served:
+            results.append(served[i])
+            continue
+        if frames is not None:
+            df = frames[series.x_column.name]
+            row_count = len(df)
+        plot_data = None
+        if series_cache is not None and fingerprint is not None:
+            plot_data = series_cache.get(fingerprint, series, resolution)
+        if plot_data is None:
+            on_line = None
+            if frames is None and pyramid_keys[i] is not None and fingerprint is not None:
+                # Only the full line makes a complete pyramid
+                on_line = partial(_build_pyramid, pyramids, pyramid_keys[i], fingerprint, row_count)
+            plot_data = _execute_series(series, df, row_count, fingerprint, resolution, on_line)
+            if series_cache is not None and fingerprint is not None:
+                series_cache.put(fingerprint, series, plot_data, resolution)
         results.append(plot_data)
 
     return results
@@ -2,8 +2,9 @@
 Parser for PlotQL DSL.
 
 Grammar (simplified):
-    query       := with_clause plot_clause [where_clause] [options_clause]
+    query       := with_clause [refresh_clause] plot_clause [where_clause] [options_clause]
     with_clause := WITH string
+    refresh_clause := REFRESH EVERY number unit
     plot_clause := PLOT column AGAINST column [AS plot_type]
     where_clause := WHERE condition ((AND|OR) condition)*
     condition   := column op value
@@ -14,9 +15,11 @@ from __future__ import annotations
 
 import json
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple, Union
 
 from plotql.core.ast import (
     AggregateFunc,
@@ -41,6 +44,13 @@ class ParseError(Exception):
         super().__init__(f"{message} at position {position}")
 
 
+# Seconds per unit of a REFRESH EVERY interval
+REFRESH_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+# Shortest REFRESH EVERY interval, in seconds
+REFRESH_MIN_SECONDS = 1
+
+
 # Load grammar definitions from shared JSON
 _GRAMMAR_PATH = Path(__file__).parent.parent / "grammar.json"
 with open(_GRAMMAR_PATH) as f:
@@ -76,32 +86,41 @@ class Lexer:
         (r"\s+", "WHITESPACE"),
     ]
 
+    # All patterns combined into one alternation with a named group per token
+    # type, compiled once. Alternation order matches TOKEN_PATTERNS priority.
+    TOKEN_REGEX = re.compile(
+        "|".join(f"(?P<{token_type}>{pattern})" for pattern, token_type in TOKEN_PATTERNS)
+    )
+
     def __init__(self, text: str):
         self.text = text
         self.pos = 0
 
     def tokenize(self) -> Iterator[Token]:
-        """Generate tokens from input text."""
-        while self.pos < len(self.text):
-            match = None
-            for pattern, token_type in self.TOKEN_PATTERNS:
-                regex = re.compile(pattern)
-                match = regex.match(self.text, self.pos)
-                if match:
-                    value = match.group(0)
-                    if token_type != "WHITESPACE":
-                        # Classify identifiers as keywords or aggregate funcs
-                        if token_type == "IDENT":
-                            upper = value.upper()
-                            if upper in self.KEYWORDS:
-                                token_type = upper
-                            elif upper in self.AGGREGATE_FUNCS:
-                                token_type = "AGGFUNC"
-                        yield Token(token_type, value, self.pos)
-                    self.pos = match.end()
-                    break
+        """Generate tokens from input text in a single pass."""
+        match_at = self.TOKEN_REGEX.match
+        keywords = self.KEYWORDS
+        aggregate_funcs = self.AGGREGATE_FUNCS
+        text = self.text
+        length = len(text)
+
+        while self.pos < length:
+            match = match_at(text, self.pos)
             if not match:
-                raise ParseError(f"Unexpected character: {self.text[self.pos]!r}", self.pos)
+                raise ParseError(f"Unexpected character: {text[self.pos]!r}", self.pos)
+
+            token_type = match.lastgroup
+            if token_type != "WHITESPACE":
+                value = match.group()
+                # Classify identifiers as keywords or aggregate funcs
+                if token_type == "IDENT":
+                    upper = value.upper()
+                    if upper in keywords:
+                        token_type = upper
+                    elif upper in aggregate_funcs:
+                        token_type = "AGGFUNC"
+                yield Token(token_type, value, self.pos)
+            self.pos = match.end()
 
 
 class Parser:
@@ -144,9 +163,32 @@ class Parser:
             return self.advance()
         return None
 
+    def match_word(self, word: str) -> Optional[Token]:
+        """
+        Match a contextual keyword: an identifier spelled like word, in
+        any case. Contextual keywords stay usable as column names.
+        """
+        token = self.current
+        if token and token.type == "IDENT" and token.value.upper() == word:
+            return self.advance()
+        return None
+
+    def expect_word(self, word: str) -> Token:
+        token = self.match_word(word)
+        if token is not None:
+            return token
+        token = self.current
+        if token is None:
+            raise ParseError(f"Expected {word}, got end of input")
+        raise ParseError(
+            f"Expected {word}, got {token.type} ({token.value!r})",
+            token.position
+        )
+
     def parse(self) -> PlotQuery:
         """Parse a complete PlotQL query."""
         source = self.parse_with_clause()
+        refresh = self.parse_refresh_clause()
 
         # Parse one or more series (PLOT clauses with optional FILTER/FORMAT)
         series_list: List[PlotSeries] = []
@@ -175,6 +217,7 @@ class Parser:
         return PlotQuery(
             source=source,
             series=series_list,
+            refresh=refresh,
         )
 
     def parse_with_clause(self) -> SourceRef:
@@ -212,6 +255,34 @@ class Parser:
         is_literal = len(args) == 1
         return SourceRef(args=args, is_literal=is_literal)
 
+    def parse_refresh_clause(self) -> Optional[float]:
+        """
+        Parse: REFRESH EVERY number unit, where unit is s, m or h.
+
+        Returns:
+            The interval in seconds, or None if there's no REFRESH clause.
+        """
+        # Contextual keywords: only REFRESH can follow the WITH clause
+        if not self.match_word("REFRESH"):
+            return None
+        self.expect_word("EVERY")
+        number = self.expect("NUMBER")
+        unit = self.current
+        if unit is None or unit.type != "IDENT" or unit.value.lower() not in REFRESH_UNITS:
+            valid = ", ".join(REFRESH_UNITS)
+            raise ParseError(
+                f"Expected a time unit after {number.value} ({valid})",
+                unit.position if unit else number.position,
+            )
+        self.advance()
+        seconds = float(number.value) * REFRESH_UNITS[unit.value.lower()]
+        if seconds < REFRESH_MIN_SECONDS:
+            raise ParseError(
+                f"REFRESH interval must be at least {REFRESH_MIN_SECONDS}s",
+                number.position,
+            )
+        return seconds
+
     def parse_column_ref(self) -> ColumnRef:
         """
         Parse a column reference, optionally with aggregation.
@@ -350,6 +421,8 @@ class Parser:
                 options.line_color = str(value) if value is not None else None
             elif key_lower in ("line_style", "style"):
                 options.line_style = str(value) if value is not None else None
+            elif key_lower == "bins":
+                options.bins = str(value) if value is not None else None
             elif key_lower == "title":
                 options.title = str(value) if value is not None else None
             elif key_lower == "xlabel":
@@ -364,10 +437,31 @@ class Parser:
         return options
 
 
+# Parsed queries keyed by query text, most recently used last. Errors are
+# cached too, so re-validating unchanged invalid text is also free.
+PARSE_CACHE_SIZE = 128
+_parse_cache: OrderedDict[str, Union[PlotQuery, ParseError]] = OrderedDict()
+# parse() runs on worker threads as well as the UI thread
+_parse_cache_lock = threading.Lock()
+
+
+def _parse_uncached(query: str) -> PlotQuery:
+    """Lex and parse a query string without consulting the cache."""
+    lexer = Lexer(query)
+    tokens = list(lexer.tokenize())
+    parser = Parser(tokens)
+    return parser.parse()
+
+
 def parse(query: str) -> PlotQuery:
     """
     Parse a PlotQL query string into an AST.
 
+    Results are cached by query text, so reparsing unchanged text (e.g. on
+    every keystroke in the TUI) is free. Calls with the same text return
+    the same AST object, so treat it as read-only; derive changed queries
+    with dataclasses.replace().
+
     Example:
         >>> ast = parse("WITH 'data.csv' PLOT price AGAINST time AS line")
         >>> ast.source
@@ -375,7 +469,250 @@ def parse(query: str) -> PlotQuery:
         >>> ast.plot_type
         PlotType.LINE
     """
-    lexer = Lexer(query)
-    tokens = list(lexer.tokenize())
-    parser = Parser(tokens)
-    return parser.parse()
+    with _parse_cache_lock:
+        cached = _parse_cache.get(query)
+        if cached is not None:
+            _parse_cache.move_to_end(query)
+
+    if cached is None:
+        try:
+            cached = _parse_uncached(query)
+        except ParseError as e:
+            cached = e
+        with _parse_cache_lock:
+            _parse_cache[query] = cached
+            while len(_parse_cache) > PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+
+    if isinstance(cached, ParseError):
+        raise ParseError(cached.message, cached.position)
+    return cached
+
+
+def clear_parse_cache() -> None:
+    """Clear the parse cache."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
+
+
+# =============================================================================
+# Multi-Query Scripts
+# =============================================================================
+
+# WITH keywords outside string literals start a new query in a script
+_QUERY_SPLIT_RE = re.compile(r"""'[^']*'|"[^"]*"|\bWITH\b""", re.IGNORECASE)
+
+
+def split_script(text: str) -> List[Tuple[int, str]]:
+    """
+    Split a script into its individual queries.
+
+    Every query starts with a WITH clause, so a script is split at each
+    WITH keyword that isn't inside a string literal. Text before the first
+    WITH (if any) is returned as its own chunk so it surfaces as a parse
+    error rather than being silently dropped.
+
+    Args:
+        text: Script text containing one or more queries
+
+    Returns:
+        List of (offset, query_text) tuples in script order, where offset
+        is the position of the query within the script. Blank chunks are
+        skipped.
+    """
+    boundaries = [
+        m.start() for m in _QUERY_SPLIT_RE.finditer(text)
+        if m.group()[0] not in "'\""
+    ]
+    starts = [0] + boundaries
+    ends = boundaries + [len(text)]
+    queries = []
+    for start, end in zip(starts, ends):
+        chunk = text[start:end]
+        stripped = chunk.lstrip()
+        if stripped.strip():
+            offset = start + len(chunk) - len(stripped)
+            queries.append((offset, stripped.rstrip()))
+    return queries
+
+
+def parse_script(text: str) -> List[PlotQuery]:
+    """
+    Parse a script containing one or more PlotQL queries.
+
+    Example:
+        >>> queries = parse_script('''
+        ...     WITH source('a.csv') PLOT y AGAINST x
+        ...     WITH source('b.csv') PLOT y AGAINST x AS 'bar'
+        ... ''')
+        >>> len(queries)
+        2
+
+    Raises:
+        ParseError: If any query is invalid. The position is relative to
+            the start of the script.
+    """
+    queries = []
+    for offset, query_text in split_script(text):
+        try:
+            queries.append(parse(query_text))
+        except ParseError as e:
+            raise ParseError(e.message, offset + e.position)
+    return queries
+
+
+# =============================================================================
+# Incremental Parsing with Diagnostics
+# =============================================================================
+
+@dataclass
+class Diagnostic:
+    """A parse problem located in the query text."""
+    message: str
+    start: int  # Character offset where the problem starts
+    end: int    # Character offset just past the problem
+
+
+@dataclass
+class ParseResult:
+    """Outcome of a recovering parse: the AST if valid, plus all diagnostics."""
+    query: Optional[PlotQuery]
+    diagnostics: List[Diagnostic]
+
+    @property
+    def ok(self) -> bool:
+        """True if the text parsed without any diagnostics."""
+        return not self.diagnostics
+
+
+# Block boundaries: a PLOT keyword outside of string literals. Strings are
+# matched (and skipped) first so a quoted 'PLOT' doesn't split a block.
+_BLOCK_SPLIT_RE = re.compile(r"""'[^']*'|"[^"]*"|\bPLOT\b""", re.IGNORECASE)
+
+# A parsed block: its AST node (or None) and its error (relative offsets)
+_BlockResult = Tuple[Optional[object], Optional[Diagnostic]]
+
+
+class IncrementalParser:
+    """
+    Error-recovering parser for live validation of an editor buffer.
+
+    The buffer is split into blocks - the WITH header and its REFRESH
+    clause, then one block per PLOT clause with its FILTER/FORMAT - and
+    each block is parsed on its own.
+    Block results are cached by block text, so after an edit only the
+    changed block is lexed and parsed again, and an error in one block
+    doesn't hide errors (or valid series) in the others. Like parse(),
+    results share their series with the cache: treat them as read-only.
+
+    Example:
+        parser = IncrementalParser()
+        result = parser.parse(editor_text)
+        for diag in result.diagnostics:
+            underline(diag.start, diag.end, diag.message)
+    """
+
+    def __init__(self, max_blocks: int = 512) -> None:
+        self.max_blocks = max_blocks
+        self._blocks: OrderedDict[Tuple[bool, str], _BlockResult] = OrderedDict()
+
+    def parse(self, text: str) -> ParseResult:
+        """
+        Parse text, recovering from errors at block boundaries.
+
+        Returns:
+            ParseResult with the PlotQuery (None if any block failed) and
+            diagnostics with absolute character offsets.
+        """
+        boundaries = [
+            m.start() for m in _BLOCK_SPLIT_RE.finditer(text)
+            if m.group()[0] not in "'\""
+        ]
+        starts = [0] + boundaries
+        ends = boundaries + [len(text)]
+
+        diagnostics: List[Diagnostic] = []
+        source: Optional[SourceRef] = None
+        refresh: Optional[float] = None
+        series_list: List[PlotSeries] = []
+
+        for index, (start, end) in enumerate(zip(starts, ends)):
+            is_header = index == 0
+            node, error = self._parse_block(text[start:end], is_header)
+            if error is not None:
+                diagnostics.append(Diagnostic(
+                    message=error.message,
+                    start=start + error.start,
+                    end=start + error.end,
+                ))
+            elif is_header:
+                source, refresh = node
+            else:
+                series_list.append(node)
+
+        if not boundaries and not diagnostics:
+            end = len(text.rstrip())
+            diagnostics.append(Diagnostic(
+                message="Expected at least one PLOT clause",
+                start=end,
+                end=end + 1,
+            ))
+
+        query = None
+        if not diagnostics:
+            query = PlotQuery(source=source, series=series_list, refresh=refresh)
+        return ParseResult(query=query, diagnostics=diagnostics)
+
+    def _parse_block(self, block: str, is_header: bool) -> _BlockResult:
+        """Parse one block, using the cached result if the text is unchanged."""
+        key = (is_header, block)
+        cached = self._blocks.get(key)
+        if cached is not None:
+            self._blocks.move_to_end(key)
+            return cached
+
+        result = self._parse_block_uncached(block, is_header)
+        self._blocks[key] = result
+        while len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _parse_block_uncached(block: str, is_header: bool) -> _BlockResult:
+        """Lex and parse a single block, converting failures to a diagnostic."""
+        try:
+            tokens = list(Lexer(block).tokenize())
+        except ParseError as e:
+            return None, Diagnostic(e.message, e.position, e.position + 1)
+
+        parser = Parser(tokens)
+        try:
+            if is_header:
+                node = (parser.parse_with_clause(), parser.parse_refresh_clause())
+            else:
+                x_col, y_col, plot_type = parser.parse_plot_clause()
+                node = PlotSeries(
+                    x_column=x_col,
+                    y_column=y_col,
+                    plot_type=plot_type,
+                    filter=parser.parse_filter_clause(),
+                    format=parser.parse_format_clause(),
+                )
+            if parser.current is not None:
+                raise ParseError(
+                    f"Unexpected token: {parser.current.value!r}",
+                    parser.current.position
+                )
+        except ParseError as e:
+            # Prefer the token the error points at; errors raised without a
+            # position (0) refer to wherever the parser stopped
+            token = next((t for t in tokens if t.position == e.position), None)
+            if token is None or e.position == 0:
+                token = parser.current
+            if token is None:
+                # Ran out of input - point just past the block's last token
+                end = len(block.rstrip())
+                return None, Diagnostic(e.message, end, end + 1)
+            return None, Diagnostic(e.message, token.position, token.position + len(token.value))
+
+        return node, None
@@ -0,0 +1,347 @@
+"""
+Multi-resolution aggregates of large line series.
+
+A pyramid holds the count, min, max and mean of a line's y values in x
+buckets of power-of-two widths: a base level of about PYRAMID_BASE_BUCKETS
+buckets across the line, then levels of ever wider buckets up to a few
+hundred. Drawing the line at a pixel width coarser than the base level
+reads one level - a few thousand rows - instead of loading the source.
+
+Pyramids are built once from a loaded source, stored on disk as Parquet
+(one row group range per level, so a level is read without the others),
+and rebuilt when the source's fingerprint changes. The least recently used
+pyramids are deleted once the store outgrows PYRAMID_MAX_BYTES; deleting
+the directory clears it by hand.
+
+Usage:
+    store = PyramidStore()
+    store.build(key, fingerprint, x, y, row_count)
+    pyramid = store.get(key, fingerprint)
+    if pyramid is not None:
+        line = pyramid.line(pyramid.low, pyramid.high, resolution=800)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+import polars as pl
+
+from plotql.core.utils import TimestampInfo
+
+
+# Where pyramids are stored
+PYRAMID_DIR = Path.home() / ".cache" / "plotql" / "pyramids"
+
+# Lines with fewer points are cheap to draw from the source
+PYRAMID_MIN_ROWS = 1_000_000
+
+# Buckets across a line at the finest level
+PYRAMID_BASE_BUCKETS = 2 ** 16
+
+# Levels stop once a line fits in this many buckets
+PYRAMID_TOP_BUCKETS = 2 ** 8
+
+# Pyramids are deleted, least recently used first, past this total size
+PYRAMID_MAX_BYTES = 1024 ** 3
+
+# Bumped when the stored layout changes, so old pyramids are rebuilt
+PYRAMID_VERSION = 1
+
+
+@dataclass
+class Pyramid:
+    """A stored pyramid's metadata."""
+    path: Path  # Parquet file holding every level
+    fingerprint: str  # Source fingerprint it was built from
+    base_level: int  # Finest level; bucket width is 2 ** level
+    top_level: int  # Coarsest level
+    low: float  # Smallest x value
+    high: float  # Largest x value
+    row_count: int  # Rows in the source
+    filtered_count: int  # Points on the line
+    x_timestamp: Optional[TimestampInfo] = None  # Set if x holds epoch timestamps
+
+    def level_for(self, span: float, resolution: int) -> Optional[int]:
+        """
+        Choose the coarsest level with at least one bucket per pixel.
+
+        Args:
+            span: Width of the visible x range
+            resolution: Plot width in pixels
+
+        Returns:
+            The level, or None if pixels are finer than the base level, so
+            the raw data is needed.
+        """
+        if not span > 0:
+            return None
+        level = math.floor(math.log2(span / resolution))
+        if level < self.base_level:
+            return None
+        return min(level, self.top_level)
+
+    def line(
+        self,
+        low: float,
+        high: float,
+        resolution: int,
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, int]]:
+        """
+        Read the points that draw the line between low and high.
+
+        Each bucket contributes its minimum and maximum, at their own x
+        positions, so the line covers the same pixels as the raw data.
+
+        Args:
+            low: Lower bound of the visible x range
+            high: Upper bound of the visible x range
+            resolution: Plot width in pixels
+
+        Returns:
+            Tuple of (x, y, point count in range), or None if the range
+            needs the raw data.
+        """
+        level = self.level_for(high - low, resolution)
+        if level is None:
+            return None
+        width = 2.0 ** level
+        buckets = (
+            pl.scan_parquet(self.path)
+            .filter(
+                (pl.col("level") == level)
+                & pl.col("bucket").is_between(math.floor(low / width), math.floor(high / width))
+            )
+            .collect()
+        )
+        points = pl.concat([
+            buckets.select(x=pl.col("min_x"), y=pl.col("min")),
+            buckets.select(x=pl.col("max_x"), y=pl.col("max")),
+        ]).unique(maintain_order=True).filter(pl.col("x").is_between(low, high)).sort("x")
+        return points["x"].to_numpy(), points["y"].to_numpy(), int(buckets["count"].sum())
+
+
+def build_levels(x: np.ndarray, y: np.ndarray) -> Tuple[pl.DataFrame, int]:
+    """
+    Aggregate a line into buckets at every level.
+
+    Args:
+        x: Finite x values
+        y: Finite y values
+
+    Returns:
+        Tuple of (one row per bucket per level, sorted by level then
+        bucket; base level).
+    """
+    span = float(x.max() - x.min())
+    base = math.ceil(math.log2(span / PYRAMID_BASE_BUCKETS)) if span > 0 else 0
+    points = pl.DataFrame({"x": x, "y": y})
+    level_frame = (
+        points.group_by(bucket=(pl.col("x") / 2.0 ** base).floor().cast(pl.Int64))
+        .agg(
+            count=pl.len(),
+            min=pl.col("y").min(),
+            max=pl.col("y").max(),
+            mean=pl.col("y").mean(),
+            min_x=pl.col("x").get(pl.col("y").arg_min()),
+            max_x=pl.col("x").get(pl.col("y").arg_max()),
+        )
+    )
+    levels = [level_frame.with_columns(level=pl.lit(base, pl.Int16))]
+    level = base
+    while len(level_frame) > PYRAMID_TOP_BUCKETS:
+        # Each bucket merges the two below it
+        level += 1
+        level_frame = (
+            level_frame.group_by(bucket=pl.col("bucket") // 2)
+            .agg(
+                count=pl.col("count").sum(),
+                min=pl.col("min").min(),
+                max=pl.col("max").max(),
+                mean=(pl.col("mean") * pl.col("count")).sum() / pl.col("count").sum(),
+                min_x=pl.col("min_x").get(pl.col("min").arg_min()),
+                max_x=pl.col("max_x").get(pl.col("max").arg_max()),
+            )
+        )
+        levels.append(level_frame.with_columns(level=pl.lit(level, pl.Int16)))
+    return pl.concat(levels).sort("level", "bucket"), base
+
+
+class PyramidStore:
+    """
+    Pyramids of large line series, stored on disk.
+
+    Each pyramid is identified by a key naming its source, x and y columns
+    and filter, and is valid for one source fingerprint; a pyramid built
+    from an older version of the source is ignored and replaced on the
+    next build. Reading a pyramid marks it as used, and each build deletes
+    the least recently used pyramids until the store fits max_bytes.
+
+    Thread-safe, and safe to share between processes.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        min_rows: int = PYRAMID_MIN_ROWS,
+        max_bytes: Optional[int] = PYRAMID_MAX_BYTES,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            directory: Where pyramids are stored. Defaults to PYRAMID_DIR.
+            min_rows: Lines with fewer points aren't worth a pyramid.
+            max_bytes: Size the stored pyramids are pruned to after each
+                build. None never prunes.
+        """
+        self.directory = directory or PYRAMID_DIR
+        self.min_rows = min_rows
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key: str, fingerprint: str) -> Optional[Pyramid]:
+        """
+        Get the pyramid built for a key from this version of its source.
+
+        Returns:
+            The pyramid, or None if there is none or it's out of date.
+        """
+        path = self._path(key)
+        try:
+            meta = json.loads(path.with_suffix(".json").read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get("version") != PYRAMID_VERSION or meta.get("fingerprint") != fingerprint:
+            return None
+        try:
+            # Recently read pyramids are the last to be pruned
+            os.utime(path)
+        except OSError:
+            return None
+        x_timestamp = meta["x_timestamp"]
+        return Pyramid(
+            path=path,
+            fingerprint=fingerprint,
+            base_level=meta["base_level"],
+            top_level=meta["top_level"],
+            low=meta["low"],
+            high=meta["high"],
+            row_count=meta["row_count"],
+            filtered_count=meta["filtered_count"],
+            x_timestamp=TimestampInfo(**x_timestamp) if x_timestamp else None,
+        )
+
+    def build(
+        self,
+        key: str,
+        fingerprint: str,
+        x: pl.Series,
+        y: pl.Series,
+        row_count: int,
+        x_timestamp: Optional[TimestampInfo] = None,
+    ) -> Optional[Pyramid]:
+        """
+        Build and store the pyramid of a line, if it's large enough.
+
+        Args:
+            key: Identity of the line (source, columns, filter)
+            fingerprint: Fingerprint of the source the line was read from
+            x: X values, numeric (epoch integers for timestamps)
+            y: Y values, numeric
+            row_count: Rows in the source
+            x_timestamp: Timestamp info of the x axis, if it has one
+
+        Returns:
+            The new pyramid, or None if the line is too small or not
+            numeric.
+        """
+        if len(x) < self.min_rows or not (x.dtype.is_numeric() and y.dtype.is_numeric()):
+            return None
+        xs = np.asarray(x.to_numpy(), dtype=float)
+        ys = np.asarray(y.to_numpy(), dtype=float)
+        finite = np.isfinite(xs) & np.isfinite(ys)
+        if not finite.any():
+            return None
+        xs, ys = xs[finite], ys[finite]
+
+        levels, base = build_levels(xs, ys)
+        pyramid = Pyramid(
+            path=self._path(key),
+            fingerprint=fingerprint,
+            base_level=base,
+            top_level=int(levels["level"].max()),
+            low=float(xs.min()),
+            high=float(xs.max()),
+            row_count=row_count,
+            filtered_count=len(xs),
+            x_timestamp=x_timestamp,
+        )
+        meta = {
+            "version": PYRAMID_VERSION,
+            "fingerprint": fingerprint,
+            "base_level": pyramid.base_level,
+            "top_level": pyramid.top_level,
+            "low": pyramid.low,
+            "high": pyramid.high,
+            "row_count": row_count,
+            "filtered_count": pyramid.filtered_count,
+            "x_timestamp": asdict(x_timestamp) if x_timestamp else None,
+        }
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Metadata last, since it vouches for the data
+            self._write(
+                pyramid.path,
+                lambda temp: levels.write_parquet(temp, row_group_size=PYRAMID_TOP_BUCKETS * 16),
+            )
+            self._write(pyramid.path.with_suffix(".json"), lambda temp: temp.write_text(json.dumps(meta)))
+            if self.max_bytes is not None:
+                self._prune(keep=pyramid.path)
+        return pyramid
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha1(key.encode()).hexdigest()}.parquet"
+
+    def _write(self, path: Path, write: Callable[[Path], object]) -> None:
+        """
+        Write a file aside and move it into place, so readers never see a
+        partial file. The temporary name is unique, so processes building
+        the same pyramid don't write over each other's files.
+        """
+        with tempfile.NamedTemporaryFile(dir=self.directory, suffix=".tmp", delete=False) as file:
+            temp = Path(file.name)
+        try:
+            write(temp)
+            os.replace(temp, path)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+
+    def _prune(self, keep: Path) -> None:
+        """Delete the least recently used pyramids until the store fits max_bytes."""
+        pyramids = []
+        for path in self.directory.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Pruned by another process
+            pyramids.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in pyramids)
+        for _, size, path in sorted(pyramids):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            # Metadata first, so the pyramid is never found without its data
+            path.with_suffix(".json").unlink(missing_ok=True)
+            path.unlink(missing_ok=True)
+            total -= size
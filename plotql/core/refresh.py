@@ -0,0 +1,210 @@
+"""
+Periodic re-execution of a query over a growing source.
+
+A Refresher keeps a query's source loaded between runs and, on each
+refresh, fetches only what was added since the previous one (see
+Connector.load_increment): rows past the largest x value seen on
+ClickHouse, the bytes appended to a CSV or NDJSON file. The query is
+re-executed only when the fetched data changed, so a refresh of an idle
+source costs one cheap probe and no rendering.
+
+Usage:
+    from plotql.core import parse
+    from plotql.core.refresh import Refresher
+
+    query = parse("WITH source('app.csv') REFRESH EVERY 5s PLOT latency AGAINST ts")
+    refresher = Refresher(query)
+    data = refresher.run()  # First run: loads the file
+    data = refresher.refresh()  # None unless rows were added
+"""
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+
+import polars as pl
+
+from plotql.core.ast import PlotQuery, PlotType, SourceRef
+from plotql.core.executor import CancelToken, PlotData, _call_connector, execute
+
+if TYPE_CHECKING:
+    from plotql.core.ast import DataSource, WhereClause
+
+
+class LiveSource:
+    """
+    One source's rows, kept up to date by fetching increments.
+
+    Stands in for a SourceCache when executing the query it was made for:
+    load() returns the rows fetched so far, with a fingerprint that changes
+    whenever they do.
+    """
+
+    def __init__(
+        self,
+        source: Union[SourceRef, "DataSource"],
+        column: Optional[str] = None,
+        filters: Optional[List["WhereClause"]] = None,
+    ) -> None:
+        """
+        Initialize the source.
+
+        Args:
+            source: The source to follow
+            column: A column whose values only increase as rows are added,
+                    if there is one; lets databases fetch just the new rows
+            filters: Filters to push down to the connector, as for load_data()
+        """
+        self.source = source
+        self.column = column
+        self.filters = filters
+        self.frame: Optional[pl.DataFrame] = None
+        # Bumped whenever frame changes
+        self.version = 0
+        self._cursor: Any = None
+
+    def poll(self, cancel: Optional[CancelToken] = None) -> bool:
+        """
+        Fetch the rows added since the last poll.
+
+        Returns:
+            True if the rows changed.
+
+        Raises:
+            ExecutionError: If the source can't be loaded.
+            ExecutionCancelled: If the token is cancelled during the load.
+        """
+        increment = _call_connector(
+            self.source,
+            lambda connector, config: connector.load_increment(
+                config, self._cursor, self.column, self.filters
+            ),
+            cancel,
+        )
+        self._cursor = increment.cursor
+        rows = increment.rows
+
+        if increment.replace or self.frame is None:
+            changed = self.frame is None or not rows.equals(self.frame)
+            frame = rows
+        else:
+            if not len(rows) and not increment.retract:
+                return False
+            frame = self.frame
+            if increment.retract:
+                frame = frame.head(max(len(frame) - increment.retract, 0))
+            if len(rows):
+                frame = pl.concat([frame, rows], how="vertical_relaxed")
+            changed = True
+        if increment.max_rows is not None:
+            frame = frame.tail(increment.max_rows)
+
+        if changed:
+            self.frame = frame
+            self.version += 1
+        return changed
+
+    def load(
+        self,
+        source: Union[SourceRef, "DataSource"],
+        filters: Optional[List["WhereClause"]] = None,
+        cancel: Optional[CancelToken] = None,
+    ) -> Tuple[pl.DataFrame, str]:
+        """
+        Return the rows fetched so far, polling first if there are none.
+
+        Has the signature of SourceCache.load so it can be passed to
+        execute(); source and filters are ignored, the rows being those of
+        the source this was made for.
+        """
+        if self.frame is None:
+            self.poll(cancel)
+        return self.frame, f"live:{id(self)}:{self.version}"
+
+
+def tail_column(query: PlotQuery) -> Optional[str]:
+    """
+    The column new rows of the query's source can be found past, if any.
+
+    That's the x column when every series is a line against the same
+    one: lines are drawn in x order, so new points lie past the last.
+    """
+    columns = {series.x_column.name for series in query.series}
+    if len(columns) != 1:
+        return None
+    if any(series.plot_type != PlotType.LINE for series in query.series):
+        return None
+    return columns.pop()
+
+
+class Refresher:
+    """
+    Re-executes a query when its source has new rows.
+
+    Thread-safe; a refresh requested while another run is in progress is
+    skipped rather than queued.
+    """
+
+    def __init__(self, query: PlotQuery) -> None:
+        self.query = query
+        filters = [s.filter for s in query.series if s.filter is not None]
+        self.source = LiveSource(query.source, tail_column(query), filters)
+        self._lock = threading.Lock()
+        # Version of the source the last returned results came from
+        self._version: Optional[int] = None
+
+    def run(
+        self,
+        cancel: Optional[CancelToken] = None,
+        resolution: Optional[int] = None,
+    ) -> List[PlotData]:
+        """
+        Fetch new rows and execute the query, whether or not rows changed.
+
+        Args:
+            cancel: Optional token to abort the run
+            resolution: Plot width in pixels, as for execute()
+
+        Raises:
+            ExecutionError: If loading or executing fails.
+            ExecutionCancelled: If the token is cancelled.
+        """
+        with self._lock:
+            self.source.poll(cancel)
+            return self._execute(cancel, resolution)
+
+    def refresh(
+        self,
+        cancel: Optional[CancelToken] = None,
+        resolution: Optional[int] = None,
+    ) -> Optional[List[PlotData]]:
+        """
+        Fetch new rows and execute the query if they changed anything.
+
+        Returns:
+            The query's results, or None if the data is unchanged since
+            the last results or another run is still in progress.
+
+        Raises:
+            ExecutionError: If loading or executing fails.
+            ExecutionCancelled: If the token is cancelled.
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            self.source.poll(cancel)
+            if self.source.version == self._version:
+                return None
+            return self._execute(cancel, resolution)
+        finally:
+            self._lock.release()
+
+    def _execute(
+        self,
+        cancel: Optional[CancelToken],
+        resolution: Optional[int],
+    ) -> List[PlotData]:
+        version = self.source.version
+        data = execute(self.query, cache=self.source, cancel=cancel, resolution=resolution)
+        self._version = version
+        return data
@@ -0,0 +1,286 @@
+"""
+Parallel rendering of independent charts.
+
+Each chart is rendered in a pool of worker processes, each holding its own
+engine, so a set of N charts renders in roughly the time of the slowest
+one on an N-core machine. Workers draw every chart into its tile of one
+shared memory canvas, so pixels come back without being pickled or encoded,
+and a dashboard grid is assembled as the charts finish.
+
+Usage:
+    from plotql.core import RenderService
+
+    with RenderService() as service:
+        charts = service.render([data_a, data_b, data_c])
+        grid, errors = service.render_grid([data_a, data_b, data_c], columns=2)
+    grid.save("dashboard.png")
+"""
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image, ImageColor
+
+from plotql.core.engines import Engine, get_engine, set_engine
+from plotql.core.executor import PlotData
+from plotql.themes import THEME
+
+PlotDataInput = Union[PlotData, List[PlotData]]
+
+# Position of a chart on the canvas: (top, left, width, height) in pixels
+Tile = Tuple[int, int, int, int]
+
+
+@dataclass
+class RenderedChart:
+    """Outcome of rendering one chart."""
+    index: int  # Position of the chart in the request (0-based)
+    image: Optional[Image.Image] = None  # RGBA image, if rendering succeeded
+    error: Optional[str] = None  # Error message, if rendering failed
+
+    @property
+    def ok(self) -> bool:
+        """True if the chart was rendered."""
+        return self.error is None
+
+
+def _init_worker(engine: Engine) -> None:
+    """Worker process initializer: install the parent's rendering engine."""
+    set_engine(engine)
+
+
+def create_render_pool(workers: int, engine: Engine) -> ProcessPoolExecutor:
+    """
+    Start a pool of render worker processes.
+
+    Args:
+        workers: Number of processes
+        engine: Engine installed in every worker, so get_engine() there
+            returns an engine configured like the caller's
+
+    Returns:
+        The pool. Shut it down when done.
+    """
+    # Spawn rather than fork: forking after Polars has started its
+    # thread pool can deadlock the child
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(engine,),
+    )
+
+
+def _render_tile(engine: Engine, data: PlotDataInput, tile: Tile, canvas: np.ndarray) -> None:
+    """Render one chart and copy its pixels into its tile of the canvas."""
+    top, left, width, height = tile
+    with engine.render(data, width, height) as result:
+        pixels, rendered_width, rendered_height = result.to_rgba()
+        if (rendered_width, rendered_height) != (width, height):
+            raise ValueError(
+                f"Engine rendered {rendered_width}x{rendered_height}, "
+                f"expected {width}x{height}"
+            )
+        canvas[top:top + height, left:left + width] = np.frombuffer(
+            pixels, dtype=np.uint8
+        ).reshape(height, width, 4)
+
+
+def _render_shared_tile(
+    data: PlotDataInput,
+    tile: Tile,
+    canvas_name: str,
+    canvas_shape: Tuple[int, int, int],
+) -> Optional[str]:
+    """
+    Worker task: render one chart into a shared memory canvas.
+
+    Returns:
+        The error message if rendering failed, else None.
+    """
+    memory = SharedMemory(name=canvas_name)
+    canvas = np.ndarray(canvas_shape, dtype=np.uint8, buffer=memory.buf)
+    error = None
+    try:
+        _render_tile(get_engine(), data, tile, canvas)
+    except Exception as e:
+        # Reported rather than raised: the traceback would keep the canvas
+        # view alive, and shared memory can't be closed while it's exported
+        error = str(e)
+    del canvas
+    memory.close()
+    return error
+
+
+class RenderService:
+    """
+    Renders independent charts in parallel.
+
+    Worker processes start on first use and are reused for every render
+    until the service is closed, so the cost of importing the engine is
+    paid once. Use the service as a context manager, or call close().
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        engine: Optional[Engine] = None,
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            workers: Number of render processes. Defaults to the CPU
+                count; 1 renders in the calling process.
+            engine: Engine to render with. Defaults to get_engine().
+        """
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        self._engine = engine or get_engine()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def render(
+        self,
+        data_sets: Sequence[PlotDataInput],
+        width: int = 800,
+        height: int = 600,
+    ) -> List[RenderedChart]:
+        """
+        Render each data set as its own chart.
+
+        A failing chart doesn't stop the others: its error is recorded in
+        its RenderedChart.
+
+        Args:
+            data_sets: PlotData (or list of PlotData for layered series) per chart
+            width: Chart width in pixels
+            height: Chart height in pixels
+
+        Returns:
+            One RenderedChart per data set, in order.
+        """
+        canvas, errors = self._render_canvas(data_sets, width, height, columns=1)
+        return [
+            RenderedChart(
+                index=i,
+                image=None if error else Image.fromarray(
+                    canvas[i * height:(i + 1) * height], "RGBA"
+                ),
+                error=error,
+            )
+            for i, error in enumerate(errors)
+        ]
+
+    def render_grid(
+        self,
+        data_sets: Sequence[PlotDataInput],
+        columns: int,
+        width: int = 800,
+        height: int = 600,
+    ) -> Tuple[Image.Image, List[Optional[str]]]:
+        """
+        Render charts into a single image, laid out in a grid.
+
+        Charts fill the grid row by row. Failed charts leave their tile
+        blank.
+
+        Args:
+            data_sets: PlotData (or list of PlotData for layered series) per chart
+            columns: Number of charts per row
+            width: Width of each chart in pixels
+            height: Height of each chart in pixels
+
+        Returns:
+            Tuple of (grid image, error message per chart or None if it
+            rendered).
+
+        Raises:
+            ValueError: If columns is not positive.
+        """
+        if columns < 1:
+            raise ValueError(f"columns must be a positive integer, got {columns}")
+        canvas, errors = self._render_canvas(data_sets, width, height, columns)
+        return Image.fromarray(canvas, "RGBA"), errors
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "RenderService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = create_render_pool(self._workers, self._engine)
+        return self._pool
+
+    def _render_canvas(
+        self,
+        data_sets: Sequence[PlotDataInput],
+        width: int,
+        height: int,
+        columns: int,
+    ) -> Tuple[np.ndarray, List[Optional[str]]]:
+        """
+        Render charts into the tiles of one canvas.
+
+        Returns:
+            Tuple of (canvas of shape (rows * height, columns * width, 4),
+            error message per chart or None if it rendered).
+        """
+        count = len(data_sets)
+        columns = max(1, min(columns, count))
+        rows = math.ceil(count / columns)
+        shape = (rows * height, columns * width, 4)
+        tiles = [
+            ((i // columns) * height, (i % columns) * width, width, height)
+            for i in range(count)
+        ]
+        background = (*ImageColor.getrgb(THEME.background)[:3], 255)
+
+        if self._workers == 1 or count <= 1:
+            canvas = np.empty(shape, dtype=np.uint8)
+            canvas[:] = background
+            errors: List[Optional[str]] = []
+            for data, tile in zip(data_sets, tiles):
+                try:
+                    _render_tile(self._engine, data, tile, canvas)
+                    errors.append(None)
+                except Exception as e:
+                    errors.append(str(e))
+            return canvas, errors
+
+        memory = SharedMemory(create=True, size=math.prod(shape))
+        shared = None
+        try:
+            shared = np.ndarray(shape, dtype=np.uint8, buffer=memory.buf)
+            shared[:] = background
+            pool = self._get_pool()
+            futures: List[Future] = [
+                pool.submit(_render_shared_tile, data, tile, memory.name, shape)
+                for data, tile in zip(data_sets, tiles)
+            ]
+            errors = []
+            for future in futures:
+                try:
+                    errors.append(future.result())
+                except Exception as e:
+                    errors.append(str(e))
+            canvas = shared.copy()
+        finally:
+            # Views must be released before the memory can be closed
+            shared = None
+            memory.close()
+            memory.unlink()
+        return canvas, errors
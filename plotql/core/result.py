@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from io import BytesIO
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Tuple
 
 
 class PlotResult:
@@ -26,6 +26,12 @@ class PlotResult:
         result.figure.set_title("Custom") # Modify underlying figure
         result.show()                     # Display interactively
         png_bytes = result.to_bytes()     # Get raw bytes
+
+    Results hold the rendered figure until closed. Use close(), or a with
+    block, when rendering repeatedly so memory is released promptly:
+
+        with render(data) as result:
+            result.save("plot.png")
     """
 
     def __init__(
@@ -35,6 +41,7 @@ class PlotResult:
         to_bytes_func: Callable[[Any, str], bytes],
         show_func: Callable[[Any], None],
         close_func: Callable[[Any], None],
+        to_rgba_func: Optional[Callable[[Any], Tuple[memoryview, int, int]]] = None,
     ) -> None:
         """
         Initialize PlotResult.
@@ -45,12 +52,17 @@ class PlotResult:
             to_bytes_func: Function to export figure to bytes (figure, format) -> bytes
             show_func: Function to display figure interactively (figure) -> None
             close_func: Function to close figure and free memory (figure) -> None
+            to_rgba_func: Optional function exposing the rendered pixels
+                (figure) -> (buffer, width, height), where buffer holds
+                width * height RGBA pixels, row-major. Engines that can't
+                provide one fall back to decoding PNG bytes.
         """
         self._figure = figure
         self._save_func = save_func
         self._to_bytes_func = to_bytes_func
         self._show_func = show_func
         self._close_func = close_func
+        self._to_rgba_func = to_rgba_func
 
     @property
     def figure(self) -> Any:
@@ -74,13 +86,41 @@ class PlotResult:
         """
         return self._to_bytes_func(self._figure, format)
 
+    def to_rgba(self) -> Tuple[memoryview, int, int]:
+        """
+        Get the rendered pixels as a raw RGBA buffer.
+
+        Skips image encoding entirely where the engine supports it. The
+        buffer may share memory with the engine's canvas, so it is only
+        valid until the figure is drawn again.
+
+        Returns:
+            Tuple of (buffer, width, height)
+        """
+        if self._to_rgba_func is not None:
+            return self._to_rgba_func(self._figure)
+        image = self._decode_png().convert("RGBA")
+        return memoryview(image.tobytes()), image.width, image.height
+
     def to_image(self) -> Any:
         """
         Convert to PIL Image.
 
+        Built directly on the RGBA buffer when the engine provides one (no
+        PNG encode/decode and no copy); call .copy() on the image if the
+        figure will be redrawn while the image is still in use.
+
         Returns:
             PIL Image object
         """
+        if self._to_rgba_func is None:
+            return self._decode_png()
+
+        from PIL import Image
+        buffer, width, height = self._to_rgba_func(self._figure)
+        return Image.frombuffer("RGBA", (width, height), buffer, "raw", "RGBA", 0, 1)
+
+    def _decode_png(self) -> Any:
         from PIL import Image
         return Image.open(BytesIO(self.to_bytes("png")))
 
@@ -111,6 +151,12 @@ class PlotResult:
         """
         self._close_func(self._figure)
 
+    def __enter__(self) -> "PlotResult":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _repr_png_(self) -> bytes:
         """Jupyter notebook PNG display support."""
         return self.to_bytes("png")
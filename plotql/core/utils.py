@@ -6,9 +6,12 @@ Contains data transformations for rendering and timestamp detection.
 from __future__ import annotations
 
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import polars as pl
 
 from plotql.themes import THEME
@@ -107,8 +110,38 @@ def map_to_sizes(
 # Default color palette for categorical colors (5 distinct colors)
 BUCKET_COLORS = ["blue", "green", "yellow", "pink", "teal"]
 
+# Palette shared by the rendering engines, derived from the theme
+ENGINE_COLORS = {
+    "background": THEME.background,
+    "paper": THEME.background,
+    "text": THEME.text,
+    "grid": THEME.grid,
+    "axes": THEME.axes,
+    # Chart colors for programmatic access
+    "primary": THEME.chart_colors["primary"],
+    "secondary": THEME.chart_colors["secondary"],
+    "tertiary": THEME.chart_colors["tertiary"],
+    "quaternary": THEME.chart_colors["quaternary"],
+    "accent": THEME.chart_colors["accent"],
+}
+
+
+def palette_color(color_name: Optional[str]) -> str:
+    """
+    Convert a user color name to its theme palette color.
+
+    Args:
+        color_name: Color name (e.g., "blue", "red") or None
+
+    Returns:
+        Hex color string, the primary color for None or unknown names
+    """
+    if not color_name:
+        return ENGINE_COLORS["primary"]
+    return THEME.color_map.get(color_name.lower(), ENGINE_COLORS["primary"])
 
-def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """Convert hex color to RGB tuple."""
     hex_color = hex_color.lstrip('#')
     return (
@@ -119,8 +152,8 @@ def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
 
 
 # Gradient endpoints from theme (converted to RGB for interpolation)
-GRADIENT_START = _hex_to_rgb(THEME.gradient[0])
-GRADIENT_END = _hex_to_rgb(THEME.gradient[1])
+GRADIENT_START = hex_to_rgb(THEME.gradient[0])
+GRADIENT_END = hex_to_rgb(THEME.gradient[1])
 
 
 def interpolate_color(t: float) -> str:
@@ -214,6 +247,171 @@ def map_to_colors(
         return [value_to_color[v] for v in values], False
 
 
+def gradient_rgb(t: np.ndarray) -> np.ndarray:
+    """
+    Vectorized interpolate_color for arrays.
+
+    Args:
+        t: Array of values between 0 and 1 (clipped)
+
+    Returns:
+        Array of shape t.shape + (3,) with RGB channels in [0, 1]
+    """
+    t = np.clip(np.asarray(t, dtype=float), 0.0, 1.0)[..., None]
+    start = np.array(GRADIENT_START, dtype=float) / 255
+    end = np.array(GRADIENT_END, dtype=float) / 255
+    return start + t * (end - start)
+
+
+def bin_points(
+    x: np.ndarray,
+    y: np.ndarray,
+    shape: Tuple[int, int],
+    extent: Tuple[float, float, float, float],
+    weights: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Aggregate points into a 2D grid of cells.
+
+    Cost is one pass over the points plus one over the cells, so a grid the
+    size of the plot area can summarize any number of points.
+
+    Args:
+        x: Finite x coordinates
+        y: Finite y coordinates
+        shape: Grid size as (rows, cols)
+        extent: Grid bounds as (xmin, xmax, ymin, ymax); points outside
+            are clamped to the edge cells
+        weights: Optional per-point values to sum per cell
+
+    Returns:
+        (counts, sums) arrays of the grid shape. Row 0 is ymin. sums is
+        None when no weights are given.
+    """
+    rows, cols = shape
+    xmin, xmax, ymin, ymax = extent
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    xi = ((x - xmin) * (cols / (xmax - xmin))).astype(np.intp)
+    yi = ((y - ymin) * (rows / (ymax - ymin))).astype(np.intp)
+    np.clip(xi, 0, cols - 1, out=xi)
+    np.clip(yi, 0, rows - 1, out=yi)
+    cells = yi * cols + xi
+
+    counts = np.bincount(cells, minlength=rows * cols).reshape(rows, cols)
+    sums = None
+    if weights is not None:
+        sums = np.bincount(
+            cells, weights=np.asarray(weights, dtype=float), minlength=rows * cols
+        ).reshape(rows, cols)
+    return counts, sums
+
+
+# Lines with more points than this per pixel column are decimated
+LINE_DECIMATE_FACTOR = 4
+
+
+def decimate_line(x: np.ndarray, y: np.ndarray, buckets: int) -> np.ndarray:
+    """
+    Select the points of a line that matter when drawn `buckets` pixels wide.
+
+    The x range is split into equal buckets (one per pixel column) and each
+    keeps its first, last, minimum and maximum points. Drawn at that width,
+    the reduced line covers the same pixels as the full one.
+
+    Args:
+        x: Finite x values, sorted ascending
+        y: Finite y values
+        buckets: Number of buckets, typically the plot width in pixels
+
+    Returns:
+        Sorted indices of the points to keep.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    span = x[-1] - x[0] if len(x) else 0.0
+    if len(x) <= LINE_DECIMATE_FACTOR * buckets or not span > 0:
+        return np.arange(len(x))
+
+    bucket = ((x - x[0]) * (buckets / span)).astype(np.intp)
+    np.minimum(bucket, buckets - 1, out=bucket)
+    # x is sorted, so each bucket is a contiguous run
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    ends = np.r_[starts[1:], len(x)] - 1
+    run = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(x)]))
+
+    def first_match(values: np.ndarray) -> np.ndarray:
+        # Index of the first point in each bucket equal to that bucket's value
+        matches = np.flatnonzero(y == values[run])
+        return matches[np.r_[True, run[matches[1:]] != run[matches[:-1]]]]
+
+    lowest = first_match(np.minimum.reduceat(y, starts))
+    highest = first_match(np.maximum.reduceat(y, starts))
+    return np.unique(np.concatenate([starts, ends, lowest, highest]))
+
+
+# =============================================================================
+# Histogram Binning
+# =============================================================================
+
+# Bin count when the Freedman-Diaconis rule can't be applied (zero IQR)
+HIST_DEFAULT_BINS = 10
+# Upper bound on automatically chosen bin counts
+HIST_MAX_BINS = 200
+
+
+def histogram_bins(
+    values: Union[pl.Series, Sequence],
+    bins: Optional[int] = None,
+) -> Tuple[List[float], List[int]]:
+    """
+    Bin values into equal-width bins.
+
+    Min, max and quartiles are computed with Polars and each value's bin
+    index with one vectorized expression, so nothing is sorted. Nulls and
+    NaNs are ignored.
+
+    Args:
+        values: Numeric values to bin
+        bins: Number of bins. Defaults to the Freedman-Diaconis rule
+            (bin width 2 * IQR / n^(1/3)), capped at HIST_MAX_BINS.
+
+    Returns:
+        (edges, counts): len(counts) + 1 bin edges and the count per bin.
+        Both are empty if there are no values. The last bin includes its
+        right edge.
+    """
+    if not isinstance(values, pl.Series):
+        values = pl.Series(values, strict=False)
+    values = values.cast(pl.Float64, strict=False).drop_nulls().drop_nans()
+    n = len(values)
+    if n == 0:
+        return [], []
+
+    lo, hi = values.min(), values.max()
+    if lo == hi:
+        # A single value gets a unit-wide range, as in np.histogram
+        lo, hi = lo - 0.5, hi + 0.5
+        bins = bins or 1
+
+    if bins is None:
+        iqr = values.quantile(0.75) - values.quantile(0.25)
+        width = 2 * iqr / n ** (1 / 3)
+        if width > 0:
+            bins = min(HIST_MAX_BINS, max(1, int(np.ceil((hi - lo) / width))))
+        else:
+            bins = HIST_DEFAULT_BINS
+
+    index = (
+        ((values - lo) * (bins / (hi - lo)))
+        .floor()
+        .cast(pl.Int64)
+        .clip(0, bins - 1)
+    )
+    counts = np.bincount(index.to_numpy(), minlength=bins)
+    return np.linspace(lo, hi, bins + 1).tolist(), counts.tolist()
+
+
 # =============================================================================
 # Timestamp Detection and Conversion
 # =============================================================================
@@ -224,6 +422,8 @@ class TimestampInfo:
     column_name: str
     input_format: str
     output_format: str
+    # Fraction of sampled values matching the detected format (0-1)
+    confidence: float = 1.0
 
 
 # Mapping of regex patterns to (input_format, output_format)
@@ -251,6 +451,26 @@ DATETIME_PATTERNS = [
 ]
 
 
+# Resolution of the numeric timestamps handed from the executor to engines
+TIMESTAMP_UNIT = "us"
+
+# Values taken from each of head, tail, and a random slice when detecting
+TIMESTAMP_SAMPLE_SIZE = 100
+
+# Minimum fraction of sampled values that must match a format
+TIMESTAMP_MIN_CONFIDENCE = 0.9
+
+# Mapping from DATETIME_PATTERNS format letters to Polars/chrono directives
+_FORMAT_DIRECTIVES = {
+    "Y": "%Y",
+    "m": "%m",
+    "d": "%d",
+    "H": "%H",
+    "M": "%M",
+    "S": "%S",
+}
+
+
 def detect_datetime_format(sample: str) -> Optional[Tuple[str, str]]:
     """
     Detect the datetime format of a sample string.
@@ -272,53 +492,269 @@ def is_datetime_column(series: pl.Series) -> Optional[Tuple[str, str]]:
 
     Returns (input_format, output_format) if datetime, None otherwise.
     """
+    detection = detect_column_format(series)
+    if detection is None:
+        return None
+    input_fmt, output_fmt, _ = detection
+    return input_fmt, output_fmt
+
+
+def sample_column(
+    series: pl.Series,
+    sample_size: int = TIMESTAMP_SAMPLE_SIZE,
+) -> pl.Series:
+    """
+    Take a non-null sample from the head, tail, and a random slice of a series.
+
+    Sampling across the column (rather than only the first values) catches
+    columns whose format changes partway through.
+    """
+    if len(series) <= sample_size * 3:
+        return series.drop_nulls()
+
+    parts = [
+        series.head(sample_size),
+        series.tail(sample_size),
+        series.sample(sample_size, seed=0),
+    ]
+    sample = pl.concat(parts).drop_nulls()
+    if len(sample) == 0 and series.null_count() < len(series):
+        # Sparse column - fall back to the first non-null values
+        sample = series.drop_nulls().head(sample_size)
+    return sample
+
+
+def detect_column_format(
+    series: pl.Series,
+    min_confidence: float = TIMESTAMP_MIN_CONFIDENCE,
+) -> Optional[Tuple[str, str, float]]:
+    """
+    Detect the datetime format of a column from a sample of its values.
+
+    Each pattern in DATETIME_PATTERNS is checked with a vectorized
+    str.contains over the sample, and the best match wins if the fraction
+    of matching values reaches min_confidence.
+
+    Returns (input_format, output_format, confidence) if datetime, None otherwise.
+    """
     # Check if already a Polars datetime type
     if series.dtype in (pl.Datetime, pl.Date):
-        return "Y-m-d H:M:S", "m-d H:M"
+        return "Y-m-d H:M:S", "m-d H:M", 1.0
 
-    # Check if string that looks like datetime
-    if series.dtype in (pl.Utf8, pl.String):
-        non_null = series.drop_nulls()
-        if len(non_null) == 0:
+    if series.dtype not in (pl.Utf8, pl.String):
+        return None
+
+    sample = sample_column(series)
+    if len(sample) == 0:
+        return None
+
+    sample = sample.str.strip_chars()
+    best: Optional[Tuple[str, str, float]] = None
+    for pattern, input_fmt, output_fmt in DATETIME_PATTERNS:
+        confidence = sample.str.contains(pattern).sum() / len(sample)
+        if best is None or confidence > best[2]:
+            best = (input_fmt, output_fmt, confidence)
+        if confidence == 1.0:
+            break
+
+    if best is None or best[2] < min_confidence:
+        return None
+    return best
+
+
+class TimestampDetector:
+    """
+    Timestamp detection service with a per-column result cache.
+
+    Results for string columns are cached by (source fingerprint, column name),
+    so repeated executions against an unchanged source and multiple series
+    on the same column don't re-sample it. Columns without a fingerprint are
+    always detected afresh.
+    """
+
+    def __init__(
+        self,
+        min_confidence: float = TIMESTAMP_MIN_CONFIDENCE,
+        max_entries: int = 256,
+    ) -> None:
+        self.min_confidence = min_confidence
+        self.max_entries = max_entries
+        self._cache: OrderedDict[Tuple[str, str], Optional[Tuple[str, str, float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def detect(
+        self,
+        series: pl.Series,
+        fingerprint: Optional[str] = None,
+    ) -> Optional[TimestampInfo]:
+        """
+        Detect whether a series holds timestamps.
+
+        Args:
+            series: The column to inspect (its name is used as cache key)
+            fingerprint: Identifier of the source content, or None to skip the cache
+
+        Returns:
+            TimestampInfo if the column is a timestamp column, None otherwise.
+        """
+        # Native temporal and non-string dtypes are decided by dtype alone
+        if fingerprint is None or series.dtype not in (pl.Utf8, pl.String):
+            detection = detect_column_format(series, self.min_confidence)
+        else:
+            key = (fingerprint, series.name)
+            with self._lock:
+                cached = key in self._cache
+                if cached:
+                    self._cache.move_to_end(key)
+                    detection = self._cache[key]
+            if not cached:
+                detection = detect_column_format(series, self.min_confidence)
+                with self._lock:
+                    self._cache[key] = detection
+                    while len(self._cache) > self.max_entries:
+                        self._cache.popitem(last=False)
+
+        if detection is None:
             return None
+        input_fmt, output_fmt, confidence = detection
+        return TimestampInfo(
+            column_name=series.name,
+            input_format=input_fmt,
+            output_format=output_fmt,
+            confidence=confidence,
+        )
 
-        samples = non_null.head(5).to_list()
-        result = detect_datetime_format(str(samples[0]))
-        if result:
-            return result
+    def clear(self) -> None:
+        """Clear all cached detections."""
+        with self._lock:
+            self._cache.clear()
 
-    return None
+
+# Shared detector used by the executor
+_detector = TimestampDetector()
+
+
+def get_timestamp_detector() -> TimestampDetector:
+    """Get the shared timestamp detector."""
+    return _detector
 
 
 def detect_timestamp_columns(
     df: pl.DataFrame,
     x_col: str,
-    y_col: str
+    y_col: str,
+    fingerprint: Optional[str] = None,
 ) -> Tuple[Optional[TimestampInfo], Optional[TimestampInfo]]:
     """
     Detect datetime columns and return format info.
 
+    Args:
+        df: DataFrame containing both columns
+        x_col: X column name
+        y_col: Y column name
+        fingerprint: Source fingerprint for caching detections (optional)
+
     Returns (x_timestamp_info, y_timestamp_info).
     """
-    x_info = None
-    y_info = None
+    x_info = _detector.detect(df[x_col], fingerprint)
+    y_info = x_info if y_col == x_col else _detector.detect(df[y_col], fingerprint)
+    return x_info, y_info
 
-    # Check X column
-    formats = is_datetime_column(df[x_col])
-    if formats:
-        x_info = TimestampInfo(
-            column_name=x_col,
-            input_format=formats[0],
-            output_format=formats[1],
-        )
 
-    # Check Y column
-    formats = is_datetime_column(df[y_col])
-    if formats:
-        y_info = TimestampInfo(
-            column_name=y_col,
-            input_format=formats[0],
-            output_format=formats[1],
-        )
+def to_strftime(input_format: str) -> str:
+    """
+    Convert a DATETIME_PATTERNS input format to a strftime-style string.
 
-    return x_info, y_info
+    Example:
+        "Y-m-d H:M:S.f" -> "%Y-%m-%d %H:%M:%S%.f"
+    """
+    result = []
+    i = 0
+    while i < len(input_format):
+        char = input_format[i]
+        if input_format.startswith(".f", i):
+            result.append("%.f")
+            i += 2
+            continue
+        result.append(_FORMAT_DIRECTIVES.get(char, char))
+        i += 1
+    return "".join(result)
+
+
+def parse_timestamp_series(series: pl.Series, input_format: str) -> pl.Series:
+    """
+    Parse a string series to a Polars Datetime series in one vectorized pass.
+
+    Values that don't match the format become null. Time-only formats are
+    anchored to 1970-01-01. Series that are already Date/Datetime are cast.
+
+    Args:
+        series: Series of datetime strings (or native temporal values)
+        input_format: Format from DATETIME_PATTERNS (e.g., "Y-m-d H:M:S")
+
+    Returns:
+        Series of dtype Datetime
+    """
+    if series.dtype == pl.Datetime:
+        return series
+    if series.dtype == pl.Date:
+        return series.cast(pl.Datetime(TIMESTAMP_UNIT))
+
+    fmt = to_strftime(input_format)
+    if "Y" not in input_format:
+        # Time only - nanoseconds since midnight become nanoseconds since epoch
+        times = series.str.strip_chars().str.to_time(fmt, strict=False)
+        return times.cast(pl.Int64).cast(pl.Datetime("ns")).cast(pl.Datetime(TIMESTAMP_UNIT))
+    return series.str.strip_chars().str.to_datetime(
+        fmt, time_unit=TIMESTAMP_UNIT, strict=False
+    )
+
+
+def timestamps_to_epoch(series: pl.Series, input_format: str) -> pl.Series:
+    """
+    Convert a timestamp column to integer epoch values (TIMESTAMP_UNIT).
+
+    This is the representation the executor hands to engines for datetime
+    axes, so engines never parse strings point by point.
+    """
+    return parse_timestamp_series(series, input_format).dt.epoch(TIMESTAMP_UNIT)
+
+
+def to_numeric_array(values: Sequence) -> Optional[np.ndarray]:
+    """
+    Convert axis values to a NumPy array, if they are all numeric.
+
+    Goes through Polars, which converts large Python lists several times
+    faster than NumPy does.
+
+    Returns:
+        The array, or None if any value is missing or not a number.
+    """
+    if isinstance(values, np.ndarray):
+        series = pl.Series(values)
+    else:
+        series = pl.Series(values, strict=False)
+    if not series.dtype.is_numeric() or series.null_count():
+        return None
+    return series.to_numpy()
+
+
+def to_datetime_array(values: Sequence) -> np.ndarray:
+    """
+    Convert axis values to a NumPy datetime64 array for rendering.
+
+    Accepts epoch integers (as produced by the executor), native
+    date/datetime objects, or datetime strings in a DATETIME_PATTERNS
+    format. Unparseable values become NaT.
+    """
+    series = pl.Series(values, strict=False)
+    if series.dtype in (pl.Utf8, pl.String):
+        formats = is_datetime_column(series)
+        if formats is None:
+            return np.full(len(series), np.datetime64("NaT"), dtype=f"datetime64[{TIMESTAMP_UNIT}]")
+        series = parse_timestamp_series(series, formats[0])
+    elif series.dtype.is_numeric():
+        series = series.cast(pl.Int64).cast(pl.Datetime(TIMESTAMP_UNIT))
+    else:
+        series = parse_timestamp_series(series, "Y-m-d H:M:S")
+    return series.to_numpy()
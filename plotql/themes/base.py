@@ -39,6 +39,7 @@ class PlotQLTheme:
     cursor: str              # Cursor color
     selection: str           # Selection background
     highlight: str           # Bracket matching, search highlight
+    error: str               # Live parse error underline
 
     # Chart palette - colors for plot lines, markers, bars
     chart_colors: Dict[str, str] = field(default_factory=dict)
@@ -45,6 +45,7 @@ THEME = PlotQLTheme(
     cursor="#ebbcba",
     selection="#403d52",
     highlight="#f6c177",
+    error="#eb6f92",
 
     # Chart color palette
     chart_colors={
@@ -4,12 +4,14 @@ PlotQL UI - Terminal User Interface.
 This module provides the interactive TUI for PlotQL queries.
 
 Usage:
-    from plotql.ui import run_tui
+    from plotql.ui import run_dashboard, run_tui
 
     run_tui()  # Launch the interactive TUI
+    run_dashboard(script, columns=2, refresh=30)  # Watch several queries
 """
 from __future__ import annotations
 
 from plotql.ui.tui import run_tui, PlotQLApp
+from plotql.ui.dashboard import run_dashboard, DashboardApp
 
-__all__ = ["run_tui", "PlotQLApp"]
+__all__ = ["run_tui", "PlotQLApp", "run_dashboard", "DashboardApp"]
@@ -6,12 +6,21 @@ and file paths.
 """
 from __future__ import annotations
 
+import bisect
+import math
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Tuple
 
-import polars as pl
+from plotql.core.ast import SourceRef
+from plotql.core.connectors.base import ConnectorError
+from plotql.core.connectors.files import file_schema
+from plotql.core.executor import SchemaCache, get_schema_cache
 
 
 @dataclass
@@ -28,6 +37,7 @@ class Completion:
 # PlotQL keywords
 KEYWORDS = [
     "WITH", "SOURCE", "PLOT", "AGAINST", "AS", "FILTER", "FORMAT", "AND", "OR", "NOT",
+    "REFRESH", "EVERY",
 ]
 
 # Aggregate functions
@@ -43,8 +53,21 @@ PLOT_TYPES = [
 # Format options
 FORMAT_OPTIONS = [
     "title", "xlabel", "ylabel", "color", "line_color", "marker_color", "marker_size", "marker",
+    "bins",
 ]
 
+# File types offered by file path completion
+DATA_EXTENSIONS = {".csv", ".parquet", ".json", ".ndjson"}
+
+# Most frequent values suggested after a FILTER operator
+VALUE_COMPLETIONS = 10
+
+# Seconds between checks of an indexed directory for changes
+PATH_INDEX_REFRESH = 2.0
+
+# Directories kept in the path index
+PATH_INDEX_MAX_DIRS = 64
+
 # Color options for plotext
 COLOR_OPTIONS = [
     "red", "green", "blue", "yellow", "cyan", "magenta", "white", "black",
@@ -199,7 +222,15 @@ def get_context(text: str, cursor_pos: int) -> Tuple[str, str, Optional[str]]:
     if re.search(r"PLOT\s*$", before_upper):
         return ("column", partial, detected_plot_type)
 
-    # After WITH source(...), suggest PLOT
+    # After REFRESH, suggest EVERY
+    if re.search(r"\bREFRESH\s+$", before_upper):
+        return ("after_refresh_keyword", partial, detected_plot_type)
+
+    # After a complete REFRESH EVERY interval, suggest PLOT
+    if re.search(r"\bREFRESH\s+EVERY\s+[0-9.]+\s*[SMH]\s+$", before_upper):
+        return ("after_refresh", partial, detected_plot_type)
+
+    # After WITH source(...), suggest PLOT or REFRESH
     if re.search(r"WITH\s+source\([^)]+\)\s*$", before, re.IGNORECASE):
         return ("after_with", partial, detected_plot_type)
 
@@ -250,22 +281,214 @@ def get_context(text: str, cursor_pos: int) -> Tuple[str, str, Optional[str]]:
     if re.search(r"WITH\s+['\"][^'\"]+['\"]$", text_before_partial, re.IGNORECASE):
         return ("after_with", partial, detected_plot_type)
 
+    # Typing a keyword after WITH source(...) or a REFRESH clause
+    if re.search(r"WITH\s+source\([^)]+\)$", text_before_partial, re.IGNORECASE):
+        return ("after_with", partial, detected_plot_type)
+    if re.search(r"\bREFRESH$", text_before_partial_upper):
+        return ("after_refresh_keyword", partial, detected_plot_type)
+    if re.search(r"\bREFRESH\s+EVERY\s+[0-9.]+\s*[SMH]$", text_before_partial_upper):
+        return ("after_refresh", partial, detected_plot_type)
+
     return ("none", partial, detected_plot_type)
 
 
-def get_file_completions(partial_path: str, limit: int = 10) -> List[Completion]:
+@dataclass
+class _DirListing:
+    """Indexed contents of one directory."""
+    mtime_ns: int  # Directory mtime when listed
+    checked: float  # time.monotonic() of the last mtime check
+    names: List[str]  # Visible subdirectories and data files
+    is_dir: List[bool]
+    keys: List[str]  # Lowercase names, sorted, for prefix search
+
+
+def _list_directory(directory: Path, mtime_ns: int) -> _DirListing:
+    """List a directory's subdirectories and data files with os.scandir."""
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            try:
+                # Types come from the directory listing; only symlinks are stat'ed
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir or os.path.splitext(name)[1].lower() in DATA_EXTENSIONS:
+                entries.append((name.lower(), name, is_dir))
+    entries.sort()
+
+    return _DirListing(
+        mtime_ns=mtime_ns,
+        checked=time.monotonic(),
+        names=[name for _, name, _ in entries],
+        is_dir=[is_dir for _, _, is_dir in entries],
+        keys=[key for key, _, _ in entries],
+    )
+
+
+def _is_subsequence(partial: str, key: str) -> bool:
+    """True if key contains partial's characters in order, in linear time."""
+    remaining = iter(key)
+    return all(c in remaining for c in partial)
+
+
+class PathIndex:
+    """
+    Directory listings for file path completion.
+
+    A directory is listed once and its data files and subdirectories kept
+    sorted, so a lookup is a binary search for the typed prefix rather
+    than a listing and a stat per entry. A listing is checked against its
+    directory's mtime at most every refresh seconds; a changed directory
+    is re-listed in a background thread while lookups keep using the old
+    listing, so only the first lookup of a directory waits on the disk.
+    The least recently used listings are dropped beyond max_dirs.
+
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_dirs: int = PATH_INDEX_MAX_DIRS,
+        refresh: float = PATH_INDEX_REFRESH,
+    ) -> None:
+        self.max_dirs = max_dirs
+        self.refresh = refresh
+        self._listings: OrderedDict[str, _DirListing] = OrderedDict()
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+
+    def lookup(self, directory: Path, partial: str, limit: int = 10) -> List[Tuple[str, bool]]:
+        """
+        Find entries of a directory matching a partial name.
+
+        Names starting with partial (case-insensitively) come first, then
+        names containing its characters in order (e.g. "tcsv" matches
+        "trades.csv").
+
+        Args:
+            directory: Directory to search
+            partial: Partial name typed so far
+            limit: Maximum number of matches
+
+        Returns:
+            List of (name, is_directory) tuples.
+        """
+        listing = self._get(directory)
+        if listing is None:
+            return []
+
+        partial = partial.lower()
+        first = bisect.bisect_left(listing.keys, partial)
+        matches = []
+        for i in range(first, len(listing.keys)):
+            if len(matches) >= limit or not listing.keys[i].startswith(partial):
+                break
+            matches.append(i)
+
+        if partial and len(matches) < limit:
+            prefixed = set(matches)
+            for i, key in enumerate(listing.keys):
+                if i not in prefixed and _is_subsequence(partial, key):
+                    matches.append(i)
+                    if len(matches) >= limit:
+                        break
+
+        return [(listing.names[i], listing.is_dir[i]) for i in matches]
+
+    def warm(self, directory: Path) -> None:
+        """List a directory in the background, ahead of its first lookup."""
+        self._start_refresh(directory)
+
+    def clear(self) -> None:
+        """Drop all listings."""
+        with self._lock:
+            self._listings.clear()
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def _get(self, directory: Path) -> Optional[_DirListing]:
+        key = os.path.abspath(directory)
+        with self._lock:
+            listing = self._listings.get(key)
+            if listing is not None:
+                self._listings.move_to_end(key)
+
+        if listing is None:
+            return self._list(key)
+
+        now = time.monotonic()
+        if now - listing.checked >= self.refresh:
+            listing.checked = now
+            try:
+                changed = os.stat(key).st_mtime_ns != listing.mtime_ns
+            except OSError:
+                changed = True
+            if changed:
+                self._start_refresh(Path(key))
+        return listing
+
+    def _list(self, key: str) -> Optional[_DirListing]:
+        """List a directory and store the listing (None if it can't be listed)."""
+        try:
+            listing = _list_directory(Path(key), os.stat(key).st_mtime_ns)
+        except OSError:
+            with self._lock:
+                self._listings.pop(key, None)
+            return None
+
+        with self._lock:
+            self._listings[key] = listing
+            self._listings.move_to_end(key)
+            while len(self._listings) > self.max_dirs:
+                self._listings.popitem(last=False)
+        return listing
+
+    def _start_refresh(self, directory: Path) -> None:
+        key = os.path.abspath(directory)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                self._list(key)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="plotql-path-index", daemon=True).start()
+
+
+# Shared path index used by file path completion
+_path_index = PathIndex()
+
+
+def get_path_index() -> PathIndex:
+    """Get the shared path index."""
+    return _path_index
+
+
+def get_file_completions(
+    partial_path: str,
+    limit: int = 10,
+    index: Optional[PathIndex] = None,
+) -> List[Completion]:
     """
     Get file path completions.
 
     Args:
         partial_path: The partial path typed so far
         limit: Maximum number of suggestions
+        index: Path index to search. Defaults to the shared index.
 
     Returns:
         List of file path completions
     """
-    completions = []
-
     # Determine the directory to search and the prefix to match
     if not partial_path:
         search_dir = Path(".")
@@ -279,49 +502,27 @@ def get_file_completions(partial_path: str, limit: int = 10) -> List[Completion]
         if str(search_dir) == ".":
             search_dir = Path(".")
 
-    # Supported file extensions
-    data_extensions = {".csv", ".parquet", ".json", ".ndjson"}
-
-    try:
-        if not search_dir.exists():
-            return completions
-
-        for entry in sorted(search_dir.iterdir()):
-            name = entry.name
-
-            # Skip hidden files
-            if name.startswith("."):
-                continue
-
-            # Match prefix
-            if prefix and not name.lower().startswith(prefix.lower()):
-                continue
-
-            # Build the completion path
-            if str(search_dir) == ".":
-                completion_path = name
-            else:
-                completion_path = str(search_dir / name)
-
-            if entry.is_dir():
-                # Add trailing slash for directories
-                completions.append(Completion(
-                    text=completion_path + "/",
-                    display=name + "/",
-                    kind="directory"
-                ))
-            elif entry.suffix.lower() in data_extensions:
-                completions.append(Completion(
-                    text=completion_path + "'",
-                    display=name,
-                    kind="file"
-                ))
-
-            if len(completions) >= limit:
-                break
-
-    except PermissionError:
-        pass
+    completions = []
+    for name, is_dir in (index or _path_index).lookup(search_dir, prefix, limit):
+        # Build the completion path
+        if str(search_dir) == ".":
+            completion_path = name
+        else:
+            completion_path = str(search_dir / name)
+
+        if is_dir:
+            # Add trailing slash for directories
+            completions.append(Completion(
+                text=completion_path + "/",
+                display=name + "/",
+                kind="directory"
+            ))
+        else:
+            completions.append(Completion(
+                text=completion_path + "'",
+                display=name,
+                kind="file"
+            ))
 
     return completions
 
@@ -362,23 +563,62 @@ def extract_file_path(text: str) -> Optional[str]:
     return None
 
 
+def extract_source(text: str) -> Optional[SourceRef]:
+    """
+    Extract the source reference from a WITH source() clause.
+
+    Unlike extract_file_path, this covers every source type - including
+    database tables such as source(pump_fun, trades) - by returning the
+    reference as the parser would, without resolving it.
+    """
+    match = re.search(r"WITH\s+source\(([^)]*)\)", text, re.IGNORECASE)
+    if not match:
+        return None
+
+    raw_args = [arg.strip() for arg in match.group(1).split(",")]
+    args = [arg.strip("'\"") for arg in raw_args]
+    if not all(args):
+        return None
+    return SourceRef(args=args, is_literal=raw_args[0][0] in "'\"")
+
+
+def get_filter_column(text: str) -> Optional[str]:
+    """Get the column being compared in the FILTER condition at the end of text."""
+    match = re.search(
+        r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:!=|<=|>=|=|<|>)\s*[^<>=!\s]*$", text
+    )
+    return match.group(1) if match else None
+
+
+def format_filter_value(value: object) -> Optional[str]:
+    """
+    Format a value as a FILTER literal.
+
+    Returns:
+        The literal, or None if the value can't be written in a query.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        literal = repr(value)
+        # The grammar has no exponent notation
+        return literal if "e" not in literal else f"{value:f}"
+    if isinstance(value, str):
+        for quote in ("'", '"'):
+            if quote not in value:
+                return f"{quote}{value}{quote}"
+    return None
+
+
 def get_columns_from_file(file_path: str) -> List[str]:
-    """Load column names from a data file."""
+    """Read column names from a data file's header."""
     try:
-        # Try to infer file type and load just the schema
-        if file_path.endswith(".csv"):
-            df = pl.read_csv(file_path, n_rows=0)
-        elif file_path.endswith(".parquet"):
-            df = pl.read_parquet(file_path, n_rows=0)
-        elif file_path.endswith(".json"):
-            df = pl.read_json(file_path)
-        elif file_path.endswith(".ndjson"):
-            df = pl.read_ndjson(file_path, n_rows=1)
-        else:
-            # Default to CSV
-            df = pl.read_csv(file_path, n_rows=0)
-        return df.columns
-    except Exception:
+        return file_schema(Path(file_path)).names()
+    except ConnectorError:
         return []
 
 
@@ -386,12 +626,13 @@ class AutoCompleter:
     """
     Context-aware autocomplete provider for PlotQL.
 
-    Caches column names from the data file for performance.
+    Column names come from a SchemaCache (by default the one shared with
+    the executor), so a source's columns are read once per file version
+    and sources already queried need no IO at all.
     """
 
-    def __init__(self):
-        self._cached_path: Optional[str] = None
-        self._cached_columns: List[str] = []
+    def __init__(self, schema_cache: Optional[SchemaCache] = None):
+        self._schema_cache = schema_cache if schema_cache is not None else get_schema_cache()
 
     def get_completions(
         self,
@@ -424,11 +665,12 @@ class AutoCompleter:
 
         completions: List[Completion] = []
 
-        # Update column cache if file changed
-        file_path = extract_file_path(text)
-        if file_path and file_path != self._cached_path:
-            self._cached_path = file_path
-            self._cached_columns = get_columns_from_file(file_path)
+        # Look up the current source's columns (re-read if a file changed)
+        # Local copy: completions may be computed on several threads at once
+        columns: List[str] = []
+        source = extract_source(text)
+        if source:
+            columns = self._schema_cache.columns(source)
 
         if context == "start":
             # Only WITH is valid at start
@@ -445,13 +687,23 @@ class AutoCompleter:
             return get_file_completions(partial, limit)
 
         elif context == "after_with":
-            # After file path, only PLOT is valid
+            # After file path, PLOT or a REFRESH clause
+            for kw in ["PLOT", "REFRESH"]:
+                if kw.startswith(partial_upper) or not partial:
+                    completions.append(Completion(kw, kw, "keyword"))
+
+        elif context == "after_refresh_keyword":
+            if "EVERY".startswith(partial_upper) or not partial:
+                completions.append(Completion("EVERY", "EVERY", "keyword"))
+
+        elif context == "after_refresh":
+            # After the REFRESH interval, only PLOT is valid
             if "PLOT".startswith(partial_upper) or not partial:
                 completions.append(Completion("PLOT", "PLOT", "keyword"))
 
         elif context == "column":
             # Suggest columns and aggregate functions
-            for col in self._cached_columns:
+            for col in columns:
                 if col.lower().startswith(partial_lower) or not partial:
                     completions.append(Completion(col, col, "column"))
 
@@ -461,7 +713,7 @@ class AutoCompleter:
 
         elif context == "agg_column":
             # Inside aggregate function - suggest columns only
-            for col in self._cached_columns:
+            for col in columns:
                 if col.lower().startswith(partial_lower) or not partial:
                     completions.append(Completion(col + ")", col, "column"))
 
@@ -514,7 +766,7 @@ class AutoCompleter:
 
         elif context == "filter_column":
             # Suggest columns for filter conditions
-            for col in self._cached_columns:
+            for col in columns:
                 if col.lower().startswith(partial_lower) or not partial:
                     completions.append(Completion(col, col, "column"))
 
@@ -524,8 +776,12 @@ class AutoCompleter:
                 completions.append(Completion(op, op, "operator"))
 
         elif context == "filter_value":
-            # Suggest columns or common values
-            for col in self._cached_columns:
+            # Suggest the filtered column's common values and range first
+            completions.extend(
+                self._get_value_completions(source, text[:cursor_pos], partial)
+            )
+            # Then columns
+            for col in columns:
                 if col.lower().startswith(partial_lower) or not partial:
                     completions.append(Completion(col, col, "column"))
             # Also suggest AND/OR/FORMAT/PLOT to continue
@@ -546,13 +802,13 @@ class AutoCompleter:
                 if color.startswith(partial_lower) or not partial:
                     completions.append(Completion(f"'{color}'", color, "value"))
             # Also suggest column names for dynamic colors
-            for col in self._cached_columns:
+            for col in columns:
                 if col.lower().startswith(partial_lower) or not partial:
                     completions.append(Completion(col, col, "column"))
 
         elif context == "format_size":
             # Suggest column names for dynamic sizing
-            for col in self._cached_columns:
+            for col in columns:
                 if col.lower().startswith(partial_lower) or not partial:
                     completions.append(Completion(col, col, "column"))
 
@@ -575,9 +831,14 @@ class AutoCompleter:
             # In column context, prioritize columns and functions over keywords
             if context == "column":
                 kind_order = {"column": 0, "function": 1, "keyword": 2, "type": 3}
+            elif context == "filter_value":
+                kind_order = {"value": 0, "column": 1, "keyword": 2}
             else:
                 kind_order = {"keyword": 0, "function": 1, "column": 2, "type": 3}
             is_prefix = 0 if c.text.lower().startswith(partial_lower) else 1
+            # Filter values stay in frequency order
+            if context == "filter_value" and c.kind == "value":
+                return (is_prefix, 0, "")
             return (is_prefix, kind_order.get(c.kind, 99), c.text.lower())
 
         unique.sort(key=sort_key)
@@ -608,12 +869,38 @@ class AutoCompleter:
         elif plot_type in ("line", "bar"):
             return universal + line_bar_options
         elif plot_type == "hist":
-            return universal + ["color", "line_color"]
+            return universal + ["color", "line_color", "bins"]
         else:
             # Unknown or no plot type - show all options
             return FORMAT_OPTIONS
 
+    def _get_value_completions(
+        self,
+        source: Optional[SourceRef],
+        before: str,
+        partial: str,
+    ) -> List[Completion]:
+        """Suggest values for a FILTER condition from the column's statistics."""
+        column = get_filter_column(before)
+        if source is None or column is None:
+            return []
+        stats = self._schema_cache.column_stats(source, column, VALUE_COMPLETIONS)
+        if stats is None:
+            return []
+
+        typed = partial.strip("'\"").lower()
+        completions = []
+        # The range first: for numeric columns it's the most useful hint
+        for label, value in (("min", stats.min), ("max", stats.max)):
+            literal = format_filter_value(value)
+            if literal and literal.startswith(typed):
+                completions.append(Completion(literal, f"{literal} ({label})", "value"))
+        for value in stats.values:
+            literal = format_filter_value(value)
+            if literal and str(value).lower().startswith(typed):
+                completions.append(Completion(literal, str(value), "value"))
+        return completions
+
     def invalidate_cache(self) -> None:
-        """Clear the column cache."""
-        self._cached_path = None
-        self._cached_columns = []
+        """Clear the column cache, so sources are read again."""
+        self._schema_cache.clear()
@@ -0,0 +1,344 @@
+"""
+Dashboard mode: several queries watched side by side.
+
+Each query of a script gets its own pane (a title, a plot and a status
+line), laid out in a grid. Panes execute concurrently in worker threads
+and share one SourceCache, so a file used by several panes is read once
+however many of them refresh at the same moment. Every pane refreshes
+on its own interval and can be refreshed by hand.
+
+Usage:
+    from plotql.ui.dashboard import run_dashboard
+
+    run_dashboard(Path("oncall.pql").read_text(), columns=2, refresh=30)
+"""
+from __future__ import annotations
+
+import logging
+from functools import partial
+from typing import List, Optional
+
+from PIL import Image as PILImage
+from rich.markup import escape
+from rich.text import Text
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.containers import Grid, Vertical
+from textual.timer import Timer
+from textual.widgets import Footer, Header, Static
+
+from plotql.core import (
+    execute,
+    parse_script,
+    CancelToken,
+    ExecutionCancelled,
+    PlotData,
+    PlotQuery,
+    PyramidStore,
+    SeriesCache,
+    SourceCache,
+)
+from plotql.themes import THEME
+from plotql.ui.tui import SOURCE_CACHE_ENTRIES, PlotPanel, StatusBar
+
+logger = logging.getLogger(__name__)
+
+# Refresh intervals (seconds) a pane cycles through; 0 turns refreshing off
+REFRESH_CHOICES = (0, 5, 15, 60, 300)
+
+
+def format_interval(seconds: float) -> str:
+    """Describe a refresh interval for a pane title."""
+    if not seconds:
+        return "manual"
+    if seconds % 60 == 0:
+        return f"every {seconds // 60:g}m"
+    return f"every {seconds:g}s"
+
+
+def pane_title(query: PlotQuery) -> str:
+    """Title of a query's pane: its first title, else what it plots."""
+    for series in query.series:
+        if series.format.title:
+            return series.format.title
+    return ", ".join(f"{s.y_column} against {s.x_column}" for s in query.series)
+
+
+class DashboardPane(Vertical):
+    """
+    One query of a dashboard, refreshed on its own interval.
+
+    Runs in a worker thread on the pane, so panes execute concurrently;
+    a tick that arrives while the previous run is still going is skipped.
+    """
+
+    BINDINGS = [
+        Binding("r", "refresh_pane", "Refresh"),
+        Binding("i", "cycle_interval", "Interval"),
+        Binding("escape", "cancel", "Cancel", show=False),
+    ]
+
+    DEFAULT_CSS = f"""
+    DashboardPane {{
+        border: heavy {THEME.border};
+        height: 1fr;
+    }}
+    DashboardPane:focus-within {{
+        border: heavy {THEME.highlight};
+    }}
+    DashboardPane > .pane-title {{
+        height: 1;
+        padding: 0 1;
+        color: {THEME.text};
+        background: {THEME.background_alt};
+    }}
+    DashboardPane > PlotPanel {{
+        height: 1fr;
+    }}
+    DashboardPane > StatusBar {{
+        height: 1;
+        padding: 0 1;
+        color: {THEME.text};
+        background: {THEME.background_alt};
+    }}
+    """
+
+    def __init__(self, index: int, query: PlotQuery, interval: float = 0) -> None:
+        """
+        Initialize the pane.
+
+        Args:
+            index: Position of the query in the script (0-based)
+            query: Query shown in the pane
+            interval: Seconds between refreshes; 0 refreshes only on demand
+        """
+        super().__init__(id=f"pane-{index}")
+        self.index = index
+        self.plot_query = query
+        self.interval = interval
+        self._timer: Optional[Timer] = None
+        # Token of the run in flight; None when idle
+        self._token: Optional[CancelToken] = None
+        # Whether the pane shows a plot; until then runs show a text preview
+        self._plotted = False
+
+    @property
+    def running(self) -> bool:
+        """True while the pane's query is executing or rendering."""
+        return self._token is not None
+
+    @property
+    def plot(self) -> PlotPanel:
+        return self.query_one(PlotPanel)
+
+    @property
+    def status(self) -> StatusBar:
+        return self.query_one(StatusBar)
+
+    def compose(self) -> ComposeResult:
+        yield Static(classes="pane-title")
+        yield PlotPanel(id=f"plot-{self.index}")
+        yield StatusBar(id=f"status-{self.index}")
+
+    def on_mount(self) -> None:
+        self._update_title()
+        self.set_refresh_interval(self.interval)
+
+    def set_refresh_interval(self, seconds: float) -> None:
+        """Refresh every `seconds` from now on; 0 stops refreshing."""
+        self.interval = seconds
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+        if seconds:
+            self._timer = self.set_interval(seconds, self.refresh_data)
+        self._update_title()
+
+    def action_refresh_pane(self) -> None:
+        """Refresh the pane now."""
+        self.refresh_data()
+
+    def action_cycle_interval(self) -> None:
+        """Switch to the next refresh interval in REFRESH_CHOICES."""
+        later = [c for c in REFRESH_CHOICES if c > self.interval]
+        self.set_refresh_interval(later[0] if later else REFRESH_CHOICES[0])
+        self.app.notify(f"{pane_title(self.plot_query)}: {format_interval(self.interval)}")
+
+    def action_cancel(self) -> None:
+        """Cancel the pane's run in flight."""
+        token = self._token
+        if token is not None:
+            self._token = None
+            self.run_worker(token.cancel, group="cancel", thread=True)
+            self.status.set_cancelled()
+
+    def refresh_data(self) -> None:
+        """Execute and render the pane's query in a worker thread."""
+        if self.running:
+            return  # Still busy with the previous refresh
+        token = CancelToken()
+        self._token = token
+        self.status.set_running("Running query")
+        width, height = self.plot._get_pixel_size()
+        self.run_worker(
+            partial(self._run, token, width, height),
+            name="query",
+            group="query",
+            thread=True,
+            # Not exclusive: a finished run's thread may still be returning
+            # when the next refresh starts, and cancelling it gains nothing
+            exit_on_error=False,
+        )
+
+    def _update_title(self) -> None:
+        self.query_one(".pane-title", Static).update(
+            f"{escape(pane_title(self.plot_query))} [{THEME.text_muted}]· {format_interval(self.interval)}[/]"
+        )
+
+    def _run(self, token: CancelToken, width: int, height: int) -> None:
+        """Execute and render the query. Runs in a worker thread."""
+        dashboard: DashboardApp = self.app
+        try:
+            data = execute(
+                self.plot_query,
+                cache=dashboard.source_cache,
+                cancel=token,
+                series_cache=dashboard.series_cache,
+                resolution=width,
+                pyramids=dashboard.pyramids,
+            )
+            token.raise_if_cancelled()
+            if not self._plotted:
+                # Later refreshes keep the previous plot up while rendering
+                preview = PlotPanel.render_text(data, width, height)
+                if preview is not None:
+                    self._post_result(token, self._rendering, preview)
+            image = PlotPanel.render_image(data, width, height, f"plot-{self.index}")
+        except ExecutionCancelled:
+            return
+        except Exception as e:
+            self._post_result(token, self._failed, str(e))
+        else:
+            self._post_result(token, self._succeeded, data, image)
+
+    def _post_result(self, token: CancelToken, callback, *args) -> None:
+        """Hand a worker result to the UI thread unless it was cancelled."""
+        if token.cancelled:
+            return
+        try:
+            self.app.call_from_thread(callback, token, *args)
+        except RuntimeError:
+            pass  # App is shutting down
+
+    def _rendering(self, token: CancelToken, preview: Text) -> None:
+        if token is self._token:
+            self.status.set_running("Rendering")
+            self.plot.show_preview(preview)
+
+    def _succeeded(self, token: CancelToken, data: List[PlotData], image: PILImage.Image) -> None:
+        if token is not self._token:
+            return
+        self._token = None
+        self._plotted = True
+        self.plot.show_image(image)
+        self.status.set_success(data)
+
+    def _failed(self, token: CancelToken, message: str) -> None:
+        if token is not self._token:
+            return
+        self._token = None
+        logger.error(f"Pane {self.index + 1}: {message}")
+        self.status.set_error(message)
+        self.plot.show_error(message)
+        self._plotted = False
+
+
+class DashboardApp(App):
+    """Grid of query panes, each executed and refreshed independently."""
+
+    TITLE = "PlotQL Dashboard"
+    CSS = f"""
+    Screen {{
+        background: {THEME.background};
+    }}
+    #dashboard {{
+        grid-gutter: 0;
+    }}
+    """
+
+    BINDINGS = [
+        Binding("ctrl+q", "quit", "Quit"),
+        Binding("f5", "refresh_all", "Refresh all", show=True),
+    ]
+
+    def __init__(
+        self,
+        queries: List[PlotQuery],
+        columns: int = 2,
+        refresh: float = 0,
+    ) -> None:
+        """
+        Initialize the dashboard.
+
+        Args:
+            queries: One query per pane, in layout order
+            columns: Panes per row
+            refresh: Initial refresh interval in seconds of every pane
+                whose query has no REFRESH clause; 0 refreshes only on demand
+
+        Raises:
+            ValueError: If there are no queries, columns is not positive
+                or refresh is negative.
+        """
+        if not queries:
+            raise ValueError("A dashboard needs at least one query")
+        if columns < 1:
+            raise ValueError(f"columns must be a positive integer, got {columns}")
+        if refresh < 0:
+            raise ValueError(f"refresh must not be negative, got {refresh}")
+        super().__init__()
+        self.queries = queries
+        self.columns = min(columns, len(queries))
+        self.refresh_interval = refresh
+        # Shared by every pane, so a source used by several panes is read
+        # once per change; room for each pane to use its own source
+        self.source_cache = SourceCache(max_entries=max(SOURCE_CACHE_ENTRIES, len(queries)))
+        self.series_cache = SeriesCache()
+        self.pyramids = PyramidStore()
+
+    @property
+    def panes(self) -> List[DashboardPane]:
+        return list(self.query(DashboardPane))
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        grid = Grid(
+            *(
+                DashboardPane(i, query, query.refresh or self.refresh_interval)
+                for i, query in enumerate(self.queries)
+            ),
+            id="dashboard",
+        )
+        grid.styles.grid_size_columns = self.columns
+        yield grid
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self.action_refresh_all()
+
+    def action_refresh_all(self) -> None:
+        """Refresh every pane that isn't already running."""
+        for pane in self.panes:
+            pane.refresh_data()
+
+
+def run_dashboard(script: str, columns: int = 2, refresh: float = 0) -> None:
+    """
+    Run a dashboard of every query in a script.
+
+    Raises:
+        ParseError: If any query in the script is invalid.
+        ValueError: If the script has no queries or the layout is invalid.
+    """
+    app = DashboardApp(parse_script(script), columns=columns, refresh=refresh)
+    app.run()
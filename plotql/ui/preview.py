@@ -0,0 +1,203 @@
+"""
+Text preview of query results, drawn with Unicode braille characters.
+
+Each terminal cell holds a 2x4 grid of braille dots, so a panel of
+80x24 cells is a 160x96 dot canvas. Lines, markers and bars are set on
+the canvas with NumPy straight from the executed arrays, which takes a
+few milliseconds, and shown while the full-resolution image renders
+(Sixel encoding of a large panel is much slower, and some terminals
+can't display it at all).
+
+Usage:
+    from plotql.ui.preview import render_preview
+
+    text = render_preview(execute(query), columns=80, rows=24)
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+from rich.text import Text
+
+from plotql.core import PlotData, PlotType
+from plotql.core.engines.raster import Axis, AxisSeries, RasterEngine, prepare_axes
+from plotql.core.utils import LINE_DECIMATE_FACTOR, decimate_line
+from plotql.themes import THEME
+
+# Braille dots per cell
+DOTS_X = 2
+DOTS_Y = 4
+
+# Bit of each dot in a braille character, indexed [row][column]
+_DOT_BITS = np.array([[0x01, 0x08], [0x02, 0x10], [0x04, 0x20], [0x40, 0x80]], dtype=np.uint8)
+_BRAILLE_BLANK = 0x2800
+
+# Cells between x tick labels
+LABEL_GAP = 2
+
+
+def render_preview(data_list: List[PlotData], columns: int, rows: int) -> Text:
+    """
+    Draw query results as braille text filling columns x rows cells.
+
+    The plot keeps the axes of the full render (category, time and
+    numeric scales, bars from zero), with y tick labels in a left gutter
+    and x tick labels on the bottom row. Series are drawn in order, each
+    cell taking the color of the last series with a dot in it.
+
+    Args:
+        data_list: Results of executing a query
+        columns: Width in terminal cells
+        rows: Height in terminal cells
+
+    Returns:
+        The preview, or empty text if the area is too small to plot in.
+    """
+    # Same axes (timestamps, categories, histogram bins) as the full render
+    series, x_axis, y_axis = prepare_axes(data_list)
+
+    gutter = max((len(label) for label in y_axis.labels), default=0) + 1
+    width = columns - gutter
+    height = rows - 1  # Bottom row holds the x labels
+    if width < 4 or height < 2:
+        return Text()
+
+    mask = np.zeros((height, width), dtype=np.uint8)
+    owner = np.full((height, width), -1, dtype=np.int64)
+    engine = RasterEngine()
+    default_marker = engine.marker_color(data_list[0], engine.COLORS["primary"])
+    colors = []
+    for index, s in enumerate(series):
+        dots = _draw_series(s, x_axis, y_axis, width * DOTS_X, height * DOTS_Y)
+        cells = _to_cells(dots)
+        mask |= cells
+        owner[cells > 0] = index
+        fmt = s.data.series.format
+        if s.data.series.plot_type == PlotType.SCATTER:
+            colors.append(engine.marker_color(s.data, default_marker))
+        else:
+            colors.append(engine.get_color(fmt.line_color))
+
+    lines = []
+    y_labels = _y_labels(y_axis, height)
+    for row in range(height):
+        line = Text(y_labels.get(row, "").rjust(gutter - 1) + " ", style=THEME.text_muted)
+        chars = "".join(chr(_BRAILLE_BLANK + int(bits)) for bits in mask[row])
+        start = 0
+        # One span per run of cells owned by the same series
+        for end in list(np.flatnonzero(np.diff(owner[row])) + 1) + [width]:
+            series_index = owner[row, start]
+            style = colors[series_index] if series_index >= 0 else None
+            line.append(chars[start:end], style=style)
+            start = end
+        lines.append(line)
+    lines.append(Text(" " * gutter + _x_label_row(x_axis, width), style=THEME.text_muted))
+    return Text("\n").join(lines)
+
+
+def _draw_series(
+    series: AxisSeries,
+    x_axis: Axis,
+    y_axis: Axis,
+    width: int,
+    height: int,
+) -> np.ndarray:
+    """Set the dots one series covers on a width x height canvas."""
+    dots = np.zeros((height, width), dtype=bool)
+    plot_type = series.data.series.plot_type
+
+    if plot_type in (PlotType.BAR, PlotType.HIST):
+        left = series.x if plot_type == PlotType.HIST else series.x - series.widths / 2
+        x0 = x_axis.to_pixels(left, 0, width - 1)
+        x1 = x_axis.to_pixels(left + series.widths, 0, width - 1)
+        base = y_axis.to_pixels(np.zeros(1), height - 1, 0)[0]
+        tops = y_axis.to_pixels(series.y, height - 1, 0)
+        for a, b, top in zip(x0, x1, tops):
+            if not (np.isfinite(a) and np.isfinite(b) and np.isfinite(top)):
+                continue
+            # At least one dot wide, so narrow bars stay visible
+            c0, c1 = _clip(round(a), width), _clip(max(round(b) - 1, round(a)), width)
+            r0, r1 = sorted((_clip(round(top), height), _clip(round(base), height)))
+            dots[r0:r1 + 1, c0:c1 + 1] = True
+        return dots
+
+    x, y = series.x, series.y
+    if (
+        plot_type == PlotType.LINE
+        and len(x) > LINE_DECIMATE_FACTOR * width
+        and np.isfinite(x).all()
+        and np.isfinite(y).all()
+        and (x[1:] >= x[:-1]).all()
+    ):
+        keep = decimate_line(x, y, width)
+        x, y = x[keep], y[keep]
+    px = x_axis.to_pixels(x, 0, width - 1)
+    py = y_axis.to_pixels(y, height - 1, 0)
+
+    if plot_type == PlotType.LINE:
+        px, py = _segments(px, py)
+    finite = np.isfinite(px) & np.isfinite(py)
+    cols = np.round(px[finite]).astype(np.intp)
+    rows = np.round(py[finite]).astype(np.intp)
+    inside = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+    dots[rows[inside], cols[inside]] = True
+    return dots
+
+
+def _segments(px: np.ndarray, py: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Points along the segments between consecutive points, a dot apart.
+
+    Segments with a missing end are left out, breaking the line there.
+    """
+    if len(px) < 2:
+        return px, py
+    x0, y0, x1, y1 = px[:-1], py[:-1], px[1:], py[1:]
+    joined = np.isfinite(x0) & np.isfinite(y0) & np.isfinite(x1) & np.isfinite(y1)
+    x0, y0, x1, y1 = x0[joined], y0[joined], x1[joined], y1[joined]
+    steps = np.ceil(np.maximum(np.abs(x1 - x0), np.abs(y1 - y0))).astype(np.intp) + 1
+    segment = np.repeat(np.arange(len(steps)), steps)
+    # Position of each point within its segment, from 0 to 1
+    offset = np.arange(steps.sum()) - np.repeat(np.cumsum(steps) - steps, steps)
+    t = offset / np.maximum(steps - 1, 1)[segment]
+    xs = x0[segment] + (x1 - x0)[segment] * t
+    ys = y0[segment] + (y1 - y0)[segment] * t
+    # Lone points between missing values are kept as dots
+    return np.concatenate([xs, px]), np.concatenate([ys, py])
+
+
+def _to_cells(dots: np.ndarray) -> np.ndarray:
+    """Fold a dot canvas into braille bit masks, one per cell."""
+    height, width = dots.shape
+    blocks = dots.reshape(height // DOTS_Y, DOTS_Y, width // DOTS_X, DOTS_X)
+    return np.einsum("rycx,yx->rc", blocks.astype(np.uint8), _DOT_BITS).astype(np.uint8)
+
+
+def _clip(value: int, length: int) -> int:
+    return min(max(int(value), 0), length - 1)
+
+
+def _y_labels(axis: Axis, height: int) -> Dict[int, str]:
+    """Tick labels by the row they fall in, skipping rows already labeled."""
+    rows = np.round(axis.to_pixels(np.asarray(axis.ticks), height * DOTS_Y - 1, 0) / DOTS_Y)
+    labels = {}
+    for row, label in zip(rows.astype(int), axis.labels):
+        if 0 <= row < height:
+            labels.setdefault(row, label)
+    return labels
+
+
+def _x_label_row(axis: Axis, width: int) -> str:
+    """The bottom row: tick labels centered under their ticks, where they fit."""
+    row = [" "] * width
+    columns = axis.to_pixels(np.asarray(axis.ticks), 0, width * DOTS_X - 1) / DOTS_X
+    free_from = 0
+    for column, label in zip(columns, axis.labels):
+        start = int(round(column)) - len(label) // 2
+        start = min(max(start, free_from), width - len(label))
+        if start < free_from:
+            continue  # Overlaps the previous label or doesn't fit
+        row[start:start + len(label)] = label
+        free_from = start + len(label) + LABEL_GAP
+    return "".join(row)
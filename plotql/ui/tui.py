@@ -11,34 +11,58 @@ A harlequin-inspired interface with:
 from __future__ import annotations
 
 import logging
+import os
 import sys
+import threading
+from bisect import bisect_right
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from textual.app import App, ComposeResult
+from textual.timer import Timer
 from textual.binding import Binding
 from textual.containers import Vertical
+from textual.css.query import NoMatches
+from textual.message import Message
 from textual.widgets import Footer, Header, Static, TextArea
 from textual.widgets.text_area import TextAreaTheme
 # Force Sixel rendering for HD quality in supported terminals (VSCode, iTerm2, etc)
 from textual_image.widget import SixelImage as TextualImage
 from rich.style import Style
+from rich.text import Text
 from PIL import Image as PILImage
-from io import BytesIO
 
-from plotql.ui.autocomplete import AutoCompleter
+from plotql.ui.autocomplete import AutoCompleter, Completion, get_path_index
 from plotql.ui.config_editor import ConfigEditorScreen
+from plotql.ui.preview import render_preview
 from plotql.ui.state import get_last_query, save_last_query
 from plotql.core import (
     execute,
     get_engine,
     parse,
+    restyle,
+    CancelToken,
+    Diagnostic,
+    ExecutionCancelled,
     ExecutionError,
+    IncrementalParser,
     ParseError,
     PlotData,
+    PlotQuery,
+    PyramidStore,
+    Refresher,
+    SeriesCache,
+    SourceCache,
+    TileCache,
+    XRange,
+    x_extent,
 )
 from plotql.themes import THEME
 
+# Live parse errors - underlined so the token's position stays visible
+ERROR_STYLE = Style(color=THEME.error, underline=True)
+
 # Build TextArea theme from centralized theme
 PLOTQL_THEME = TextAreaTheme(
     name=f"plotql-{THEME.name}",
@@ -100,6 +124,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Serializes renders from worker threads (retained figures are not thread-safe)
+_render_lock = threading.Lock()
+
+# Set PLOTQL_DEBUG_PLOT to a file path to save every rendered plot there
+DEBUG_PLOT_PATH = os.environ.get("PLOTQL_DEBUG_PLOT")
+
+# Pause in typing (seconds) before completions are computed
+COMPLETION_DELAY = 0.1
+
+# Pause in typing (seconds) before live mode re-runs the query
+LIVE_DELAY = 0.5
+
+# Seconds between auto-refreshes of a query without a REFRESH clause
+REFRESH_DEFAULT = 5.0
+
+# Loaded sources kept between runs (each holds a whole DataFrame)
+SOURCE_CACHE_ENTRIES = 2
+
+# Fraction of the visible x range moved by one pan step
+PAN_STEP = 0.25
+
+# Scale of the visible x range per zoom step
+ZOOM_STEP = 0.5
+
 
 EXAMPLE_QUERY = """\
 WITH 'examples/trades.csv'
@@ -224,9 +272,51 @@ class QueryEditor(TextArea):
         self.indent_width = 2
         self.autocompleter = AutoCompleter()
         self._completion_active = False
+        self._completion_timer: Optional[Timer] = None
+        # Id of the latest completion request; older results are dropped
+        self._completion_request = 0
+        self.diagnostics: List[Diagnostic] = []
+        # Underlined (start, end) character ranges, by line
+        self._error_ranges: Dict[int, List[Tuple[int, int]]] = {}
+        self._incremental_parser = IncrementalParser()
+        self._update_diagnostics()
+
+    def get_line(self, line_index: int) -> Text:
+        """Get a line for rendering, with live parse diagnostics underlined."""
+        line = super().get_line(line_index)
+        for start, end in self._error_ranges.get(line_index, ()):
+            line.stylize(ERROR_STYLE, start, end)
+        return line
+
+    def _update_diagnostics(self) -> None:
+        """Re-validate the buffer and record each diagnostic's range."""
+        text = self.text
+        self.diagnostics = self._incremental_parser.parse(text).diagnostics
+        self._error_ranges = {}
+
+        lines = text.split("\n")
+        line_starts = [0]
+        for line in lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+
+        for diag in self.diagnostics:
+            row = max(0, bisect_right(line_starts, diag.start) - 1)
+            line = lines[row]
+            start = diag.start - line_starts[row]
+            end = min(diag.end - line_starts[row], len(line))
+            if start >= len(line):
+                # Error at end of line/input - underline the last character
+                start = max(0, len(line) - 1)
+                end = len(line)
+            if start >= end:
+                continue
+            self._error_ranges.setdefault(row, []).append((start, end))
 
     def on_text_area_changed(self, _event) -> None:
-        """Auto-trigger completions as user types."""
+        """Re-validate the buffer and auto-trigger completions as user types."""
+        # Runs before the app's handler, which shows the new diagnostics
+        self._update_diagnostics()
+        self.refresh()
         text = self.text
         if not text:
             return
@@ -237,7 +327,7 @@ class QueryEditor(TextArea):
             char = text[offset - 1] if offset <= len(text) else ""
             # Trigger on quote (for file paths), open paren, space, newline, or alphanumeric
             if char in ("'", '"', " ", "/", "(", "\n") or char.isalnum():
-                self._show_completions()
+                self._schedule_completions()
 
     def _get_cursor_offset(self) -> int:
         """Convert cursor location to character offset."""
@@ -261,26 +351,71 @@ class QueryEditor(TextArea):
         popup.hide()
         self._completion_active = False
 
+    def _schedule_completions(self) -> None:
+        """Show completions once typing pauses, restarting the wait on each key."""
+        if self._completion_timer is not None:
+            self._completion_timer.stop()
+        self._completion_timer = self.set_timer(COMPLETION_DELAY, self._show_completions)
+
     def _show_completions(self) -> None:
-        """Show autocomplete suggestions."""
+        """Compute autocomplete suggestions in a worker thread."""
+        self._completion_request += 1
+        self.run_worker(
+            partial(
+                self._compute_completions,
+                self._completion_request,
+                self.text,
+                self._get_cursor_offset(),
+            ),
+            name="completions",
+            group="completions",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _compute_completions(self, request: int, text: str, offset: int) -> None:
+        """Get completions off the UI thread: they may read files and the config."""
         try:
-            popup = self.app.query_one("#completion-popup", CompletionPopup)
-            offset = self._get_cursor_offset()
-            completions = self.autocompleter.get_completions(self.text, offset)
-
-            if completions:
-                # Extract display text
-                display_items = [c.display for c in completions]
-                # Pass editor for cursor positioning
-                popup.show_completions(display_items, self)
-                # Store full completions for insertion
-                popup._full_completions = completions
-                self._completion_active = True
-            else:
-                popup.hide()
-                self._completion_active = False
+            completions = self.autocompleter.get_completions(text, offset)
         except Exception as e:
             logger.error(f"Autocomplete error: {e}")
+            return
+        try:
+            self.app.call_from_thread(
+                self._apply_completions, request, text, offset, completions
+            )
+        except RuntimeError:
+            pass  # App is shutting down
+
+    def _apply_completions(
+        self,
+        request: int,
+        text: str,
+        offset: int,
+        completions: List[Completion],
+    ) -> None:
+        """Show suggestions, unless the buffer changed since they were requested."""
+        if request != self._completion_request:
+            return
+        if self.text != text or self._get_cursor_offset() != offset:
+            return
+        try:
+            popup = self.app.query_one("#completion-popup", CompletionPopup)
+        except NoMatches:
+            return  # Screen is being torn down
+
+        if completions:
+            # Extract display text
+            display_items = [c.display for c in completions]
+            # Pass editor for cursor positioning
+            popup.show_completions(display_items, self)
+            # Store full completions for insertion
+            popup._full_completions = completions
+            self._completion_active = True
+        else:
+            popup.hide()
+            self._completion_active = False
 
     def on_key(self, event) -> None:
         """Handle key events for autocomplete navigation."""
@@ -353,7 +488,8 @@ class QueryEditor(TextArea):
             quote_char = text[0]
             # Find if there's an unmatched opening quote before cursor
             quote_match = re.search(rf"{quote_char}([^{quote_char}]*)$", before)
-            if quote_match:
+            # An even count means the last quote closes an earlier string
+            if quote_match and before.count(quote_char) % 2 == 1:
                 # User typed quote + partial, replace from the quote
                 quote_start = quote_match.start()
                 new_text = self.text[:quote_start] + text + self.text[offset:]
@@ -391,8 +527,30 @@ class QueryEditor(TextArea):
             self.cursor_location = (len(lines) - 1, len(lines[-1]))
 
 
-class PlotPanel(Static):
-    """Plot display panel using textual-image for HD rendering."""
+class PlotPanel(Static, can_focus=True):
+    """
+    Plot display panel using textual-image for HD rendering.
+
+    When focused, the keyboard pans and zooms the x axis of line and
+    scatter plots. The panel only tracks the visible window and posts
+    ViewChanged; the app re-executes the query over it.
+    """
+
+    BINDINGS = [
+        Binding("left,h", f"pan({-PAN_STEP})", "Pan left", show=False),
+        Binding("right,l", f"pan({PAN_STEP})", "Pan right", show=False),
+        Binding("plus,equals_sign,up", f"zoom({ZOOM_STEP})", "Zoom in"),
+        Binding("minus,down", f"zoom({1 / ZOOM_STEP})", "Zoom out"),
+        Binding("0", "reset_view", "Reset zoom"),
+    ]
+
+    class ViewChanged(Message):
+        """Posted when the visible x range changes."""
+
+        def __init__(self, view: Optional[XRange]) -> None:
+            super().__init__()
+            # Visible window, or None for the whole plot
+            self.view = view
 
     DEFAULT_CSS = f"""
     PlotPanel {{
@@ -405,6 +563,11 @@ class PlotPanel(Static):
         width: auto;
         height: 1fr;
     }}
+    PlotPanel > #plot-preview {{
+        width: 100%;
+        height: 100%;
+        display: none;
+    }}
     """
 
     # Default cell size in pixels (common terminal default)
@@ -414,11 +577,44 @@ class PlotPanel(Static):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._last_size = (0, 0)
+        # Full x range of the plotted results, None if they can't be windowed
+        self.extent: Optional[XRange] = None
+        # Visible window, None when the whole plot is shown
+        self.view: Optional[XRange] = None
+
+    def set_extent(self, extent: Optional[XRange]) -> None:
+        """Start over from the whole plot of new results."""
+        self.extent = extent
+        self.view = None
+
+    def action_zoom(self, factor: float) -> None:
+        """Scale the visible x range about its centre."""
+        if self.extent is None:
+            return
+        view = (self.view or self.extent).zoom(factor, self.extent)
+        if view.high - view.low >= self.extent.high - self.extent.low:
+            view = None  # Zoomed all the way out
+        self._set_view(view)
+
+    def action_pan(self, fraction: float) -> None:
+        """Move the visible x range by a fraction of its width."""
+        if self.view is not None:
+            self._set_view(self.view.pan(fraction, self.extent))
+
+    def action_reset_view(self) -> None:
+        """Show the whole plot again."""
+        self._set_view(None)
+
+    def _set_view(self, view: Optional[XRange]) -> None:
+        if view != self.view:
+            self.view = view
+            self.post_message(self.ViewChanged(view))
 
     def compose(self) -> ComposeResult:
-        """Create the image widget."""
+        """Create the image widget, and the text preview shown while it renders."""
         placeholder = self._create_placeholder()
         yield TextualImage(placeholder, id="plot-image")
+        yield Static(id="plot-preview")
 
     def _create_placeholder(self) -> PILImage.Image:
         """Create a placeholder image matching the terminal background."""
@@ -443,50 +639,169 @@ class PlotPanel(Static):
     def render_plot(self, data: List[PlotData]) -> None:
         """Render plot from query results using the configured engine."""
         try:
-            # Get current widget size in pixels
             width, height = self._get_pixel_size()
+            self.show_image(self.render_image(data, width, height, self.id))
+        except Exception as e:
+            logger.error(f"Plot render error: {e}")
+            self.show_error(str(e))
 
-            # Render to PNG bytes using the engine at 1:1 scale (no downsampling)
+    @staticmethod
+    def render_image(
+        data: List[PlotData],
+        width: int,
+        height: int,
+        view: Optional[str] = None,
+    ) -> PILImage.Image:
+        """
+        Render query results to an image.
+
+        Renders through the engine's retained view for the panel, so
+        re-running a query with the same layout only updates the plot data.
+        Safe to call from a worker thread: renders are serialized because
+        the engine's retained figures are not thread-safe.
+        """
+        with _render_lock:
+            # Render straight to RGBA pixels at 1:1 scale - no PNG round trip.
+            # Copy out of the canvas buffer, which the next render redraws.
             engine = get_engine()
-            img_bytes = engine.render_to_bytes(data, width, height, scale=1.0)
+            with engine.render_view(data, width, height, view or "plot") as result:
+                img = result.to_image().copy()
 
-            # Save to file for debugging
-            with open("debug_plot.png", "wb") as f:
-                f.write(img_bytes)
-            logger.info(f"Saved debug_plot.png ({width}x{height})")
+        if DEBUG_PLOT_PATH:
+            img.save(DEBUG_PLOT_PATH)
+            logger.info(f"Saved {DEBUG_PLOT_PATH} ({width}x{height})")
 
-            # Load as PIL Image
-            img = PILImage.open(BytesIO(img_bytes))
+        return img
 
-            # Update the image widget by querying for it
-            try:
-                image_widget = self.query_one("#plot-image", TextualImage)
-                image_widget.image = img
-                self._last_size = (width, height)
-                logger.info(f"Plot rendered: {width}x{height}")
-            except Exception as e:
-                logger.error(f"Could not find image widget: {e}")
+    @classmethod
+    def render_text(cls, data: List[PlotData], width: int, height: int) -> Optional[Text]:
+        """
+        Draw query results as braille text for a panel of the given pixel size.
 
+        Takes a few milliseconds, so it can be shown while render_image()
+        runs. Safe to call from a worker thread.
+
+        Returns:
+            The preview, or None if it couldn't be drawn.
+        """
+        try:
+            return render_preview(data, int(width / cls.CELL_WIDTH), int(height / cls.CELL_HEIGHT))
         except Exception as e:
-            logger.error(f"Plot render error: {e}")
-            self.show_error(str(e))
+            # Only a preview: the full render reports any real problem
+            logger.warning(f"Plot preview error: {e}")
+            return None
+
+    def show_preview(self, text: Text) -> None:
+        """Display a text preview in place of the image until show_image()."""
+        try:
+            preview = self.query_one("#plot-preview", Static)
+            preview.update(text)
+            preview.display = True
+            self.query_one("#plot-image", TextualImage).display = False
+        except NoMatches as e:
+            logger.error(f"Could not find preview widget: {e}")
+
+    def show_image(self, img: PILImage.Image) -> None:
+        """Display a rendered plot image."""
+        self._hide_preview()
+        try:
+            image_widget = self.query_one("#plot-image", TextualImage)
+            image_widget.display = True
+            image_widget.image = img
+            self._last_size = img.size
+            logger.info(f"Plot rendered: {img.size[0]}x{img.size[1]}")
+        except Exception as e:
+            logger.error(f"Could not find image widget: {e}")
 
     def show_error(self, message: str) -> None:
         """Display error state."""
+        self._hide_preview()
         try:
             image_widget = self.query_one("#plot-image", TextualImage)
+            image_widget.display = True
             image_widget.image = self._create_placeholder()
         except Exception:
             pass
 
+    def _hide_preview(self) -> None:
+        try:
+            self.query_one("#plot-preview", Static).display = False
+        except NoMatches:
+            pass
+
+
+def memory_usage_mb() -> Optional[float]:
+    """
+    Resident memory of this process in MB, or None if unavailable.
+
+    Reads current usage from /proc on Linux; elsewhere falls back to the
+    peak resident size reported by getrusage.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
 
 class StatusBar(Static):
     """Shows query status and row counts."""
 
-    def __init__(self):
-        super().__init__("Ready - Press F5 to execute", id="status")
+    READY_MESSAGE = "Ready - Press F5 to execute"
+    SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+    def __init__(self, id: str = "status"):
+        super().__init__(self.READY_MESSAGE, id=id)
+        self._showing_diagnostics = False
+        self._stage: Optional[str] = None
+        self._frame = 0
+        self._spinner: Optional[Timer] = None
+
+    @property
+    def running(self) -> bool:
+        """True while a query is in progress."""
+        return self._stage is not None
+
+    def set_running(self, stage: str) -> None:
+        """Show an animated progress indicator for a running query."""
+        self._showing_diagnostics = False
+        self._stage = stage
+        if self._spinner is None:
+            self._spinner = self.set_interval(0.1, self._advance_spinner)
+        self._render_progress()
+
+    def _advance_spinner(self) -> None:
+        self._frame = (self._frame + 1) % len(self.SPINNER_FRAMES)
+        self._render_progress()
+
+    def _render_progress(self) -> None:
+        if self._stage is None:
+            return
+        frame = self.SPINNER_FRAMES[self._frame]
+        self.update(f"[{THEME.highlight}]{frame}[/] {self._stage}... (Esc to cancel)")
+
+    def _stop_spinner(self) -> None:
+        self._stage = None
+        if self._spinner is not None:
+            self._spinner.stop()
+            self._spinner = None
+
+    def set_cancelled(self) -> None:
+        self._stop_spinner()
+        self._showing_diagnostics = False
+        self.update("[yellow]Cancelled[/]")
 
     def set_success(self, data_list: List[PlotData]) -> None:
+        self._stop_spinner()
+        self._showing_diagnostics = False
         # Use first series for row counts (all series share same base data)
         first = data_list[0]
         filtered = first.filtered_count
@@ -495,19 +810,47 @@ class StatusBar(Static):
 
         if series_count == 1:
             if filtered == total:
-                self.update(f"[green]OK[/] - {total} rows")
+                message = f"[green]OK[/] - {total} rows"
             else:
-                self.update(f"[green]OK[/] - {filtered}/{total} rows (filtered)")
+                message = f"[green]OK[/] - {filtered}/{total} rows (filtered)"
         else:
             # Show series count for multi-series queries
-            self.update(f"[green]OK[/] - {total} rows, {series_count} series")
+            message = f"[green]OK[/] - {total} rows, {series_count} series"
+
+        # Memory after each run, so growth over a long session is visible
+        memory = memory_usage_mb()
+        if memory is not None:
+            message += f" [{THEME.text_muted}]· {memory:.0f} MB[/]"
+        self.update(message)
 
     def set_error(self, message: str) -> None:
+        self._stop_spinner()
+        self._showing_diagnostics = False
         # Truncate long errors
         if len(message) > 80:
             message = message[:77] + "..."
         self.update(f"[red]Error:[/] {message}")
 
+    def set_diagnostics(self, diagnostics: List[Diagnostic], text: str) -> None:
+        """Show the first live parse diagnostic, or clear a previous one."""
+        if self.running:
+            return  # Progress takes precedence while a query runs
+        if not diagnostics:
+            if self._showing_diagnostics:
+                self.update(self.READY_MESSAGE)
+                self._showing_diagnostics = False
+            return
+
+        first = diagnostics[0]
+        line = text.count("\n", 0, first.start) + 1
+        message = f"{first.message} (line {line})"
+        if len(diagnostics) > 1:
+            message += f" +{len(diagnostics) - 1} more"
+        if len(message) > 80:
+            message = message[:77] + "..."
+        self.update(f"[yellow]Syntax:[/] {message}")
+        self._showing_diagnostics = True
+
 
 class PlotQLApp(App):
     """PlotQL interactive TUI application."""
@@ -542,12 +885,39 @@ class PlotQLApp(App):
     BINDINGS = [
         Binding("ctrl+q", "quit", "Quit"),
         Binding("f5", "execute", "Execute", show=True),
+        Binding("f4", "toggle_live", "Live", show=True),
+        Binding("f3", "focus_plot", "Pan/Zoom", show=True),
         Binding("f2", "edit_config", "Connectors", show=True),
+        Binding("f8", "toggle_refresh", "Auto-refresh", show=True),
+        # Priority so it works from the editor; inactive when idle, so Esc
+        # falls through to the editor (e.g. to dismiss completions)
+        Binding("escape", "cancel_query", "Cancel", priority=True),
     ]
 
-    def __init__(self, initial_query: Optional[str] = None):
+    def __init__(self, initial_query: Optional[str] = None, live: bool = False):
         super().__init__()
         self.initial_query = initial_query
+        # Live mode re-runs the query whenever an edit leaves it valid
+        self.live = live
+        self._live_timer: Optional[Timer] = None
+        # Query of the last live run, so edits that don't change it are skipped
+        self._live_query: Optional[PlotQuery] = None
+        # Auto-refresh re-runs the plotted query as its source grows
+        self.auto_refreshing = False
+        self._refresh_timer: Optional[Timer] = None
+        # Follows the source of the plotted query while auto-refreshing
+        self._refresher: Optional[Refresher] = None
+        # Token of the query in flight; a new run supersedes it
+        self._cancel_token: Optional[CancelToken] = None
+        # Reused between runs, so a re-run only recomputes what changed
+        self._source_cache = SourceCache(max_entries=SOURCE_CACHE_ENTRIES)
+        self._series_cache = SeriesCache()
+        # Rows fetched for zoomed windows, reused while panning and zooming
+        self._tile_cache = TileCache()
+        # Pre-aggregated large lines, kept on disk between sessions
+        self._pyramids = PyramidStore()
+        # Query and results shown in the plot panel
+        self._last_result: Optional[tuple[PlotQuery, List[PlotData]]] = None
         logger.info("PlotQLApp initialized")
 
     def on_key(self, event) -> None:
@@ -565,45 +935,394 @@ class PlotQLApp(App):
         yield CompletionPopup()
         yield Footer()
 
+    def on_text_area_changed(self, event: TextArea.Changed) -> None:
+        """Surface live parse diagnostics from the query editor."""
+        if not isinstance(event.text_area, QueryEditor):
+            return
+        try:
+            status = self.query_one("#status", StatusBar)
+        except NoMatches:
+            return  # Screen is being torn down
+        status.set_diagnostics(event.text_area.diagnostics, event.text_area.text)
+        if self.live:
+            self._schedule_live_run(event.text_area)
+
     def on_mount(self) -> None:
+        # Index the working directory before the first path completion
+        get_path_index().warm(Path("."))
         if self.initial_query:
             editor = self.query_one("#editor", TextArea)
             editor.text = self.initial_query
             # Auto-execute if query provided
             self.action_execute()
 
+    def check_action(self, action: str, parameters: tuple) -> Optional[bool]:
+        """Only offer cancelling while a query is running."""
+        if action == "cancel_query":
+            return self._cancel_token is not None
+        return True
+
     def action_execute(self) -> None:
-        """Execute the current query."""
+        """Execute the current query in a worker thread."""
         logger.info("action_execute called!")
         editor = self.query_one("#editor", TextArea)
-        plot = self.query_one("#plot", PlotPanel)
-        status = self.query_one("#status", StatusBar)
 
         query_text = editor.text.strip()
         if not query_text:
-            status.set_error("Empty query")
+            self.query_one("#status", StatusBar).set_error("Empty query")
             return
+        self._start_query(query_text)
 
+    def action_focus_plot(self) -> None:
+        """Move focus between the editor and the plot (to pan and zoom)."""
+        plot = self.query_one("#plot", PlotPanel)
+        if plot.has_focus:
+            self.query_one("#editor", QueryEditor).focus()
+        else:
+            plot.focus()
+
+    def on_plot_panel_view_changed(self, event: PlotPanel.ViewChanged) -> None:
+        """Re-execute the plotted query over the new x window."""
+        if self._last_result is None:
+            return
+        query, data = self._last_result
+        if event.view is None:
+            # The whole plot is the last full result
+            self._start_render(query, data)
+        else:
+            self._start_view(query, event.view)
+
+    def action_toggle_live(self) -> None:
+        """Turn live mode (re-run on every valid edit) on or off."""
+        self.live = not self.live
+        self.notify(f"Live mode {'on' if self.live else 'off'}")
+        if self.live:
+            self._schedule_live_run(self.query_one("#editor", QueryEditor))
+        elif self._live_timer is not None:
+            self._live_timer.stop()
+            self._live_timer = None
+
+    def action_toggle_refresh(self) -> None:
+        """Turn auto-refresh of the plotted query on or off."""
+        self.auto_refreshing = not self.auto_refreshing
+        query = self._last_result[0] if self._last_result is not None else None
+        self._schedule_refresh(query)
+        if self.auto_refreshing:
+            interval = (query and query.refresh) or REFRESH_DEFAULT
+            self.notify(f"Auto-refresh every {interval:g}s")
+        else:
+            self.notify("Auto-refresh off")
+
+    def _schedule_refresh(
+        self,
+        query: Optional[PlotQuery],
+        refresher: Optional[Refresher] = None,
+    ) -> None:
+        """Refresh the query on its interval while auto-refresh is on, else stop."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+            self._refresh_timer = None
+        if not self.auto_refreshing or query is None:
+            self._refresher = None
+            return
+        if refresher is None and (self._refresher is None or self._refresher.query != query):
+            refresher = Refresher(query)
+        if refresher is not None:
+            self._refresher = refresher
+        self._refresh_timer = self.set_interval(
+            query.refresh or REFRESH_DEFAULT, self._refresh_tick
+        )
+
+    def _refresh_tick(self) -> None:
+        """Re-run the plotted query in the background if its source changed."""
+        refresher = self._refresher
+        if refresher is None or self._cancel_token is not None:
+            return  # Skipped while a run is in flight
+        plot = self.query_one("#plot", PlotPanel)
+        if plot.view is not None:
+            return  # Don't pull a zoomed plot back to the whole range
+        token = CancelToken()
+        self._set_active_token(token)
+        width, height = plot._get_pixel_size()
+        self.run_worker(
+            partial(self._run_refresh, refresher, token, width, height, plot.id),
+            name="query",
+            group="query",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _schedule_live_run(self, editor: "QueryEditor") -> None:
+        """Re-run the query once typing pauses, if the edit left it valid."""
+        if self._live_timer is not None:
+            self._live_timer.stop()
+            self._live_timer = None
+        if editor.diagnostics or not editor.text.strip():
+            return
+        self._live_timer = self.set_timer(LIVE_DELAY, self._live_run)
+
+    def _live_run(self) -> None:
+        """Bring the plot up to date with the editor, doing as little as possible."""
+        self._live_timer = None
+        query_text = self.query_one("#editor", QueryEditor).text.strip()
         try:
-            # Parse
-            ast = parse(query_text)
-            # Execute
-            data = execute(ast)
-            # Render
-            plot.render_plot(data)
-            status.set_success(data)
+            query = parse(query_text)
+        except ParseError:
+            return
+        # Whitespace and comment edits leave the query unchanged
+        if query == self._live_query:
+            return
+        self._live_query = query
+
+        if self._last_result is not None:
+            previous, data = self._last_result
+            restyled = restyle(previous, data, query)
+            if restyled is not None:
+                # Only styling changed: redraw the plot without executing
+                self._start_render(query, restyled)
+                return
+        self._start_query(query_text)
 
-        except ParseError as e:
-            status.set_error(f"Parse: {e.message}")
-            plot.show_error(str(e))
+    def _start_query(self, query_text: str) -> None:
+        """Execute a query and render it in a worker thread."""
+        plot = self.query_one("#plot", PlotPanel)
 
-        except ExecutionError as e:
-            status.set_error(str(e))
-            plot.show_error(str(e))
+        # Supersede any query still running
+        token = self._start_run("Running query")
+        width, height = plot._get_pixel_size()
+        self.run_worker(
+            partial(self._run_query, query_text, token, width, height, plot.id),
+            name="query",
+            group="query",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
 
+    def _start_render(self, query: PlotQuery, data: List[PlotData]) -> None:
+        """Render results without executing, in a worker thread."""
+        plot = self.query_one("#plot", PlotPanel)
+
+        token = self._start_run("Rendering")
+        width, height = plot._get_pixel_size()
+        self.run_worker(
+            partial(self._run_render, query, data, token, width, height, plot.id),
+            name="query",
+            group="query",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _start_view(self, query: PlotQuery, view: XRange) -> None:
+        """Execute a query over an x window and render it, in a worker thread."""
+        plot = self.query_one("#plot", PlotPanel)
+
+        token = self._start_run("Loading range")
+        width, height = plot._get_pixel_size()
+        self.run_worker(
+            partial(self._run_view, query, view, token, width, height, plot.id),
+            name="query",
+            group="query",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _start_run(self, stage: str) -> CancelToken:
+        """Cancel the run in flight and make a token for a new one."""
+        self._abort_query()
+        token = CancelToken()
+        self._set_active_token(token)
+        self.query_one("#status", StatusBar).set_running(stage)
+        return token
+
+    def action_cancel_query(self) -> None:
+        """Cancel the running query."""
+        if self._abort_query():
+            self.query_one("#status", StatusBar).set_cancelled()
+
+    def _abort_query(self) -> bool:
+        """Cancel the query in flight, if any. Returns True if one was."""
+        token = self._cancel_token
+        if token is None:
+            return False
+        self._set_active_token(None)
+        # Aborting may block on the network (e.g. killing a database query)
+        self.run_worker(token.cancel, group="cancel", thread=True)
+        return True
+
+    def _set_active_token(self, token: Optional[CancelToken]) -> None:
+        self._cancel_token = token
+        self.refresh_bindings()
+
+    def _run_query(
+        self,
+        query_text: str,
+        token: CancelToken,
+        width: int,
+        height: int,
+        view: Optional[str] = None,
+    ) -> None:
+        """Parse, execute and render a query. Runs in a worker thread."""
+        refresher = None
+        try:
+            ast = parse(query_text)
+            if self.auto_refreshing or ast.refresh:
+                # Start following the source, so refreshes fetch only new rows
+                refresher = self._refresher
+                if refresher is None or refresher.query != ast:
+                    refresher = Refresher(ast)
+                data = refresher.run(token, resolution=width)
+            else:
+                data = execute(
+                    ast,
+                    cache=self._source_cache,
+                    cancel=token,
+                    series_cache=self._series_cache,
+                    resolution=width,
+                    pyramids=self._pyramids,
+                )
+            token.raise_if_cancelled()
+            preview = PlotPanel.render_text(data, width, height)
+            self._post_result(token, self._query_rendering, preview)
+            image = PlotPanel.render_image(data, width, height, view)
+        except ExecutionCancelled:
+            return
+        except ParseError as e:
+            self._post_result(token, self._query_failed, f"Parse: {e.message}")
+        except ExecutionError as e:
+            self._post_result(token, self._query_failed, str(e))
+        except Exception as e:
+            self._post_result(token, self._query_failed, str(e))
+        else:
+            self._post_result(token, self._query_succeeded, data, image, ast, refresher)
+
+    def _run_refresh(
+        self,
+        refresher: Refresher,
+        token: CancelToken,
+        width: int,
+        height: int,
+        view: Optional[str] = None,
+    ) -> None:
+        """Re-run a query and render it if its data changed. Runs in a worker thread."""
+        try:
+            data = refresher.refresh(token, resolution=width)
+            if data is None:
+                self._post_result(token, self._refresh_unchanged)
+                return
+            token.raise_if_cancelled()
+            image = PlotPanel.render_image(data, width, height, view)
+        except ExecutionCancelled:
+            return
         except Exception as e:
-            status.set_error(str(e))
-            plot.show_error(str(e))
+            self._post_result(token, self._query_failed, str(e))
+        else:
+            self._post_result(
+                token, self._query_succeeded, data, image, refresher.query, refresher
+            )
+
+    def _run_render(
+        self,
+        query: PlotQuery,
+        data: List[PlotData],
+        token: CancelToken,
+        width: int,
+        height: int,
+        view: Optional[str] = None,
+    ) -> None:
+        """Render results of an earlier run. Runs in a worker thread."""
+        try:
+            image = PlotPanel.render_image(data, width, height, view)
+        except Exception as e:
+            self._post_result(token, self._query_failed, str(e))
+        else:
+            self._post_result(token, self._query_succeeded, data, image, query)
+
+    def _run_view(
+        self,
+        query: PlotQuery,
+        view: XRange,
+        token: CancelToken,
+        width: int,
+        height: int,
+        plot_view: Optional[str] = None,
+    ) -> None:
+        """Execute a query over an x window and render it. Runs in a worker thread."""
+        try:
+            # Lines are reduced to the panel width, so a narrow window
+            # shows every point while a wide one stays cheap to draw
+            data = execute(
+                query,
+                cache=self._source_cache,
+                cancel=token,
+                x_range=view,
+                resolution=width,
+                tiles=self._tile_cache,
+                pyramids=self._pyramids,
+            )
+            token.raise_if_cancelled()
+            preview = PlotPanel.render_text(data, width, height)
+            self._post_result(token, self._query_rendering, preview)
+            image = PlotPanel.render_image(data, width, height, plot_view)
+        except ExecutionCancelled:
+            return
+        except Exception as e:
+            self._post_result(token, self._query_failed, str(e))
+        else:
+            # Without the query, so the full result stays the base for zooming
+            self._post_result(token, self._query_succeeded, data, image)
+
+    def _post_result(self, token: CancelToken, callback, *args) -> None:
+        """Hand a worker result to the UI thread unless it was superseded."""
+        if token.cancelled:
+            return
+        try:
+            self.call_from_thread(callback, token, *args)
+        except RuntimeError:
+            pass  # App is shutting down
+
+    def _query_rendering(self, token: CancelToken, preview: Optional[Text] = None) -> None:
+        if token is not self._cancel_token:
+            return
+        self.query_one("#status", StatusBar).set_running("Rendering")
+        if preview is not None:
+            self.query_one("#plot", PlotPanel).show_preview(preview)
+
+    def _query_succeeded(
+        self,
+        token: CancelToken,
+        data: List[PlotData],
+        image: PILImage.Image,
+        query: Optional[PlotQuery] = None,
+        refresher: Optional[Refresher] = None,
+    ) -> None:
+        if token is not self._cancel_token:
+            return
+        self._set_active_token(None)
+        plot = self.query_one("#plot", PlotPanel)
+        if query is not None:
+            if query.refresh and (self._last_result is None or self._last_result[0] != query):
+                # Running a query with a REFRESH clause turns auto-refresh on
+                self.auto_refreshing = True
+            self._last_result = (query, data)
+            plot.set_extent(x_extent(data))
+            self._schedule_refresh(query, refresher)
+        plot.show_image(image)
+        self.query_one("#status", StatusBar).set_success(data)
+
+    def _refresh_unchanged(self, token: CancelToken) -> None:
+        if token is self._cancel_token:
+            self._set_active_token(None)
+
+    def _query_failed(self, token: CancelToken, message: str) -> None:
+        if token is not self._cancel_token:
+            return
+        self._set_active_token(None)
+        self.query_one("#status", StatusBar).set_error(message)
+        self.query_one("#plot", PlotPanel).show_error(message)
 
     def action_edit_config(self) -> None:
         """Open the config editor screen."""
@@ -625,7 +1344,7 @@ class PlotQLApp(App):
         self.exit()
 
 
-def run_tui(query: Optional[str] = None) -> None:
+def run_tui(query: Optional[str] = None, live: bool = False) -> None:
     """Run the PlotQL TUI application."""
-    app = PlotQLApp(initial_query=query)
+    app = PlotQLApp(initial_query=query, live=live)
     app.run()
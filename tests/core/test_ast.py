@@ -500,6 +500,18 @@ class TestPlotQuery:
         assert "AND" in repr_str
         assert "y < 100" in repr_str
 
+    def test_repr_with_refresh(self):
+        """Test __repr__ shows the refresh interval after the source."""
+        from dataclasses import replace
+
+        query = make_plot_query(
+            source="data.csv",
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+        )
+        assert "REFRESH" not in repr(query)
+        assert "WITH source('data.csv') REFRESH EVERY 30s" in repr(replace(query, refresh=30.0))
+
     def test_plot_query_equality(self):
         """Test PlotQuery equality."""
         query1 = make_plot_query(
@@ -0,0 +1,206 @@
+"""
+Unit tests for plotql.core.batch module.
+
+Tests headless rendering of multi-query scripts and the `plotql render` CLI.
+"""
+from pathlib import Path
+
+import pytest
+
+from plotql.cli import main
+from plotql.core.batch import output_path, render_script
+
+
+def _script(csv: Path, count: int) -> str:
+    return "\n".join(
+        f"WITH source('{csv}') PLOT y AGAINST x AS 'line'"
+        for _ in range(count)
+    )
+
+
+class TestOutputPath:
+    """Tests for output file naming."""
+
+    def test_numbered_from_one(self, temp_dir: Path):
+        """Test files are numbered in script order starting at 1."""
+        assert output_path(temp_dir, "report", 0, 5, "png").name == "report_001.png"
+
+    def test_padding_grows_with_count(self, temp_dir: Path):
+        """Test numbering is padded so large batches sort correctly."""
+        assert output_path(temp_dir, "report", 9, 1200, "svg").name == "report_0010.svg"
+
+
+class TestRenderScript:
+    """Tests for render_script."""
+
+    def test_renders_every_query(self, temp_csv: Path, temp_dir: Path):
+        """Test each query in the script is written to its own file."""
+        out = temp_dir / "out"
+        results = render_script(_script(temp_csv, 3), out, workers=1)
+
+        assert [r.ok for r in results] == [True, True, True]
+        assert [r.path.name for r in results] == [
+            "plot_001.png", "plot_002.png", "plot_003.png",
+        ]
+        for result in results:
+            assert result.path.read_bytes().startswith(b"\x89PNG")
+
+    def test_svg_output(self, temp_csv: Path, temp_dir: Path):
+        """Test SVG output format."""
+        results = render_script(
+            _script(temp_csv, 1), temp_dir, format="svg", workers=1
+        )
+        assert b"<svg" in results[0].path.read_bytes()
+
+    def test_unsupported_format(self, temp_csv: Path, temp_dir: Path):
+        """Test unknown formats are rejected up front."""
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            render_script(_script(temp_csv, 1), temp_dir, format="bmp")
+
+    def test_failures_do_not_stop_batch(self, temp_csv: Path, temp_dir: Path):
+        """Test parse and execution errors are recorded per query."""
+        script = (
+            f"WITH source('{temp_csv}') PLOT y\n"
+            f"WITH source('{temp_dir / 'missing.csv'}') PLOT y AGAINST x\n"
+            f"WITH source('{temp_csv}') PLOT y AGAINST x\n"
+        )
+        results = render_script(script, temp_dir, workers=1)
+
+        assert results[0].error.startswith("Parse error")
+        assert results[1].error.startswith("Execution error")
+        assert results[2].ok
+
+    def test_source_loaded_once(self, temp_csv: Path, temp_dir: Path, monkeypatch):
+        """Test a file referenced by many queries is read once."""
+        from plotql.core.connectors import LiteralConnector
+
+        loads = []
+        original = LiteralConnector.load
+
+        def counting_load(self, config, filters=None):
+            loads.append(config["path"])
+            return original(self, config, filters)
+
+        monkeypatch.setattr(LiteralConnector, "load", counting_load)
+        render_script(_script(temp_csv, 4), temp_dir, workers=1)
+        assert len(loads) == 1
+
+    def test_process_pool(self, temp_csv: Path, temp_dir: Path):
+        """Test rendering across worker processes."""
+        results = render_script(_script(temp_csv, 3), temp_dir, workers=2)
+
+        assert all(r.ok for r in results)
+        assert all(r.path.exists() for r in results)
+
+    def test_empty_script(self, temp_dir: Path):
+        """Test a script without queries renders nothing."""
+        assert render_script("\n\n", temp_dir) == []
+
+
+class TestRenderCommand:
+    """Tests for the `plotql render` CLI command."""
+
+    def test_render_command(self, temp_csv: Path, temp_dir: Path, capsys):
+        """Test rendering a script file from the command line."""
+        script = temp_dir / "report.pql"
+        script.write_text(_script(temp_csv, 2))
+        out = temp_dir / "charts"
+
+        code = main(["render", str(script), "-o", str(out), "-j", "1"])
+
+        assert code == 0
+        assert sorted(p.name for p in out.iterdir()) == [
+            "report_001.png", "report_002.png",
+        ]
+        assert "report_001.png" in capsys.readouterr().out
+
+    def test_render_command_reports_failures(self, temp_dir: Path, capsys):
+        """Test failing queries give a non-zero exit status."""
+        script = temp_dir / "bad.pql"
+        script.write_text("WITH source('x.csv') PLOT y")
+
+        code = main(["render", str(script), "-o", str(temp_dir), "-j", "1"])
+
+        assert code == 1
+        assert "query 1" in capsys.readouterr().err
+
+    def test_render_command_missing_file(self, temp_dir: Path, capsys):
+        """Test a missing script file is reported."""
+        code = main(["render", str(temp_dir / "nope.pql")])
+
+        assert code == 1
+        assert "File not found" in capsys.readouterr().err
+
+    def test_render_command_engine(self, temp_csv: Path, temp_dir: Path, monkeypatch):
+        """Test --engine selects the rendering engine by name."""
+        from plotql.core import engines
+
+        monkeypatch.setattr(engines, "_default_engine", None)
+        script = temp_dir / "report.pql"
+        script.write_text(_script(temp_csv, 1))
+        out = temp_dir / "charts"
+
+        code = main(["render", str(script), "-o", str(out), "-j", "1", "--engine", "raster"])
+
+        assert code == 0
+        assert isinstance(engines.get_engine(), engines.RasterEngine)
+        assert (out / "report_001.png").read_bytes().startswith(b"\x89PNG")
+
+    def test_render_command_unknown_engine(self, temp_dir: Path, capsys):
+        """Test an unknown engine name is reported."""
+        script = temp_dir / "report.pql"
+        script.write_text("")
+
+        code = main(["render", str(script), "--engine", "nope"])
+
+        assert code == 1
+        assert "Unknown engine 'nope'" in capsys.readouterr().err
+
+
+class TestRenderGridScript:
+    """Tests for tiling a script's charts into one image."""
+
+    def test_grid_written_once(self, temp_csv: Path, temp_dir: Path):
+        """Test every chart is tiled into a single file."""
+        from PIL import Image
+
+        results = render_script(
+            _script(temp_csv, 3), temp_dir, name="dash",
+            width=200, height=150, workers=1, columns=2,
+        )
+
+        assert all(r.path == temp_dir / "dash.png" for r in results)
+        assert Image.open(temp_dir / "dash.png").size == (400, 300)
+
+    def test_grid_skips_failed_queries(self, temp_csv: Path, temp_dir: Path):
+        """Test queries that fail to execute are left out of the grid."""
+        script = f"WITH source('{temp_csv}') PLOT y\n" + _script(temp_csv, 1)
+        results = render_script(script, temp_dir, width=200, height=150, workers=1, columns=2)
+
+        assert results[0].error.startswith("Parse error")
+        assert results[1].ok
+
+    def test_grid_requires_png(self, temp_csv: Path, temp_dir: Path):
+        """Test grids can't be written as SVG."""
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            render_script(_script(temp_csv, 1), temp_dir, format="svg", columns=2)
+
+    def test_grid_command(self, temp_csv: Path, temp_dir: Path, capsys):
+        """Test `plotql render --grid` prints the one file it writes."""
+        script = temp_dir / "report.pql"
+        script.write_text(_script(temp_csv, 2))
+
+        code = main(["render", str(script), "-o", str(temp_dir), "-j", "1", "--grid", "2"])
+
+        assert code == 0
+        assert capsys.readouterr().out.split() == [str(temp_dir / "report.png")]
+
+    def test_grid_command_invalid(self, temp_csv: Path, temp_dir: Path, capsys):
+        """Test invalid grid options are reported."""
+        script = temp_dir / "report.pql"
+        script.write_text(_script(temp_csv, 1))
+
+        code = main(["render", str(script), "--grid", "0"])
+
+        assert code == 1
+        assert "columns must be a positive integer" in capsys.readouterr().err
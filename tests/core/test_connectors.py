@@ -8,6 +8,7 @@ import pytest
 
 from plotql.core.config import (
     ConfigError,
+    get_engine_name,
     get_source_config,
     list_sources,
     list_sources_by_type,
@@ -110,6 +111,33 @@ path = "/data/trades.csv"
         assert "type" in str(exc_info.value).lower()
 
 
+class TestGetEngineName:
+    """Tests for the config file's engine entry."""
+
+    def test_engine_name(self, tmp_path):
+        """Test a top-level engine entry is read alongside sources."""
+        config_path = tmp_path / "sources.toml"
+        config_path.write_text('engine = "raster"\n\n[trades]\ntype = "file"\npath = "/data/trades.csv"\n')
+
+        assert get_engine_name(config_path) == "raster"
+        assert list_sources(config_path) == ["trades"]
+
+    def test_no_engine_entry(self, tmp_path):
+        """Test configs without an engine entry return None."""
+        config_path = tmp_path / "sources.toml"
+        config_path.write_text('[trades]\ntype = "file"\npath = "/data/trades.csv"\n')
+
+        assert get_engine_name(config_path) is None
+
+    def test_engine_must_be_string(self, tmp_path):
+        """Test a non-string engine entry is rejected."""
+        config_path = tmp_path / "sources.toml"
+        config_path.write_text("engine = 3\n")
+
+        with pytest.raises(ConfigError, match="engine"):
+            get_engine_name(config_path)
+
+
 class TestListSources:
     """Tests for list_sources."""
 
@@ -225,6 +253,22 @@ class TestLiteralConnector:
             connector.load({"path": str(tmp_path / "missing.csv")})
         assert "not found" in str(exc_info.value).lower()
 
+    def test_fingerprint_changes_with_content(self, tmp_path):
+        """Test fingerprint changes when the file is rewritten."""
+        path = tmp_path / "data.csv"
+        path.write_text("x,y\n1,2\n")
+        connector = LiteralConnector()
+        before = connector.fingerprint({"path": str(path)})
+        path.write_text("x,y\n1,2\n3,4\n")
+        after = connector.fingerprint({"path": str(path)})
+        assert before is not None
+        assert before != after
+
+    def test_fingerprint_missing_file(self, tmp_path):
+        """Test fingerprint is None for a missing file."""
+        connector = LiteralConnector()
+        assert connector.fingerprint({"path": str(tmp_path / "missing.csv")}) is None
+
 
 # =============================================================================
 # FileConnector Tests
@@ -325,6 +369,14 @@ class TestFolderConnector:
             connector.load({"path": str(tmp_path), "segments": ["missing.csv"]})
         assert "not found" in str(exc_info.value).lower()
 
+    def test_fingerprint(self, tmp_path):
+        """Test fingerprint resolves the segments under the root."""
+        (tmp_path / "data.csv").write_text("x,y\n1,2\n")
+        connector = FolderConnector()
+        fingerprint = connector.fingerprint({"path": str(tmp_path), "segments": ["data.csv"]})
+        assert fingerprint is not None
+        assert "data.csv" in fingerprint
+
     def test_path_traversal_blocked(self, tmp_path):
         """Test that path traversal is blocked."""
         # Create a file outside the root
@@ -507,6 +559,414 @@ path = "{data_dir}"
         assert list(results[0].y) == [50, 100]
 
 
+# =============================================================================
+# Schema Tests
+# =============================================================================
+
+
+class TestConnectorSchema:
+    """Tests for reading source schemas without loading rows."""
+
+    @pytest.fixture(autouse=True)
+    def no_loading(self, monkeypatch):
+        """Fail any test that falls back to loading the data."""
+        for connector in (LiteralConnector, FileConnector, FolderConnector):
+            monkeypatch.setattr(connector, "load", lambda *a, **k: pytest.fail("loaded rows"))
+
+    @pytest.mark.parametrize("fixture", ["temp_csv", "temp_parquet", "temp_json", "temp_ndjson"])
+    def test_file_formats(self, fixture, request):
+        """Test each file format's schema is read from the file's start."""
+        path = request.getfixturevalue(fixture)
+        expected = pl.read_csv(path).schema if fixture == "temp_csv" else None
+
+        schema = LiteralConnector().schema({"path": str(path)})
+
+        assert schema.names()[:2] == ["x", "y"]
+        assert schema["x"] == pl.Int64
+        if expected is not None:
+            assert schema == expected
+
+    def test_json_beyond_prefix(self, tmp_path, monkeypatch):
+        """Test a JSON array is inferred from its first records only."""
+        from plotql.core.connectors import files
+
+        path = tmp_path / "big.json"
+        pl.DataFrame({"a": range(1000), "b": ["text"] * 1000}).write_json(path)
+        monkeypatch.setattr(files, "JSON_SCHEMA_PREFIX", 100)
+        monkeypatch.setattr(pl, "read_json", lambda *a, **k: pytest.fail("read whole file"))
+
+        assert files.file_schema(path) == pl.Schema({"a": pl.Int64, "b": pl.String})
+
+    def test_json_object_falls_back(self, tmp_path):
+        """Test JSON that isn't an array of records is read in full."""
+        path = tmp_path / "columns.json"
+        path.write_text('{"a": [1, 2], "b": [3, 4]}')
+
+        assert LiteralConnector().schema({"path": str(path)}).names() == ["a", "b"]
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file raises ConnectorError."""
+        with pytest.raises(ConnectorError, match="File not found"):
+            FileConnector().schema({"path": str(tmp_path / "missing.csv")})
+
+    def test_folder(self, tmp_path):
+        """Test a folder source reads the schema of the file its segments name."""
+        (tmp_path / "2024").mkdir()
+        (tmp_path / "2024" / "trades.csv").write_text("price,volume\n1.5,10\n")
+
+        schema = FolderConnector().schema({"path": str(tmp_path), "segments": ["2024", "trades.csv"]})
+
+        assert schema == pl.Schema({"price": pl.Float64, "volume": pl.Int64})
+
+    def test_folder_path_traversal(self, tmp_path):
+        """Test a folder schema lookup can't escape the root directory."""
+        root = tmp_path / "root"
+        root.mkdir()
+        (tmp_path / "secret.csv").write_text("a\n1\n")
+
+        with pytest.raises(ConnectorError, match="Path traversal not allowed"):
+            FolderConnector().schema({"path": str(root), "segments": ["..", "secret.csv"]})
+
+    def test_default_loads_source(self):
+        """Test connectors without a schema lookup fall back to loading."""
+        from plotql.core.connectors import Connector
+
+        class TableConnector(Connector):
+            def validate_config(self, config):
+                pass
+
+            def load(self, config, filters=None):
+                return pl.DataFrame({"a": [1], "b": ["x"]})
+
+        assert TableConnector().schema({}) == pl.Schema({"a": pl.Int64, "b": pl.String})
+
+
+class TestClickHouseSchema:
+    """Tests for ClickHouse schema lookup."""
+
+    def test_describe_table(self, monkeypatch):
+        """Test the schema comes from DESCRIBE TABLE, with types mapped to Polars."""
+        from unittest.mock import MagicMock
+
+        from plotql.core.connectors.clickhouse import ClickHouseConnector
+
+        client = MagicMock()
+        client.query.return_value.result_set = [
+            ("ts", "DateTime64(3)", "", "", "", "", ""),
+            ("price", "Nullable(Float64)", "", "", "", "", ""),
+            ("symbol", "LowCardinality(String)", "", "", "", "", ""),
+            ("tags", "Array(String)", "", "", "", "", ""),
+        ]
+        connector = ClickHouseConnector()
+        monkeypatch.setattr(connector, "_get_client", lambda config: client)
+
+        schema = connector.schema({"host": "localhost", "table": "trades"})
+
+        client.query.assert_called_once_with("DESCRIBE TABLE trades")
+        assert schema == pl.Schema({
+            "ts": pl.Datetime("us"),
+            "price": pl.Float64,
+            "symbol": pl.String,
+            "tags": pl.Unknown,
+        })
+
+    def test_query_failure(self, monkeypatch):
+        """Test a failing DESCRIBE raises ConnectionError."""
+        from unittest.mock import MagicMock
+
+        from plotql.core.connectors import ConnectionError
+        from plotql.core.connectors.clickhouse import ClickHouseConnector
+
+        client = MagicMock()
+        client.query.side_effect = RuntimeError("Table trades doesn't exist")
+        connector = ClickHouseConnector()
+        monkeypatch.setattr(connector, "_get_client", lambda config: client)
+
+        with pytest.raises(ConnectionError, match="doesn't exist"):
+            connector.schema({"host": "localhost", "table": "trades"})
+
+    @pytest.mark.parametrize("type_name, dtype", [
+        ("UInt8", pl.Int64),
+        ("Int64", pl.Int64),
+        ("Float32", pl.Float64),
+        ("Nullable(LowCardinality(String))", pl.String),
+        ("FixedString(16)", pl.String),
+        ("DateTime('UTC')", pl.Datetime("us")),
+        ("Date32", pl.Date),
+        ("Bool", pl.Boolean),
+        ("Map(String, UInt64)", pl.Unknown),
+    ])
+    def test_type_mapping(self, type_name, dtype):
+        """Test ClickHouse types map to the Polars types load() returns."""
+        from plotql.core.connectors.clickhouse import clickhouse_dtype
+
+        assert clickhouse_dtype(type_name) == dtype
+
+
+class TestColumnStats:
+    """Tests for sampled column statistics used by filter value completion."""
+
+    def test_frequent_values_and_range(self, tmp_path):
+        """Test values are ordered by frequency and numeric ranges are reported."""
+        path = tmp_path / "trades.csv"
+        pl.DataFrame({
+            "symbol": ["AAPL", "MSFT", "AAPL", "GOOG", "AAPL", "MSFT"],
+            "volume": [5, 1, 9, 3, 3, 3],
+        }).write_csv(path)
+
+        symbol = LiteralConnector().column_stats({"path": str(path)}, "symbol", k=2)
+        volume = LiteralConnector().column_stats({"path": str(path)}, "volume")
+
+        assert symbol.values == ["AAPL", "MSFT"]
+        assert symbol.min is None
+        assert (volume.values[0], volume.min, volume.max) == (3, 1, 9)
+        assert not volume.sampled
+
+    def test_float_columns_have_range_only(self, temp_parquet):
+        """Test float columns report a range but no frequent values."""
+        pl.DataFrame({"price": [1.5, 2.5, 1.5]}).write_parquet(temp_parquet)
+
+        stats = FileConnector().column_stats({"path": str(temp_parquet)}, "price")
+
+        assert stats.values == []
+        assert (stats.min, stats.max) == (1.5, 2.5)
+
+    def test_temporal_columns_have_no_range(self, temp_parquet):
+        """Test date columns report no range, since FILTER can't compare them."""
+        from datetime import date
+
+        pl.DataFrame({"day": [date(2024, 1, 2), date(2024, 1, 1)]}).write_parquet(temp_parquet)
+
+        stats = FileConnector().column_stats({"path": str(temp_parquet)}, "day")
+
+        assert (stats.min, stats.max) == (None, None)
+
+    def test_samples_start_of_file(self, tmp_path, monkeypatch):
+        """Test only the first STATS_SAMPLE_ROWS rows are read."""
+        from plotql.core.connectors import files
+
+        path = tmp_path / "data.ndjson"
+        pl.DataFrame({"x": list(range(100))}).write_ndjson(path)
+        monkeypatch.setattr(files, "STATS_SAMPLE_ROWS", 10)
+
+        stats = LiteralConnector().column_stats({"path": str(path)}, "x")
+
+        assert (stats.min, stats.max) == (0, 9)
+        assert stats.sampled
+
+    def test_json_prefix(self, temp_json):
+        """Test JSON arrays are summarized from the records at their start."""
+        stats = LiteralConnector().column_stats({"path": str(temp_json)}, "y")
+        assert (stats.min, stats.max) == (4, 6)
+
+    def test_folder(self, tmp_path):
+        """Test folder sources summarize the file their segments name."""
+        (tmp_path / "trades.csv").write_text("side\nbuy\nsell\nbuy\n")
+
+        stats = FolderConnector().column_stats(
+            {"path": str(tmp_path), "segments": ["trades.csv"]}, "side"
+        )
+
+        assert stats.values == ["buy", "sell"]
+
+    def test_unknown_column(self, temp_csv):
+        """Test a missing column raises ConnectorError."""
+        with pytest.raises(ConnectorError, match="nope"):
+            LiteralConnector().column_stats({"path": str(temp_csv)}, "nope")
+
+    def test_default_has_no_stats(self):
+        """Test connectors without a cheap summary provide none."""
+        from plotql.core.connectors import Connector
+
+        class TableConnector(Connector):
+            def validate_config(self, config):
+                pass
+
+            def load(self, config, filters=None):
+                pytest.fail("loaded rows")
+
+        assert TableConnector().column_stats({}, "a") is None
+
+    def test_clickhouse_pushdown(self, monkeypatch):
+        """Test ClickHouse computes topK and range in a bounded server-side query."""
+        from unittest.mock import MagicMock
+
+        from plotql.core.connectors import base
+        from plotql.core.connectors.clickhouse import ClickHouseConnector
+
+        client = MagicMock()
+        client.query.return_value.result_set = [(["AAPL", "MSFT"], "AAPL", "MSFT")]
+        connector = ClickHouseConnector()
+        monkeypatch.setattr(connector, "_get_client", lambda config: client)
+
+        stats = connector.column_stats({"host": "localhost", "table": "trades"}, "symbol", k=5)
+
+        query = client.query.call_args.args[0]
+        settings = client.query.call_args.kwargs["settings"]
+        assert query == "SELECT topK(5)(symbol), min(symbol), max(symbol) FROM trades"
+        assert settings["max_rows_to_read"] == base.STATS_SAMPLE_ROWS
+        assert settings["read_overflow_mode"] == "break"
+        assert stats.values == ["AAPL", "MSFT"]
+        assert stats.min is None  # String ranges aren't useful
+
+
+class TestLoadRange:
+    """Tests for loading the rows of an x range."""
+
+    def test_csv_numbers(self, temp_csv):
+        """Test only rows with the column in range are loaded, bounds included."""
+        df = LiteralConnector().load_range({"path": str(temp_csv)}, "x", 2, 4)
+        assert df["x"].to_list() == [2, 3, 4]
+
+    def test_parquet_datetimes(self, temp_parquet):
+        """Test Parquet sources compare native datetimes."""
+        from datetime import datetime
+
+        pl.DataFrame({
+            "ts": [datetime(2026, 1, d) for d in range(1, 8)],
+            "y": list(range(7)),
+        }).write_parquet(temp_parquet, row_group_size=2)
+
+        df = FileConnector().load_range(
+            {"path": str(temp_parquet)}, "ts", datetime(2026, 1, 3), datetime(2026, 1, 5)
+        )
+
+        assert df["y"].to_list() == [2, 3, 4]
+
+    def test_string_bounds(self, tmp_path):
+        """Test string bounds are compared as values, not column names."""
+        (tmp_path / "events.csv").write_text(
+            "ts,y\n2026-01-01 10:00:00,1\n2026-01-02 09:00:00,2\n2026-01-03 08:00:00,3\n"
+        )
+
+        df = FolderConnector().load_range(
+            {"path": str(tmp_path), "segments": ["events.csv"]}, "ts", "2026-01-02", "2026-01-03"
+        )
+
+        assert df["y"].to_list() == [2]
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file raises ConnectorError."""
+        with pytest.raises(ConnectorError, match="File not found"):
+            LiteralConnector().load_range({"path": str(tmp_path / "none.csv")}, "x", 0, 1)
+
+
+class TestLoadIncrement:
+    """Tests for loading the rows appended to a file."""
+
+    def _load(self, path, cursor=None):
+        return LiteralConnector().load_increment({"path": str(path)}, cursor)
+
+    def test_first_load_reads_all(self, temp_csv):
+        """Test the first increment reads the whole file and replaces."""
+        increment = self._load(temp_csv)
+        assert increment.replace
+        assert increment.rows["x"].to_list() == [1, 2, 3, 4, 5]
+
+    def test_unchanged(self, temp_csv):
+        """Test an unchanged file yields no rows."""
+        first = self._load(temp_csv)
+        increment = self._load(temp_csv, first.cursor)
+        assert not increment.replace
+        assert len(increment.rows) == 0
+
+    def test_appended_rows_only(self, tmp_path):
+        """Test only the lines after the previous read are parsed."""
+        path = tmp_path / "live.csv"
+        path.write_text("x,y\n1,10\n2,20\n")
+        first = self._load(path)
+        with open(path, "a") as f:
+            f.write("3,30\n4,40\n")
+
+        increment = self._load(path, first.cursor)
+
+        assert not increment.replace
+        assert increment.rows["y"].to_list() == [30, 40]
+        assert increment.cursor.offset == path.stat().st_size
+
+    def test_header_only_then_appended(self, tmp_path):
+        """Test rows appended to a header-only file get their own types."""
+        path = tmp_path / "live.csv"
+        path.write_text("x,y\n")
+        first = self._load(path)
+        assert first.cursor.offset == 0
+        with open(path, "a") as f:
+            f.write("1,10\n2,20\n3,15")
+
+        increment = self._load(path, first.cursor)
+
+        assert increment.replace
+        assert increment.rows["y"].to_list() == [10, 20, 15]
+        assert increment.rows.schema["x"] == pl.Int64
+
+    def test_partial_line_retracted(self, tmp_path):
+        """Test a line still being written is read again once finished."""
+        path = tmp_path / "live.csv"
+        path.write_text("x,y\n1,10\n2,2")
+        first = self._load(path)
+        assert first.rows["y"].to_list() == [10, 2]
+        with open(path, "a") as f:
+            f.write("0\n3,30\n")
+
+        increment = self._load(path, first.cursor)
+
+        assert increment.retract == 1
+        assert increment.rows["y"].to_list() == [20, 30]
+
+    def test_rewritten_file_reloaded(self, tmp_path):
+        """Test a file rewritten in place is read in full."""
+        path = tmp_path / "live.csv"
+        path.write_text("x,y\n1,10\n2,20\n")
+        first = self._load(path)
+        path.write_text("x,y\n9,90\n")
+
+        increment = self._load(path, first.cursor)
+
+        assert increment.replace
+        assert increment.rows["y"].to_list() == [90]
+
+    def test_new_types_reloaded(self, tmp_path):
+        """Test appended rows that don't fit the schema read so far reload the file."""
+        path = tmp_path / "live.csv"
+        path.write_text("x,y\n1,10\n")
+        first = self._load(path)
+        with open(path, "a") as f:
+            f.write("2,2.5\n")
+
+        increment = self._load(path, first.cursor)
+
+        assert increment.replace
+        assert increment.rows["y"].to_list() == [10.0, 2.5]
+
+    def test_ndjson(self, tmp_path):
+        """Test NDJSON files are followed line by line."""
+        path = tmp_path / "live.ndjson"
+        path.write_text('{"x": 1}\n')
+        first = FolderConnector().load_increment(
+            {"path": str(tmp_path), "segments": ["live.ndjson"]}
+        )
+        with open(path, "a") as f:
+            f.write('{"x": 2}\n')
+
+        increment = FolderConnector().load_increment(
+            {"path": str(tmp_path), "segments": ["live.ndjson"]}, first.cursor
+        )
+
+        assert increment.rows["x"].to_list() == [2]
+
+    def test_parquet_replaced(self, temp_parquet):
+        """Test Parquet files are read in full whenever they change."""
+        pl.DataFrame({"x": [1, 2]}).write_parquet(temp_parquet)
+        increment = FileConnector().load_increment({"path": str(temp_parquet)})
+        assert increment.replace
+        assert increment.rows["x"].to_list() == [1, 2]
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file raises ConnectorError."""
+        with pytest.raises(ConnectorError, match="File not found"):
+            self._load(tmp_path / "none.csv")
+
+
 # =============================================================================
 # Filter Pushdown Tests
 # =============================================================================
@@ -614,6 +1074,67 @@ class TestClickHouseFilterPushdown:
         result = connector._build_query("trades", filters, 10000)
         assert result == "SELECT * FROM trades WHERE (price > 100) OR (volume > 1000) LIMIT 10000"
 
+    def test_build_query_with_range(self):
+        """Test an x range is ANDed with the pushed-down filters."""
+        from datetime import datetime
+
+        from plotql.core.ast import Condition, ComparisonOp, WhereClause
+        from plotql.core.connectors.clickhouse import ClickHouseConnector
+
+        connector = ClickHouseConnector()
+        x_range = ("ts", datetime(2026, 1, 1, 10), datetime(2026, 1, 1, 11, 0, 0, 500))
+
+        result = connector._build_query("trades", None, 100, x_range=x_range)
+        assert result == (
+            "SELECT * FROM trades WHERE ts >= '2026-01-01 10:00:00' "
+            "AND ts <= '2026-01-01 11:00:00' LIMIT 100"
+        )
+
+        filters = [
+            WhereClause(conditions=[Condition(column="price", op=ComparisonOp.GT, value=100)]),
+            WhereClause(conditions=[Condition(column="side", op=ComparisonOp.EQ, value="buy")]),
+        ]
+        result = connector._build_query("trades", filters, 100, x_range=("id", 5, 9))
+        assert result == (
+            "SELECT * FROM trades WHERE ((price > 100) OR (side = 'buy')) "
+            "AND (id >= 5 AND id <= 9) LIMIT 100"
+        )
+
+    def test_build_query_after(self):
+        """Test an exclusive lower bound is ANDed and rows ordered."""
+        from plotql.core.connectors.clickhouse import ClickHouseConnector
+
+        connector = ClickHouseConnector()
+
+        result = connector._build_query("trades", None, 100, after=("id", 41), order_by="id")
+        assert result == "SELECT * FROM trades WHERE id > 41 ORDER BY id LIMIT 100"
+
+    def test_load_increment(self, monkeypatch):
+        """Test the newest rows are fetched first, then only rows past the cursor."""
+        from unittest.mock import MagicMock
+
+        from plotql.core.connectors.clickhouse import ClickHouseConnector
+
+        client = MagicMock()
+        client.query.return_value.column_names = ["id", "price"]
+        client.query.return_value.result_set = [(3, 30.0), (2, 20.0)]
+        connector = ClickHouseConnector()
+        monkeypatch.setattr(connector, "_get_client", lambda config: client)
+        config = {"host": "localhost", "table": "trades", "limit": 2}
+
+        first = connector.load_increment(config, column="id")
+        assert client.query.call_args[0][0] == "SELECT * FROM trades ORDER BY id DESC LIMIT 2"
+        assert first.rows["id"].to_list() == [2, 3]
+        assert (first.cursor, first.max_rows) == (3, 2)
+
+        client.query.return_value.result_set = [(4, 40.0)]
+        increment = connector.load_increment(config, first.cursor, column="id")
+        assert client.query.call_args[0][0] == (
+            "SELECT * FROM trades WHERE id > 3 ORDER BY id LIMIT 2"
+        )
+        assert increment.rows["price"].to_list() == [40.0]
+        assert increment.cursor == 4
+
     def test_supports_filter_pushdown_flag(self):
         """Test that ClickHouse connector has pushdown enabled."""
         from plotql.core.connectors.clickhouse import ClickHouseConnector
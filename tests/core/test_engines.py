@@ -9,7 +9,15 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from plotql.core.ast import ColumnRef, FormatOptions, PlotQuery, PlotSeries, PlotType
-from plotql.core.engines import MatplotlibEngine, get_engine
+from plotql.core.engines import (
+    MatplotlibEngine,
+    RasterEngine,
+    available_engines,
+    create_engine,
+    get_engine,
+    register_engine,
+    set_engine,
+)
 from plotql.core.engines.base import Engine
 from plotql.core.executor import ColorInfo, PlotData, SizeInfo
 from plotql.core.result import PlotResult
@@ -89,6 +97,58 @@ class TestGetEngine:
         assert isinstance(engine2, Engine)
 
 
+class TestEngineRegistry:
+    """Tests for selecting engines by name."""
+
+    @pytest.fixture(autouse=True)
+    def reset_engine(self, monkeypatch, tmp_path):
+        """Start each test without a default engine or config file."""
+        from plotql.core import engines
+
+        monkeypatch.setattr(engines, "_default_engine", None)
+        monkeypatch.setattr(engines, "_engines", dict(engines._engines))
+        monkeypatch.setattr("plotql.core.config.CONFIG_PATH", tmp_path / "sources.toml")
+
+    def test_builtin_engines(self):
+        """Test the built-in engines are registered."""
+        assert {"matplotlib", "raster"} <= set(available_engines())
+
+    def test_create_engine_by_name(self):
+        """Test engines are created by (case-insensitive) name."""
+        assert isinstance(create_engine("raster"), RasterEngine)
+        assert isinstance(create_engine("Matplotlib"), MatplotlibEngine)
+
+    def test_unknown_engine(self):
+        """Test an unknown name lists the available engines."""
+        with pytest.raises(ValueError, match="Unknown engine 'nope'. Available: .*raster"):
+            create_engine("nope")
+
+    def test_register_engine(self):
+        """Test custom engines can be registered with a factory."""
+        register_engine("custom", RasterEngine)
+        assert "custom" in available_engines()
+        assert isinstance(create_engine("custom"), RasterEngine)
+
+    def test_set_engine_by_name(self):
+        """Test set_engine accepts a registered name."""
+        set_engine("raster")
+        assert isinstance(get_engine(), RasterEngine)
+
+    def test_default_engine(self):
+        """Test matplotlib is used when nothing is configured."""
+        assert isinstance(get_engine(), MatplotlibEngine)
+
+    def test_engine_from_config(self, tmp_path):
+        """Test the config file's engine entry picks the default engine."""
+        (tmp_path / "sources.toml").write_text('engine = "raster"\n')
+        assert isinstance(get_engine(), RasterEngine)
+
+    def test_invalid_config_falls_back(self, tmp_path):
+        """Test an unreadable config doesn't prevent rendering."""
+        (tmp_path / "sources.toml").write_text("not valid toml [[[")
+        assert isinstance(get_engine(), MatplotlibEngine)
+
+
 # =============================================================================
 # MatplotlibEngine Tests
 # =============================================================================
@@ -232,6 +292,445 @@ class TestMatplotlibEngineRender:
         result.close()
 
 
+class TestMatplotlibEngineRenderView:
+    """Tests for retained-figure rendering with render_view."""
+
+    @pytest.fixture
+    def engine(self):
+        engine = MatplotlibEngine()
+        yield engine
+        engine.close_view()
+
+    def _data(self, temp_csv: Path, plot_type: PlotType, y, fmt=None) -> PlotData:
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=plot_type,
+            format=fmt,
+        )
+        return PlotData(
+            x=[1.0, 2.0, 3.0, 4.0, 5.0][:len(y)],
+            y=y,
+            series=query.series[0],
+            row_count=len(y),
+            filtered_count=len(y),
+        )
+
+    @pytest.mark.parametrize(
+        "plot_type",
+        [PlotType.SCATTER, PlotType.LINE, PlotType.BAR, PlotType.HIST],
+    )
+    def test_update_matches_fresh_render(self, engine, temp_csv: Path, plot_type):
+        """Test an in-place update renders the same image as a fresh figure."""
+        import numpy as np
+
+        first = self._data(temp_csv, plot_type, [1.0, 2.0, 3.0, 4.0, 5.0])
+        second = self._data(
+            temp_csv, plot_type, [50.0, 10.0, 30.0, 20.0, 40.0],
+            fmt=FormatOptions(title="Updated", line_color="red"),
+        )
+
+        figure = engine.render_view(first, 400, 300).figure
+        updated = engine.render_view(second, 400, 300)
+        assert updated.figure is figure
+
+        fresh = engine.render(second, 400, 300)
+        assert np.array_equal(
+            np.asarray(updated.to_image()), np.asarray(fresh.to_image())
+        )
+        fresh.close()
+
+    def test_layout_change_rebuilds(self, engine, temp_csv: Path):
+        """Test a different plot type gets a new figure."""
+        first = engine.render_view(self._data(temp_csv, PlotType.SCATTER, [1.0, 2.0]), 400, 300)
+        second = engine.render_view(self._data(temp_csv, PlotType.LINE, [1.0, 2.0]), 400, 300)
+        assert second.figure is not first.figure
+
+    def test_size_change_rebuilds(self, engine, temp_csv: Path):
+        """Test a resized view gets a new figure at the new size."""
+        data = self._data(temp_csv, PlotType.LINE, [1.0, 2.0])
+        engine.render_view(data, 400, 300)
+        result = engine.render_view(data, 500, 300)
+        assert result.to_image().size == (500, 300)
+
+    def test_views_are_independent(self, engine, temp_csv: Path):
+        """Test each view keeps its own figure."""
+        data = self._data(temp_csv, PlotType.LINE, [1.0, 2.0])
+        left = engine.render_view(data, 400, 300, view="left")
+        right = engine.render_view(data, 400, 300, view="right")
+        assert left.figure is not right.figure
+        engine.close_view("left")
+        engine.close_view("right")
+
+    def test_close_result_keeps_figure(self, engine, temp_csv: Path):
+        """Test closing a view result doesn't release the retained figure."""
+        result = engine.render_view(self._data(temp_csv, PlotType.LINE, [1.0, 2.0]), 400, 300)
+        result.close()
+        assert result.figure.axes
+
+        engine.close_view()
+        assert not result.figure.axes
+
+    def test_engine_pickles_without_views(self, engine, temp_csv: Path):
+        """Test retained figures aren't sent along with a pickled engine."""
+        import pickle
+
+        engine.render_view(self._data(temp_csv, PlotType.LINE, [1.0, 2.0]), 400, 300)
+        assert pickle.loads(pickle.dumps(engine))._views == {}
+
+
+class TestMatplotlibEngineRgba:
+    """Tests for the raw RGBA buffer export."""
+
+    def test_rgba_matches_png(self, temp_csv: Path):
+        """Test the RGBA buffer holds the same pixels as the PNG export."""
+        import numpy as np
+
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.SCATTER,
+        )
+        data = PlotData(
+            x=[1.0, 2.0, 3.0],
+            y=[3.0, 1.0, 2.0],
+            series=query.series[0],
+            row_count=3,
+            filtered_count=3,
+        )
+
+        with MatplotlibEngine().render(data, 300, 200) as result:
+            pixels, width, height = result.to_rgba()
+            assert (width, height) == (300, 200)
+
+            image = result.to_image()
+            from_png = result._decode_png().convert("RGBA")
+            assert np.array_equal(np.asarray(image), np.asarray(from_png))
+
+
+class TestMatplotlibEngineRaster:
+    """Tests for aggregate rasterization of large scatter plots."""
+
+    @pytest.fixture
+    def series(self, temp_csv: Path) -> PlotSeries:
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.SCATTER,
+        )
+        return query.series[0]
+
+    def _data(self, series: PlotSeries, count: int = 1000, **kwargs) -> PlotData:
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        return PlotData(
+            x=rng.normal(size=count).tolist(),
+            y=rng.normal(size=count).tolist(),
+            series=series,
+            row_count=count,
+            filtered_count=count,
+            **kwargs,
+        )
+
+    def _series_artists(self, engine: MatplotlibEngine, data: PlotData):
+        return engine._build_view([data], 400, 300).series[0]
+
+    def test_below_threshold_draws_markers(self, series):
+        """Test small scatter plots keep individual markers."""
+        from matplotlib.collections import PathCollection
+
+        artists = self._series_artists(MatplotlibEngine(raster_threshold=5000), self._data(series))
+        assert not artists.raster
+        assert isinstance(artists.artist, PathCollection)
+
+    def test_above_threshold_draws_image(self, series):
+        """Test large scatter plots are drawn as one image at the axes' pixel size."""
+        from matplotlib.image import AxesImage
+
+        engine = MatplotlibEngine(raster_threshold=500)
+        view = engine._build_view([self._data(series)], 400, 300)
+        artists = view.series[0]
+        assert artists.raster
+        assert isinstance(artists.artist, AxesImage)
+
+        pixels = artists.artist.get_array()
+        bbox = view.ax.get_window_extent()
+        assert pixels.shape == (round(bbox.height), round(bbox.width), 4)
+        # Every point lands in an opaque pixel; the rest are transparent
+        assert 0 < (pixels[..., 3] > 0).sum() <= 1000
+
+    def test_threshold_none_disables(self, series):
+        """Test raster_threshold=None always draws markers."""
+        artists = self._series_artists(MatplotlibEngine(raster_threshold=None), self._data(series))
+        assert not artists.raster
+
+    def test_axis_limits_cover_data(self, series):
+        """Test the raster spans the data range."""
+        data = self._data(series)
+        view = MatplotlibEngine(raster_threshold=500)._build_view([data], 400, 300)
+        xmin, xmax = view.ax.get_xlim()
+        assert xmin <= min(data.x) and xmax >= max(data.x)
+
+    def test_continuous_color_uses_mean(self, series):
+        """Test a continuous color column is averaged per pixel onto the gradient."""
+        import numpy as np
+
+        from plotql.core.utils import GRADIENT_END
+
+        data = self._data(
+            series,
+            color_values=[10.0] * 1000,
+            marker_colors=["#000000"] * 1000,
+            color_info=ColorInfo(
+                is_continuous=True, column_name="v", min_value=0.0, max_value=10.0
+            ),
+        )
+        pixels = self._series_artists(MatplotlibEngine(raster_threshold=500), data).artist.get_array()
+        opaque = pixels[pixels[..., 3] > 0]
+        assert np.allclose(opaque[:, :3] * 255, GRADIENT_END)
+
+    def test_categorical_colors_blend(self, series):
+        """Test categorical point colors are kept per pixel."""
+        import numpy as np
+        from matplotlib.colors import to_rgb
+
+        engine = MatplotlibEngine(raster_threshold=500)
+        data = self._data(series, marker_colors=["green"] * 1000)
+        pixels = self._series_artists(engine, data).artist.get_array()
+        opaque = pixels[pixels[..., 3] > 0]
+        assert np.allclose(opaque[:, :3], to_rgb(engine.get_color("green")))
+
+    def test_render_view_updates_raster(self, series):
+        """Test retained views re-bin raster series in place."""
+        engine = MatplotlibEngine(raster_threshold=500)
+        first = engine.render_view(self._data(series), 400, 300, view="v")
+        image = engine._views["v"].series[0].artist
+
+        shifted = self._data(series)
+        shifted.x = [v + 100 for v in shifted.x]
+        engine.render_view(shifted, 400, 300, view="v")
+
+        assert engine._views["v"].series[0].artist is image
+        assert engine._views["v"].ax.get_xlim()[0] > 90
+        first.close()
+        engine.close_view("v")
+
+    def test_switching_modes_rebuilds(self, series):
+        """Test crossing the threshold rebuilds the retained figure."""
+        engine = MatplotlibEngine(raster_threshold=500)
+        engine.render_view(self._data(series, count=100), 400, 300, view="v")
+        figure = engine._views["v"].figure
+        engine.render_view(self._data(series), 400, 300, view="v")
+
+        assert engine._views["v"].figure is not figure
+        assert engine._views["v"].series[0].raster
+        engine.close_view("v")
+
+
+class TestMatplotlibEngineDrawSettings:
+    """Tests for the path settings scoped to each draw."""
+
+    @pytest.fixture
+    def data(self, temp_csv: Path) -> PlotData:
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.LINE,
+        )
+        return PlotData(
+            x=[1.0, 2.0, 3.0],
+            y=[3.0, 1.0, 2.0],
+            series=query.series[0],
+            row_count=3,
+            filtered_count=3,
+        )
+
+    @pytest.fixture
+    def seen(self, monkeypatch) -> list:
+        """Record the chunksize in effect whenever Agg draws a path."""
+        import matplotlib
+        from matplotlib.backends.backend_agg import RendererAgg
+
+        seen = []
+        draw_path = RendererAgg.draw_path
+
+        def recording_draw_path(renderer, *args, **kwargs):
+            seen.append(matplotlib.rcParams["agg.path.chunksize"])
+            return draw_path(renderer, *args, **kwargs)
+
+        monkeypatch.setattr(RendererAgg, "draw_path", recording_draw_path)
+        return seen
+
+    @pytest.mark.parametrize("export", ["to_rgba", "to_bytes"])
+    def test_applied_while_drawing(self, data, seen, export):
+        """Test paths are drawn with the engine's chunksize."""
+        from plotql.core.engines.matplotlib import DRAW_RC
+
+        with MatplotlibEngine().render(data, 300, 200) as result:
+            getattr(result, export)()
+
+        assert seen
+        assert set(seen) == {DRAW_RC["agg.path.chunksize"]}
+
+    def test_global_rcparams_untouched(self, data):
+        """Test rendering leaves matplotlib's global settings alone."""
+        import matplotlib
+
+        with MatplotlibEngine().render(data, 300, 200) as result:
+            result.to_rgba()
+            result.to_bytes()
+
+        for key in ("agg.path.chunksize", "path.simplify", "path.simplify_threshold"):
+            assert matplotlib.rcParams[key] == matplotlib.rcParamsDefault[key]
+
+
+class TestMatplotlibEngineLineDecimation:
+    """Tests for decimating lines with far more points than pixels."""
+
+    @pytest.fixture
+    def series(self, temp_csv: Path) -> PlotSeries:
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.LINE,
+        )
+        return query.series[0]
+
+    def _data(self, series: PlotSeries, x, y, **kwargs) -> PlotData:
+        return PlotData(
+            x=list(x),
+            y=list(y),
+            series=series,
+            row_count=len(x),
+            filtered_count=len(x),
+            **kwargs,
+        )
+
+    def _line(self, engine: MatplotlibEngine, data: PlotData):
+        return engine._build_view([data], 400, 300).series[0].artist
+
+    def test_long_line_decimated(self, series):
+        """Test a long line is reduced while keeping its extremes and ends."""
+        import numpy as np
+
+        y = np.random.default_rng(0).normal(size=100_000)
+        data = self._data(series, range(100_000), y)
+        line = self._line(MatplotlibEngine(), data)
+
+        ydata = np.asarray(line.get_ydata())
+        assert len(ydata) <= 4 * 400
+        assert ydata.min() == y.min() and ydata.max() == y.max()
+        assert line.get_xdata()[0] == 0 and line.get_xdata()[-1] == 99_999
+
+    def test_short_line_untouched(self, series):
+        """Test lines with few points are drawn in full."""
+        data = self._data(series, range(100), range(100))
+        assert len(self._line(MatplotlibEngine(), data).get_xdata()) == 100
+
+    def test_gaps_not_decimated(self, series):
+        """Test lines with missing values are drawn in full to keep their gaps."""
+        y = [float(i) for i in range(10_000)]
+        y[5] = None
+        data = self._data(series, range(10_000), y)
+        assert len(self._line(MatplotlibEngine(), data).get_xdata()) == 10_000
+
+    def test_unsorted_not_decimated(self, series):
+        """Test lines not sorted by x are drawn in full."""
+        x = list(range(10_000))[::-1]
+        data = self._data(series, x, range(10_000))
+        assert len(self._line(MatplotlibEngine(), data).get_xdata()) == 10_000
+
+    def test_timestamp_axis(self, series):
+        """Test decimated epoch timestamps are still drawn as dates."""
+        import numpy as np
+
+        from plotql.core.utils import TIMESTAMP_UNIT, TimestampInfo
+
+        x = [1_700_000_000_000_000 + i * 60_000_000 for i in range(10_000)]
+        data = self._data(
+            series, x, range(10_000),
+            x_timestamp=TimestampInfo(
+                column_name="x", input_format="epoch", output_format="%Y-%m-%d",
+            ),
+        )
+        xdata = self._line(MatplotlibEngine(), data).get_xdata()
+        assert len(xdata) < 10_000
+        assert np.asarray(xdata).dtype == np.dtype(f"datetime64[{TIMESTAMP_UNIT}]")
+
+    def test_render_view_update_decimates(self, series):
+        """Test in-place updates of retained views are decimated too."""
+        engine = MatplotlibEngine()
+        engine.render_view(self._data(series, range(100), range(100)), 400, 300, view="v")
+        engine.render_view(self._data(series, range(100_000), range(100_000)), 400, 300, view="v")
+
+        line = engine._views["v"].series[0].artist
+        assert len(line.get_xdata()) <= 4 * 400
+        engine.close_view("v")
+
+
+class TestMatplotlibEngineFigureLifecycle:
+    """Tests that rendered figures don't accumulate in memory."""
+
+    @pytest.fixture
+    def engine(self):
+        return MatplotlibEngine()
+
+    @pytest.fixture
+    def plot_data(self, temp_csv: Path) -> PlotData:
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.LINE,
+        )
+        return PlotData(
+            x=[1.0, 2.0, 3.0],
+            y=[3.0, 1.0, 2.0],
+            series=query.series[0],
+            row_count=3,
+            filtered_count=3,
+        )
+
+    def test_figures_bypass_pyplot(self, engine, plot_data):
+        """Test renders don't register figures with pyplot's global manager."""
+        import matplotlib.pyplot as plt
+
+        before = len(plt.get_fignums())
+        for _ in range(5):
+            engine.render(plot_data, 200, 150).to_bytes()
+        assert len(plt.get_fignums()) == before
+
+    def test_render_to_bytes_closes(self, engine, plot_data):
+        """Test render_to_bytes releases the figure it created."""
+        with patch.object(PlotResult, "close", autospec=True) as close:
+            engine.render_to_bytes(plot_data, 200, 150)
+        close.assert_called_once()
+
+    def test_context_manager_releases_figure(self, engine, plot_data):
+        """Test leaving a with block clears the figure."""
+        with engine.render(plot_data, 200, 150) as result:
+            assert result.figure.axes
+        assert not result.figure.axes
+
+    def test_figure_freed_when_unreferenced(self, engine, plot_data):
+        """Test nothing global keeps a rendered figure alive."""
+        import gc
+        import weakref
+
+        result = engine.render(plot_data, 200, 150)
+        figure_ref = weakref.ref(result.figure)
+        result.to_bytes()
+        del result
+        gc.collect()
+        assert figure_ref() is None
+
+
 class TestMatplotlibEngineScatterPlot:
     """Tests for scatter plot rendering."""
 
@@ -468,6 +967,27 @@ class TestMatplotlibEngineHistPlot:
         assert result.to_bytes()
         result.close()
 
+    def test_hist_draws_executor_bins(self, engine, temp_csv: Path):
+        """Test pre-binned data is drawn as one bar per bin."""
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.HIST,
+        )
+        data = PlotData(
+            x=[0.0, 1.0, 3.0],
+            y=[4, 7, 2],
+            series=query.series[0],
+            row_count=13,
+            filtered_count=13,
+            bin_edges=[0.0, 1.0, 3.0, 4.0],
+        )
+
+        bars = engine._build_view([data], 400, 300).series[0].artist
+        assert [r.get_height() for r in bars.patches] == [4, 7, 2]
+        assert [r.get_width() for r in bars.patches] == [1.0, 2.0, 1.0]
+
 
 class TestMatplotlibEngineFormatOptions:
     """Tests for format options handling."""
@@ -583,7 +1103,7 @@ class TestMatplotlibEngineGetTerminalPixelSize:
 
 
 class TestMatplotlibEngineFigureToBytes:
-    """Tests for _figure_to_bytes static method."""
+    """Tests for the _figure_to_bytes helper."""
 
     def test_figure_to_bytes_png(self):
         """Test _figure_to_bytes with PNG format."""
@@ -729,3 +1249,159 @@ class TestMatplotlibEngineEdgeCases:
         result = engine.render(data, 400, 300)
         assert result.to_bytes()
         result.close()
+
+
+# =============================================================================
+# RasterEngine Tests
+# =============================================================================
+
+class TestRasterEngine:
+    """Tests for the Pillow-based RasterEngine."""
+
+    @staticmethod
+    def _data(plot_type: PlotType = PlotType.SCATTER, x=None, y=None, **kwargs) -> PlotData:
+        x = [1.0, 2.0, 3.0, 4.0, 5.0] if x is None else x
+        y = [3.0, 1.0, 4.0, 1.0, 5.0] if y is None else y
+        series = PlotSeries(
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=plot_type,
+            format=kwargs.pop("format", FormatOptions()),
+        )
+        return PlotData(
+            x=x, y=y, series=series, row_count=len(y), filtered_count=len(y), **kwargs
+        )
+
+    @staticmethod
+    def _pixels(data, width: int = 320, height: int = 240):
+        import numpy as np
+
+        with RasterEngine().render(data, width, height) as result:
+            return np.asarray(result.to_image())
+
+    @pytest.mark.parametrize("plot_type", list(PlotType))
+    def test_renders_every_plot_type(self, plot_type: PlotType):
+        """Test each plot type renders at the requested size."""
+        pixels = self._pixels(self._data(plot_type))
+        assert pixels.shape == (240, 320, 4)
+
+    def test_draws_series_color(self):
+        """Test the series is drawn in the theme's primary color."""
+        from plotql.themes import THEME
+
+        pixels = self._pixels(self._data(PlotType.LINE))
+        primary = tuple(int(THEME.chart_colors["primary"][i:i + 2], 16) for i in (1, 3, 5))
+        assert (pixels[:, :, :3] == primary).all(axis=2).any()
+
+    def test_rgba_buffer(self):
+        """Test the raw RGBA buffer matches the image size."""
+        with RasterEngine().render(self._data(), 200, 100) as result:
+            pixels, width, height = result.to_rgba()
+            assert (width, height) == (200, 100)
+            assert len(pixels) == 200 * 100 * 4
+
+    def test_save_png(self, temp_dir: Path):
+        """Test saving to PNG."""
+        path = temp_dir / "chart.png"
+        with RasterEngine().render(self._data(), 200, 100) as result:
+            result.save(str(path), "png")
+        assert path.read_bytes().startswith(b"\x89PNG")
+
+    def test_svg_unsupported(self):
+        """Test vector output is rejected."""
+        with RasterEngine().render(self._data(), 200, 100) as result:
+            with pytest.raises(ValueError, match="cannot write 'svg'"):
+                result.to_bytes("svg")
+
+    def test_multiple_series(self):
+        """Test layered series render together."""
+        data = [self._data(PlotType.LINE), self._data(PlotType.SCATTER, y=[5.0, 4.0, 3.0, 2.0, 1.0])]
+        assert self._pixels(data).shape == (240, 320, 4)
+
+    def test_categorical_axes_and_legend(self):
+        """Test string x values and categorical marker colors."""
+        data = self._data(
+            PlotType.BAR,
+            x=["a", "b", "c"],
+            y=[1.0, 2.0, 3.0],
+        )
+        scatter = self._data(
+            x=[1.0, 2.0, 3.0],
+            y=[1.0, 2.0, 3.0],
+            marker_colors=["red", "blue", "red"],
+            color_info=ColorInfo(
+                is_continuous=False,
+                column_name="side",
+                category_colors={"buy": "red", "sell": "blue"},
+            ),
+        )
+        assert self._pixels(data).shape == (240, 320, 4)
+        assert self._pixels(scatter).shape == (240, 320, 4)
+
+    def test_continuous_colorbar(self):
+        """Test continuous marker colors reserve space for a colorbar."""
+        data = self._data(
+            color_values=[1.0, 2.0, 3.0, 4.0, 5.0],
+            marker_colors=["#000000"] * 5,
+            color_info=ColorInfo(
+                is_continuous=True, column_name="price", min_value=1.0, max_value=5.0,
+            ),
+        )
+        assert self._pixels(data).shape == (240, 320, 4)
+
+    def test_timestamp_axis(self):
+        """Test epoch timestamps render on a datetime axis."""
+        from plotql.core.utils import TimestampInfo
+
+        start = 1_700_000_000_000_000
+        data = self._data(
+            PlotType.LINE,
+            x=[start + i * 60_000_000 for i in range(5)],
+            x_timestamp=TimestampInfo(
+                column_name="x", input_format="epoch", output_format="%H:%M",
+            ),
+        )
+        assert self._pixels(data).shape == (240, 320, 4)
+
+    def test_prepare_axes_shares_categories(self):
+        """Test series on a category axis share one category order, bars from zero."""
+        from plotql.core.engines.raster import prepare_axes
+
+        first = self._data(PlotType.BAR, x=["a", "b"], y=[2.0, 3.0])
+        second = self._data(PlotType.BAR, x=["b", "c"], y=[1.0, 4.0])
+        series, x_axis, y_axis = prepare_axes([first, second])
+
+        assert x_axis.categories == {"a": 0, "b": 1, "c": 2}
+        assert list(series[1].x) == [1.0, 2.0]
+        assert y_axis.lo <= 0.0
+
+    def test_empty_data(self):
+        """Test a series without rows still renders axes."""
+        assert self._pixels(self._data(x=[], y=[])).shape == (240, 320, 4)
+
+    def test_marker_paths_agree(self):
+        """Test direct stamping and dilation give the same pixels."""
+        import numpy as np
+        from PIL import Image
+
+        rng = np.random.default_rng(0)
+        px = rng.uniform(0, 60, 50)
+        py = rng.uniform(0, 40, 50)
+        colors = rng.integers(0, 255, (50, 3), dtype=np.uint8)
+        sizes = rng.choice([3, 4, 7], 50)
+
+        direct = Image.new("RGBA", (60, 40))
+        RasterEngine._draw_markers(direct, px, py, colors, sizes)
+
+        # Repeating the points many times forces the dilation path
+        # without changing which point owns each pixel
+        repeat = 50
+        dilated = Image.new("RGBA", (60, 40))
+        RasterEngine._draw_markers(
+            dilated,
+            np.tile(px, repeat),
+            np.tile(py, repeat),
+            np.tile(colors, (repeat, 1)),
+            np.tile(sizes, repeat),
+        )
+        assert np.array_equal(np.asarray(direct), np.asarray(dilated))
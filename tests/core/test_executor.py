@@ -18,18 +18,31 @@ from plotql.core.ast import (
     PlotQuery,
     PlotSeries,
     PlotType,
+    SourceRef,
     WhereClause,
 )
 from plotql.core.executor import (
+    CancelToken,
     ColorInfo,
+    ExecutionCancelled,
     ExecutionError,
     PlotData,
+    SchemaCache,
+    SeriesCache,
     SizeInfo,
+    SourceCache,
+    TileCache,
+    XRange,
     apply_aggregation,
     apply_where,
     execute,
+    get_schema_cache,
+    restyle,
+    source_fingerprint,
     validate_series_format_options,
+    x_extent,
 )
+from plotql.core.pyramid import PyramidStore
 from tests.conftest import make_plot_query
 
 
@@ -322,6 +335,31 @@ class TestValidateFormatOptions:
             validate_series_format_options(query.series[0])
         assert "marker_color is only valid for scatter" in str(exc_info.value)
 
+    def test_bins_only_for_hist(self, temp_csv: Path):
+        """Test bins is invalid for other plot types."""
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.BAR,
+            format=FormatOptions(bins="10"),
+        )
+        with pytest.raises(ExecutionError, match="bins is only valid for histograms"):
+            validate_series_format_options(query.series[0])
+
+    @pytest.mark.parametrize("bins", ["0", "-3", "ten", "2.5"])
+    def test_bins_must_be_positive_integer(self, temp_csv: Path, bins: str):
+        """Test invalid bin counts are rejected."""
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.HIST,
+            format=FormatOptions(bins=bins),
+        )
+        with pytest.raises(ExecutionError, match="bins must be a positive integer"):
+            validate_series_format_options(query.series[0])
+
 
 # =============================================================================
 # execute Function Tests
@@ -553,6 +591,9 @@ class TestExecuteWithDynamicFormatting:
         assert result.color_info.is_continuous is True
         assert result.color_info.min_value is not None
         assert result.color_info.max_value is not None
+        # Raw values are kept alongside the mapped colors
+        assert len(result.color_values) == len(result.marker_colors)
+        assert min(result.color_values) == result.color_info.min_value
 
     def test_categorical_color_info(self, temp_csv: Path):
         """Test ColorInfo for categorical column."""
@@ -592,6 +633,51 @@ class TestExecuteWithTimestamps:
         assert result.x_timestamp is not None
         assert result.x_timestamp.column_name == "timestamp"
 
+    def test_timestamp_values_are_epoch(self, temp_csv_with_timestamps: Path):
+        """Test that timestamp strings are converted to sorted epoch integers."""
+        query = make_plot_query(
+            source=str(temp_csv_with_timestamps),
+            x_column=ColumnRef(name="timestamp"),
+            y_column=ColumnRef(name="value"),
+            plot_type=PlotType.LINE,
+        )
+        result = execute(query)[0]
+
+        assert all(isinstance(v, int) for v in result.x)
+        assert result.x == sorted(result.x)
+        # 2026-01-01 10:00:00 in epoch microseconds
+        assert result.x[0] == 1_767_261_600_000_000
+
+    def test_timestamp_not_kept_for_count(self, temp_csv_with_timestamps: Path):
+        """Test counting a timestamp column yields a plain numeric axis."""
+        query = make_plot_query(
+            source=str(temp_csv_with_timestamps),
+            x_column=ColumnRef(name="value"),
+            y_column=ColumnRef(name="timestamp", aggregate=AggregateFunc.COUNT),
+            plot_type=PlotType.BAR,
+        )
+        result = execute(query)[0]
+
+        assert result.y_timestamp is None
+
+    def test_source_fingerprint(self, temp_csv: Path):
+        """Test literal file sources are fingerprinted."""
+        query = make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+        )
+        assert source_fingerprint(query.source) is not None
+
+    def test_source_fingerprint_missing_file(self, tmp_path: Path):
+        """Test missing sources have no fingerprint."""
+        query = make_plot_query(
+            source=str(tmp_path / "missing.csv"),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+        )
+        assert source_fingerprint(query.source) is None
+
     def test_no_timestamp_for_numeric(self, temp_csv: Path):
         """Test that numeric columns don't get timestamp info."""
         query = make_plot_query(
@@ -607,6 +693,668 @@ class TestExecuteWithTimestamps:
         assert result.y_timestamp is None
 
 
+# =============================================================================
+# SourceCache Tests
+# =============================================================================
+
+class TestSourceCache:
+    """Tests for sharing loaded sources between queries."""
+
+    def _query(self, path: Path, y: str = "y") -> PlotQuery:
+        return make_plot_query(
+            source=str(path),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name=y),
+        )
+
+    def test_source_loaded_once(self, temp_csv: Path, monkeypatch):
+        """Test queries on the same file share one load."""
+        from plotql.core.connectors import LiteralConnector
+
+        loads = []
+        original = LiteralConnector.load
+
+        def counting_load(self, config, filters=None):
+            loads.append(config["path"])
+            return original(self, config, filters)
+
+        monkeypatch.setattr(LiteralConnector, "load", counting_load)
+        cache = SourceCache()
+        first = execute(self._query(temp_csv), cache=cache)[0]
+        second = execute(self._query(temp_csv, y="value"), cache=cache)[0]
+
+        assert len(loads) == 1
+        assert first.y == [10, 20, 30, 40, 50]
+        assert second.y == [1.5, 2.5, 3.5, 4.5, 5.5]
+
+    def test_concurrent_loads_shared(self, temp_csv: Path, monkeypatch):
+        """Test queries loading the same file at once share one read."""
+        import threading
+        import time
+
+        from plotql.core.connectors import LiteralConnector
+
+        loads = []
+        original = LiteralConnector.load
+
+        def slow_load(self, config, filters=None):
+            loads.append(config["path"])
+            time.sleep(0.2)
+            return original(self, config, filters)
+
+        monkeypatch.setattr(LiteralConnector, "load", slow_load)
+        cache = SourceCache()
+        results = []
+        threads = [
+            threading.Thread(target=lambda y=y: results.append(execute(self._query(temp_csv, y), cache=cache)))
+            for y in ("y", "value", "y")
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+        assert len(results) == 3
+
+    def test_failed_load_retried_by_waiter(self, temp_csv: Path, monkeypatch):
+        """Test a waiting query loads the source itself if the first load fails."""
+        import threading
+        import time
+
+        from plotql.core.connectors import ConnectorError, LiteralConnector
+
+        loads = []
+        original = LiteralConnector.load
+
+        def flaky_load(self, config, filters=None):
+            loads.append(config["path"])
+            time.sleep(0.2)
+            if len(loads) == 1:
+                raise ConnectorError("disk busy")
+            return original(self, config, filters)
+
+        monkeypatch.setattr(LiteralConnector, "load", flaky_load)
+        cache = SourceCache()
+        errors = []
+
+        def first():
+            try:
+                execute(self._query(temp_csv), cache=cache)
+            except ExecutionError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=first)
+        thread.start()
+        time.sleep(0.05)
+        result = execute(self._query(temp_csv), cache=cache)[0]
+        thread.join()
+
+        assert len(loads) == 2
+        assert len(errors) == 1
+        assert result.y == [10, 20, 30, 40, 50]
+
+    def test_changed_file_reloaded(self, temp_csv: Path):
+        """Test a modified file isn't served from the cache."""
+        cache = SourceCache()
+        execute(self._query(temp_csv), cache=cache)
+
+        pl.DataFrame({"x": [1, 2], "y": [7, 8]}).write_csv(temp_csv)
+        result = execute(self._query(temp_csv), cache=cache)[0]
+        assert result.y == [7, 8]
+
+    def test_bounded(self, temp_dir: Path):
+        """Test the cache evicts least recently used sources."""
+        cache = SourceCache(max_entries=2)
+        for i in range(3):
+            path = temp_dir / f"data{i}.csv"
+            pl.DataFrame({"x": [i], "y": [i]}).write_csv(path)
+            execute(self._query(path), cache=cache)
+        assert len(cache) == 2
+
+    def test_missing_source_raises(self, temp_dir: Path):
+        """Test load errors surface as ExecutionError."""
+        with pytest.raises(ExecutionError):
+            execute(self._query(temp_dir / "missing.csv"), cache=SourceCache())
+
+
+class TestSchemaCache:
+    """Tests for the column name cache shared with autocomplete."""
+
+    def _source(self, path: Path) -> SourceRef:
+        return SourceRef(args=[str(path)], is_literal=True)
+
+    def test_reads_header(self, temp_csv: Path, monkeypatch):
+        """Test columns are read without loading the source."""
+        from plotql.core.connectors import LiteralConnector
+
+        monkeypatch.setattr(LiteralConnector, "load", lambda *a, **k: pytest.fail("loaded rows"))
+        assert SchemaCache().columns(self._source(temp_csv)) == ["x", "y", "category", "value"]
+
+    def test_read_once(self, temp_csv: Path, monkeypatch):
+        """Test repeated lookups of an unchanged file don't re-read it."""
+        from plotql.core.connectors import LiteralConnector
+
+        reads = []
+        original = LiteralConnector.schema
+        monkeypatch.setattr(
+            LiteralConnector,
+            "schema",
+            lambda self, config: reads.append(config) or original(self, config),
+        )
+        cache = SchemaCache()
+        cache.columns(self._source(temp_csv))
+        cache.columns(self._source(temp_csv))
+        assert len(reads) == 1
+
+    def test_changed_file_reread(self, temp_csv: Path):
+        """Test a modified file's new columns are picked up."""
+        cache = SchemaCache()
+        cache.columns(self._source(temp_csv))
+
+        pl.DataFrame({"a": [1], "b": [2]}).write_csv(temp_csv)
+        assert cache.columns(self._source(temp_csv)) == ["a", "b"]
+
+    def test_execute_records_columns(self, temp_csv: Path, monkeypatch):
+        """Test executing a query fills the shared cache."""
+        from plotql.core.connectors import LiteralConnector
+
+        get_schema_cache().clear()
+        execute(make_plot_query(
+            source=str(temp_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+        ))
+
+        # Lookups now can't read the file, so the columns must be recorded
+        monkeypatch.setattr(LiteralConnector, "schema", lambda self, config: pl.Schema())
+        assert get_schema_cache().columns(self._source(temp_csv)) == ["x", "y", "category", "value"]
+
+    def test_record_without_fingerprint(self, monkeypatch):
+        """Test sources without a fingerprint are keyed by their config."""
+        from plotql.core.connectors import LiteralConnector
+
+        monkeypatch.setattr(LiteralConnector, "fingerprint", lambda self, config: None)
+        cache = SchemaCache()
+        cache.record(self._source("remote.csv"), pl.Schema({"a": pl.Int64, "b": pl.String}))
+        assert cache.schema(self._source("remote.csv")) == pl.Schema({"a": pl.Int64, "b": pl.String})
+
+    def test_unreadable_source(self, temp_dir: Path):
+        """Test missing sources have no columns and aren't cached."""
+        cache = SchemaCache()
+        assert cache.columns(self._source(temp_dir / "missing.csv")) == []
+        assert len(cache) == 0
+
+    def test_column_stats_cached(self, temp_csv: Path, monkeypatch):
+        """Test column statistics are computed once per file version."""
+        from plotql.core.connectors import LiteralConnector
+
+        calls = []
+        original = LiteralConnector.column_stats
+        monkeypatch.setattr(
+            LiteralConnector,
+            "column_stats",
+            lambda self, *args: calls.append(args) or original(self, *args),
+        )
+        cache = SchemaCache()
+        first = cache.column_stats(self._source(temp_csv), "x")
+        assert cache.column_stats(self._source(temp_csv), "x") is first
+        assert len(calls) == 1
+
+    def test_column_stats_unknown_column(self, temp_csv: Path):
+        """Test columns the source doesn't have get no statistics."""
+        assert SchemaCache().column_stats(self._source(temp_csv), "nope") is None
+
+    def test_bounded(self, temp_dir: Path):
+        """Test the cache evicts least recently used sources."""
+        cache = SchemaCache(max_entries=2)
+        for i in range(3):
+            path = temp_dir / f"data{i}.csv"
+            pl.DataFrame({"x": [i]}).write_csv(path)
+            cache.columns(self._source(path))
+        assert len(cache) == 2
+
+
+class TestSeriesCache:
+    """Tests for reusing executed series between runs."""
+
+    @pytest.fixture
+    def computed(self, monkeypatch):
+        """Record the series that are actually computed."""
+        from plotql.core import executor
+
+        calls = []
+        original = executor._execute_series
+        monkeypatch.setattr(
+            executor,
+            "_execute_series",
+            lambda series, *args: calls.append(series) or original(series, *args),
+        )
+        return calls
+
+    def _query(self, path: Path, *series: PlotSeries) -> PlotQuery:
+        return PlotQuery(source=SourceRef(args=[str(path)], is_literal=True), series=list(series))
+
+    def _series(self, y: str = "y", **format_options) -> PlotSeries:
+        return PlotSeries(
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name=y),
+            plot_type=PlotType.LINE,
+            format=FormatOptions(**format_options),
+        )
+
+    def test_styling_change_not_recomputed(self, temp_csv: Path, computed):
+        """Test a styling-only change reuses the data with the new format."""
+        cache = SeriesCache()
+        execute(self._query(temp_csv, self._series()), series_cache=cache)
+        results = execute(
+            self._query(temp_csv, self._series(title="Prices", line_color="red")),
+            series_cache=cache,
+        )
+
+        assert len(computed) == 1
+        assert results[0].y == [10, 20, 30, 40, 50]
+        assert results[0].series.format.title == "Prices"
+
+    def test_only_changed_series_recomputed(self, temp_csv: Path, computed):
+        """Test editing one series of a query leaves the others cached."""
+        cache = SeriesCache()
+        execute(self._query(temp_csv, self._series(), self._series("value")), series_cache=cache)
+        execute(self._query(temp_csv, self._series(), self._series("category")), series_cache=cache)
+
+        assert [s.y_column.name for s in computed] == ["y", "value", "category"]
+
+    def test_changed_file_recomputed(self, temp_csv: Path, computed):
+        """Test series are recomputed when the source file changes."""
+        cache = SeriesCache()
+        execute(self._query(temp_csv, self._series()), series_cache=cache)
+        pl.DataFrame({"x": [1], "y": [7]}).write_csv(temp_csv)
+        results = execute(self._query(temp_csv, self._series()), series_cache=cache)
+
+        assert len(computed) == 2
+        assert results[0].y == [7]
+
+    def test_invalid_format_still_rejected(self, temp_csv: Path):
+        """Test cached series still validate the new format options."""
+        cache = SeriesCache()
+        execute(self._query(temp_csv, self._series()), series_cache=cache)
+
+        series = self._series()
+        series.format.bins = "10"
+        with pytest.raises(ExecutionError, match="bins is only valid for histograms"):
+            execute(self._query(temp_csv, series), series_cache=cache)
+
+
+class TestRestyle:
+    """Tests for restyle."""
+
+    def _query(self, **format_options) -> PlotQuery:
+        return make_plot_query(
+            source="data.csv",
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            format=FormatOptions(**format_options),
+        )
+
+    def _data(self, query: PlotQuery) -> list:
+        return [PlotData(x=[1], y=[2], series=query.series[0], row_count=1, filtered_count=1)]
+
+    def test_styling_change(self):
+        """Test styling edits reuse the results with the new styling."""
+        previous = self._query()
+        query = self._query(title="Prices")
+
+        data = restyle(previous, self._data(previous), query)
+
+        assert data[0].y == [2]
+        assert data[0].series is query.series[0]
+
+    def test_data_change(self):
+        """Test edits that change data need execution."""
+        previous = self._query()
+        assert restyle(previous, self._data(previous), self._query(marker_size="3")) is None
+
+        other_source = self._query()
+        other_source.source = SourceRef(args=["other.csv"], is_literal=True)
+        assert restyle(previous, self._data(previous), other_source) is None
+
+
+# =============================================================================
+# X Range Tests
+# =============================================================================
+
+def _line_query(path: Path, x: str = "x", y: str = "y") -> PlotQuery:
+    return make_plot_query(
+        source=str(path),
+        x_column=ColumnRef(name=x),
+        y_column=ColumnRef(name=y),
+        plot_type=PlotType.LINE,
+    )
+
+
+class TestXRange:
+    """Tests for XRange zooming and panning."""
+
+    def test_zoom_about_centre(self):
+        """Test zooming scales the window about its centre."""
+        full = XRange(0, 100)
+        assert XRange(20, 60).zoom(0.5, full) == XRange(30, 50)
+
+    def test_zoom_out_stays_within_bounds(self):
+        """Test zooming out never shows more than the full extent."""
+        full = XRange(0, 100)
+        assert XRange(70, 100).zoom(2, full) == XRange(40, 100)
+        assert XRange(10, 90).zoom(4, full) == full
+
+    def test_pan_clamped(self):
+        """Test panning stops at the edges of the full extent."""
+        full = XRange(0, 100, "Y-m-d")
+        view = XRange(50, 70, "Y-m-d").pan(0.25, full)
+        assert view == XRange(55, 75, "Y-m-d")
+        assert view.pan(10, full) == XRange(80, 100, "Y-m-d")
+        assert view.pan(-10, full) == XRange(0, 20, "Y-m-d")
+
+    def test_empty_range_rejected(self):
+        """Test a window must have a positive width."""
+        with pytest.raises(ValueError, match="low must be below high"):
+            XRange(5, 5)
+
+
+class TestXExtent:
+    """Tests for x_extent."""
+
+    def _data(self, x: list, plot_type: PlotType = PlotType.LINE, timestamp=None) -> PlotData:
+        series = PlotSeries(
+            x_column=ColumnRef(name="x"), y_column=ColumnRef(name="y"), plot_type=plot_type
+        )
+        return PlotData(
+            x=x, y=x, series=series, row_count=len(x), filtered_count=len(x),
+            x_timestamp=timestamp,
+        )
+
+    def test_spans_all_series(self):
+        """Test the extent covers every series' x values."""
+        assert x_extent([self._data([3, 5]), self._data([1, 4])]) == XRange(1, 5)
+
+    def test_timestamp_format(self):
+        """Test timestamp axes carry their format."""
+        from plotql.core.utils import TimestampInfo
+
+        info = TimestampInfo(column_name="x", input_format="Y-m-d", output_format="Y-m-d")
+        assert x_extent([self._data([0, 10], timestamp=info)]).input_format == "Y-m-d"
+
+    def test_not_windowable(self):
+        """Test bar charts, text axes and single points have no extent."""
+        assert x_extent([self._data([1, 2], PlotType.BAR)]) is None
+        assert x_extent([self._data(["a", "b"])]) is None
+        assert x_extent([self._data([2, 2])]) is None
+
+
+class TestExecuteXRange:
+    """Tests for executing over a window of the x axis."""
+
+    @pytest.fixture
+    def series_csv(self, temp_dir: Path) -> Path:
+        path = temp_dir / "series.csv"
+        pl.DataFrame({"x": list(range(1000)), "y": [i % 7 for i in range(1000)]}).write_csv(path)
+        return path
+
+    def test_window_rows(self, series_csv: Path):
+        """Test only rows in the window are executed."""
+        results = execute(_line_query(series_csv), x_range=XRange(100, 199))
+
+        assert results[0].x == list(range(100, 200))
+        assert results[0].row_count == 100
+
+    def test_timestamp_window(self, temp_dir: Path):
+        """Test windows over string timestamps are pushed down by day and cut exactly."""
+        path = temp_dir / "times.csv"
+        pl.DataFrame({
+            "ts": [f"2026-01-0{d} 12:00:00" for d in range(1, 8)],
+            "y": list(range(7)),
+        }).write_csv(path)
+        query = _line_query(path, x="ts")
+        extent = x_extent(execute(query))
+        day = (extent.high - extent.low) / 6
+
+        results = execute(query, x_range=XRange(extent.low + 2 * day, extent.low + 4 * day, extent.input_format))
+
+        assert results[0].y == [2, 3, 4]
+
+    def test_resolution_reduces_lines(self, series_csv: Path):
+        """Test lines are reduced to the points visible at the resolution."""
+        full = execute(_line_query(series_csv), resolution=10)[0]
+        window = execute(_line_query(series_csv), x_range=XRange(0, 39), resolution=10)[0]
+
+        assert len(full.x) < 1000
+        assert full.filtered_count == 1000
+        assert (full.x[0], full.x[-1]) == (0, 999)
+        # A narrow window has few enough points to keep them all
+        assert window.x == list(range(40))
+
+    def test_scatter_not_reduced(self, series_csv: Path):
+        """Test only lines are reduced."""
+        query = _line_query(series_csv)
+        query.series[0].plot_type = PlotType.SCATTER
+        assert len(execute(query, resolution=10)[0].x) == 1000
+
+    def test_pushed_down_to_connector(self, series_csv: Path, monkeypatch):
+        """Test the window is passed to the connector's load_range."""
+        from plotql.core.connectors import LiteralConnector
+
+        calls = []
+        original = LiteralConnector.load_range
+        monkeypatch.setattr(
+            LiteralConnector, "load_range",
+            lambda self, config, *args, **kwargs: calls.append(args) or original(self, config, *args, **kwargs),
+        )
+
+        execute(_line_query(series_csv), x_range=XRange(10, 20))
+
+        assert calls == [("x", 10, 20)]
+
+
+class TestTileCache:
+    """Tests for reusing fetched x ranges as tiles."""
+
+    @pytest.fixture
+    def fetches(self, monkeypatch):
+        """Record the ranges actually loaded from the source."""
+        from plotql.core import executor
+
+        calls = []
+        original = executor.load_x_range
+        monkeypatch.setattr(
+            executor,
+            "load_x_range",
+            lambda source, column, x_range, *args, **kwargs: (
+                calls.append((x_range.low, x_range.high))
+                or original(source, column, x_range, *args, **kwargs)
+            ),
+        )
+        return calls
+
+    @pytest.fixture
+    def series_csv(self, temp_dir: Path) -> Path:
+        path = temp_dir / "series.csv"
+        pl.DataFrame({"x": list(range(256)), "y": list(range(256))}).write_csv(path)
+        return path
+
+    def test_pan_reuses_tiles(self, series_csv: Path, fetches):
+        """Test panning within fetched tiles loads nothing."""
+        tiles = TileCache()
+        execute(_line_query(series_csv), x_range=XRange(64, 96), tiles=tiles)
+        results = execute(_line_query(series_csv), x_range=XRange(70, 100), tiles=tiles)
+
+        assert fetches == [(64, 96), (96, 128)]
+        assert results[0].x == list(range(70, 101))
+
+    def test_zoom_in_cuts_wider_tile(self, series_csv: Path, fetches):
+        """Test zooming in is served from a wider tile already fetched."""
+        tiles = TileCache()
+        execute(_line_query(series_csv), x_range=XRange(0, 128), tiles=tiles)
+        fetched = len(fetches)
+        results = execute(_line_query(series_csv), x_range=XRange(40, 47), tiles=tiles)
+
+        assert len(fetches) == fetched
+        assert results[0].x == list(range(40, 48))
+
+    def test_changed_file_refetched(self, series_csv: Path, fetches):
+        """Test tiles of a changed file aren't reused."""
+        tiles = TileCache()
+        execute(_line_query(series_csv), x_range=XRange(0, 7), tiles=tiles)
+        pl.DataFrame({"x": [1, 2], "y": [7, 8]}).write_csv(series_csv)
+        results = execute(_line_query(series_csv), x_range=XRange(0, 7), tiles=tiles)
+
+        assert fetches == [(0, 8), (0, 8)]
+        assert results[0].y == [7, 8]
+
+    def test_bounded(self, series_csv: Path):
+        """Test the oldest tiles are evicted beyond max_entries."""
+        tiles = TileCache(max_entries=2)
+        for low in (0, 64, 128, 192):
+            execute(_line_query(series_csv), x_range=XRange(low, low + 32), tiles=tiles)
+        assert len(tiles) == 2
+
+
+class TestExecuteWithPyramids:
+    """Tests for drawing large lines from their pyramids."""
+
+    @pytest.fixture
+    def pyramids(self, tmp_path: Path, monkeypatch) -> PyramidStore:
+        from plotql.core import pyramid
+
+        monkeypatch.setattr(pyramid, "PYRAMID_BASE_BUCKETS", 64)
+        monkeypatch.setattr(pyramid, "PYRAMID_TOP_BUCKETS", 4)
+        return PyramidStore(tmp_path / "pyramids", min_rows=100)
+
+    @pytest.fixture
+    def loads(self, monkeypatch):
+        """Record the sources actually loaded."""
+        from plotql.core import executor
+
+        calls = []
+        original = executor.load_data
+        monkeypatch.setattr(
+            executor,
+            "load_data",
+            lambda source, *args, **kwargs: calls.append(source) or original(source, *args, **kwargs),
+        )
+        return calls
+
+    @pytest.fixture
+    def series_csv(self, temp_dir: Path) -> Path:
+        path = temp_dir / "series.csv"
+        pl.DataFrame({"x": list(range(1024)), "y": [i % 13 for i in range(1024)]}).write_csv(path)
+        return path
+
+    def test_second_run_skips_source(self, series_csv: Path, pyramids, loads):
+        """Test the first run builds the pyramid and the next draws from it."""
+        first = execute(_line_query(series_csv), resolution=8, pyramids=pyramids)[0]
+        second = execute(_line_query(series_csv), resolution=8, pyramids=pyramids)[0]
+
+        assert len(loads) == 1
+        assert (second.row_count, second.filtered_count) == (1024, 1024)
+        assert len(second.x) <= 2 * 16
+        assert (min(second.y), max(second.y)) == (min(first.y), max(first.y))
+
+    def test_window_from_pyramid(self, series_csv: Path, pyramids, loads):
+        """Test coarse windows are drawn from the pyramid too."""
+        execute(_line_query(series_csv), resolution=8, pyramids=pyramids)
+        results = execute(
+            _line_query(series_csv), x_range=XRange(256, 767), resolution=8, pyramids=pyramids
+        )
+
+        assert len(loads) == 1
+        assert results[0].filtered_count == 512
+        assert 256 <= min(results[0].x) and max(results[0].x) <= 767
+
+    def test_fine_window_loads_source(self, series_csv: Path, pyramids, loads):
+        """Test windows needing more detail than the base level read the source."""
+        execute(_line_query(series_csv), resolution=8, pyramids=pyramids)
+        results = execute(
+            _line_query(series_csv), x_range=XRange(100, 139), resolution=10, pyramids=pyramids
+        )
+
+        assert results[0].x == list(range(100, 140))
+
+    def test_changed_file_rebuilt(self, series_csv: Path, pyramids, loads):
+        """Test a pyramid isn't used once its source changes."""
+        execute(_line_query(series_csv), resolution=8, pyramids=pyramids)
+        pl.DataFrame({"x": list(range(200)), "y": [5] * 200}).write_csv(series_csv)
+        results = execute(_line_query(series_csv), resolution=8, pyramids=pyramids)
+
+        assert len(loads) == 2
+        assert set(results[0].y) == {5}
+
+    def test_aggregates_not_pyramided(self, series_csv: Path, pyramids):
+        """Test only plain lines get pyramids."""
+        query = _line_query(series_csv)
+        query.series[0].plot_type = PlotType.SCATTER
+        execute(query, resolution=8, pyramids=pyramids)
+
+        assert not pyramids.directory.exists()
+
+
+# =============================================================================
+# Cancellation Tests
+# =============================================================================
+
+class TestCancellation:
+    """Tests for cancelling execution with a CancelToken."""
+
+    def _query(self, path: Path) -> PlotQuery:
+        return make_plot_query(
+            source=str(path),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+        )
+
+    def test_cancelled_before_start(self, temp_csv: Path):
+        """Test a cancelled token stops execution before loading."""
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(ExecutionCancelled):
+            execute(self._query(temp_csv), cancel=token)
+
+    def test_cancel_during_load(self, temp_csv: Path, monkeypatch):
+        """Test cancelling mid-load aborts the connector and discards data."""
+        from plotql.core.connectors import LiteralConnector
+
+        token = CancelToken()
+        aborted = []
+        original = LiteralConnector.load
+
+        def slow_load(self, config, filters=None):
+            token.cancel()  # Simulate a cancel from another thread
+            return original(self, config, filters)
+
+        monkeypatch.setattr(LiteralConnector, "load", slow_load)
+        monkeypatch.setattr(
+            LiteralConnector, "cancel", lambda self: aborted.append(True)
+        )
+        with pytest.raises(ExecutionCancelled):
+            execute(self._query(temp_csv), cancel=token)
+        assert aborted == [True]
+
+    def test_uncancelled_token_runs(self, temp_csv: Path):
+        """Test execution completes normally with an unused token."""
+        result = execute(self._query(temp_csv), cancel=CancelToken())[0]
+        assert result.y == [10, 20, 30, 40, 50]
+
+    def test_cancelled_is_execution_error(self):
+        """Test callers catching ExecutionError also catch cancellation."""
+        assert issubclass(ExecutionCancelled, ExecutionError)
+
+    def test_callback_after_cancel_runs_immediately(self):
+        """Test registering on a cancelled token calls back at once."""
+        token = CancelToken()
+        token.cancel()
+        calls = []
+        token.on_cancel(lambda: calls.append(1))
+        assert calls == [1]
+
+
 # =============================================================================
 # PlotData Dataclass Tests
 # =============================================================================
@@ -816,21 +1564,34 @@ class TestPlotDataSorting:
         # x (categories) should follow the same reordering
         assert result.x == ["B", "D", "A", "C", "E"]
 
-    def test_hist_sorted_by_y(self, unsorted_csv: Path):
-        """Test histogram data is sorted ascending by y (smallest bar first)."""
+    def test_hist_binned(self, unsorted_csv: Path):
+        """Test histograms return bin edges and counts instead of raw values."""
         query = make_plot_query(
             source=str(unsorted_csv),
             x_column=ColumnRef(name="category"),
             y_column=ColumnRef(name="y"),
             plot_type=PlotType.HIST,
+            format=FormatOptions(bins="4"),
         )
-        results = execute(query)
-        result = results[0]
+        result = execute(query)[0]
 
-        # y values should be sorted ascending (smallest bar first)
-        assert result.y == [10, 20, 30, 40, 50]
-        # x (categories) should follow the same reordering
-        assert result.x == ["B", "D", "A", "C", "E"]
+        assert result.bin_edges == [10.0, 20.0, 30.0, 40.0, 50.0]
+        assert result.y == [1, 1, 1, 2]
+        assert result.x == result.bin_edges[:-1]
+        assert result.filtered_count == 5
+
+    def test_hist_default_bins(self, unsorted_csv: Path):
+        """Test histograms pick a bin count when none is given."""
+        query = make_plot_query(
+            source=str(unsorted_csv),
+            x_column=ColumnRef(name="x"),
+            y_column=ColumnRef(name="y"),
+            plot_type=PlotType.HIST,
+        )
+        result = execute(query)[0]
+
+        assert sum(result.y) == 5
+        assert len(result.bin_edges) == len(result.y) + 1
 
     def test_scatter_sorting_preserves_marker_sizes(self, unsorted_csv: Path):
         """Test that marker_sizes are reordered along with the data."""
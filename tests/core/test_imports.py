@@ -0,0 +1,109 @@
+"""
+Import-time tests for the plotql package.
+
+Each test runs in a fresh interpreter, since the modules under test are
+already loaded in the pytest process.
+"""
+import subprocess
+import sys
+
+import pytest
+
+# Heavy dependencies that must not load until a query runs or renders
+HEAVY_MODULES = ("matplotlib", "polars", "numpy", "textual", "PIL")
+
+# Upper bound for `import plotql`. Loading Polars or matplotlib alone takes
+# several times longer, so a regression fails clearly even on slow machines.
+IMPORT_BUDGET_US = 200_000
+
+
+def _loaded_after(code: str) -> set:
+    """Run code in a fresh interpreter and return the heavy modules it loaded."""
+    check = (
+        f"{code}\n"
+        "import sys\n"
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True,
+    ).stdout
+    # The code under test may print too; the module list is the last line
+    return set(out.splitlines()[-1].split()) if out.strip() else set()
+
+
+class TestLazyImports:
+    """Tests that importing plotql defers its heavy dependencies."""
+
+    def test_import_plotql(self):
+        """Test `import plotql` loads none of the heavy dependencies."""
+        assert _loaded_after("import plotql, plotql.core") == set()
+
+    def test_cli_help(self):
+        """Test `plotql --help` loads none of the heavy dependencies."""
+        code = (
+            "from plotql.cli import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+        )
+        assert _loaded_after(code) == set()
+
+    def test_parse_without_polars(self):
+        """Test parsing a query doesn't load Polars or an engine."""
+        code = "from plotql import parse\nparse(\"WITH source('a.csv') PLOT y AGAINST x\")"
+        assert _loaded_after(code) == set()
+
+    def test_engine_loaded_on_first_use(self):
+        """Test the matplotlib engine is imported only when it's needed."""
+        assert "matplotlib" not in _loaded_after("from plotql.core import execute")
+        assert "matplotlib" not in _loaded_after("from plotql.core import RasterEngine")
+        assert "matplotlib" in _loaded_after("from plotql.core import get_engine\nget_engine()")
+
+    def test_matplotlib_engine_avoids_pyplot(self):
+        """Test rendering uses the Figure API without pyplot's global state."""
+        code = (
+            "import sys\n"
+            "from plotql.core import MatplotlibEngine\n"
+            "print('pyplot' if 'matplotlib.pyplot' in sys.modules else '')\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.strip() == ""
+
+    def test_public_names_resolve(self):
+        """Test every name in __all__ is importable."""
+        import plotql
+        import plotql.core
+
+        for module in (plotql, plotql.core):
+            for name in module.__all__:
+                assert getattr(module, name) is not None
+            assert set(module.__all__) <= set(dir(module))
+
+    def test_unknown_attribute(self):
+        """Test unknown names still raise AttributeError."""
+        import plotql.core
+
+        with pytest.raises(AttributeError):
+            plotql.core.not_a_name
+
+
+class TestImportTime:
+    """Benchmark guarding `import plotql` against regressions."""
+
+    def test_import_time_budget(self):
+        """Test `import plotql` stays within its time budget."""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import plotql"],
+            capture_output=True, text=True, check=True,
+        )
+        # Lines are "import time: self [us] | cumulative | name"
+        cumulative = {
+            line.split("|")[2].strip(): int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and line.count("|") == 2
+            and line.split("|")[1].strip().isdigit()
+        }
+        assert cumulative["plotql"] < IMPORT_BUDGET_US
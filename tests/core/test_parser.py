@@ -3,6 +3,10 @@ Unit tests for plotql.core.parser module.
 
 Tests lexer tokenization and parser functionality at token level.
 """
+import threading
+import time
+from collections import OrderedDict
+
 import pytest
 
 from plotql.core.ast import (
@@ -12,7 +16,17 @@ from plotql.core.ast import (
     LogicalOp,
     PlotType,
 )
-from plotql.core.parser import Lexer, ParseError, Parser, Token, parse
+from plotql.core.parser import (
+    IncrementalParser,
+    Lexer,
+    ParseError,
+    Parser,
+    Token,
+    clear_parse_cache,
+    parse,
+    parse_script,
+    split_script,
+)
 
 
 # =============================================================================
@@ -355,6 +369,162 @@ class TestLexerCompleteQueries:
 # Parser Tests
 # =============================================================================
 
+class TestLexerCompiled:
+    """Tests for the combined single-pass token regex."""
+
+    def test_regex_compiled_once(self):
+        """Test the token regex is shared across lexer instances."""
+        assert Lexer("a").TOKEN_REGEX is Lexer("b").TOKEN_REGEX
+
+    def test_pattern_priority_preserved(self):
+        """Test operators win over numbers and strings keep their quotes."""
+        tokens = list(Lexer("x>=-1 'a b'").tokenize())
+        assert [(t.type, t.value) for t in tokens] == [
+            ("IDENT", "x"),
+            ("OP", ">="),
+            ("NUMBER", "-1"),
+            ("STRING", "'a b'"),
+        ]
+
+    def test_long_query(self):
+        """Test tokenizing a multi-hundred-line query."""
+        lines = ["WITH source('data.csv')"]
+        lines += ["PLOT y AGAINST x FILTER a > 1 FORMAT title = 't'"] * 300
+        tokens = list(Lexer("\n".join(lines)).tokenize())
+        assert len(tokens) == 5 + 300 * 12
+
+
+# =============================================================================
+# Multi-Query Script Tests
+# =============================================================================
+
+class TestParseScript:
+    """Tests for splitting and parsing multi-query scripts."""
+
+    def test_split_multiple_queries(self):
+        """Test each WITH starts a new query."""
+        text = (
+            "WITH source('a.csv') PLOT y AGAINST x\n"
+            "\n"
+            "WITH source('b.csv') PLOT y AGAINST x AS 'bar'\n"
+        )
+        chunks = split_script(text)
+        assert [q for _, q in chunks] == [
+            "WITH source('a.csv') PLOT y AGAINST x",
+            "WITH source('b.csv') PLOT y AGAINST x AS 'bar'",
+        ]
+        assert chunks[1][0] == text.index("WITH source('b.csv')")
+
+    def test_split_ignores_with_in_strings(self):
+        """Test WITH inside a string literal doesn't split."""
+        text = "WITH source('a.csv') PLOT y AGAINST x FORMAT title = 'with care'"
+        assert len(split_script(text)) == 1
+
+    def test_split_keeps_leading_garbage(self):
+        """Test text before the first WITH is kept as its own chunk."""
+        chunks = split_script("  oops WITH source('a.csv') PLOT y AGAINST x")
+        assert chunks[0] == (2, "oops")
+
+    def test_split_empty(self):
+        """Test an empty script has no queries."""
+        assert split_script("  \n\n ") == []
+
+    def test_parse_script(self):
+        """Test parsing every query in a script."""
+        queries = parse_script(
+            "WITH source('a.csv') PLOT y AGAINST x "
+            "WITH source('b.csv') PLOT y AGAINST x AS 'bar'"
+        )
+        assert [q.source.args for q in queries] == [["a.csv"], ["b.csv"]]
+        assert queries[1].series[0].plot_type == PlotType.BAR
+
+    def test_parse_script_error_position(self):
+        """Test error positions are relative to the whole script."""
+        text = "WITH source('a.csv') PLOT y AGAINST x\nWITH source('b.csv') PLOT y"
+        with pytest.raises(ParseError) as exc:
+            parse_script(text)
+        assert exc.value.position >= text.index("WITH source('b.csv')")
+
+
+# =============================================================================
+# Parse Cache Tests
+# =============================================================================
+
+class TestParseCache:
+    """Tests for the parse() result cache."""
+
+    def setup_method(self):
+        clear_parse_cache()
+
+    def test_cached_result_equal(self):
+        """Test reparsing the same text returns an equal AST."""
+        query = "WITH source('data.csv') PLOT y AGAINST x"
+        assert parse(query) == parse(query)
+
+    def test_cached_result_shared(self):
+        """Test a cache hit returns the cached AST itself, without copying."""
+        query = "WITH source('data.csv') PLOT y AGAINST x"
+        assert parse(query) is parse(query)
+
+    def test_cache_hit_cheaper_than_miss(self):
+        """Test reparsing unchanged text costs a small fraction of parsing it."""
+        query = "WITH source('data.csv')" + "".join(
+            f" PLOT avg(y{i}) AGAINST x AS 'line' FILTER a > {i} AND b = 'v' FORMAT title = 't{i}'"
+            for i in range(200)
+        )
+        start = time.perf_counter()
+        parse(query)
+        miss = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(10):
+            parse(query)
+        hit = (time.perf_counter() - start) / 10
+
+        assert hit < miss / 20
+
+    def test_cached_error_reraised(self):
+        """Test parse errors are raised again for unchanged invalid text."""
+        query = "WITH source('data.csv') PLOT y"
+        with pytest.raises(ParseError) as first:
+            parse(query)
+        with pytest.raises(ParseError) as second:
+            parse(query)
+        assert first.value.message == second.value.message
+        assert first.value.position == second.value.position
+
+    def test_cache_skips_lexing(self, monkeypatch):
+        """Test a cache hit doesn't tokenize again."""
+        query = "WITH source('data.csv') PLOT y AGAINST x"
+        parse(query)
+
+        def fail(self):
+            raise AssertionError("tokenize called on cache hit")
+
+        monkeypatch.setattr(Lexer, "tokenize", fail)
+        parse(query)
+
+    def test_eviction_during_lookup(self, monkeypatch):
+        """Test another thread evicting an entry mid-lookup doesn't break the hit."""
+        query = "WITH source('data.csv') PLOT y AGAINST x"
+        other = threading.Thread(target=parse, args=("WITH source('data.csv') PLOT y AGAINST z",))
+
+        class RacingCache(OrderedDict):
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                if value is not None and other.ident is None:
+                    # Give the other thread a chance to evict the entry now
+                    other.start()
+                    other.join(timeout=0.2)
+                return value
+
+        monkeypatch.setattr("plotql.core.parser.PARSE_CACHE_SIZE", 1)
+        monkeypatch.setattr("plotql.core.parser._parse_cache", RacingCache())
+        parse(query)
+        assert parse(query) == parse(query)
+        other.join()
+
+
 class TestParserBasics:
     """Basic parser functionality tests."""
 
@@ -399,6 +569,59 @@ class TestParserWithClause:
         assert result.source.args[0] == "./data/file.csv"
 
 
+class TestParserRefreshClause:
+    """Test parsing REFRESH EVERY clause."""
+
+    def test_no_refresh(self):
+        """Test queries without the clause don't refresh."""
+        assert parse("WITH source('file.csv') PLOT y AGAINST x").refresh is None
+
+    @pytest.mark.parametrize("interval, seconds", [
+        ("5s", 5.0),
+        ("1.5s", 1.5),
+        ("2m", 120.0),
+        ("1 H", 3600.0),
+    ])
+    def test_units(self, interval, seconds):
+        """Test the interval is converted to seconds."""
+        result = parse(f"WITH source('file.csv') REFRESH EVERY {interval} PLOT y AGAINST x")
+        assert result.refresh == seconds
+
+    def test_missing_unit(self):
+        """Test an interval without a unit is rejected."""
+        with pytest.raises(ParseError, match="Expected a time unit after 5"):
+            parse("WITH source('file.csv') REFRESH EVERY 5 PLOT y AGAINST x")
+
+    @pytest.mark.parametrize("interval", ["0s", "0.0001s", "0.5s"])
+    def test_interval_too_short(self, interval):
+        """Test intervals under a second are rejected."""
+        with pytest.raises(ParseError, match="must be at least 1s"):
+            parse(f"WITH source('file.csv') REFRESH EVERY {interval} PLOT y AGAINST x")
+
+    def test_keywords_usable_as_columns(self):
+        """Test REFRESH and EVERY are keywords only in the clause."""
+        result = parse(
+            "WITH source('file.csv') refresh every 5s "
+            "PLOT every AGAINST refresh FILTER every > 3"
+        )
+        assert result.refresh == 5.0
+        assert result.series[0].y_column.name == "every"
+        assert result.series[0].x_column.name == "refresh"
+        assert result.series[0].filter.conditions[0].column == "every"
+
+    def test_missing_every(self):
+        """Test REFRESH must be followed by EVERY."""
+        with pytest.raises(ParseError, match="Expected EVERY"):
+            parse("WITH source('file.csv') REFRESH 5s PLOT y AGAINST x")
+
+    def test_incremental(self):
+        """Test the incremental parser reads the clause with the header."""
+        query = "WITH source('file.csv')\nREFRESH EVERY 10s\nPLOT y AGAINST x"
+        result = IncrementalParser().parse(query)
+        assert result.query == parse(query)
+        assert result.query.refresh == 10.0
+
+
 class TestParserPlotClause:
     """Test parsing PLOT clause."""
 
@@ -607,6 +830,11 @@ class TestParserFormatClause:
         result = parse("WITH source('data.csv') PLOT y AGAINST x FORMAT style = dotted")
         assert result.series[0].format.line_style == "dotted"
 
+    def test_format_bins(self):
+        """Test FORMAT with bins."""
+        result = parse("WITH source('data.csv') PLOT y AGAINST x AS 'hist' FORMAT bins = 20")
+        assert result.series[0].format.bins == "20"
+
     def test_format_marker_null(self):
         """Test FORMAT with marker = NULL."""
         result = parse("WITH source('data.csv') PLOT y AGAINST x FORMAT marker = NULL")
@@ -1004,3 +1232,106 @@ class TestParserMultipleSeries:
         assert result.series[1].filter is not None
         assert result.series[1].filter.conditions[0].column == "user_id"
         assert result.series[1].format.marker_size == "5"
+
+
+# =============================================================================
+# IncrementalParser Tests
+# =============================================================================
+
+class TestIncrementalParser:
+    """Tests for the error-recovering block parser."""
+
+    def test_valid_query_matches_parse(self):
+        """Test a valid query produces the same AST as parse()."""
+        query = (
+            "WITH source('data.csv')\n"
+            "PLOT y AGAINST x AS 'line' FILTER a > 1\n"
+            "PLOT count(z) AGAINST x AS 'bar' FORMAT title = 'T'"
+        )
+        result = IncrementalParser().parse(query)
+        assert result.ok
+        assert result.query == parse(query)
+
+    def test_errors_in_multiple_blocks(self):
+        """Test an error in one series doesn't hide errors in another."""
+        query = (
+            "WITH source('data.csv')\n"
+            "PLOT y AGAIN x\n"
+            "PLOT y AGAINST x\n"
+            "PLOT z AGAINST\n"
+        )
+        result = IncrementalParser().parse(query)
+        assert result.query is None
+        assert len(result.diagnostics) == 2
+        first, second = result.diagnostics
+        assert query[first.start:first.end] == "AGAIN"
+        assert "AGAINST" in first.message
+        assert second.start == len(query.rstrip())
+
+    def test_diagnostic_points_at_bad_plot_type(self):
+        """Test the diagnostic covers the offending token."""
+        query = "WITH source('data.csv') PLOT y AGAINST x AS 'pie'"
+        diag = IncrementalParser().parse(query).diagnostics[0]
+        assert query[diag.start:diag.end] == "'pie'"
+
+    def test_lexer_error_located(self):
+        """Test unexpected characters are reported at their offset."""
+        query = "WITH source('data.csv') PLOT y AGAINST x FILTER a @ 1"
+        diag = IncrementalParser().parse(query).diagnostics[0]
+        assert query[diag.start] == "@"
+
+    def test_quoted_plot_does_not_split(self):
+        """Test PLOT inside a string literal is not a block boundary."""
+        query = "WITH source('data.csv') PLOT y AGAINST x FORMAT title = 'PLOT me'"
+        result = IncrementalParser().parse(query)
+        assert result.ok
+        assert result.query.series[0].format.title == "PLOT me"
+
+    def test_missing_plot(self):
+        """Test a header without PLOT clauses is reported."""
+        result = IncrementalParser().parse("WITH source('data.csv')")
+        assert not result.ok
+        assert "PLOT" in result.diagnostics[0].message
+
+    def test_only_edited_block_reparsed(self, monkeypatch):
+        """Test unchanged blocks come from the cache after an edit."""
+        parser = IncrementalParser()
+        header = "WITH source('data.csv')\n"
+        parser.parse(header + "PLOT y AGAINST x\nPLOT z AGAINST x")
+
+        lexed = []
+        original = Lexer.tokenize
+
+        def tracking(self):
+            lexed.append(self.text)
+            return original(self)
+
+        monkeypatch.setattr(Lexer, "tokenize", tracking)
+        result = parser.parse(header + "PLOT y AGAINST x\nPLOT w AGAINST x")
+
+        assert result.ok
+        assert lexed == ["PLOT w AGAINST x"]
+
+    def test_cached_blocks_shared(self):
+        """Test unchanged blocks return their cached series without copying."""
+        parser = IncrementalParser()
+        query = "WITH source('data.csv') PLOT y AGAINST x"
+        assert parser.parse(query).query.series[0] is parser.parse(query).query.series[0]
+
+    def test_cached_reparse_cheaper_than_parse(self):
+        """Test reparsing a fully cached script costs a small fraction of parsing it."""
+        text = "WITH source('data.csv')\n" + "".join(
+            f"PLOT avg(y{i}) AGAINST x AS 'line'\nFILTER a > {i} AND b = 'v'\nFORMAT title = 't{i}'\n"
+            for i in range(150)
+        )
+        parser = IncrementalParser()
+        start = time.perf_counter()
+        parser.parse(text)
+        miss = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(10):
+            parser.parse(text)
+        hit = (time.perf_counter() - start) / 10
+
+        assert hit < miss / 5
@@ -0,0 +1,177 @@
+"""
+Unit tests for plotql.core.pyramid module.
+
+Tests building, storing and reading multi-resolution line aggregates.
+"""
+import os
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from plotql.core import pyramid as pyramid_module
+from plotql.core.pyramid import PyramidStore, build_levels
+from plotql.core.utils import TimestampInfo
+
+
+@pytest.fixture
+def small_levels(monkeypatch):
+    """Use few buckets per level so small lines have several levels."""
+    monkeypatch.setattr(pyramid_module, "PYRAMID_BASE_BUCKETS", 64)
+    monkeypatch.setattr(pyramid_module, "PYRAMID_TOP_BUCKETS", 4)
+
+
+def _line(n: int = 1024) -> tuple:
+    x = np.arange(n, dtype=float)
+    y = np.sin(x / 50) * 100 + (x % 7)
+    return x, y
+
+
+class TestBuildLevels:
+    """Tests for build_levels."""
+
+    def test_levels_halve(self, small_levels):
+        """Test each level merges pairs of buckets until few are left."""
+        x, y = _line()
+        levels, base = build_levels(x, y)
+
+        assert base == 4  # 1023 / 64 rounds up to buckets 16 wide
+        counts = levels.group_by("level").len().sort("level")["len"].to_list()
+        assert counts == [64, 32, 16, 8, 4]
+
+    def test_aggregates(self, small_levels):
+        """Test every level summarizes the same points."""
+        x, y = _line()
+        levels, _ = build_levels(x, y)
+
+        for level in levels.partition_by("level"):
+            assert level["count"].sum() == len(x)
+            assert level["min"].min() == y.min()
+            assert level["max"].max() == y.max()
+            mean = (level["mean"] * level["count"]).sum() / level["count"].sum()
+            assert mean == pytest.approx(y.mean())
+
+    def test_extreme_positions(self, small_levels):
+        """Test each bucket records where its minimum and maximum are."""
+        x, y = _line()
+        levels, _ = build_levels(x, y)
+
+        for row in levels.iter_rows(named=True):
+            assert y[int(row["min_x"])] == row["min"]
+            assert y[int(row["max_x"])] == row["max"]
+
+
+class TestPyramidStore:
+    """Tests for storing and finding pyramids."""
+
+    def test_round_trip(self, tmp_path: Path, small_levels):
+        """Test a built pyramid is found for its key and fingerprint."""
+        store = PyramidStore(tmp_path, min_rows=10)
+        x, y = _line()
+        info = TimestampInfo(column_name="t", input_format="Y-m-d", output_format="Y-m-d")
+
+        built = store.build("line", "v1", pl.Series(x), pl.Series(y), 2000, info)
+        found = store.get("line", "v1")
+
+        assert found == built
+        assert (found.low, found.high, found.row_count) == (0, 1023, 2000)
+        assert found.x_timestamp == info
+
+    def test_stale_fingerprint(self, tmp_path: Path):
+        """Test a pyramid built from another version of the source is ignored."""
+        store = PyramidStore(tmp_path, min_rows=10)
+        x, y = _line()
+        store.build("line", "v1", pl.Series(x), pl.Series(y), 1024)
+
+        assert store.get("line", "v2") is None
+        assert store.get("other", "v1") is None
+
+    def test_small_or_text_lines_skipped(self, tmp_path: Path):
+        """Test lines below min_rows or with text values get no pyramid."""
+        store = PyramidStore(tmp_path, min_rows=100)
+
+        assert store.build("a", "v1", pl.Series([1, 2]), pl.Series([3, 4]), 2) is None
+        assert store.build("b", "v1", pl.Series(range(200)), pl.Series(["y"] * 200), 200) is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_missing_values_dropped(self, tmp_path: Path):
+        """Test points with missing or non-finite values are left out."""
+        store = PyramidStore(tmp_path, min_rows=3)
+        pyramid = store.build(
+            "line", "v1", pl.Series([0.0, 1.0, 2.0, 3.0]), pl.Series([1.0, None, np.nan, 4.0]), 4
+        )
+        assert pyramid.filtered_count == 2
+
+
+    def test_write_leaves_no_temp_files(self, tmp_path: Path, monkeypatch):
+        """Test builds leave only the pyramid, even when writing fails."""
+        store = PyramidStore(tmp_path, min_rows=10)
+        x, y = _line()
+        store.build("line", "v1", pl.Series(x), pl.Series(y), 1024)
+        assert sorted(p.suffix for p in tmp_path.iterdir()) == [".json", ".parquet"]
+
+        def fail(self, file, **kwargs):
+            Path(file).write_bytes(b"partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(pl.DataFrame, "write_parquet", fail)
+        with pytest.raises(OSError):
+            store.build("other", "v1", pl.Series(x), pl.Series(y), 1024)
+        assert sorted(p.suffix for p in tmp_path.iterdir()) == [".json", ".parquet"]
+
+    def test_prunes_least_recently_used(self, tmp_path: Path):
+        """Test builds past max_bytes delete the pyramids read longest ago."""
+        store = PyramidStore(tmp_path, min_rows=10, max_bytes=None)
+        x, y = _line()
+        a = store.build("a", "v1", pl.Series(x), pl.Series(y), 1024)
+        b = store.build("b", "v1", pl.Series(x), pl.Series(y), 1024)
+        os.utime(a.path, (1, 1))
+        os.utime(b.path, (2, 2))
+        store.get("a", "v1")  # Now the most recently used
+
+        store.max_bytes = int(2.5 * a.path.stat().st_size)
+        store.build("c", "v1", pl.Series(x), pl.Series(y), 1024)
+
+        assert store.get("a", "v1") is not None
+        assert store.get("b", "v1") is None
+        assert not b.path.with_suffix(".json").exists()
+        assert store.get("c", "v1") is not None
+
+
+class TestPyramidLine:
+    """Tests for reading a line from a pyramid."""
+
+    @pytest.fixture
+    def pyramid(self, tmp_path: Path, small_levels):
+        x, y = _line()
+        return PyramidStore(tmp_path, min_rows=10).build(
+            "line", "v1", pl.Series(x), pl.Series(y), 1024
+        )
+
+    def test_level_choice(self, pyramid):
+        """Test the coarsest level with a bucket per pixel is chosen."""
+        assert pyramid.level_for(1024, 8) == 7
+        assert pyramid.level_for(1024, 2) == 8  # Capped at the top level
+        assert pyramid.level_for(1024, 512) is None  # Finer than the base
+
+    def test_full_line(self, pyramid):
+        """Test the line keeps each bucket's extremes, in x order."""
+        x, y, count = pyramid.line(0, 1023, 8)
+
+        assert count == 1024
+        assert len(x) <= 2 * 16  # Buckets 64 wide, two points each
+        assert (np.diff(x) > 0).all()
+        assert y.min() == _line()[1].min()
+        assert y.max() == _line()[1].max()
+
+    def test_window(self, pyramid):
+        """Test a window reads only its buckets."""
+        x, _, count = pyramid.line(256, 511, 8)
+
+        assert x.min() >= 256 and x.max() <= 511
+        assert count == 256
+
+    def test_too_fine(self, pyramid):
+        """Test windows needing more detail than the base level return None."""
+        assert pyramid.line(0, 100, 50) is None
@@ -0,0 +1,144 @@
+"""
+Unit tests for plotql.core.refresh module.
+
+Tests following a growing source and re-executing only on new data.
+"""
+import threading
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from plotql.core import ExecutionError, parse
+from plotql.core.connectors import Increment, LiteralConnector
+from plotql.core.refresh import LiveSource, Refresher, tail_column
+
+
+@pytest.fixture
+def live_csv(tmp_path: Path) -> Path:
+    """A CSV file rows can be appended to."""
+    path = tmp_path / "live.csv"
+    path.write_text("ts,y\n1,10\n2,20\n")
+    return path
+
+
+def _append(path: Path, text: str) -> None:
+    with open(path, "a") as f:
+        f.write(text)
+
+
+class TestTailColumn:
+    """Tests for choosing the column new rows are found past."""
+
+    def test_shared_line_axis(self):
+        """Test lines against one x column follow it."""
+        query = parse("WITH source('a.csv') PLOT y AGAINST ts AS 'line' PLOT z AGAINST ts AS 'line'")
+        assert tail_column(query) == "ts"
+
+    def test_other_plots(self):
+        """Test scatter plots and mixed x columns follow nothing."""
+        assert tail_column(parse("WITH source('a.csv') PLOT y AGAINST ts")) is None
+        query = parse("WITH source('a.csv') PLOT y AGAINST a AS 'line' PLOT y AGAINST b AS 'line'")
+        assert tail_column(query) is None
+
+
+class TestLiveSource:
+    """Tests for applying increments to the fetched rows."""
+
+    def test_appended(self, live_csv: Path):
+        """Test appended rows are added to those fetched before."""
+        source = LiveSource(parse(f"WITH source('{live_csv}') PLOT y AGAINST ts").source)
+        assert source.poll()
+        _append(live_csv, "3,30\n")
+
+        assert source.poll()
+        assert source.frame["y"].to_list() == [10, 20, 30]
+        assert source.version == 2
+
+    def test_unchanged(self, live_csv: Path):
+        """Test a poll without new rows keeps the version."""
+        source = LiveSource(parse(f"WITH source('{live_csv}') PLOT y AGAINST ts").source)
+        source.poll()
+
+        assert not source.poll()
+        assert source.version == 1
+
+    def test_rewritten_identically(self, live_csv: Path):
+        """Test a full reload with the same rows isn't a change."""
+        source = LiveSource(parse(f"WITH source('{live_csv}') PLOT y AGAINST ts").source)
+        source.poll()
+        live_csv.write_text("ts,y\n1,10\n2,20\n")
+
+        assert not source.poll()
+
+    def test_bounded(self, monkeypatch):
+        """Test only the newest max_rows rows are kept."""
+        increments = iter([
+            Increment(rows=pl.DataFrame({"x": [1, 2]}), cursor=2, max_rows=3),
+            Increment(rows=pl.DataFrame({"x": [3, 4]}), cursor=4, max_rows=3),
+        ])
+        monkeypatch.setattr(
+            LiteralConnector, "load_increment",
+            lambda self, config, cursor=None, column=None, filters=None: next(increments),
+        )
+        source = LiveSource(parse("WITH source('a.csv') PLOT y AGAINST x").source)
+        source.poll()
+        source.poll()
+
+        assert source.frame["x"].to_list() == [2, 3, 4]
+
+    def test_missing_file(self, tmp_path: Path):
+        """Test a missing source raises ExecutionError."""
+        source = LiveSource(parse(f"WITH source('{tmp_path / 'none.csv'}') PLOT y AGAINST x").source)
+        with pytest.raises(ExecutionError, match="File not found"):
+            source.poll()
+
+
+class TestRefresher:
+    """Tests for re-executing a query as its source grows."""
+
+    def test_refresh_on_new_rows(self, live_csv: Path):
+        """Test a refresh returns results only when rows were added."""
+        refresher = Refresher(parse(f"WITH source('{live_csv}') PLOT y AGAINST ts AS 'line'"))
+        assert refresher.run()[0].row_count == 2
+        assert refresher.refresh() is None
+
+        _append(live_csv, "3,30\n")
+        data = refresher.refresh()
+
+        assert data[0].row_count == 3
+        assert list(data[0].y) == [10, 20, 30]
+        assert refresher.refresh() is None
+
+    def test_header_only_start(self, tmp_path: Path):
+        """Test a source that starts as a bare header is typed by its first rows."""
+        path = tmp_path / "live.csv"
+        path.write_text("x,y\n")
+        refresher = Refresher(parse(f"WITH source('{path}') PLOT y AGAINST x AS 'line'"))
+        refresher.run()
+        _append(path, "1,10\n2,20\n3,15\n")
+
+        assert list(refresher.refresh()[0].y) == [10, 20, 15]
+        _append(path, "4,25\n")
+        assert list(refresher.refresh()[0].y) == [10, 20, 15, 25]
+        assert refresher.source.frame.schema["y"] == pl.Int64
+
+    def test_first_refresh_executes(self, live_csv: Path):
+        """Test a refresh before any run executes the query."""
+        refresher = Refresher(parse(f"WITH source('{live_csv}') PLOT y AGAINST ts"))
+        assert refresher.refresh()[0].row_count == 2
+
+    def test_overlapping_refresh_skipped(self, live_csv: Path):
+        """Test a refresh while another run holds the source is skipped."""
+        refresher = Refresher(parse(f"WITH source('{live_csv}') PLOT y AGAINST ts"))
+        refresher._lock.acquire()
+        try:
+            result = []
+            thread = threading.Thread(target=lambda: result.append(refresher.refresh()))
+            thread.start()
+            thread.join()
+        finally:
+            refresher._lock.release()
+
+        assert result == [None]
+        assert refresher.source.frame is None
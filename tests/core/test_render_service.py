@@ -0,0 +1,127 @@
+"""
+Unit tests for plotql.core.render_service module.
+
+Tests parallel rendering of independent charts and grid tiling.
+"""
+import numpy as np
+import pytest
+
+from plotql.core.ast import ColumnRef, PlotSeries, PlotType
+from plotql.core.engines import RasterEngine
+from plotql.core.executor import PlotData
+from plotql.core.render_service import RenderService, create_render_pool
+
+
+class FailingEngine(RasterEngine):
+    """Engine that can't render charts titled 'fail'."""
+
+    def render(self, data, width, height):
+        if data.series.format.title == "fail":
+            raise RuntimeError("cannot draw")
+        return super().render(data, width, height)
+
+
+def _data(slope: float, plot_type: PlotType = PlotType.LINE) -> PlotData:
+    series = PlotSeries(
+        x_column=ColumnRef(name="x"),
+        y_column=ColumnRef(name="y"),
+        plot_type=plot_type,
+    )
+    return PlotData(
+        x=[0.0, 1.0, 2.0, 3.0],
+        y=[0.0, slope, 2 * slope, 3 * slope],
+        series=series,
+        row_count=4,
+        filtered_count=4,
+    )
+
+
+def _pixels(data: PlotData, width: int, height: int) -> np.ndarray:
+    with RasterEngine().render(data, width, height) as result:
+        return np.asarray(result.to_image()).copy()
+
+
+class TestRender:
+    """Tests for RenderService.render."""
+
+    def test_renders_each_chart(self):
+        """Test each data set becomes its own image, in order."""
+        data_sets = [_data(1.0), _data(-1.0)]
+        with RenderService(workers=1, engine=RasterEngine()) as service:
+            charts = service.render(data_sets, 200, 150)
+
+        assert [c.index for c in charts] == [0, 1]
+        assert all(c.ok for c in charts)
+        for chart, data in zip(charts, data_sets):
+            assert chart.image.size == (200, 150)
+            assert np.array_equal(np.asarray(chart.image), _pixels(data, 200, 150))
+
+    def test_failures_do_not_stop_others(self):
+        """Test a failing chart is recorded without losing the rest."""
+        failing = _data(1.0)
+        failing.series.format.title = "fail"
+        with RenderService(workers=1, engine=FailingEngine()) as service:
+            charts = service.render([failing, _data(2.0)], 200, 150)
+
+        assert charts[0].error == "cannot draw"
+        assert charts[0].image is None
+        assert charts[1].ok
+
+    def test_empty(self):
+        """Test rendering nothing returns no charts."""
+        assert RenderService(workers=1, engine=RasterEngine()).render([]) == []
+
+
+class TestRenderGrid:
+    """Tests for RenderService.render_grid."""
+
+    def test_tiles_row_by_row(self):
+        """Test charts are placed in the grid row by row."""
+        data_sets = [_data(1.0), _data(2.0), _data(3.0, PlotType.SCATTER)]
+        with RenderService(workers=1, engine=RasterEngine()) as service:
+            grid, errors = service.render_grid(data_sets, columns=2, width=120, height=90)
+
+        assert grid.size == (240, 180)
+        assert errors == [None, None, None]
+        pixels = np.asarray(grid)
+        assert np.array_equal(pixels[:90, 120:], _pixels(data_sets[1], 120, 90))
+        assert np.array_equal(pixels[90:, :120], _pixels(data_sets[2], 120, 90))
+
+    def test_columns_capped_by_count(self):
+        """Test a grid is never wider than the number of charts."""
+        with RenderService(workers=1, engine=RasterEngine()) as service:
+            grid, _ = service.render_grid([_data(1.0)], columns=4, width=120, height=90)
+        assert grid.size == (120, 90)
+
+    def test_invalid_columns(self):
+        """Test the column count must be positive."""
+        with pytest.raises(ValueError, match="columns must be a positive integer"):
+            RenderService(workers=1).render_grid([_data(1.0)], columns=0)
+
+    def test_process_pool(self):
+        """Test worker processes draw the same grid through shared memory."""
+        data_sets = [_data(1.0), _data(2.0), _data(3.0)]
+        with RenderService(workers=1, engine=RasterEngine()) as service:
+            expected, _ = service.render_grid(data_sets, columns=2, width=120, height=90)
+        with RenderService(workers=2, engine=RasterEngine()) as service:
+            grid, errors = service.render_grid(data_sets, columns=2, width=120, height=90)
+            # The pool is reused across calls
+            charts = service.render(data_sets[:2], 120, 90)
+
+        assert errors == [None, None, None]
+        assert np.array_equal(np.asarray(grid), np.asarray(expected))
+        assert all(c.ok for c in charts)
+
+
+class TestRenderPool:
+    """Tests for create_render_pool."""
+
+    def test_workers_use_engine(self):
+        """Test each worker renders with the engine it was given."""
+        from plotql.core.engines import get_engine
+
+        pool = create_render_pool(1, RasterEngine())
+        try:
+            assert isinstance(pool.submit(get_engine).result(), RasterEngine)
+        finally:
+            pool.shutdown()
@@ -175,6 +175,46 @@ class TestPlotResultToImage:
         assert isinstance(img_result, Image.Image)
         to_bytes_func.assert_called_once_with(mock_figure, "png")
 
+    def test_to_image_uses_rgba_buffer(self):
+        """Test to_image wraps the raw RGBA buffer without encoding PNG."""
+        pixels = bytearray([255, 0, 0, 255] * 6)  # 3x2 red
+        to_bytes_func = MagicMock()
+        result = PlotResult(
+            figure=MagicMock(),
+            save_func=MagicMock(),
+            to_bytes_func=to_bytes_func,
+            show_func=MagicMock(),
+            close_func=MagicMock(),
+            to_rgba_func=MagicMock(return_value=(memoryview(pixels), 3, 2)),
+        )
+
+        img = result.to_image()
+
+        assert img.mode == "RGBA"
+        assert img.size == (3, 2)
+        assert img.getpixel((2, 1)) == (255, 0, 0, 255)
+        to_bytes_func.assert_not_called()
+
+    def test_to_rgba_falls_back_to_png(self):
+        """Test to_rgba decodes PNG bytes when the engine has no buffer path."""
+        from PIL import Image
+        import io
+
+        buf = io.BytesIO()
+        Image.new("RGB", (2, 3), color="blue").save(buf, format="PNG")
+        result = PlotResult(
+            figure=MagicMock(),
+            save_func=MagicMock(),
+            to_bytes_func=MagicMock(return_value=buf.getvalue()),
+            show_func=MagicMock(),
+            close_func=MagicMock(),
+        )
+
+        pixels, width, height = result.to_rgba()
+
+        assert (width, height) == (2, 3)
+        assert bytes(pixels[:4]) == bytes([0, 0, 255, 255])
+
 
 # =============================================================================
 # PlotResult.save Tests
@@ -263,6 +303,41 @@ class TestPlotResultClose:
 
         close_func.assert_called_once_with(mock_figure)
 
+    def test_context_manager_closes(self):
+        """Test leaving a with block closes the result."""
+        mock_figure = MagicMock()
+        close_func = MagicMock()
+        result = PlotResult(
+            figure=mock_figure,
+            save_func=MagicMock(),
+            to_bytes_func=MagicMock(),
+            show_func=MagicMock(),
+            close_func=close_func,
+        )
+
+        with result as entered:
+            assert entered is result
+            close_func.assert_not_called()
+
+        close_func.assert_called_once_with(mock_figure)
+
+    def test_context_manager_closes_on_error(self):
+        """Test the result is closed even if the with block raises."""
+        close_func = MagicMock()
+        result = PlotResult(
+            figure=MagicMock(),
+            save_func=MagicMock(),
+            to_bytes_func=MagicMock(),
+            show_func=MagicMock(),
+            close_func=close_func,
+        )
+
+        with pytest.raises(RuntimeError):
+            with result:
+                raise RuntimeError("boom")
+
+        close_func.assert_called_once()
+
 
 # =============================================================================
 # PlotResult Jupyter Support Tests
@@ -3,22 +3,40 @@ Unit tests for plotql.core.utils module.
 
 Tests size mapping, color mapping, and timestamp detection utilities.
 """
+from datetime import datetime
+
+import numpy as np
 import pytest
 import polars as pl
 
 from plotql.core.utils import (
     BUCKET_COLORS,
+    ENGINE_COLORS,
     GRADIENT_END,
     GRADIENT_START,
     SIZE_MAX,
     SIZE_MIN,
+    TimestampDetector,
     TimestampInfo,
+    bin_points,
+    decimate_line,
+    detect_column_format,
     detect_datetime_format,
     detect_timestamp_columns,
+    gradient_rgb,
+    hex_to_rgb,
+    histogram_bins,
     interpolate_color,
     is_datetime_column,
     map_to_colors,
     map_to_sizes,
+    palette_color,
+    parse_timestamp_series,
+    sample_column,
+    timestamps_to_epoch,
+    to_datetime_array,
+    to_numeric_array,
+    to_strftime,
 )
 
 
@@ -44,6 +62,19 @@ class TestConstants:
         assert "pink" in BUCKET_COLORS
         assert "teal" in BUCKET_COLORS
 
+    def test_palette_color(self):
+        """Test color names map to the theme palette, falling back to primary."""
+        from plotql.themes import THEME
+
+        assert palette_color("Red") == THEME.color_map["red"]
+        assert palette_color(None) == ENGINE_COLORS["primary"]
+        assert palette_color("not-a-color") == ENGINE_COLORS["primary"]
+
+    def test_hex_to_rgb(self):
+        """Test hex colors convert to RGB tuples."""
+        assert hex_to_rgb("#ff8000") == (255, 128, 0)
+        assert hex_to_rgb("0a0b0c") == (10, 11, 12)
+
     def test_gradient_colors(self):
         """Test gradient endpoint colors."""
         assert len(GRADIENT_START) == 3
@@ -234,6 +265,131 @@ class TestInterpolateColor:
         assert color == interpolate_color(1.0)
 
 
+class TestGradientRgb:
+    """Tests for gradient_rgb function."""
+
+    def test_matches_interpolate_color(self):
+        """Test array interpolation agrees with the scalar version."""
+        rgb = gradient_rgb(np.array([0.0, 0.5, 1.0]))
+        for t, channels in zip([0.0, 0.5, 1.0], rgb):
+            expected = interpolate_color(t)
+            assert f"#{''.join(f'{int(c * 255):02x}' for c in channels)}" == expected
+
+    def test_clamps_and_keeps_shape(self):
+        """Test values are clamped and a channel axis is appended."""
+        rgb = gradient_rgb(np.array([[-1.0, 2.0]]))
+        assert rgb.shape == (1, 2, 3)
+        assert np.allclose(rgb[0, 0] * 255, GRADIENT_START)
+        assert np.allclose(rgb[0, 1] * 255, GRADIENT_END)
+
+
+class TestBinPoints:
+    """Tests for bin_points function."""
+
+    def test_counts_per_cell(self):
+        """Test points are counted in their grid cell, row 0 at ymin."""
+        x = np.array([0.1, 0.2, 0.9])
+        y = np.array([0.1, 0.1, 0.9])
+        counts, sums = bin_points(x, y, (2, 2), (0.0, 1.0, 0.0, 1.0))
+
+        assert counts.tolist() == [[2, 0], [0, 1]]
+        assert sums is None
+
+    def test_edges_clamped(self):
+        """Test points on or beyond the bounds land in edge cells."""
+        x = np.array([0.0, 1.0, 5.0])
+        y = np.array([0.0, 1.0, -5.0])
+        counts, _ = bin_points(x, y, (2, 2), (0.0, 1.0, 0.0, 1.0))
+
+        assert counts.sum() == 3
+        assert counts[0, 0] == 1
+        assert counts[1, 1] == 1
+        assert counts[0, 1] == 1
+
+    def test_sums_weights(self):
+        """Test weights are summed per cell."""
+        x = np.array([0.1, 0.2, 0.9])
+        y = np.array([0.1, 0.1, 0.9])
+        weights = np.array([1.0, 3.0, 5.0])
+        _, sums = bin_points(x, y, (2, 2), (0.0, 1.0, 0.0, 1.0), weights=weights)
+
+        assert sums.tolist() == [[4.0, 0.0], [0.0, 5.0]]
+
+
+class TestDecimateLine:
+    """Tests for decimate_line function."""
+
+    def test_short_line_kept(self):
+        """Test lines with few points per bucket are returned whole."""
+        x = np.arange(10.0)
+        assert decimate_line(x, x, 5).tolist() == list(range(10))
+
+    def test_keeps_extremes_per_bucket(self):
+        """Test each bucket keeps its first, last, min and max points."""
+        rng = np.random.default_rng(0)
+        x = np.arange(10_000.0)
+        y = rng.normal(size=10_000)
+        keep = decimate_line(x, y, 10)
+
+        assert len(keep) <= 40
+        assert keep[0] == 0 and keep[-1] == 9_999
+        assert y.argmin() in keep and y.argmax() in keep
+        assert np.all(np.diff(keep) > 0)
+
+    def test_constant_x(self):
+        """Test a zero-width x range isn't decimated."""
+        x = np.zeros(100)
+        assert len(decimate_line(x, np.arange(100.0), 2)) == 100
+
+
+class TestHistogramBins:
+    """Tests for histogram_bins function."""
+
+    def test_matches_numpy(self):
+        """Test fixed bins agree with np.histogram."""
+        values = np.random.default_rng(0).normal(size=1000)
+        edges, counts = histogram_bins(values.tolist(), 12)
+        expected_counts, expected_edges = np.histogram(values, bins=12)
+
+        assert counts == expected_counts.tolist()
+        assert np.allclose(edges, expected_edges)
+
+    def test_freedman_diaconis_default(self):
+        """Test the default bin count follows the Freedman-Diaconis rule."""
+        values = np.random.default_rng(0).normal(size=1000)
+        _, counts = histogram_bins(pl.Series(values))
+        width = 2 * (np.quantile(values, 0.75) - np.quantile(values, 0.25)) / 1000 ** (1 / 3)
+
+        assert len(counts) == int(np.ceil(np.ptp(values) / width))
+        assert sum(counts) == 1000
+
+    def test_ignores_missing(self):
+        """Test nulls and NaNs are not counted."""
+        _, counts = histogram_bins([1.0, None, float("nan"), 2.0], 2)
+        assert counts == [1, 1]
+
+    def test_single_value(self):
+        """Test a constant column gets one unit-wide bin."""
+        assert histogram_bins([3, 3, 3]) == ([2.5, 3.5], [3])
+
+    def test_empty(self):
+        """Test no values gives no bins."""
+        assert histogram_bins([]) == ([], [])
+
+
+class TestToNumericArray:
+    """Tests for to_numeric_array function."""
+
+    def test_numbers(self):
+        """Test numeric lists convert to arrays."""
+        assert to_numeric_array([1, 2, 3]).tolist() == [1, 2, 3]
+
+    def test_missing_or_text(self):
+        """Test lists with nulls or strings are rejected."""
+        assert to_numeric_array([1.0, None]) is None
+        assert to_numeric_array(["a", "b"]) is None
+
+
 # =============================================================================
 # map_to_colors Tests
 # =============================================================================
@@ -450,6 +606,125 @@ class TestIsDatetimeColumn:
         result = is_datetime_column(series)
         assert result is not None
 
+    def test_format_change_late_in_column(self):
+        """Test a column whose format changes after the first rows is rejected."""
+        values = ["2026-01-01"] * 500 + ["01/01/2026 10:00:00"] * 500
+        series = pl.Series("ts", values)
+        result = is_datetime_column(series)
+        assert result is None
+
+    def test_mostly_datetime_column(self):
+        """Test a few stray values don't prevent detection."""
+        values = ["2026-01-01 10:00:00"] * 99 + ["n/a"]
+        series = pl.Series("ts", values)
+        result = is_datetime_column(series)
+        assert result == ("Y-m-d H:M:S", "m-d H:M")
+
+
+# =============================================================================
+# detect_column_format / sample_column Tests
+# =============================================================================
+
+class TestDetectColumnFormat:
+    """Tests for sampled column format detection."""
+
+    def test_confidence_full_match(self):
+        """Test confidence is 1.0 when every sample matches."""
+        series = pl.Series("ts", ["2026-01-01", "2026-01-02"])
+        result = detect_column_format(series)
+        assert result == ("Y-m-d", "Y-m-d", 1.0)
+
+    def test_confidence_partial_match(self):
+        """Test confidence reflects the matching fraction."""
+        series = pl.Series("ts", ["2026-01-01"] * 3 + ["junk"])
+        result = detect_column_format(series, min_confidence=0.5)
+        assert result is not None
+        assert result[2] == 0.75
+
+    def test_below_min_confidence(self):
+        """Test detection fails below the confidence threshold."""
+        series = pl.Series("ts", ["2026-01-01", "junk"])
+        assert detect_column_format(series) is None
+
+    def test_native_datetime(self):
+        """Test native temporal dtypes are detected with full confidence."""
+        series = pl.Series("ts", []).cast(pl.Datetime)
+        result = detect_column_format(series)
+        assert result is not None
+        assert result[2] == 1.0
+
+    def test_sample_covers_head_and_tail(self):
+        """Test samples include values from both ends of the column."""
+        series = pl.Series("v", [str(i) for i in range(10_000)])
+        sample = sample_column(series, sample_size=10).to_list()
+        assert len(sample) == 30
+        assert "0" in sample
+        assert "9999" in sample
+
+    def test_sample_small_column_uses_all_values(self):
+        """Test small columns are used whole, minus nulls."""
+        series = pl.Series("v", ["a", None, "b"])
+        assert sample_column(series).to_list() == ["a", "b"]
+
+
+# =============================================================================
+# TimestampDetector Tests
+# =============================================================================
+
+class TestTimestampDetector:
+    """Tests for the caching timestamp detector."""
+
+    def test_detect_returns_info(self):
+        """Test detection returns TimestampInfo with confidence."""
+        detector = TimestampDetector()
+        info = detector.detect(pl.Series("ts", ["2026-01-01 10:00:00"]))
+        assert info is not None
+        assert info.column_name == "ts"
+        assert info.confidence == 1.0
+
+    def test_cached_by_fingerprint(self):
+        """Test results are reused for the same fingerprint and column."""
+        detector = TimestampDetector()
+        detector.detect(pl.Series("ts", ["2026-01-01"]), fingerprint="src:1")
+        # Same key with different content - the cached decision wins
+        info = detector.detect(pl.Series("ts", ["junk"]), fingerprint="src:1")
+        assert info is not None
+        assert info.input_format == "Y-m-d"
+
+    def test_new_fingerprint_redetects(self):
+        """Test a changed fingerprint triggers fresh detection."""
+        detector = TimestampDetector()
+        detector.detect(pl.Series("ts", ["2026-01-01"]), fingerprint="src:1")
+        info = detector.detect(pl.Series("ts", ["junk"]), fingerprint="src:2")
+        assert info is None
+
+    def test_no_fingerprint_not_cached(self):
+        """Test detection without a fingerprint is never cached."""
+        detector = TimestampDetector()
+        detector.detect(pl.Series("ts", ["2026-01-01"]))
+        assert detector.detect(pl.Series("ts", ["junk"])) is None
+
+    def test_non_string_dtype_bypasses_cache(self):
+        """Test a numeric column isn't answered from a string column's entry."""
+        detector = TimestampDetector()
+        detector.detect(pl.Series("ts", ["2026-01-01"]), fingerprint="src:1")
+        assert detector.detect(pl.Series("ts", [1, 2]), fingerprint="src:1") is None
+
+    def test_cache_is_bounded(self):
+        """Test the oldest entries are evicted past max_entries."""
+        detector = TimestampDetector(max_entries=2)
+        for i in range(3):
+            detector.detect(pl.Series(f"c{i}", ["2026-01-01"]), fingerprint="src")
+        assert len(detector._cache) == 2
+        assert ("src", "c0") not in detector._cache
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        detector = TimestampDetector()
+        detector.detect(pl.Series("ts", ["2026-01-01"]), fingerprint="src")
+        detector.clear()
+        assert len(detector._cache) == 0
+
 
 # =============================================================================
 # detect_timestamp_columns Tests
@@ -512,6 +787,73 @@ class TestDetectTimestampColumns:
         assert x_info.output_format is not None
 
 
+# =============================================================================
+# Timestamp Parsing Tests
+# =============================================================================
+
+class TestTimestampParsing:
+    """Tests for vectorized timestamp parsing helpers."""
+
+    def test_to_strftime_datetime(self):
+        """Test conversion of a date+time format."""
+        assert to_strftime("Y-m-d H:M:S") == "%Y-%m-%d %H:%M:%S"
+
+    def test_to_strftime_fractional_and_t_separator(self):
+        """Test fractional seconds and literal T separator."""
+        assert to_strftime("Y-m-dTH:M:S.f") == "%Y-%m-%dT%H:%M:%S%.f"
+
+    def test_parse_datetime_strings(self):
+        """Test parsing strings to a Datetime series."""
+        series = pl.Series("ts", ["2026-01-01 10:00:00", "2026-01-02 11:30:00"])
+        result = parse_timestamp_series(series, "Y-m-d H:M:S")
+        assert result.dtype == pl.Datetime
+        assert result.to_list() == [
+            datetime(2026, 1, 1, 10, 0, 0),
+            datetime(2026, 1, 2, 11, 30, 0),
+        ]
+
+    def test_parse_us_format(self):
+        """Test US format is parsed month-first."""
+        series = pl.Series("ts", ["02/03/2026"])
+        result = parse_timestamp_series(series, "m/d/Y")
+        assert result.to_list() == [datetime(2026, 2, 3)]
+
+    def test_parse_time_only(self):
+        """Test time-only values are anchored to the epoch date."""
+        series = pl.Series("t", ["21:58:52.5"])
+        result = parse_timestamp_series(series, "H:M:S.f")
+        assert result.to_list() == [datetime(1970, 1, 1, 21, 58, 52, 500000)]
+
+    def test_parse_mismatched_values_become_null(self):
+        """Test values not matching the format become null instead of raising."""
+        series = pl.Series("ts", ["2026-01-01", "not a date", None])
+        result = parse_timestamp_series(series, "Y-m-d")
+        assert result.null_count() == 2
+
+    def test_timestamps_to_epoch(self):
+        """Test conversion to epoch microseconds."""
+        series = pl.Series("ts", ["1970-01-01 00:00:01"])
+        result = timestamps_to_epoch(series, "Y-m-d H:M:S")
+        assert result.to_list() == [1_000_000]
+
+    def test_to_datetime_array_from_epoch(self):
+        """Test epoch ints become datetime64 values."""
+        result = to_datetime_array([0, 1_000_000, None])
+        assert result.dtype == np.dtype("datetime64[us]")
+        assert result[1] == np.datetime64("1970-01-01T00:00:01")
+        assert np.isnat(result[2])
+
+    def test_to_datetime_array_from_strings(self):
+        """Test datetime strings are parsed without per-point dateutil calls."""
+        result = to_datetime_array(["2026-01-01 10:00:00", "2026-01-01 10:01:00"])
+        assert result[0] == np.datetime64("2026-01-01T10:00:00")
+
+    def test_to_datetime_array_from_datetimes(self):
+        """Test native datetime objects are passed through."""
+        result = to_datetime_array([datetime(2026, 1, 1, 10)])
+        assert result[0] == np.datetime64("2026-01-01T10:00:00")
+
+
 # =============================================================================
 # TimestampInfo Tests
 # =============================================================================
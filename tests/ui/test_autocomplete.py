@@ -3,9 +3,12 @@ Unit tests for plotql.ui.autocomplete module.
 
 Tests context detection, file completions, column extraction, and AutoCompleter.
 """
+import os
+import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import polars as pl
 import pytest
 
 from plotql.ui.autocomplete import (
@@ -17,9 +20,13 @@ from plotql.ui.autocomplete import (
     KEYWORDS,
     PLOT_TYPES,
     extract_file_path,
+    extract_source,
+    format_filter_value,
     get_columns_from_file,
+    PathIndex,
     get_context,
     get_file_completions,
+    get_filter_column,
 )
 
 
@@ -141,6 +148,13 @@ class TestGetContext:
         context, partial, _ = get_context("WITH source('data.csv') ", 24)
         assert context == "after_with"
 
+    def test_refresh_clause_contexts(self):
+        """Test EVERY follows REFRESH, and PLOT follows the interval."""
+        text = "WITH source('data.csv') REFRESH "
+        assert get_context(text, len(text))[0] == "after_refresh_keyword"
+        text = "WITH source('data.csv') REFRESH EVERY 5s "
+        assert get_context(text, len(text))[0] == "after_refresh"
+
     def test_column_context_after_plot(self):
         """Test after PLOT keyword."""
         context, partial, _ = get_context("WITH source('data.csv') PLOT ", 29)
@@ -323,6 +337,92 @@ class TestGetFileCompletions:
         assert completions == []
 
 
+class TestPathIndex:
+    """Tests for the PathIndex used by file path completion."""
+
+    def test_prefix_then_fuzzy(self, temp_dir: Path):
+        """Test prefix matches come before fuzzy matches, case-insensitively."""
+        for name in ("Trades.csv", "trips.parquet", "stock_trades.csv", "notes.txt"):
+            (temp_dir / name).write_text("a\n1\n")
+
+        matches = PathIndex().lookup(temp_dir, "tr")
+
+        assert matches == [
+            ("Trades.csv", False),
+            ("trips.parquet", False),
+            ("stock_trades.csv", False),
+        ]
+
+    def test_lists_directory_once(self, temp_dir: Path, monkeypatch):
+        """Test repeated lookups reuse the listing instead of scanning again."""
+        from plotql.ui import autocomplete
+
+        (temp_dir / "a.csv").write_text("a\n1\n")
+        scans = []
+        original = autocomplete._list_directory
+        monkeypatch.setattr(
+            autocomplete,
+            "_list_directory",
+            lambda *args: scans.append(args) or original(*args),
+        )
+        index = PathIndex()
+        for partial in ("", "a", "b"):
+            index.lookup(temp_dir, partial)
+
+        assert len(scans) == 1
+
+    def test_refreshes_changed_directory(self, temp_dir: Path):
+        """Test a changed directory is re-listed after the refresh interval."""
+        (temp_dir / "old.csv").write_text("a\n1\n")
+        index = PathIndex(refresh=0)
+        assert index.lookup(temp_dir, "") == [("old.csv", False)]
+
+        (temp_dir / "new.csv").write_text("a\n1\n")
+        os.utime(temp_dir, ns=(0, 0))  # Guarantee an mtime change
+        index.lookup(temp_dir, "")  # Serves the old listing, starts a refresh
+
+        deadline = time.monotonic() + 5
+        while len(index.lookup(temp_dir, "")) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert index.lookup(temp_dir, "") == [("new.csv", False), ("old.csv", False)]
+
+    def test_bounded(self, temp_dir: Path):
+        """Test the index keeps only the most recently used directories."""
+        index = PathIndex(max_dirs=2)
+        for i in range(3):
+            (temp_dir / str(i)).mkdir()
+            index.lookup(temp_dir / str(i), "")
+        assert len(index) == 2
+
+    def test_large_directory(self, temp_dir: Path):
+        """Test lookups in a large directory return only the requested matches."""
+        for i in range(5000):
+            (temp_dir / f"part-{i:05d}.parquet").touch()
+        index = PathIndex()
+        index.lookup(temp_dir, "")
+
+        start = time.perf_counter()
+        matches = index.lookup(temp_dir, "part-0499", limit=5)
+        elapsed = time.perf_counter() - start
+
+        assert [name for name, _ in matches] == [f"part-0499{i}.parquet" for i in range(5)]
+        assert elapsed < 0.05
+
+    def test_fuzzy_repetitive_names(self, temp_dir: Path):
+        """Test a near-miss against names repeating the typed characters stays fast."""
+        for i in range(2000):
+            (temp_dir / f"part-{i:05d}-00000000-0000-0000-0000-000000000000.parquet").touch()
+        index = PathIndex()
+        index.lookup(temp_dir, "")
+
+        start = time.perf_counter()
+        matches = index.lookup(temp_dir, "part-00001x")
+        elapsed = time.perf_counter() - start
+
+        assert matches == []
+        assert elapsed < 0.5
+
+
 # =============================================================================
 # extract_file_path Tests
 # =============================================================================
@@ -367,6 +467,52 @@ class TestExtractFilePath:
         assert result == "data.csv"
 
 
+class TestExtractSource:
+    """Tests for extract_source function."""
+
+    def test_literal_path(self):
+        """Test a quoted path is a literal source."""
+        source = extract_source("WITH source('data.csv') PLOT y AGAINST x")
+        assert source.args == ["data.csv"]
+        assert source.is_literal
+
+    def test_database_table(self):
+        """Test an alias and table name are kept unresolved."""
+        source = extract_source("WITH source(pump_fun, trades) PLOT ")
+        assert source.args == ["pump_fun", "trades"]
+        assert not source.is_literal
+
+    def test_folder_segments(self):
+        """Test quoted folder segments are unquoted."""
+        source = extract_source("WITH source(local, '2024', 'trades.csv') PLOT ")
+        assert source.args == ["local", "2024", "trades.csv"]
+
+    def test_incomplete(self):
+        """Test unfinished or empty source clauses give no source."""
+        assert extract_source("WITH source(pump_fun, ") is None
+        assert extract_source("WITH source() PLOT ") is None
+
+
+class TestFilterValues:
+    """Tests for filter value helpers."""
+
+    def test_filter_column(self):
+        """Test the compared column is found before the value being typed."""
+        assert get_filter_column("FILTER price > ") == "price"
+        assert get_filter_column("FILTER a = 1 AND symbol != 'AA") == "symbol"
+        assert get_filter_column("FILTER price") is None
+
+    def test_format_filter_value(self):
+        """Test values are written as literals the grammar accepts."""
+        assert format_filter_value(42) == "42"
+        assert format_filter_value(0.5) == "0.5"
+        assert format_filter_value(1e-05) == "0.000010"
+        assert format_filter_value("AAPL") == "'AAPL'"
+        assert format_filter_value("it's") == '"it\'s"'
+        assert format_filter_value(True) is None
+        assert format_filter_value(float("nan")) is None
+
+
 # =============================================================================
 # get_columns_from_file Tests
 # =============================================================================
@@ -409,14 +555,33 @@ class TestAutoCompleter:
     """Tests for AutoCompleter class."""
 
     @pytest.fixture
-    def completer(self):
+    def schema_cache(self):
+        """A schema cache of its own, so tests don't share read sources."""
+        from plotql.core.executor import SchemaCache
+
+        return SchemaCache()
+
+    @pytest.fixture
+    def completer(self, schema_cache):
         """Create an AutoCompleter instance."""
-        return AutoCompleter()
+        return AutoCompleter(schema_cache)
 
-    def test_init(self, completer):
+    def test_init(self, completer, schema_cache):
         """Test AutoCompleter initialization."""
-        assert completer._cached_path is None
-        assert completer._cached_columns == []
+        assert len(schema_cache) == 0
+
+    def test_default_shared_schema_cache(self, temp_csv: Path):
+        """Test completers use the executor's schema cache by default."""
+        from plotql.core.ast import SourceRef
+        from plotql.core.executor import get_schema_cache
+
+        get_schema_cache().clear()
+        text = f"WITH source('{temp_csv}') PLOT "
+        AutoCompleter().get_completions(text, len(text))
+
+        source = SourceRef(args=[str(temp_csv)], is_literal=True)
+        assert len(get_schema_cache()) == 1
+        assert "x" in get_schema_cache().columns(source)
 
     def test_start_completions(self, completer):
         """Test completions at start of query."""
@@ -432,6 +597,14 @@ class TestAutoCompleter:
         # Should suggest source(
         assert any("source(" in c.text for c in completions)
 
+    def test_refresh_completions(self, completer):
+        """Test REFRESH is offered after the source, and PLOT after the interval."""
+        completions = completer.get_completions("WITH source('data.csv') RE", 26)
+        assert [c.text for c in completions] == ["REFRESH"]
+
+        text = "WITH source('data.csv') REFRESH EVERY 30s "
+        assert [c.text for c in completer.get_completions(text, len(text))] == ["PLOT"]
+
     def test_column_completions(self, completer, temp_csv: Path):
         """Test column completions."""
         text = f"WITH source('{temp_csv}') PLOT "
@@ -444,23 +617,25 @@ class TestAutoCompleter:
         # Should also include aggregate functions
         assert any(c.text.startswith("count") for c in completions)
 
-    def test_column_cache(self, completer, temp_csv: Path):
-        """Test column caching."""
+    def test_column_cache(self, completer, schema_cache, temp_csv: Path, monkeypatch):
+        """Test a source's columns are read once."""
         text = f"WITH source('{temp_csv}') PLOT "
         completer.get_completions(text, len(text))
+        assert len(schema_cache) == 1
 
-        assert completer._cached_path == str(temp_csv)
-        assert "x" in completer._cached_columns
+        monkeypatch.setattr("plotql.core.connectors.LiteralConnector.schema", lambda self, config: pl.Schema())
+        completions = completer.get_completions(text, len(text))
+        assert any(c.text == "category" for c in completions)
 
-    def test_cache_update_on_new_file(self, completer, temp_csv: Path, temp_parquet: Path):
-        """Test cache updates when file changes."""
+    def test_cache_update_on_new_file(self, completer, schema_cache, temp_csv: Path, temp_parquet: Path):
+        """Test a new source's columns are read alongside the cached ones."""
         text1 = f"WITH source('{temp_csv}') PLOT "
         completer.get_completions(text1, len(text1))
-        assert completer._cached_path == str(temp_csv)
 
         text2 = f"WITH source('{temp_parquet}') PLOT "
-        completer.get_completions(text2, len(text2))
-        assert completer._cached_path == str(temp_parquet)
+        completions = completer.get_completions(text2, len(text2))
+        assert len(schema_cache) == 2
+        assert not any(c.text == "category" for c in completions)
 
     def test_aggregate_completions(self, completer, temp_csv: Path):
         """Test aggregate function completions."""
@@ -526,17 +701,79 @@ class TestAutoCompleter:
 
         assert len(completions) <= 3
 
-    def test_invalidate_cache(self, completer, temp_csv: Path):
+    def test_invalidate_cache(self, completer, schema_cache, temp_csv: Path):
         """Test cache invalidation."""
         text = f"WITH source('{temp_csv}') PLOT "
         completer.get_completions(text, len(text))
 
-        assert completer._cached_path is not None
+        assert len(schema_cache) == 1
 
         completer.invalidate_cache()
 
-        assert completer._cached_path is None
-        assert completer._cached_columns == []
+        assert len(schema_cache) == 0
+
+    def test_columns_from_shared_schema_cache(self, temp_csv: Path, monkeypatch):
+        """Test columns recorded by the executor are reused without reading the file."""
+        from plotql.core.ast import SourceRef
+        from plotql.core.executor import SchemaCache, source_fingerprint
+
+        source = SourceRef(args=[str(temp_csv)], is_literal=True)
+        cache = SchemaCache()
+        cache.record(source, {"price": pl.Float64, "time": pl.Datetime("us")}, source_fingerprint(source))
+        monkeypatch.setattr("plotql.core.connectors.LiteralConnector.schema", lambda self, config: pl.Schema())
+
+        text = f"WITH source('{temp_csv}') PLOT "
+        completions = AutoCompleter(cache).get_completions(text, len(text))
+
+        assert {"price", "time"} <= {c.text for c in completions}
+
+    def test_database_table_columns(self, tmp_path: Path, monkeypatch):
+        """Test columns of a database table come from the connector's schema."""
+        from plotql.core.connectors.clickhouse import ClickHouseConnector
+        from plotql.core.executor import SchemaCache
+
+        config_path = tmp_path / "sources.toml"
+        config_path.write_text('[pump_fun]\ntype = "clickhouse"\nhost = "localhost"\n')
+        monkeypatch.setattr("plotql.core.config.CONFIG_PATH", config_path)
+        monkeypatch.setattr(
+            ClickHouseConnector,
+            "schema",
+            lambda self, config: pl.Schema({"price": pl.Float64, config["table"]: pl.String}),
+        )
+
+        text = "WITH source(pump_fun, trades) PLOT "
+        completions = AutoCompleter(SchemaCache()).get_completions(text, len(text))
+
+        assert {"price", "trades"} <= {c.text for c in completions}
+
+    def test_filter_value_completions(self, temp_dir: Path):
+        """Test frequent values are suggested first, in frequency order."""
+        from plotql.core.executor import SchemaCache
+
+        path = temp_dir / "trades.csv"
+        pl.DataFrame({
+            "symbol": ["MSFT", "AAPL", "AAPL", "GOOG", "AAPL", "MSFT"],
+            "price": [1.5, 2.0, 3.0, 4.5, 5.0, 6.0],
+        }).write_csv(path)
+        completer = AutoCompleter(SchemaCache())
+
+        text = f"WITH source('{path}') PLOT price AGAINST price FILTER symbol = "
+        completions = completer.get_completions(text, len(text))
+        assert [c.text for c in completions[:3]] == ["'AAPL'", "'MSFT'", "'GOOG'"]
+
+        text += "'M"
+        completions = completer.get_completions(text, len(text))
+        assert [c.text for c in completions if c.kind == "value"] == ["'MSFT'"]
+
+    def test_filter_range_completions(self, temp_csv: Path):
+        """Test numeric columns suggest their minimum and maximum."""
+        from plotql.core.executor import SchemaCache
+
+        text = f"WITH source('{temp_csv}') PLOT y AGAINST x FILTER x > "
+        completions = AutoCompleter(SchemaCache()).get_completions(text, len(text))
+
+        displays = [c.display for c in completions if c.kind == "value"]
+        assert displays[:2] == ["1 (min)", "5 (max)"]
 
     def test_completions_sorted(self, completer, temp_csv: Path):
         """Test that completions are sorted appropriately."""
@@ -595,6 +832,13 @@ class TestAutoCompleterValidFormatOptions:
         assert "title" in options
         assert "color" in options
 
+    def test_hist_format_options(self, completer):
+        """Test format options for histograms."""
+        options = completer._get_valid_format_options("hist")
+
+        assert "bins" in options
+        assert "marker_size" not in options
+
     def test_unknown_plot_type(self, completer):
         """Test format options for unknown plot type."""
         options = completer._get_valid_format_options(None)
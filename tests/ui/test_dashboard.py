@@ -0,0 +1,236 @@
+"""
+End-to-end tests for plotql.ui.dashboard module.
+
+Tests laying out, executing and refreshing several query panes.
+"""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from plotql.core import parse, parse_script
+from plotql.ui.dashboard import (
+    REFRESH_CHOICES,
+    DashboardApp,
+    format_interval,
+    pane_title,
+)
+from plotql.ui.tui import StatusBar
+
+
+async def _settle(app: DashboardApp, pilot) -> None:
+    await pilot.pause()
+    await app.workers.wait_for_complete()
+    await pilot.pause()
+
+
+class TestDashboardLayout:
+    """Tests for building a dashboard from a script."""
+
+    def test_invalid_layout(self, temp_csv: Path):
+        """Test empty scripts and bad column counts are rejected."""
+        query = parse(f"WITH source('{temp_csv}') PLOT y AGAINST x")
+        with pytest.raises(ValueError, match="at least one query"):
+            DashboardApp([])
+        with pytest.raises(ValueError, match="columns must be a positive integer"):
+            DashboardApp([query], columns=0)
+        with pytest.raises(ValueError, match="refresh must not be negative"):
+            DashboardApp([query], refresh=-1)
+
+    def test_titles(self, temp_csv: Path):
+        """Test panes are titled by the query's title, else its columns."""
+        assert pane_title(parse(f"WITH source('{temp_csv}') PLOT y AGAINST x")) == "y against x"
+        titled = parse(f"WITH source('{temp_csv}') PLOT y AGAINST x FORMAT title = 'Prices'")
+        assert pane_title(titled) == "Prices"
+
+    def test_format_interval(self):
+        """Test intervals are shown in seconds or whole minutes."""
+        assert format_interval(0) == "manual"
+        assert format_interval(15) == "every 15s"
+        assert format_interval(300) == "every 5m"
+
+    @pytest.mark.asyncio
+    async def test_pane_per_query(self, temp_csv: Path):
+        """Test every query gets a pane, all executed on start."""
+        queries = parse_script(
+            f"WITH source('{temp_csv}') PLOT y AGAINST x\n"
+            f"WITH source('{temp_csv}') PLOT value AGAINST x AS 'scatter'\n"
+            f"WITH source('{temp_csv}') PLOT y AGAINST x FILTER x > 2\n"
+        )
+        app = DashboardApp(queries, columns=2)
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+
+            assert [pane.id for pane in app.panes] == ["pane-0", "pane-1", "pane-2"]
+            statuses = [str(pane.status.render()) for pane in app.panes]
+            assert all("OK" in status for status in statuses)
+            assert "3/5 rows" in statuses[2]
+
+    @pytest.mark.asyncio
+    async def test_title_shown_verbatim(self, temp_csv: Path):
+        """Test brackets in a title aren't taken as markup."""
+        query = parse(f"WITH source('{temp_csv}') PLOT y AGAINST x FORMAT title = 'Latency [ms]'")
+        app = DashboardApp([query])
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+
+            title = str(app.panes[0].query_one(".pane-title").render())
+            assert title.startswith("Latency [ms] · ")
+
+    @pytest.mark.asyncio
+    async def test_failing_pane_isolated(self, temp_csv: Path, temp_dir: Path):
+        """Test a pane whose query fails doesn't affect the others."""
+        queries = parse_script(
+            f"WITH source('{temp_dir / 'missing.csv'}') PLOT y AGAINST x\n"
+            f"WITH source('{temp_csv}') PLOT y AGAINST x\n"
+        )
+        app = DashboardApp(queries)
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+
+            first, second = app.panes
+            assert "Error" in str(first.status.render())
+            assert "OK" in str(second.status.render())
+
+
+class TestSharedLoading:
+    """Tests for panes sharing loaded sources."""
+
+    @pytest.mark.asyncio
+    async def test_file_read_once(self, temp_csv: Path, monkeypatch):
+        """Test panes on the same file read it once between them."""
+        from plotql.core.connectors import LiteralConnector
+
+        loads = []
+        original = LiteralConnector.load
+        monkeypatch.setattr(
+            LiteralConnector, "load",
+            lambda self, config, filters=None: loads.append(config["path"]) or original(self, config, filters),
+        )
+        queries = parse_script(
+            f"WITH source('{temp_csv}') PLOT y AGAINST x\n"
+            f"WITH source('{temp_csv}') PLOT value AGAINST x\n"
+            f"WITH source('{temp_csv}') PLOT y AGAINST value AS 'scatter'\n"
+        )
+        app = DashboardApp(queries)
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+            await pilot.press("f5")
+            await _settle(app, pilot)
+
+        assert len(loads) == 1
+
+
+class TestPaneRefresh:
+    """Tests for refreshing panes independently."""
+
+    @pytest.fixture
+    def executions(self, monkeypatch):
+        """Record the query of each execution."""
+        from plotql.ui import dashboard
+
+        calls = []
+        original = dashboard.execute
+        monkeypatch.setattr(
+            dashboard, "execute",
+            lambda query, *args, **kwargs: calls.append(query) or original(query, *args, **kwargs),
+        )
+        return calls
+
+    def _queries(self, path: Path) -> list:
+        return parse_script(
+            f"WITH source('{path}') PLOT y AGAINST x\n"
+            f"WITH source('{path}') PLOT value AGAINST x\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_interval(self, temp_csv: Path, executions):
+        """Test a pane with an interval refreshes on its own."""
+        app = DashboardApp(self._queries(temp_csv))
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+            first, second = app.panes
+            first.set_refresh_interval(0.05)
+
+            await asyncio.sleep(0.3)
+            await _settle(app, pilot)
+
+            assert executions.count(first.plot_query) > 2
+            assert executions.count(second.plot_query) == 1
+            assert "every 0.05s" in str(first.query_one(".pane-title").render())
+
+    @pytest.mark.asyncio
+    async def test_refresh_focused_pane(self, temp_csv: Path, executions):
+        """Test r refreshes only the focused pane."""
+        app = DashboardApp(self._queries(temp_csv))
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+            _, second = app.panes
+            second.plot.focus()
+
+            await pilot.press("r")
+            await _settle(app, pilot)
+
+            assert executions == [app.panes[0].plot_query, second.plot_query, second.plot_query]
+
+    @pytest.mark.asyncio
+    async def test_tick_skipped_while_running(self, temp_csv: Path, executions):
+        """Test a refresh requested mid-run doesn't start a second run."""
+        app = DashboardApp(self._queries(temp_csv)[:1])
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+            pane = app.panes[0]
+            pane._token = object()  # A run in flight
+
+            pane.refresh_data()
+            await _settle(app, pilot)
+
+            assert len(executions) == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_clause_interval(self, temp_csv: Path):
+        """Test a query's REFRESH clause sets its pane's interval."""
+        queries = parse_script(
+            f"WITH source('{temp_csv}') REFRESH EVERY 1m PLOT y AGAINST x\n"
+            f"WITH source('{temp_csv}') PLOT value AGAINST x\n"
+        )
+        app = DashboardApp(queries, refresh=15)
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+            assert [pane.interval for pane in app.panes] == [60, 15]
+
+    @pytest.mark.asyncio
+    async def test_cycle_interval(self, temp_csv: Path):
+        """Test i steps the focused pane through the refresh choices."""
+        app = DashboardApp(self._queries(temp_csv), refresh=REFRESH_CHOICES[-1])
+        async with app.run_test(size=(160, 50)) as pilot:
+            await _settle(app, pilot)
+            first, second = app.panes
+            first.plot.focus()
+
+            await pilot.press("i")
+            assert first.interval == REFRESH_CHOICES[0]
+            await pilot.press("i")
+            assert first.interval == REFRESH_CHOICES[1]
+            assert second.interval == REFRESH_CHOICES[-1]
+            assert isinstance(first.status, StatusBar)
+
+
+class TestDashboardCli:
+    """Tests for `plotql dashboard`."""
+
+    def test_missing_file(self, temp_dir: Path, capsys):
+        """Test a missing script is reported."""
+        from plotql.cli import main
+
+        assert main(["dashboard", str(temp_dir / "missing.pql")]) == 1
+        assert "File not found" in capsys.readouterr().err
+
+    def test_invalid_script(self, temp_dir: Path, capsys):
+        """Test parse errors are reported before the dashboard starts."""
+        from plotql.cli import main
+
+        script = temp_dir / "bad.pql"
+        script.write_text("WITH source('a.csv') PLOT")
+        assert main(["dashboard", str(script)]) == 1
+        assert "bad.pql" in capsys.readouterr().err
@@ -4,6 +4,7 @@ End-to-end tests for plotql.ui module.
 Tests the TUI application with complete query execution pipeline.
 Uses Textual's testing framework for async app testing.
 """
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -114,6 +115,22 @@ class TestPlotPanel:
             assert width > 0
             assert height > 0
 
+    def test_render_image_skips_debug_file(self, tmp_path: Path, monkeypatch, simple_plot_data):
+        """Test rendering writes no debug file unless configured."""
+        monkeypatch.chdir(tmp_path)
+        img = PlotPanel.render_image([simple_plot_data], 320, 240)
+
+        assert img.size == (320, 240)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_render_image_debug_file(self, temp_dir: Path, monkeypatch, simple_plot_data):
+        """Test PLOTQL_DEBUG_PLOT saves each rendered plot."""
+        debug_path = temp_dir / "debug.png"
+        monkeypatch.setattr("plotql.ui.tui.DEBUG_PLOT_PATH", str(debug_path))
+        PlotPanel.render_image([simple_plot_data], 320, 240)
+
+        assert debug_path.exists()
+
 
 class TestStatusBar:
     """Tests for StatusBar widget."""
@@ -406,6 +423,73 @@ class TestAutocompleteIntegration:
             await pilot.pause()
 
 
+class TestDebouncedAutocomplete:
+    """E2E tests for completions computed after typing pauses, off the UI thread."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_keys_requests_once(self, monkeypatch):
+        """Test a burst of keystrokes computes completions once."""
+        monkeypatch.setattr("plotql.ui.tui.COMPLETION_DELAY", 0.3)
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            popup = app.query_one("#completion-popup", CompletionPopup)
+            editor.text = ""
+            editor.focus()
+
+            await pilot.press("w", "i", "t")
+            assert editor._completion_request == 0
+
+            await pilot.pause(0.5)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert editor._completion_request == 1
+            assert popup.completions == ["WITH"]
+
+    @pytest.mark.asyncio
+    async def test_computed_off_ui_thread(self):
+        """Test completions are computed in a worker thread."""
+        import threading
+
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            threads = []
+            original = editor.autocompleter.get_completions
+
+            def recording(text, offset, limit=10):
+                threads.append(threading.current_thread())
+                return original(text, offset, limit)
+
+            editor.autocompleter.get_completions = recording
+            editor.text = "WI"
+            editor._show_completions()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_stale_results_dropped(self):
+        """Test suggestions for an outdated buffer aren't shown."""
+        from plotql.ui.autocomplete import Completion
+
+        app = PlotQLApp()
+        async with app.run_test():
+            editor = app.query_one("#editor", QueryEditor)
+            popup = app.query_one("#completion-popup", CompletionPopup)
+            editor.text = "WI"
+            editor._completion_request = 2
+
+            # Superseded by a newer request
+            editor._apply_completions(1, "WI", 0, [Completion("WITH", "WITH", "keyword")])
+            # Buffer changed since the request
+            editor._apply_completions(2, "W", 0, [Completion("WITH", "WITH", "keyword")])
+
+            assert "visible" not in popup.classes
+
+
 # =============================================================================
 # Plot Rendering E2E Tests
 # =============================================================================
@@ -541,6 +625,432 @@ class TestErrorDisplay:
             await pilot.pause()
 
 
+# =============================================================================
+# Live Diagnostics E2E Tests
+# =============================================================================
+
+class TestLiveDiagnostics:
+    """E2E tests for parse errors reported while typing."""
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_underlined(self):
+        """Test an invalid query is underlined without pressing F5."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            editor.text = "WITH source('data.csv')\nPLOT y AGAIN x"
+            await pilot.pause()
+
+            assert len(editor.diagnostics) == 1
+            line = editor.get_line(1)
+            assert any(
+                (span.start, span.end) == (7, 12) and span.style.underline
+                for span in line.spans
+            )
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_in_status_bar(self):
+        """Test the status bar shows the first diagnostic and clears it."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            status = app.query_one("#status", StatusBar)
+
+            editor.text = "WITH source('data.csv')\nPLOT y AGAIN x"
+            await pilot.pause()
+            assert "line 2" in str(status.render())
+
+            editor.text = "WITH source('data.csv')\nPLOT y AGAINST x"
+            await pilot.pause()
+            assert editor.diagnostics == []
+            assert str(status.render()) == StatusBar.READY_MESSAGE
+
+
+# =============================================================================
+# Background Execution E2E Tests
+# =============================================================================
+
+class TestBackgroundExecution:
+    """E2E tests for queries running off the UI thread."""
+
+    @pytest.mark.asyncio
+    async def test_result_shown_when_worker_completes(self, temp_csv: Path):
+        """Test the status bar reports the result once the worker finishes."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            status = app.query_one("#status", StatusBar)
+            editor.text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+
+            await pilot.press("f5")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert "5 rows" in str(status.render())
+            assert "MB" in str(status.render())
+            assert not status.running
+            assert app._cancel_token is None
+
+    @pytest.mark.asyncio
+    async def test_spinner_while_running(self, temp_csv: Path):
+        """Test the status bar shows progress while a query runs."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            status = app.query_one("#status", StatusBar)
+            editor.text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+
+            with patch.object(PlotQLApp, "run_worker"):
+                await pilot.press("f5")
+
+            assert status.running
+            assert "Esc to cancel" in str(status.render())
+
+    @pytest.mark.asyncio
+    async def test_escape_cancels(self, temp_csv: Path):
+        """Test Esc cancels the running query and discards its result."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            status = app.query_one("#status", StatusBar)
+            editor.text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+
+            with patch.object(PlotQLApp, "run_worker"):
+                await pilot.press("f5")
+            token = app._cancel_token
+
+            await pilot.press("escape")
+            await app.workers.wait_for_complete()
+
+            assert token.cancelled
+            assert app._cancel_token is None
+            assert "Cancelled" in str(status.render())
+
+    @pytest.mark.asyncio
+    async def test_rerun_supersedes(self, temp_csv: Path):
+        """Test pressing F5 again cancels the previous run."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            editor.text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+
+            with patch.object(PlotQLApp, "run_worker"):
+                await pilot.press("f5")
+            first = app._cancel_token
+
+            await pilot.press("f5")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert first.cancelled
+            assert app._cancel_token is None
+            assert "5 rows" in str(app.query_one("#status", StatusBar).render())
+
+
+class TestLiveMode:
+    """E2E tests for re-running the query as it is edited."""
+
+    @pytest.fixture(autouse=True)
+    def short_delay(self, monkeypatch):
+        """Shorten the live debounce so tests run quickly."""
+        monkeypatch.setattr("plotql.ui.tui.LIVE_DELAY", 0.01)
+
+    @pytest.fixture
+    def executions(self, monkeypatch):
+        """Count query executions."""
+        from plotql.ui import tui
+
+        calls = []
+        original = tui.execute
+        monkeypatch.setattr(
+            tui, "execute", lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs)
+        )
+        return calls
+
+    async def _settle(self, app: PlotQLApp, pilot: Pilot) -> None:
+        await pilot.pause(0.05)
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self, temp_csv: Path, executions):
+        """Test edits don't run the query unless live mode is on."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            app.query_one("#editor", QueryEditor).text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+            await self._settle(app, pilot)
+
+            assert executions == []
+
+    @pytest.mark.asyncio
+    async def test_valid_edit_runs(self, temp_csv: Path, executions):
+        """Test a valid edit runs the query once typing pauses."""
+        app = PlotQLApp(live=True)
+        async with app.run_test() as pilot:
+            app.query_one("#editor", QueryEditor).text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+            await self._settle(app, pilot)
+
+            assert len(executions) == 1
+            assert "5 rows" in str(app.query_one("#status", StatusBar).render())
+
+    @pytest.mark.asyncio
+    async def test_invalid_edit_skipped(self, temp_csv: Path, executions):
+        """Test edits that leave syntax errors don't run the query."""
+        app = PlotQLApp(live=True)
+        async with app.run_test() as pilot:
+            app.query_one("#editor", QueryEditor).text = f"WITH source('{temp_csv}') PLOT y AGAINST"
+            await self._settle(app, pilot)
+
+            assert executions == []
+
+    @pytest.mark.asyncio
+    async def test_format_only_change_renders_only(self, temp_csv: Path, executions):
+        """Test a styling-only edit redraws the plot without executing."""
+        app = PlotQLApp(live=True)
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            editor.text = f"WITH source('{temp_csv}') PLOT y AGAINST x AS 'line'"
+            await self._settle(app, pilot)
+
+            editor.text += " FORMAT title = 'Prices' AND line_color = 'red'"
+            await self._settle(app, pilot)
+
+            assert len(executions) == 1
+            _, data = app._last_result
+            assert data[0].series.format.title == "Prices"
+
+    @pytest.mark.asyncio
+    async def test_whitespace_change_skipped(self, temp_csv: Path, executions):
+        """Test edits that don't change the query don't run it again."""
+        app = PlotQLApp(live=True)
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+            editor.text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+            await self._settle(app, pilot)
+
+            editor.text += "\n\n"
+            await self._settle(app, pilot)
+
+            assert len(executions) == 1
+
+    @pytest.mark.asyncio
+    async def test_toggle(self, temp_csv: Path, executions):
+        """Test F4 turns live mode on and brings the plot up to date."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            app.query_one("#editor", QueryEditor).text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+            await pilot.press("f4")
+            await self._settle(app, pilot)
+
+            assert app.live
+            assert len(executions) == 1
+
+
+class TestPanZoom:
+    """E2E tests for panning and zooming the plot's x axis."""
+
+    @pytest.fixture
+    def executions(self, monkeypatch):
+        """Record the x range of each query execution."""
+        from plotql.ui import tui
+
+        calls = []
+        original = tui.execute
+        monkeypatch.setattr(
+            tui, "execute",
+            lambda *args, **kwargs: calls.append(kwargs.get("x_range")) or original(*args, **kwargs),
+        )
+        return calls
+
+    async def _settle(self, app: PlotQLApp, pilot: Pilot) -> None:
+        await pilot.pause()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+    async def _run(self, app: PlotQLApp, pilot: Pilot, query: str) -> PlotPanel:
+        app.query_one("#editor", QueryEditor).text = query
+        await pilot.press("f5")
+        await self._settle(app, pilot)
+        await pilot.press("f3")
+        return app.query_one("#plot", PlotPanel)
+
+    @pytest.mark.asyncio
+    async def test_zoom_requeries_window(self, temp_csv: Path, executions):
+        """Test zooming in executes the query over the visible window."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            plot = await self._run(app, pilot, f"WITH source('{temp_csv}') PLOT y AGAINST x AS 'line'")
+            assert plot.has_focus
+            assert plot.extent.low == 1 and plot.extent.high == 5
+
+            await pilot.press("plus")
+            await self._settle(app, pilot)
+
+            assert executions[-1] == plot.view
+            assert (plot.view.low, plot.view.high) == (2, 4)
+            assert "3 rows" in str(app.query_one("#status", StatusBar).render())
+
+    @pytest.mark.asyncio
+    async def test_pan_and_reset(self, temp_csv: Path, executions):
+        """Test panning moves the window and resetting shows the full result."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            plot = await self._run(app, pilot, f"WITH source('{temp_csv}') PLOT y AGAINST x AS 'line'")
+            await pilot.press("plus", "right", "right", "right")
+            await self._settle(app, pilot)
+            assert (plot.view.low, plot.view.high) == (3, 5)
+            runs = len(executions)
+
+            await pilot.press("0")
+            await self._settle(app, pilot)
+
+            assert plot.view is None
+            # The full result is redrawn, not executed again
+            assert len(executions) == runs
+            assert "5 rows" in str(app.query_one("#status", StatusBar).render())
+
+    @pytest.mark.asyncio
+    async def test_bar_chart_not_zoomable(self, temp_csv_categorical: Path, executions):
+        """Test plots without a numeric x axis ignore zoom keys."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            plot = await self._run(
+                app, pilot, f"WITH source('{temp_csv_categorical}') PLOT sum(amount) AGAINST group AS 'bar'"
+            )
+            await pilot.press("plus")
+            await self._settle(app, pilot)
+
+            assert "OK" in str(app.query_one("#status", StatusBar).render())
+            assert plot.extent is None
+            assert executions == [None]
+
+
+class TestAutoRefresh:
+    """E2E tests for re-running the plotted query as its source grows."""
+
+    @pytest.fixture
+    def executions(self, monkeypatch):
+        """Count executions of followed queries."""
+        from plotql.core import refresh
+
+        calls = []
+        original = refresh.execute
+        monkeypatch.setattr(
+            refresh, "execute", lambda *args, **kwargs: calls.append(args) or original(*args, **kwargs)
+        )
+        return calls
+
+    @pytest.fixture
+    def live_csv(self, tmp_path: Path) -> Path:
+        path = tmp_path / "live.csv"
+        path.write_text("ts,y\n1,10\n2,20\n")
+        return path
+
+    async def _settle(self, app: PlotQLApp, pilot: Pilot) -> None:
+        await pilot.pause()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+    async def _run(self, app: PlotQLApp, pilot: Pilot, query: str) -> None:
+        app.query_one("#editor", QueryEditor).text = query
+        await pilot.press("f5")
+        await self._settle(app, pilot)
+
+    @pytest.mark.asyncio
+    async def test_clause_follows_source(self, live_csv: Path, executions):
+        """Test a REFRESH clause turns auto-refresh on and new rows are plotted."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            await self._run(app, pilot, f"WITH source('{live_csv}') REFRESH EVERY 1h PLOT y AGAINST ts AS 'line'")
+            assert app.auto_refreshing
+            assert app._refresh_timer is not None
+            with open(live_csv, "a") as f:
+                f.write("3,30\n")
+
+            app._refresh_tick()
+            await self._settle(app, pilot)
+
+            assert "3 rows" in str(app.query_one("#status", StatusBar).render())
+            _, data = app._last_result
+            assert list(data[0].y) == [10, 20, 30]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_not_rerun(self, live_csv: Path, executions):
+        """Test ticks on an unchanged source don't execute or redraw."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            await self._run(app, pilot, f"WITH source('{live_csv}') REFRESH EVERY 1h PLOT y AGAINST ts")
+
+            app._refresh_tick()
+            await self._settle(app, pilot)
+
+            assert len(executions) == 1
+            assert app._cancel_token is None
+
+    @pytest.mark.asyncio
+    async def test_toggle(self, live_csv: Path, executions):
+        """Test F8 turns auto-refresh on and off for any query."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            await pilot.press("f8")
+            await self._run(app, pilot, f"WITH source('{live_csv}') PLOT y AGAINST ts")
+            assert app._refresh_timer is not None
+            assert len(executions) == 1
+
+            await pilot.press("f8")
+
+            assert not app.auto_refreshing
+            assert app._refresh_timer is None and app._refresher is None
+
+    @pytest.mark.asyncio
+    async def test_tick_skipped_while_running(self, live_csv: Path, executions):
+        """Test a tick while a run is in flight doesn't start another."""
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            await self._run(app, pilot, f"WITH source('{live_csv}') REFRESH EVERY 1h PLOT y AGAINST ts")
+            with open(live_csv, "a") as f:
+                f.write("3,30\n")
+            app._cancel_token = object()  # A run in flight
+
+            app._refresh_tick()
+            await self._settle(app, pilot)
+
+            assert len(executions) == 1
+
+
+class TestPlotPreview:
+    """E2E tests for the text preview shown while the plot renders."""
+
+    @pytest.mark.asyncio
+    async def test_preview_until_image(self, temp_csv: Path, monkeypatch):
+        """Test the preview is shown while rendering and replaced by the image."""
+        rendered = threading.Event()
+        render_image = PlotPanel.render_image
+        monkeypatch.setattr(
+            PlotPanel, "render_image",
+            staticmethod(lambda *args: rendered.wait(5) and render_image(*args)),
+        )
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            app.query_one("#editor", QueryEditor).text = f"WITH source('{temp_csv}') PLOT y AGAINST x"
+            await pilot.press("f5")
+            preview = app.query_one("#plot-preview")
+            for _ in range(50):
+                await pilot.pause(0.02)
+                if preview.display:
+                    break
+
+            assert preview.display
+            assert not app.query_one("#plot-image").display
+
+            rendered.set()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert not preview.display
+            assert app.query_one("#plot-image").display
+
+
 # =============================================================================
 # Theme Tests
 # =============================================================================
@@ -782,6 +1292,26 @@ class TestCompletionInsertion:
             )
 
 
+    @pytest.mark.asyncio
+    async def test_insert_completion_filter_value_without_quote(self):
+        """Test a quoted filter value is inserted after the operator.
+
+        The closing quote of source('...') must not be mistaken for an
+        opening quote typed by the user.
+        """
+        app = PlotQLApp()
+        async with app.run_test() as pilot:
+            editor = app.query_one("#editor", QueryEditor)
+
+            editor.text = "WITH source('data.csv') PLOT y AGAINST x FILTER symbol = "
+            editor.cursor_location = (0, len(editor.text))
+
+            editor._insert_completion("'AAPL'")
+
+            assert editor.text == (
+                "WITH source('data.csv') PLOT y AGAINST x FILTER symbol = 'AAPL'"
+            )
+
 # =============================================================================
 # Run Function Tests
 # =============================================================================
@@ -118,6 +118,27 @@ class TestTreeSitterParsing:
             nodes = get_node_types(parser, query)
             assert func.decode() in [k.lower() for k in nodes.keys() if nodes[k] == "aggregate_func"]
 
+    def test_refresh_clause(self, parser):
+        """Test that REFRESH EVERY parses as a clause with its keywords."""
+        query = b"WITH source('data.csv') REFRESH EVERY 5s PLOT y AGAINST x"
+        tree = parser.parse(query)
+        assert not tree.root_node.has_error
+        assert tree.root_node.children[1].type == "refresh_clause"
+
+        nodes = get_node_types(parser, query)
+        assert nodes.get("REFRESH") == "refresh"
+        assert nodes.get("EVERY") == "every"
+
+    def test_refresh_words_as_columns(self, parser):
+        """Test columns named refresh or every are identifiers, not keywords."""
+        query = b"WITH source('data.csv') PLOT every AGAINST refresh FILTER every > 3"
+        tree = parser.parse(query)
+        assert not tree.root_node.has_error
+
+        nodes = get_node_types(parser, query)
+        assert nodes.get("every") == "identifier"
+        assert nodes.get("refresh") == "identifier"
+
     def test_complex_query(self, parser):
         """Test a complex query with all features."""
         query = b"""
@@ -138,3 +159,27 @@ FORMAT title = 'Stock Price' AND color = 'blue'
         assert nodes.get("'AAPL'") == "string"
         assert nodes.get("'Stock Price'") == "string"
         assert nodes.get("'blue'") == "string"
+
+
+class TestGrammarGenerator:
+    """Tests for the grammar.js template used by ./ctl.sh compile."""
+
+    def test_matches_grammar_js(self, tmp_path, monkeypatch):
+        """Test regenerating grammar.js keeps every rule of the checked-in one."""
+        import importlib.util
+
+        spec = importlib.util.spec_from_file_location(
+            "generate_grammar", _TS_DIR / "generate_grammar.py"
+        )
+        generate_grammar = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(generate_grammar)
+        output = tmp_path / "grammar.js"
+        monkeypatch.setattr(generate_grammar, "OUTPUT_FILE", output)
+
+        generate_grammar.generate()
+
+        def rules(path: Path) -> str:
+            text = path.read_text()
+            return text[text.index("module.exports"):]
+
+        assert rules(output) == rules(_TS_DIR / "grammar.js")
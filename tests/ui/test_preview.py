@@ -0,0 +1,107 @@
+"""
+Unit tests for plotql.ui.preview module.
+
+Tests drawing query results as braille text.
+"""
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from plotql.core import execute, parse
+from plotql.core.engines.raster import RasterEngine
+from plotql.ui.preview import _BRAILLE_BLANK, _segments, _to_cells, render_preview
+
+
+def _preview(source: Path, plots: str, columns: int = 40, rows: int = 12):
+    return render_preview(execute(parse(f"WITH source('{source}') {plots}")), columns, rows)
+
+
+def _dots(text) -> int:
+    """Number of braille dots set in the text."""
+    return sum(
+        bin(ord(c) - _BRAILLE_BLANK).count("1")
+        for c in text.plain
+        if _BRAILLE_BLANK <= ord(c) <= _BRAILLE_BLANK + 0xFF
+    )
+
+
+@pytest.fixture
+def wave_csv(tmp_path: Path) -> Path:
+    """A sine wave of 10,000 points."""
+    path = tmp_path / "wave.csv"
+    x = np.arange(10_000)
+    pl.DataFrame({"x": x, "y": np.sin(x / 500)}).write_csv(path)
+    return path
+
+
+class TestCells:
+    """Tests for folding dots into braille characters."""
+
+    def test_dot_bits(self):
+        """Test each dot of a cell sets its braille bit."""
+        dots = np.zeros((4, 2), dtype=bool)
+        dots[0, 0] = True  # Dot 1
+        dots[3, 1] = True  # Dot 8
+        assert _to_cells(dots)[0, 0] == 0x81
+
+    def test_segments_join_points(self):
+        """Test points far apart are joined a dot at a time."""
+        xs, ys = _segments(np.array([0.0, 10.0]), np.array([0.0, 0.0]))
+        assert set(np.round(xs).astype(int)) == set(range(11))
+
+    def test_segments_broken_by_missing(self):
+        """Test a missing point breaks the line."""
+        xs, _ = _segments(np.array([0.0, np.nan, 10.0]), np.array([0.0, 0.0, 0.0]))
+        assert set(np.round(xs[np.isfinite(xs)]).astype(int)) == {0, 10}
+
+
+class TestRenderPreview:
+    """Tests for drawing plots as text."""
+
+    def test_size(self, wave_csv: Path):
+        """Test the preview fills the requested cells, labels included."""
+        lines = _preview(wave_csv, "PLOT y AGAINST x AS 'line'").plain.split("\n")
+
+        assert len(lines) == 12
+        assert all(len(line) == 40 for line in lines)
+        assert lines[-1].strip().startswith("0")
+
+    def test_line_is_continuous(self, wave_csv: Path):
+        """Test a line sets a dot in every column between its ends."""
+        text = _preview(wave_csv, "PLOT y AGAINST x AS 'line'")
+        rows = text.plain.split("\n")[:-1]
+        columns = [
+            any(row[c] != chr(_BRAILLE_BLANK) for row in rows)
+            for c in range(len(rows[0]))
+            if all(_BRAILLE_BLANK <= ord(row[c]) <= _BRAILLE_BLANK + 0xFF for row in rows)
+        ]
+        drawn = np.flatnonzero(columns)
+        assert len(drawn) > 20
+        assert all(columns[drawn[0]:drawn[-1] + 1])
+
+    def test_scatter_sets_dots(self, temp_csv: Path):
+        """Test each scatter point sets a dot."""
+        assert _dots(_preview(temp_csv, "PLOT y AGAINST x")) == 5
+
+    def test_bars_filled(self, temp_csv_categorical: Path):
+        """Test bars are drawn as filled blocks."""
+        text = _preview(temp_csv_categorical, "PLOT sum(amount) AGAINST group AS 'bar'")
+        assert chr(_BRAILLE_BLANK + 0xFF) in text.plain
+
+    def test_series_colors(self, temp_csv: Path):
+        """Test each series is styled with its own color."""
+        text = _preview(
+            temp_csv,
+            "PLOT y AGAINST x AS 'line' FORMAT line_color = 'red' "
+            "PLOT value AGAINST x FORMAT marker_color = 'green'",
+        )
+        engine = RasterEngine()
+        styles = {str(span.style) for span in text.spans}
+        assert engine.get_color("red") in styles
+        assert engine.get_color("green") in styles
+
+    def test_too_small(self, temp_csv: Path):
+        """Test an area too small to plot in gives empty text."""
+        assert _preview(temp_csv, "PLOT y AGAINST x", columns=5, rows=1).plain == ""
@@ -57,6 +57,7 @@ module.exports = grammar({{
   rules: {{
     query: $ => seq(
       $.with_clause,
+      optional($.refresh_clause),
       repeat1($.series_clause)
     ),
 
@@ -71,6 +72,14 @@ module.exports = grammar({{
       $.source_call
     ),
 
+    // Interval unit (s, m, h) is checked by the parser
+    refresh_clause: $ => seq(
+      $.refresh,
+      $.every,
+      $.number,
+      $.identifier
+    ),
+
     source_call: $ => seq(
       $.source,
       '(',
@@ -113,6 +122,10 @@ module.exports = grammar({{
 
     // Keywords (case-insensitive using character classes - tree-sitter doesn't support /i flag)
 {chr(10).join(keyword_rules)}
+    // Contextual, like the parser's: the lexer only tries these where a
+    // refresh_clause can be, so columns named refresh or every stay identifiers
+    refresh: _ => token(prec(2, /{to_case_insensitive("REFRESH")}/)),
+    every: _ => token(prec(2, /{to_case_insensitive("EVERY")}/)),
 
     // Aggregate functions (case-insensitive)
     aggregate_func: _ => token(prec(2, /{func_patterns}/)),
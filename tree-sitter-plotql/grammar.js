@@ -9,6 +9,7 @@ module.exports = grammar({
   rules: {
     query: $ => seq(
       $.with_clause,
+      optional($.refresh_clause),
       repeat1($.series_clause)
     ),
 
@@ -23,6 +24,14 @@ module.exports = grammar({
       $.source_call
     ),
 
+    // Interval unit (s, m, h) is checked by the parser
+    refresh_clause: $ => seq(
+      $.refresh,
+      $.every,
+      $.number,
+      $.identifier
+    ),
+
     source_call: $ => seq(
       $.source,
       '(',
@@ -75,6 +84,10 @@ module.exports = grammar({
     format: _ => token(prec(2, /[Ff][Oo][Rr][Mm][Aa][Tt]/)),
     not: _ => token(prec(2, /[Nn][Oo][Tt]/)),
     null: _ => token(prec(2, /[Nn][Uu][Ll][Ll]/)),
+    // Contextual, like the parser's: the lexer only tries these where a
+    // refresh_clause can be, so columns named refresh or every stay identifiers
+    refresh: _ => token(prec(2, /[Rr][Ee][Ff][Rr][Ee][Ss][Hh]/)),
+    every: _ => token(prec(2, /[Ee][Vv][Ee][Rr][Yy]/)),
 
     // Aggregate functions (case-insensitive)
     aggregate_func: _ => token(prec(2, /[Cc][Oo][Uu][Nn][Tt]|[Ss][Uu][Mm]|[Aa][Vv][Gg]|[Mm][Ii][Nn]|[Mm][Aa][Xx]|[Mm][Ee][Dd][Ii][Aa][Nn]/)),
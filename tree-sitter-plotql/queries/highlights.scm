@@ -7,6 +7,8 @@
 (as) @keyword
 (filter) @keyword
 (format) @keyword
+(refresh) @keyword
+(every) @keyword
 
 ; Logical operators - soft coral/peach
 (and) @keyword.operator
@@ -6,11 +6,11 @@
 #endif
 
 #define LANGUAGE_VERSION 14
-#define STATE_COUNT 52
+#define STATE_COUNT 58
 #define LARGE_STATE_COUNT 2
-#define SYMBOL_COUNT 43
+#define SYMBOL_COUNT 46
 #define ALIAS_COUNT 0
-#define TOKEN_COUNT 26
+#define TOKEN_COUNT 28
 #define EXTERNAL_TOKEN_COUNT 0
 #define FIELD_COUNT 0
 #define MAX_ALIAS_SEQUENCE_LENGTH 6
@@ -32,33 +32,36 @@ enum {
   sym_format = 13,
   sym_not = 14,
   sym_null = 15,
-  sym_aggregate_func = 16,
-  aux_sym_string_token1 = 17,
-  aux_sym_string_token2 = 18,
-  sym_number = 19,
-  sym_identifier = 20,
-  anon_sym_LT_EQ = 21,
-  anon_sym_GT_EQ = 22,
-  anon_sym_BANG_EQ = 23,
-  anon_sym_LT = 24,
-  anon_sym_GT = 25,
-  sym_query = 26,
-  sym_series_clause = 27,
-  sym_with_clause = 28,
-  sym_source_call = 29,
-  sym_plot_clause = 30,
-  sym_filter_clause = 31,
-  sym_condition = 32,
-  sym_format_clause = 33,
-  sym_format_option = 34,
-  sym_column_ref = 35,
-  sym_aggregate_call = 36,
-  sym_string = 37,
-  sym_operator = 38,
-  aux_sym_query_repeat1 = 39,
-  aux_sym_source_call_repeat1 = 40,
-  aux_sym_filter_clause_repeat1 = 41,
-  aux_sym_format_clause_repeat1 = 42,
+  sym_refresh = 16,
+  sym_every = 17,
+  sym_aggregate_func = 18,
+  aux_sym_string_token1 = 19,
+  aux_sym_string_token2 = 20,
+  sym_number = 21,
+  sym_identifier = 22,
+  anon_sym_LT_EQ = 23,
+  anon_sym_GT_EQ = 24,
+  anon_sym_BANG_EQ = 25,
+  anon_sym_LT = 26,
+  anon_sym_GT = 27,
+  sym_query = 28,
+  sym_series_clause = 29,
+  sym_with_clause = 30,
+  sym_refresh_clause = 31,
+  sym_source_call = 32,
+  sym_plot_clause = 33,
+  sym_filter_clause = 34,
+  sym_condition = 35,
+  sym_format_clause = 36,
+  sym_format_option = 37,
+  sym_column_ref = 38,
+  sym_aggregate_call = 39,
+  sym_string = 40,
+  sym_operator = 41,
+  aux_sym_query_repeat1 = 42,
+  aux_sym_source_call_repeat1 = 43,
+  aux_sym_filter_clause_repeat1 = 44,
+  aux_sym_format_clause_repeat1 = 45,
 };
 
 static const char * const ts_symbol_names[] = {
@@ -78,6 +81,8 @@ static const char * const ts_symbol_names[] = {
   [sym_format] = "format",
   [sym_not] = "not",
   [sym_null] = "null",
+  [sym_refresh] = "refresh",
+  [sym_every] = "every",
   [sym_aggregate_func] = "aggregate_func",
   [aux_sym_string_token1] = "string_token1",
   [aux_sym_string_token2] = "string_token2",
@@ -91,6 +96,7 @@ static const char * const ts_symbol_names[] = {
   [sym_query] = "query",
   [sym_series_clause] = "series_clause",
   [sym_with_clause] = "with_clause",
+  [sym_refresh_clause] = "refresh_clause",
   [sym_source_call] = "source_call",
   [sym_plot_clause] = "plot_clause",
   [sym_filter_clause] = "filter_clause",
@@ -124,6 +130,8 @@ static const TSSymbol ts_symbol_map[] = {
   [sym_format] = sym_format,
   [sym_not] = sym_not,
   [sym_null] = sym_null,
+  [sym_refresh] = sym_refresh,
+  [sym_every] = sym_every,
   [sym_aggregate_func] = sym_aggregate_func,
   [aux_sym_string_token1] = aux_sym_string_token1,
   [aux_sym_string_token2] = aux_sym_string_token2,
@@ -137,6 +145,7 @@ static const TSSymbol ts_symbol_map[] = {
   [sym_query] = sym_query,
   [sym_series_clause] = sym_series_clause,
   [sym_with_clause] = sym_with_clause,
+  [sym_refresh_clause] = sym_refresh_clause,
   [sym_source_call] = sym_source_call,
   [sym_plot_clause] = sym_plot_clause,
   [sym_filter_clause] = sym_filter_clause,
@@ -218,6 +227,14 @@ static const TSSymbolMetadata ts_symbol_metadata[] = {
     .visible = true,
     .named = true,
   },
+  [sym_refresh] = {
+    .visible = true,
+    .named = true,
+  },
+  [sym_every] = {
+    .visible = true,
+    .named = true,
+  },
   [sym_aggregate_func] = {
     .visible = true,
     .named = true,
@@ -270,6 +287,10 @@ static const TSSymbolMetadata ts_symbol_metadata[] = {
     .visible = true,
     .named = true,
   },
+  [sym_refresh_clause] = {
+    .visible = true,
+    .named = true,
+  },
   [sym_source_call] = {
     .visible = true,
     .named = true,
@@ -389,6 +410,12 @@ static const TSStateId ts_primary_state_ids[STATE_COUNT] = {
   [49] = 49,
   [50] = 50,
   [51] = 51,
+  [52] = 52,
+  [53] = 53,
+  [54] = 54,
+  [55] = 55,
+  [56] = 56,
+  [57] = 57,
 };
 
 static bool ts_lex(TSLexer *lexer, TSStateId state) {
@@ -396,770 +423,914 @@ static bool ts_lex(TSLexer *lexer, TSStateId state) {
   eof = lexer->eof(lexer);
   switch (state) {
     case 0:
-      if (eof) ADVANCE(37);
+      if (eof) ADVANCE(47);
       if (lookahead == '!') ADVANCE(5);
-      if (lookahead == '"') ADVANCE(3);
-      if (lookahead == '\'') ADVANCE(4);
-      if (lookahead == '(') ADVANCE(38);
-      if (lookahead == ')') ADVANCE(40);
-      if (lookahead == ',') ADVANCE(39);
-      if (lookahead == '-') ADVANCE(35);
-      if (lookahead == '<') ADVANCE(109);
-      if (lookahead == '=') ADVANCE(41);
-      if (lookahead == '>') ADVANCE(110);
+      if (lookahead == '"') ADVANCE(6);
+      if (lookahead == '\'') ADVANCE(7);
+      if (lookahead == '(') ADVANCE(48);
+      if (lookahead == ')') ADVANCE(50);
+      if (lookahead == ',') ADVANCE(49);
+      if (lookahead == '-') ADVANCE(8);
+      if (lookahead == '<') ADVANCE(131);
+      if (lookahead == '=') ADVANCE(51);
+      if (lookahead == '>') ADVANCE(132);
       if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(67);
+          lookahead == 'a') ADVANCE(70);
       if (lookahead == 'C' ||
-          lookahead == 'c') ADVANCE(83);
+          lookahead == 'c') ADVANCE(72);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(73);
       if (lookahead == 'F' ||
-          lookahead == 'f') ADVANCE(70);
+          lookahead == 'f') ADVANCE(74);
       if (lookahead == 'M' ||
-          lookahead == 'm') ADVANCE(58);
+          lookahead == 'm') ADVANCE(75);
       if (lookahead == 'N' ||
-          lookahead == 'n') ADVANCE(84);
+          lookahead == 'n') ADVANCE(76);
       if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(87);
+          lookahead == 'o') ADVANCE(77);
       if (lookahead == 'P' ||
-          lookahead == 'p') ADVANCE(75);
+          lookahead == 'p') ADVANCE(78);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(79);
       if (lookahead == 'S' ||
-          lookahead == 's') ADVANCE(85);
+          lookahead == 's') ADVANCE(80);
       if (lookahead == 'W' ||
-          lookahead == 'w') ADVANCE(71);
+          lookahead == 'w') ADVANCE(81);
       if (lookahead == '\t' ||
           lookahead == '\n' ||
           lookahead == '\r' ||
           lookahead == ' ') SKIP(0)
-      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(56);
+      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(68);
       if (('B' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 1:
-      if (lookahead == '"') ADVANCE(3);
-      if (lookahead == '\'') ADVANCE(4);
-      if (lookahead == '-') ADVANCE(35);
-      if (lookahead == 'N' ||
-          lookahead == 'n') ADVANCE(102);
+      if (eof) ADVANCE(47);
+      if (lookahead == ')') ADVANCE(50);
+      if (lookahead == ',') ADVANCE(49);
+      if (lookahead == 'A' ||
+          lookahead == 'a') ADVANCE(9);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(10);
+      if (lookahead == 'F' ||
+          lookahead == 'f') ADVANCE(11);
+      if (lookahead == 'O' ||
+          lookahead == 'o') ADVANCE(12);
+      if (lookahead == 'P' ||
+          lookahead == 'p') ADVANCE(13);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(14);
+      if (lookahead == 'S' ||
+          lookahead == 's') ADVANCE(15);
+      if (lookahead == 'W' ||
+          lookahead == 'w') ADVANCE(16);
       if (lookahead == '\t' ||
           lookahead == '\n' ||
           lookahead == '\r' ||
           lookahead == ' ') SKIP(1)
-      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(56);
-      if (('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
       END_STATE();
     case 2:
-      if (lookahead == '"') ADVANCE(3);
-      if (lookahead == '\'') ADVANCE(4);
-      if (lookahead == '-') ADVANCE(35);
+      if (lookahead == '"') ADVANCE(6);
+      if (lookahead == '\'') ADVANCE(7);
+      if (lookahead == '-') ADVANCE(8);
+      if (lookahead == 'N' ||
+          lookahead == 'n') ADVANCE(82);
       if (lookahead == '\t' ||
           lookahead == '\n' ||
           lookahead == '\r' ||
           lookahead == ' ') SKIP(2)
-      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(56);
+      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(68);
       if (('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 3:
-      if (lookahead == '"') ADVANCE(55);
-      if (lookahead != 0) ADVANCE(3);
+      if (lookahead == '"') ADVANCE(6);
+      if (lookahead == '\'') ADVANCE(7);
+      if (lookahead == '-') ADVANCE(8);
+      if (lookahead == '\t' ||
+          lookahead == '\n' ||
+          lookahead == '\r' ||
+          lookahead == ' ') SKIP(3)
+      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(68);
+      if (('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 4:
-      if (lookahead == '\'') ADVANCE(54);
-      if (lookahead != 0) ADVANCE(4);
-      END_STATE();
-    case 5:
-      if (lookahead == '=') ADVANCE(108);
-      END_STATE();
-    case 6:
       if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(103);
+          lookahead == 'a') ADVANCE(83);
       if (lookahead == 'C' ||
-          lookahead == 'c') ADVANCE(83);
+          lookahead == 'c') ADVANCE(72);
       if (lookahead == 'M' ||
-          lookahead == 'm') ADVANCE(58);
+          lookahead == 'm') ADVANCE(75);
       if (lookahead == 'S' ||
-          lookahead == 's') ADVANCE(99);
+          lookahead == 's') ADVANCE(84);
       if (lookahead == '\t' ||
           lookahead == '\n' ||
           lookahead == '\r' ||
-          lookahead == ' ') SKIP(6)
+          lookahead == ' ') SKIP(4)
       if (('B' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 5:
+      if (lookahead == '=') ADVANCE(130);
+      END_STATE();
+    case 6:
+      if (lookahead == '"') ADVANCE(67);
+      if (lookahead != 0) ADVANCE(6);
       END_STATE();
     case 7:
-      if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(16);
+      if (lookahead == '\'') ADVANCE(66);
+      if (lookahead != 0) ADVANCE(7);
       END_STATE();
     case 8:
-      if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(30);
+      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(68);
       END_STATE();
     case 9:
-      if (lookahead == 'C' ||
-          lookahead == 'c') ADVANCE(11);
+      if (lookahead == 'G' ||
+          lookahead == 'g') ADVANCE(17);
+      if (lookahead == 'N' ||
+          lookahead == 'n') ADVANCE(18);
+      if (lookahead == 'S' ||
+          lookahead == 's') ADVANCE(56);
       END_STATE();
     case 10:
-      if (lookahead == 'D' ||
-          lookahead == 'd') ADVANCE(48);
+      if (lookahead == 'V' ||
+          lookahead == 'v') ADVANCE(19);
       END_STATE();
     case 11:
-      if (lookahead == 'E' ||
-          lookahead == 'e') ADVANCE(43);
+      if (lookahead == 'I' ||
+          lookahead == 'i') ADVANCE(20);
+      if (lookahead == 'O' ||
+          lookahead == 'o') ADVANCE(21);
       END_STATE();
     case 12:
-      if (lookahead == 'E' ||
-          lookahead == 'e') ADVANCE(25);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(59);
       END_STATE();
     case 13:
-      if (lookahead == 'G' ||
-          lookahead == 'g') ADVANCE(7);
-      if (lookahead == 'N' ||
-          lookahead == 'n') ADVANCE(10);
-      if (lookahead == 'S' ||
-          lookahead == 's') ADVANCE(46);
+      if (lookahead == 'L' ||
+          lookahead == 'l') ADVANCE(22);
       END_STATE();
     case 14:
-      if (lookahead == 'H' ||
-          lookahead == 'h') ADVANCE(42);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(23);
       END_STATE();
     case 15:
-      if (lookahead == 'I' ||
-          lookahead == 'i') ADVANCE(32);
+      if (lookahead == 'O' ||
+          lookahead == 'o') ADVANCE(24);
       END_STATE();
     case 16:
       if (lookahead == 'I' ||
-          lookahead == 'i') ADVANCE(21);
+          lookahead == 'i') ADVANCE(25);
       END_STATE();
     case 17:
-      if (lookahead == 'I' ||
-          lookahead == 'i') ADVANCE(19);
-      if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(26);
+      if (lookahead == 'A' ||
+          lookahead == 'a') ADVANCE(26);
       END_STATE();
     case 18:
-      if (lookahead == 'L' ||
-          lookahead == 'l') ADVANCE(23);
+      if (lookahead == 'D' ||
+          lookahead == 'd') ADVANCE(58);
       END_STATE();
     case 19:
-      if (lookahead == 'L' ||
-          lookahead == 'l') ADVANCE(33);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(27);
       END_STATE();
     case 20:
-      if (lookahead == 'M' ||
-          lookahead == 'm') ADVANCE(8);
+      if (lookahead == 'L' ||
+          lookahead == 'l') ADVANCE(28);
       END_STATE();
     case 21:
-      if (lookahead == 'N' ||
-          lookahead == 'n') ADVANCE(28);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(29);
       END_STATE();
     case 22:
       if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(34);
+          lookahead == 'o') ADVANCE(30);
       END_STATE();
     case 23:
-      if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(29);
+      if (lookahead == 'F' ||
+          lookahead == 'f') ADVANCE(31);
       END_STATE();
     case 24:
-      if (lookahead == 'R' ||
-          lookahead == 'r') ADVANCE(49);
+      if (lookahead == 'U' ||
+          lookahead == 'u') ADVANCE(32);
       END_STATE();
     case 25:
-      if (lookahead == 'R' ||
-          lookahead == 'r') ADVANCE(47);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(33);
       END_STATE();
     case 26:
-      if (lookahead == 'R' ||
-          lookahead == 'r') ADVANCE(20);
+      if (lookahead == 'I' ||
+          lookahead == 'i') ADVANCE(34);
       END_STATE();
     case 27:
       if (lookahead == 'R' ||
-          lookahead == 'r') ADVANCE(9);
+          lookahead == 'r') ADVANCE(35);
       END_STATE();
     case 28:
-      if (lookahead == 'S' ||
-          lookahead == 's') ADVANCE(31);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(36);
       END_STATE();
     case 29:
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(44);
+      if (lookahead == 'M' ||
+          lookahead == 'm') ADVANCE(37);
       END_STATE();
     case 30:
       if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(50);
+          lookahead == 't') ADVANCE(54);
       END_STATE();
     case 31:
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(45);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(38);
       END_STATE();
     case 32:
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(14);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(39);
       END_STATE();
     case 33:
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(12);
+      if (lookahead == 'H' ||
+          lookahead == 'h') ADVANCE(52);
       END_STATE();
     case 34:
-      if (lookahead == 'U' ||
-          lookahead == 'u') ADVANCE(27);
+      if (lookahead == 'N' ||
+          lookahead == 'n') ADVANCE(40);
       END_STATE();
     case 35:
-      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(56);
+      if (lookahead == 'Y' ||
+          lookahead == 'y') ADVANCE(64);
       END_STATE();
     case 36:
-      if (eof) ADVANCE(37);
-      if (lookahead == ')') ADVANCE(40);
-      if (lookahead == ',') ADVANCE(39);
-      if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(13);
-      if (lookahead == 'F' ||
-          lookahead == 'f') ADVANCE(17);
-      if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(24);
-      if (lookahead == 'P' ||
-          lookahead == 'p') ADVANCE(18);
-      if (lookahead == 'S' ||
-          lookahead == 's') ADVANCE(22);
-      if (lookahead == 'W' ||
-          lookahead == 'w') ADVANCE(15);
-      if (lookahead == '\t' ||
-          lookahead == '\n' ||
-          lookahead == '\r' ||
-          lookahead == ' ') SKIP(36)
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(41);
       END_STATE();
     case 37:
-      ACCEPT_TOKEN(ts_builtin_sym_end);
+      if (lookahead == 'A' ||
+          lookahead == 'a') ADVANCE(42);
       END_STATE();
     case 38:
-      ACCEPT_TOKEN(anon_sym_LPAREN);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(43);
       END_STATE();
     case 39:
-      ACCEPT_TOKEN(anon_sym_COMMA);
+      if (lookahead == 'C' ||
+          lookahead == 'c') ADVANCE(44);
       END_STATE();
     case 40:
-      ACCEPT_TOKEN(anon_sym_RPAREN);
+      if (lookahead == 'S' ||
+          lookahead == 's') ADVANCE(45);
       END_STATE();
     case 41:
-      ACCEPT_TOKEN(anon_sym_EQ);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(57);
       END_STATE();
     case 42:
-      ACCEPT_TOKEN(sym_with);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(60);
       END_STATE();
     case 43:
-      ACCEPT_TOKEN(sym_source);
+      if (lookahead == 'S' ||
+          lookahead == 's') ADVANCE(46);
       END_STATE();
     case 44:
-      ACCEPT_TOKEN(sym_plot);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(53);
       END_STATE();
     case 45:
-      ACCEPT_TOKEN(sym_against);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(55);
       END_STATE();
     case 46:
-      ACCEPT_TOKEN(sym_as);
+      if (lookahead == 'H' ||
+          lookahead == 'h') ADVANCE(63);
       END_STATE();
     case 47:
-      ACCEPT_TOKEN(sym_filter);
+      ACCEPT_TOKEN(ts_builtin_sym_end);
       END_STATE();
     case 48:
-      ACCEPT_TOKEN(sym_and);
+      ACCEPT_TOKEN(anon_sym_LPAREN);
       END_STATE();
     case 49:
-      ACCEPT_TOKEN(sym_or);
+      ACCEPT_TOKEN(anon_sym_COMMA);
       END_STATE();
     case 50:
-      ACCEPT_TOKEN(sym_format);
+      ACCEPT_TOKEN(anon_sym_RPAREN);
       END_STATE();
     case 51:
-      ACCEPT_TOKEN(sym_not);
+      ACCEPT_TOKEN(anon_sym_EQ);
       END_STATE();
     case 52:
-      ACCEPT_TOKEN(sym_null);
+      ACCEPT_TOKEN(sym_with);
       END_STATE();
     case 53:
-      ACCEPT_TOKEN(sym_aggregate_func);
+      ACCEPT_TOKEN(sym_source);
       END_STATE();
     case 54:
-      ACCEPT_TOKEN(aux_sym_string_token1);
+      ACCEPT_TOKEN(sym_plot);
       END_STATE();
     case 55:
-      ACCEPT_TOKEN(aux_sym_string_token2);
+      ACCEPT_TOKEN(sym_against);
       END_STATE();
     case 56:
-      ACCEPT_TOKEN(sym_number);
-      if (lookahead == '.') ADVANCE(57);
-      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(56);
+      ACCEPT_TOKEN(sym_as);
       END_STATE();
     case 57:
-      ACCEPT_TOKEN(sym_number);
-      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(57);
+      ACCEPT_TOKEN(sym_filter);
       END_STATE();
     case 58:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(104);
-      if (lookahead == 'E' ||
-          lookahead == 'e') ADVANCE(64);
-      if (lookahead == 'I' ||
-          lookahead == 'i') ADVANCE(80);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('B' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_and);
       END_STATE();
     case 59:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(80);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('B' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_or);
       END_STATE();
     case 60:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(73);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('B' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_format);
       END_STATE();
     case 61:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'A' ||
-          lookahead == 'a') ADVANCE(97);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('B' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_not);
       END_STATE();
     case 62:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'C' ||
-          lookahead == 'c') ADVANCE(65);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_null);
       END_STATE();
     case 63:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'D' ||
-          lookahead == 'd') ADVANCE(48);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_refresh);
       END_STATE();
     case 64:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'D' ||
-          lookahead == 'd') ADVANCE(72);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_every);
       END_STATE();
     case 65:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'E' ||
-          lookahead == 'e') ADVANCE(43);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_aggregate_func);
       END_STATE();
     case 66:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'E' ||
-          lookahead == 'e') ADVANCE(89);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(aux_sym_string_token1);
       END_STATE();
     case 67:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'G' ||
-          lookahead == 'g') ADVANCE(60);
-      if (lookahead == 'N' ||
-          lookahead == 'n') ADVANCE(63);
-      if (lookahead == 'S' ||
-          lookahead == 's') ADVANCE(46);
-      if (lookahead == 'V' ||
-          lookahead == 'v') ADVANCE(68);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(aux_sym_string_token2);
       END_STATE();
     case 68:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'G' ||
-          lookahead == 'g') ADVANCE(53);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_number);
+      if (lookahead == '.') ADVANCE(69);
+      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(68);
       END_STATE();
     case 69:
-      ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'H' ||
-          lookahead == 'h') ADVANCE(42);
-      if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
-          lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+      ACCEPT_TOKEN(sym_number);
+      if (('0' <= lookahead && lookahead <= '9')) ADVANCE(69);
       END_STATE();
     case 70:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'I' ||
-          lookahead == 'i') ADVANCE(76);
-      if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(90);
+      if (lookahead == 'G' ||
+          lookahead == 'g') ADVANCE(85);
+      if (lookahead == 'N' ||
+          lookahead == 'n') ADVANCE(86);
+      if (lookahead == 'S' ||
+          lookahead == 's') ADVANCE(56);
+      if (lookahead == 'V' ||
+          lookahead == 'v') ADVANCE(87);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 71:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'I' ||
-          lookahead == 'i') ADVANCE(94);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 72:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'I' ||
-          lookahead == 'i') ADVANCE(59);
+      if (lookahead == 'O' ||
+          lookahead == 'o') ADVANCE(88);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 73:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'I' ||
-          lookahead == 'i') ADVANCE(81);
+      if (lookahead == 'V' ||
+          lookahead == 'v') ADVANCE(89);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 74:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'L' ||
-          lookahead == 'l') ADVANCE(52);
+      if (lookahead == 'I' ||
+          lookahead == 'i') ADVANCE(90);
+      if (lookahead == 'O' ||
+          lookahead == 'o') ADVANCE(91);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 75:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'L' ||
-          lookahead == 'l') ADVANCE(86);
+      if (lookahead == 'A' ||
+          lookahead == 'a') ADVANCE(92);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(93);
+      if (lookahead == 'I' ||
+          lookahead == 'i') ADVANCE(94);
       if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
+          ('B' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 76:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'L' ||
-          lookahead == 'l') ADVANCE(95);
+      if (lookahead == 'O' ||
+          lookahead == 'o') ADVANCE(95);
+      if (lookahead == 'U' ||
+          lookahead == 'u') ADVANCE(96);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 77:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'L' ||
-          lookahead == 'l') ADVANCE(74);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(59);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 78:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'M' ||
-          lookahead == 'm') ADVANCE(53);
+      if (lookahead == 'L' ||
+          lookahead == 'l') ADVANCE(97);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 79:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'M' ||
-          lookahead == 'm') ADVANCE(61);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(98);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 80:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'N' ||
-          lookahead == 'n') ADVANCE(53);
+      if (lookahead == 'O' ||
+          lookahead == 'o') ADVANCE(99);
+      if (lookahead == 'U' ||
+          lookahead == 'u') ADVANCE(100);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 81:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'N' ||
-          lookahead == 'n') ADVANCE(91);
+      if (lookahead == 'I' ||
+          lookahead == 'i') ADVANCE(101);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 82:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'N' ||
-          lookahead == 'n') ADVANCE(92);
+      if (lookahead == 'U' ||
+          lookahead == 'u') ADVANCE(96);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 83:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(100);
+      if (lookahead == 'V' ||
+          lookahead == 'v') ADVANCE(87);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 84:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(93);
       if (lookahead == 'U' ||
-          lookahead == 'u') ADVANCE(77);
+          lookahead == 'u') ADVANCE(100);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 85:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(101);
-      if (lookahead == 'U' ||
-          lookahead == 'u') ADVANCE(78);
+      if (lookahead == 'A' ||
+          lookahead == 'a') ADVANCE(102);
       if (('0' <= lookahead && lookahead <= '9') ||
-          ('A' <= lookahead && lookahead <= 'Z') ||
+          ('B' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 86:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'O' ||
-          lookahead == 'o') ADVANCE(96);
+      if (lookahead == 'D' ||
+          lookahead == 'd') ADVANCE(58);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 87:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'R' ||
-          lookahead == 'r') ADVANCE(49);
+      if (lookahead == 'G' ||
+          lookahead == 'g') ADVANCE(65);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 88:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'R' ||
-          lookahead == 'r') ADVANCE(62);
+      if (lookahead == 'U' ||
+          lookahead == 'u') ADVANCE(103);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 89:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'R' ||
-          lookahead == 'r') ADVANCE(47);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(104);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 90:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'R' ||
-          lookahead == 'r') ADVANCE(79);
+      if (lookahead == 'L' ||
+          lookahead == 'l') ADVANCE(105);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 91:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'S' ||
-          lookahead == 's') ADVANCE(98);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(106);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 92:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(53);
+      if (lookahead == 'X' ||
+          lookahead == 'x') ADVANCE(65);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 93:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(51);
+      if (lookahead == 'D' ||
+          lookahead == 'd') ADVANCE(107);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 94:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(69);
+      if (lookahead == 'N' ||
+          lookahead == 'n') ADVANCE(65);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 95:
       ACCEPT_TOKEN(sym_identifier);
       if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(66);
+          lookahead == 't') ADVANCE(61);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 96:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(44);
+      if (lookahead == 'L' ||
+          lookahead == 'l') ADVANCE(108);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 97:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(50);
+      if (lookahead == 'O' ||
+          lookahead == 'o') ADVANCE(109);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 98:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'T' ||
-          lookahead == 't') ADVANCE(45);
+      if (lookahead == 'F' ||
+          lookahead == 'f') ADVANCE(110);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 99:
       ACCEPT_TOKEN(sym_identifier);
       if (lookahead == 'U' ||
-          lookahead == 'u') ADVANCE(78);
+          lookahead == 'u') ADVANCE(111);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 100:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'U' ||
-          lookahead == 'u') ADVANCE(82);
+      if (lookahead == 'M' ||
+          lookahead == 'm') ADVANCE(65);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 101:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'U' ||
-          lookahead == 'u') ADVANCE(88);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(112);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 102:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'U' ||
-          lookahead == 'u') ADVANCE(77);
+      if (lookahead == 'I' ||
+          lookahead == 'i') ADVANCE(113);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 103:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'V' ||
-          lookahead == 'v') ADVANCE(68);
+      if (lookahead == 'N' ||
+          lookahead == 'n') ADVANCE(114);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 104:
       ACCEPT_TOKEN(sym_identifier);
-      if (lookahead == 'X' ||
-          lookahead == 'x') ADVANCE(53);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(115);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 105:
       ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(116);
       if (('0' <= lookahead && lookahead <= '9') ||
           ('A' <= lookahead && lookahead <= 'Z') ||
           lookahead == '_' ||
-          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(105);
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 106:
-      ACCEPT_TOKEN(anon_sym_LT_EQ);
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'M' ||
+          lookahead == 'm') ADVANCE(117);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 107:
-      ACCEPT_TOKEN(anon_sym_GT_EQ);
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'I' ||
+          lookahead == 'i') ADVANCE(118);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 108:
-      ACCEPT_TOKEN(anon_sym_BANG_EQ);
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'L' ||
+          lookahead == 'l') ADVANCE(62);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 109:
-      ACCEPT_TOKEN(anon_sym_LT);
-      if (lookahead == '=') ADVANCE(106);
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(54);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
       END_STATE();
     case 110:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(119);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 111:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(120);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 112:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'H' ||
+          lookahead == 'h') ADVANCE(52);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 113:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'N' ||
+          lookahead == 'n') ADVANCE(121);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 114:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(65);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 115:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'Y' ||
+          lookahead == 'y') ADVANCE(64);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 116:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(122);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 117:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'A' ||
+          lookahead == 'a') ADVANCE(123);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('B' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 118:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'A' ||
+          lookahead == 'a') ADVANCE(94);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('B' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('b' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 119:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(124);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 120:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'C' ||
+          lookahead == 'c') ADVANCE(125);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 121:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'S' ||
+          lookahead == 's') ADVANCE(126);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 122:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'R' ||
+          lookahead == 'r') ADVANCE(57);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 123:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(60);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 124:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'S' ||
+          lookahead == 's') ADVANCE(127);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 125:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'E' ||
+          lookahead == 'e') ADVANCE(53);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 126:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'T' ||
+          lookahead == 't') ADVANCE(55);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 127:
+      ACCEPT_TOKEN(sym_identifier);
+      if (lookahead == 'H' ||
+          lookahead == 'h') ADVANCE(63);
+      if (('0' <= lookahead && lookahead <= '9') ||
+          ('A' <= lookahead && lookahead <= 'Z') ||
+          lookahead == '_' ||
+          ('a' <= lookahead && lookahead <= 'z')) ADVANCE(71);
+      END_STATE();
+    case 128:
+      ACCEPT_TOKEN(anon_sym_LT_EQ);
+      END_STATE();
+    case 129:
+      ACCEPT_TOKEN(anon_sym_GT_EQ);
+      END_STATE();
+    case 130:
+      ACCEPT_TOKEN(anon_sym_BANG_EQ);
+      END_STATE();
+    case 131:
+      ACCEPT_TOKEN(anon_sym_LT);
+      if (lookahead == '=') ADVANCE(128);
+      END_STATE();
+    case 132:
       ACCEPT_TOKEN(anon_sym_GT);
-      if (lookahead == '=') ADVANCE(107);
+      if (lookahead == '=') ADVANCE(129);
       END_STATE();
     default:
       return false;
@@ -1168,57 +1339,63 @@ static bool ts_lex(TSLexer *lexer, TSStateId state) {
 
 static const TSLexMode ts_lex_modes[STATE_COUNT] = {
   [0] = {.lex_state = 0},
-  [1] = {.lex_state = 36},
-  [2] = {.lex_state = 36},
+  [1] = {.lex_state = 1},
+  [2] = {.lex_state = 1},
   [3] = {.lex_state = 0},
-  [4] = {.lex_state = 36},
-  [5] = {.lex_state = 36},
-  [6] = {.lex_state = 36},
-  [7] = {.lex_state = 36},
-  [8] = {.lex_state = 36},
-  [9] = {.lex_state = 36},
+  [4] = {.lex_state = 1},
+  [5] = {.lex_state = 1},
+  [6] = {.lex_state = 1},
+  [7] = {.lex_state = 1},
+  [8] = {.lex_state = 1},
+  [9] = {.lex_state = 2},
   [10] = {.lex_state = 1},
-  [11] = {.lex_state = 2},
-  [12] = {.lex_state = 36},
-  [13] = {.lex_state = 36},
-  [14] = {.lex_state = 36},
-  [15] = {.lex_state = 36},
-  [16] = {.lex_state = 36},
-  [17] = {.lex_state = 36},
-  [18] = {.lex_state = 36},
-  [19] = {.lex_state = 6},
-  [20] = {.lex_state = 36},
-  [21] = {.lex_state = 36},
-  [22] = {.lex_state = 36},
-  [23] = {.lex_state = 36},
-  [24] = {.lex_state = 2},
-  [25] = {.lex_state = 6},
-  [26] = {.lex_state = 36},
-  [27] = {.lex_state = 0},
+  [11] = {.lex_state = 1},
+  [12] = {.lex_state = 1},
+  [13] = {.lex_state = 1},
+  [14] = {.lex_state = 1},
+  [15] = {.lex_state = 3},
+  [16] = {.lex_state = 1},
+  [17] = {.lex_state = 1},
+  [18] = {.lex_state = 1},
+  [19] = {.lex_state = 1},
+  [20] = {.lex_state = 4},
+  [21] = {.lex_state = 1},
+  [22] = {.lex_state = 1},
+  [23] = {.lex_state = 4},
+  [24] = {.lex_state = 3},
+  [25] = {.lex_state = 1},
+  [26] = {.lex_state = 1},
+  [27] = {.lex_state = 1},
   [28] = {.lex_state = 0},
-  [29] = {.lex_state = 36},
+  [29] = {.lex_state = 0},
   [30] = {.lex_state = 0},
   [31] = {.lex_state = 0},
-  [32] = {.lex_state = 0},
-  [33] = {.lex_state = 0},
-  [34] = {.lex_state = 36},
-  [35] = {.lex_state = 2},
-  [36] = {.lex_state = 2},
-  [37] = {.lex_state = 36},
-  [38] = {.lex_state = 0},
-  [39] = {.lex_state = 36},
-  [40] = {.lex_state = 2},
-  [41] = {.lex_state = 2},
-  [42] = {.lex_state = 0},
-  [43] = {.lex_state = 36},
-  [44] = {.lex_state = 36},
-  [45] = {.lex_state = 0},
-  [46] = {.lex_state = 2},
-  [47] = {.lex_state = 36},
-  [48] = {.lex_state = 0},
-  [49] = {.lex_state = 36},
+  [32] = {.lex_state = 1},
+  [33] = {.lex_state = 1},
+  [34] = {.lex_state = 0},
+  [35] = {.lex_state = 0},
+  [36] = {.lex_state = 1},
+  [37] = {.lex_state = 1},
+  [38] = {.lex_state = 1},
+  [39] = {.lex_state = 3},
+  [40] = {.lex_state = 3},
+  [41] = {.lex_state = 1},
+  [42] = {.lex_state = 3},
+  [43] = {.lex_state = 3},
+  [44] = {.lex_state = 1},
+  [45] = {.lex_state = 1},
+  [46] = {.lex_state = 0},
+  [47] = {.lex_state = 0},
+  [48] = {.lex_state = 1},
+  [49] = {.lex_state = 0},
   [50] = {.lex_state = 0},
-  [51] = {.lex_state = 0},
+  [51] = {.lex_state = 1},
+  [52] = {.lex_state = 0},
+  [53] = {.lex_state = 3},
+  [54] = {.lex_state = 0},
+  [55] = {.lex_state = 3},
+  [56] = {.lex_state = 1},
+  [57] = {.lex_state = 0},
 };
 
 static const uint16_t ts_parse_table[LARGE_STATE_COUNT][SYMBOL_COUNT] = {
@@ -1239,6 +1416,8 @@ static const uint16_t ts_parse_table[LARGE_STATE_COUNT][SYMBOL_COUNT] = {
     [sym_format] = ACTIONS(1),
     [sym_not] = ACTIONS(1),
     [sym_null] = ACTIONS(1),
+    [sym_refresh] = ACTIONS(1),
+    [sym_every] = ACTIONS(1),
     [sym_aggregate_func] = ACTIONS(1),
     [aux_sym_string_token1] = ACTIONS(1),
     [aux_sym_string_token2] = ACTIONS(1),
@@ -1251,8 +1430,8 @@ static const uint16_t ts_parse_table[LARGE_STATE_COUNT][SYMBOL_COUNT] = {
     [anon_sym_GT] = ACTIONS(1),
   },
   [1] = {
-    [sym_query] = STATE(51),
-    [sym_with_clause] = STATE(20),
+    [sym_query] = STATE(47),
+    [sym_with_clause] = STATE(4),
     [sym_with] = ACTIONS(3),
   },
 };
@@ -1269,7 +1448,7 @@ static const uint16_t ts_small_parse_table[] = {
       sym_or,
       sym_format,
   [11] = 3,
-    STATE(11), 1,
+    STATE(15), 1,
       sym_operator,
     ACTIONS(9), 2,
       anon_sym_LT,
@@ -1279,425 +1458,474 @@ static const uint16_t ts_small_parse_table[] = {
       anon_sym_LT_EQ,
       anon_sym_GT_EQ,
       anon_sym_BANG_EQ,
-  [25] = 3,
-    STATE(6), 1,
-      aux_sym_filter_clause_repeat1,
-    ACTIONS(13), 2,
-      sym_and,
-      sym_or,
-    ACTIONS(11), 3,
-      ts_builtin_sym_end,
+  [25] = 5,
+    ACTIONS(11), 1,
       sym_plot,
+    ACTIONS(13), 1,
+      sym_refresh,
+    STATE(5), 1,
+      sym_plot_clause,
+    STATE(19), 1,
+      sym_refresh_clause,
+    STATE(12), 2,
+      sym_series_clause,
+      aux_sym_query_repeat1,
+  [42] = 5,
+    ACTIONS(17), 1,
+      sym_filter,
+    ACTIONS(19), 1,
       sym_format,
-  [38] = 1,
-    ACTIONS(15), 6,
+    STATE(21), 1,
+      sym_filter_clause,
+    STATE(38), 1,
+      sym_format_clause,
+    ACTIONS(15), 2,
+      ts_builtin_sym_end,
+      sym_plot,
+  [59] = 1,
+    ACTIONS(21), 6,
       ts_builtin_sym_end,
       sym_plot,
       sym_against,
       sym_as,
       sym_filter,
       sym_format,
-  [47] = 3,
+  [68] = 3,
     STATE(8), 1,
       aux_sym_filter_clause_repeat1,
-    ACTIONS(13), 2,
+    ACTIONS(25), 2,
       sym_and,
       sym_or,
-    ACTIONS(17), 3,
+    ACTIONS(23), 3,
       ts_builtin_sym_end,
       sym_plot,
       sym_format,
-  [60] = 5,
-    ACTIONS(21), 1,
-      sym_filter,
-    ACTIONS(23), 1,
-      sym_format,
-    STATE(18), 1,
-      sym_filter_clause,
-    STATE(39), 1,
-      sym_format_clause,
-    ACTIONS(19), 2,
+  [81] = 3,
+    STATE(10), 1,
+      aux_sym_filter_clause_repeat1,
+    ACTIONS(25), 2,
+      sym_and,
+      sym_or,
+    ACTIONS(27), 3,
       ts_builtin_sym_end,
       sym_plot,
-  [77] = 3,
-    STATE(8), 1,
+      sym_format,
+  [94] = 4,
+    ACTIONS(33), 1,
+      sym_identifier,
+    STATE(33), 1,
+      sym_string,
+    ACTIONS(29), 2,
+      sym_null,
+      sym_number,
+    ACTIONS(31), 2,
+      aux_sym_string_token1,
+      aux_sym_string_token2,
+  [109] = 3,
+    STATE(10), 1,
       aux_sym_filter_clause_repeat1,
-    ACTIONS(27), 2,
+    ACTIONS(37), 2,
       sym_and,
       sym_or,
-    ACTIONS(25), 3,
+    ACTIONS(35), 3,
       ts_builtin_sym_end,
       sym_plot,
       sym_format,
-  [90] = 1,
-    ACTIONS(30), 6,
+  [122] = 1,
+    ACTIONS(40), 6,
       ts_builtin_sym_end,
       sym_plot,
       sym_against,
       sym_as,
       sym_filter,
       sym_format,
-  [99] = 4,
-    ACTIONS(36), 1,
-      sym_identifier,
-    STATE(29), 1,
-      sym_string,
-    ACTIONS(32), 2,
-      sym_null,
-      sym_number,
-    ACTIONS(34), 2,
-      aux_sym_string_token1,
-      aux_sym_string_token2,
-  [114] = 3,
-    STATE(15), 1,
-      sym_string,
-    ACTIONS(34), 2,
-      aux_sym_string_token1,
-      aux_sym_string_token2,
-    ACTIONS(38), 2,
-      sym_number,
-      sym_identifier,
-  [126] = 4,
-    ACTIONS(40), 1,
-      ts_builtin_sym_end,
+  [131] = 4,
+    ACTIONS(11), 1,
+      sym_plot,
     ACTIONS(42), 1,
+      ts_builtin_sym_end,
+    STATE(5), 1,
+      sym_plot_clause,
+    STATE(14), 2,
+      sym_series_clause,
+      aux_sym_query_repeat1,
+  [145] = 4,
+    ACTIONS(11), 1,
       sym_plot,
-    STATE(7), 1,
+    ACTIONS(44), 1,
+      ts_builtin_sym_end,
+    STATE(5), 1,
       sym_plot_clause,
-    STATE(16), 2,
+    STATE(14), 2,
       sym_series_clause,
       aux_sym_query_repeat1,
-  [140] = 2,
+  [159] = 4,
     ACTIONS(46), 1,
+      ts_builtin_sym_end,
+    ACTIONS(48), 1,
+      sym_plot,
+    STATE(5), 1,
+      sym_plot_clause,
+    STATE(14), 2,
+      sym_series_clause,
+      aux_sym_query_repeat1,
+  [173] = 3,
+    STATE(18), 1,
+      sym_string,
+    ACTIONS(31), 2,
+      aux_sym_string_token1,
+      aux_sym_string_token2,
+    ACTIONS(51), 2,
+      sym_number,
+      sym_identifier,
+  [185] = 2,
+    ACTIONS(55), 1,
       sym_as,
-    ACTIONS(44), 4,
+    ACTIONS(53), 4,
       ts_builtin_sym_end,
       sym_plot,
       sym_filter,
       sym_format,
-  [150] = 1,
-    ACTIONS(25), 5,
+  [195] = 1,
+    ACTIONS(35), 5,
       ts_builtin_sym_end,
       sym_plot,
       sym_and,
       sym_or,
       sym_format,
-  [158] = 1,
-    ACTIONS(48), 5,
+  [203] = 1,
+    ACTIONS(57), 5,
       ts_builtin_sym_end,
       sym_plot,
       sym_and,
       sym_or,
       sym_format,
-  [166] = 4,
-    ACTIONS(50), 1,
-      ts_builtin_sym_end,
-    ACTIONS(52), 1,
+  [211] = 3,
+    ACTIONS(11), 1,
       sym_plot,
-    STATE(7), 1,
+    STATE(5), 1,
       sym_plot_clause,
-    STATE(16), 2,
+    STATE(13), 2,
       sym_series_clause,
       aux_sym_query_repeat1,
-  [180] = 1,
-    ACTIONS(55), 4,
-      ts_builtin_sym_end,
-      sym_plot,
-      sym_filter,
-      sym_format,
-  [187] = 3,
-    ACTIONS(23), 1,
-      sym_format,
-    STATE(34), 1,
-      sym_format_clause,
-    ACTIONS(57), 2,
-      ts_builtin_sym_end,
-      sym_plot,
-  [198] = 4,
+  [222] = 4,
     ACTIONS(59), 1,
       sym_aggregate_func,
     ACTIONS(61), 1,
       sym_identifier,
-    STATE(9), 1,
+    STATE(6), 1,
       sym_aggregate_call,
-    STATE(13), 1,
+    STATE(51), 1,
       sym_column_ref,
-  [211] = 3,
-    ACTIONS(42), 1,
-      sym_plot,
-    STATE(7), 1,
-      sym_plot_clause,
-    STATE(12), 2,
-      sym_series_clause,
-      aux_sym_query_repeat1,
-  [222] = 3,
-    ACTIONS(65), 1,
-      sym_and,
-    STATE(23), 1,
-      aux_sym_format_clause_repeat1,
+  [235] = 3,
+    ACTIONS(19), 1,
+      sym_format,
+    STATE(41), 1,
+      sym_format_clause,
     ACTIONS(63), 2,
       ts_builtin_sym_end,
       sym_plot,
-  [233] = 3,
-    ACTIONS(65), 1,
+  [246] = 3,
+    ACTIONS(67), 1,
       sym_and,
-    STATE(21), 1,
+    STATE(25), 1,
       aux_sym_format_clause_repeat1,
-    ACTIONS(67), 2,
+    ACTIONS(65), 2,
       ts_builtin_sym_end,
       sym_plot,
-  [244] = 3,
-    ACTIONS(71), 1,
-      sym_and,
-    STATE(23), 1,
-      aux_sym_format_clause_repeat1,
-    ACTIONS(69), 2,
-      ts_builtin_sym_end,
-      sym_plot,
-  [255] = 1,
-    ACTIONS(74), 4,
-      aux_sym_string_token1,
-      aux_sym_string_token2,
-      sym_number,
-      sym_identifier,
-  [262] = 4,
+  [257] = 4,
     ACTIONS(59), 1,
       sym_aggregate_func,
     ACTIONS(61), 1,
       sym_identifier,
-    STATE(9), 1,
+    STATE(6), 1,
       sym_aggregate_call,
-    STATE(47), 1,
+    STATE(16), 1,
       sym_column_ref,
-  [275] = 1,
-    ACTIONS(69), 3,
+  [270] = 1,
+    ACTIONS(69), 4,
+      aux_sym_string_token1,
+      aux_sym_string_token2,
+      sym_number,
+      sym_identifier,
+  [277] = 3,
+    ACTIONS(67), 1,
+      sym_and,
+    STATE(26), 1,
+      aux_sym_format_clause_repeat1,
+    ACTIONS(71), 2,
       ts_builtin_sym_end,
       sym_plot,
+  [288] = 3,
+    ACTIONS(75), 1,
       sym_and,
-  [281] = 3,
-    ACTIONS(76), 1,
-      anon_sym_COMMA,
-    ACTIONS(78), 1,
-      anon_sym_RPAREN,
-    STATE(31), 1,
-      aux_sym_source_call_repeat1,
-  [291] = 3,
-    ACTIONS(80), 1,
-      anon_sym_COMMA,
-    ACTIONS(83), 1,
-      anon_sym_RPAREN,
-    STATE(28), 1,
-      aux_sym_source_call_repeat1,
-  [301] = 1,
-    ACTIONS(85), 3,
+    STATE(26), 1,
+      aux_sym_format_clause_repeat1,
+    ACTIONS(73), 2,
       ts_builtin_sym_end,
       sym_plot,
-      sym_and,
-  [307] = 2,
-    STATE(38), 1,
+  [299] = 1,
+    ACTIONS(78), 4,
+      ts_builtin_sym_end,
+      sym_plot,
+      sym_filter,
+      sym_format,
+  [306] = 2,
+    STATE(29), 1,
       sym_string,
-    ACTIONS(34), 2,
+    ACTIONS(31), 2,
       aux_sym_string_token1,
       aux_sym_string_token2,
-  [315] = 3,
-    ACTIONS(76), 1,
+  [314] = 3,
+    ACTIONS(80), 1,
       anon_sym_COMMA,
-    ACTIONS(87), 1,
+    ACTIONS(82), 1,
       anon_sym_RPAREN,
-    STATE(28), 1,
+    STATE(30), 1,
       aux_sym_source_call_repeat1,
-  [325] = 2,
-    STATE(17), 1,
+  [324] = 3,
+    ACTIONS(80), 1,
+      anon_sym_COMMA,
+    ACTIONS(84), 1,
+      anon_sym_RPAREN,
+    STATE(35), 1,
+      aux_sym_source_call_repeat1,
+  [334] = 2,
+    STATE(46), 1,
       sym_string,
-    ACTIONS(34), 2,
+    ACTIONS(31), 2,
       aux_sym_string_token1,
       aux_sym_string_token2,
-  [333] = 2,
+  [342] = 1,
+    ACTIONS(73), 3,
+      ts_builtin_sym_end,
+      sym_plot,
+      sym_and,
+  [348] = 1,
+    ACTIONS(86), 3,
+      ts_builtin_sym_end,
+      sym_plot,
+      sym_and,
+  [354] = 2,
     STATE(27), 1,
       sym_string,
-    ACTIONS(34), 2,
+    ACTIONS(31), 2,
       aux_sym_string_token1,
       aux_sym_string_token2,
-  [341] = 1,
-    ACTIONS(89), 2,
-      ts_builtin_sym_end,
-      sym_plot,
-  [346] = 2,
+  [362] = 3,
+    ACTIONS(88), 1,
+      anon_sym_COMMA,
     ACTIONS(91), 1,
-      sym_identifier,
-    STATE(14), 1,
-      sym_condition,
-  [353] = 2,
+      anon_sym_RPAREN,
+    STATE(35), 1,
+      aux_sym_source_call_repeat1,
+  [372] = 2,
     ACTIONS(93), 1,
-      sym_identifier,
-    STATE(26), 1,
-      sym_format_option,
-  [360] = 2,
-    ACTIONS(95), 1,
       sym_source,
-    STATE(49), 1,
+    STATE(37), 1,
       sym_source_call,
-  [367] = 1,
-    ACTIONS(83), 2,
-      anon_sym_COMMA,
-      anon_sym_RPAREN,
-  [372] = 1,
-    ACTIONS(57), 2,
+  [379] = 1,
+    ACTIONS(95), 2,
+      sym_plot,
+      sym_refresh,
+  [384] = 1,
+    ACTIONS(63), 2,
       ts_builtin_sym_end,
       sym_plot,
-  [377] = 2,
-    ACTIONS(93), 1,
+  [389] = 2,
+    ACTIONS(97), 1,
+      sym_identifier,
+    STATE(7), 1,
+      sym_condition,
+  [396] = 2,
+    ACTIONS(99), 1,
       sym_identifier,
     STATE(22), 1,
       sym_format_option,
-  [384] = 2,
-    ACTIONS(91), 1,
+  [403] = 1,
+    ACTIONS(101), 2,
+      ts_builtin_sym_end,
+      sym_plot,
+  [408] = 2,
+    ACTIONS(97), 1,
       sym_identifier,
-    STATE(4), 1,
+    STATE(17), 1,
       sym_condition,
-  [391] = 1,
-    ACTIONS(97), 1,
-      anon_sym_RPAREN,
-  [395] = 1,
+  [415] = 2,
     ACTIONS(99), 1,
+      sym_identifier,
+    STATE(32), 1,
+      sym_format_option,
+  [422] = 1,
+    ACTIONS(103), 2,
       sym_plot,
-  [399] = 1,
-    ACTIONS(101), 1,
+      sym_refresh,
+  [427] = 1,
+    ACTIONS(105), 2,
       sym_plot,
-  [403] = 1,
-    ACTIONS(103), 1,
-      anon_sym_EQ,
-  [407] = 1,
-    ACTIONS(105), 1,
-      sym_identifier,
-  [411] = 1,
+      sym_refresh,
+  [432] = 1,
+    ACTIONS(91), 2,
+      anon_sym_COMMA,
+      anon_sym_RPAREN,
+  [437] = 1,
     ACTIONS(107), 1,
-      sym_against,
-  [415] = 1,
+      ts_builtin_sym_end,
+  [441] = 1,
     ACTIONS(109), 1,
-      anon_sym_LPAREN,
-  [419] = 1,
+      sym_every,
+  [445] = 1,
     ACTIONS(111), 1,
-      sym_plot,
-  [423] = 1,
-    ACTIONS(113), 1,
       anon_sym_LPAREN,
-  [427] = 1,
+  [449] = 1,
+    ACTIONS(113), 1,
+      sym_number,
+  [453] = 1,
     ACTIONS(115), 1,
-      ts_builtin_sym_end,
+      sym_against,
+  [457] = 1,
+    ACTIONS(117), 1,
+      anon_sym_LPAREN,
+  [461] = 1,
+    ACTIONS(119), 1,
+      sym_identifier,
+  [465] = 1,
+    ACTIONS(121), 1,
+      anon_sym_EQ,
+  [469] = 1,
+    ACTIONS(123), 1,
+      sym_identifier,
+  [473] = 1,
+    ACTIONS(125), 1,
+      sym_plot,
+  [477] = 1,
+    ACTIONS(127), 1,
+      anon_sym_RPAREN,
 };
 
 static const uint32_t ts_small_parse_table_map[] = {
   [SMALL_STATE(2)] = 0,
   [SMALL_STATE(3)] = 11,
   [SMALL_STATE(4)] = 25,
-  [SMALL_STATE(5)] = 38,
-  [SMALL_STATE(6)] = 47,
-  [SMALL_STATE(7)] = 60,
-  [SMALL_STATE(8)] = 77,
-  [SMALL_STATE(9)] = 90,
-  [SMALL_STATE(10)] = 99,
-  [SMALL_STATE(11)] = 114,
-  [SMALL_STATE(12)] = 126,
-  [SMALL_STATE(13)] = 140,
-  [SMALL_STATE(14)] = 150,
-  [SMALL_STATE(15)] = 158,
-  [SMALL_STATE(16)] = 166,
-  [SMALL_STATE(17)] = 180,
-  [SMALL_STATE(18)] = 187,
-  [SMALL_STATE(19)] = 198,
-  [SMALL_STATE(20)] = 211,
-  [SMALL_STATE(21)] = 222,
-  [SMALL_STATE(22)] = 233,
-  [SMALL_STATE(23)] = 244,
-  [SMALL_STATE(24)] = 255,
-  [SMALL_STATE(25)] = 262,
-  [SMALL_STATE(26)] = 275,
-  [SMALL_STATE(27)] = 281,
-  [SMALL_STATE(28)] = 291,
-  [SMALL_STATE(29)] = 301,
-  [SMALL_STATE(30)] = 307,
-  [SMALL_STATE(31)] = 315,
-  [SMALL_STATE(32)] = 325,
-  [SMALL_STATE(33)] = 333,
-  [SMALL_STATE(34)] = 341,
-  [SMALL_STATE(35)] = 346,
-  [SMALL_STATE(36)] = 353,
-  [SMALL_STATE(37)] = 360,
-  [SMALL_STATE(38)] = 367,
-  [SMALL_STATE(39)] = 372,
-  [SMALL_STATE(40)] = 377,
-  [SMALL_STATE(41)] = 384,
-  [SMALL_STATE(42)] = 391,
-  [SMALL_STATE(43)] = 395,
-  [SMALL_STATE(44)] = 399,
-  [SMALL_STATE(45)] = 403,
-  [SMALL_STATE(46)] = 407,
-  [SMALL_STATE(47)] = 411,
-  [SMALL_STATE(48)] = 415,
-  [SMALL_STATE(49)] = 419,
-  [SMALL_STATE(50)] = 423,
-  [SMALL_STATE(51)] = 427,
+  [SMALL_STATE(5)] = 42,
+  [SMALL_STATE(6)] = 59,
+  [SMALL_STATE(7)] = 68,
+  [SMALL_STATE(8)] = 81,
+  [SMALL_STATE(9)] = 94,
+  [SMALL_STATE(10)] = 109,
+  [SMALL_STATE(11)] = 122,
+  [SMALL_STATE(12)] = 131,
+  [SMALL_STATE(13)] = 145,
+  [SMALL_STATE(14)] = 159,
+  [SMALL_STATE(15)] = 173,
+  [SMALL_STATE(16)] = 185,
+  [SMALL_STATE(17)] = 195,
+  [SMALL_STATE(18)] = 203,
+  [SMALL_STATE(19)] = 211,
+  [SMALL_STATE(20)] = 222,
+  [SMALL_STATE(21)] = 235,
+  [SMALL_STATE(22)] = 246,
+  [SMALL_STATE(23)] = 257,
+  [SMALL_STATE(24)] = 270,
+  [SMALL_STATE(25)] = 277,
+  [SMALL_STATE(26)] = 288,
+  [SMALL_STATE(27)] = 299,
+  [SMALL_STATE(28)] = 306,
+  [SMALL_STATE(29)] = 314,
+  [SMALL_STATE(30)] = 324,
+  [SMALL_STATE(31)] = 334,
+  [SMALL_STATE(32)] = 342,
+  [SMALL_STATE(33)] = 348,
+  [SMALL_STATE(34)] = 354,
+  [SMALL_STATE(35)] = 362,
+  [SMALL_STATE(36)] = 372,
+  [SMALL_STATE(37)] = 379,
+  [SMALL_STATE(38)] = 384,
+  [SMALL_STATE(39)] = 389,
+  [SMALL_STATE(40)] = 396,
+  [SMALL_STATE(41)] = 403,
+  [SMALL_STATE(42)] = 408,
+  [SMALL_STATE(43)] = 415,
+  [SMALL_STATE(44)] = 422,
+  [SMALL_STATE(45)] = 427,
+  [SMALL_STATE(46)] = 432,
+  [SMALL_STATE(47)] = 437,
+  [SMALL_STATE(48)] = 441,
+  [SMALL_STATE(49)] = 445,
+  [SMALL_STATE(50)] = 449,
+  [SMALL_STATE(51)] = 453,
+  [SMALL_STATE(52)] = 457,
+  [SMALL_STATE(53)] = 461,
+  [SMALL_STATE(54)] = 465,
+  [SMALL_STATE(55)] = 469,
+  [SMALL_STATE(56)] = 473,
+  [SMALL_STATE(57)] = 477,
 };
 
 static const TSParseActionEntry ts_parse_actions[] = {
   [0] = {.entry = {.count = 0, .reusable = false}},
   [1] = {.entry = {.count = 1, .reusable = false}}, RECOVER(),
-  [3] = {.entry = {.count = 1, .reusable = true}}, SHIFT(37),
+  [3] = {.entry = {.count = 1, .reusable = true}}, SHIFT(36),
   [5] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_string, 1),
   [7] = {.entry = {.count = 1, .reusable = true}}, SHIFT(24),
   [9] = {.entry = {.count = 1, .reusable = false}}, SHIFT(24),
-  [11] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_filter_clause, 2),
-  [13] = {.entry = {.count = 1, .reusable = true}}, SHIFT(35),
-  [15] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_aggregate_call, 4),
-  [17] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_filter_clause, 3),
-  [19] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_series_clause, 1),
-  [21] = {.entry = {.count = 1, .reusable = true}}, SHIFT(41),
-  [23] = {.entry = {.count = 1, .reusable = true}}, SHIFT(40),
-  [25] = {.entry = {.count = 1, .reusable = true}}, REDUCE(aux_sym_filter_clause_repeat1, 2),
-  [27] = {.entry = {.count = 2, .reusable = true}}, REDUCE(aux_sym_filter_clause_repeat1, 2), SHIFT_REPEAT(35),
-  [30] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_column_ref, 1),
-  [32] = {.entry = {.count = 1, .reusable = true}}, SHIFT(29),
-  [34] = {.entry = {.count = 1, .reusable = true}}, SHIFT(2),
-  [36] = {.entry = {.count = 1, .reusable = false}}, SHIFT(29),
-  [38] = {.entry = {.count = 1, .reusable = true}}, SHIFT(15),
-  [40] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_query, 2),
-  [42] = {.entry = {.count = 1, .reusable = true}}, SHIFT(25),
-  [44] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_plot_clause, 4),
-  [46] = {.entry = {.count = 1, .reusable = true}}, SHIFT(32),
-  [48] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_condition, 3),
-  [50] = {.entry = {.count = 1, .reusable = true}}, REDUCE(aux_sym_query_repeat1, 2),
-  [52] = {.entry = {.count = 2, .reusable = true}}, REDUCE(aux_sym_query_repeat1, 2), SHIFT_REPEAT(25),
-  [55] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_plot_clause, 6),
-  [57] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_series_clause, 2),
-  [59] = {.entry = {.count = 1, .reusable = true}}, SHIFT(48),
-  [61] = {.entry = {.count = 1, .reusable = false}}, SHIFT(9),
-  [63] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_format_clause, 3),
-  [65] = {.entry = {.count = 1, .reusable = true}}, SHIFT(36),
-  [67] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_format_clause, 2),
-  [69] = {.entry = {.count = 1, .reusable = true}}, REDUCE(aux_sym_format_clause_repeat1, 2),
-  [71] = {.entry = {.count = 2, .reusable = true}}, REDUCE(aux_sym_format_clause_repeat1, 2), SHIFT_REPEAT(36),
-  [74] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_operator, 1),
-  [76] = {.entry = {.count = 1, .reusable = true}}, SHIFT(30),
-  [78] = {.entry = {.count = 1, .reusable = true}}, SHIFT(43),
-  [80] = {.entry = {.count = 2, .reusable = true}}, REDUCE(aux_sym_source_call_repeat1, 2), SHIFT_REPEAT(30),
-  [83] = {.entry = {.count = 1, .reusable = true}}, REDUCE(aux_sym_source_call_repeat1, 2),
-  [85] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_format_option, 3),
-  [87] = {.entry = {.count = 1, .reusable = true}}, SHIFT(44),
-  [89] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_series_clause, 3),
-  [91] = {.entry = {.count = 1, .reusable = true}}, SHIFT(3),
-  [93] = {.entry = {.count = 1, .reusable = true}}, SHIFT(45),
-  [95] = {.entry = {.count = 1, .reusable = true}}, SHIFT(50),
-  [97] = {.entry = {.count = 1, .reusable = true}}, SHIFT(5),
-  [99] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_source_call, 4),
-  [101] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_source_call, 5),
-  [103] = {.entry = {.count = 1, .reusable = true}}, SHIFT(10),
-  [105] = {.entry = {.count = 1, .reusable = true}}, SHIFT(42),
-  [107] = {.entry = {.count = 1, .reusable = true}}, SHIFT(19),
-  [109] = {.entry = {.count = 1, .reusable = true}}, SHIFT(46),
-  [111] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_with_clause, 2),
-  [113] = {.entry = {.count = 1, .reusable = true}}, SHIFT(33),
-  [115] = {.entry = {.count = 1, .reusable = true}},  ACCEPT_INPUT(),
+  [11] = {.entry = {.count = 1, .reusable = true}}, SHIFT(20),
+  [13] = {.entry = {.count = 1, .reusable = true}}, SHIFT(48),
+  [15] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_series_clause, 1),
+  [17] = {.entry = {.count = 1, .reusable = true}}, SHIFT(39),
+  [19] = {.entry = {.count = 1, .reusable = true}}, SHIFT(40),
+  [21] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_column_ref, 1),
+  [23] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_filter_clause, 2),
+  [25] = {.entry = {.count = 1, .reusable = true}}, SHIFT(42),
+  [27] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_filter_clause, 3),
+  [29] = {.entry = {.count = 1, .reusable = true}}, SHIFT(33),
+  [31] = {.entry = {.count = 1, .reusable = true}}, SHIFT(2),
+  [33] = {.entry = {.count = 1, .reusable = false}}, SHIFT(33),
+  [35] = {.entry = {.count = 1, .reusable = true}}, REDUCE(aux_sym_filter_clause_repeat1, 2),
+  [37] = {.entry = {.count = 2, .reusable = true}}, REDUCE(aux_sym_filter_clause_repeat1, 2), SHIFT_REPEAT(42),
+  [40] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_aggregate_call, 4),
+  [42] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_query, 2),
+  [44] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_query, 3),
+  [46] = {.entry = {.count = 1, .reusable = true}}, REDUCE(aux_sym_query_repeat1, 2),
+  [48] = {.entry = {.count = 2, .reusable = true}}, REDUCE(aux_sym_query_repeat1, 2), SHIFT_REPEAT(20),
+  [51] = {.entry = {.count = 1, .reusable = true}}, SHIFT(18),
+  [53] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_plot_clause, 4),
+  [55] = {.entry = {.count = 1, .reusable = true}}, SHIFT(34),
+  [57] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_condition, 3),
+  [59] = {.entry = {.count = 1, .reusable = true}}, SHIFT(52),
+  [61] = {.entry = {.count = 1, .reusable = false}}, SHIFT(6),
+  [63] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_series_clause, 2),
+  [65] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_format_clause, 2),
+  [67] = {.entry = {.count = 1, .reusable = true}}, SHIFT(43),
+  [69] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_operator, 1),
+  [71] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_format_clause, 3),
+  [73] = {.entry = {.count = 1, .reusable = true}}, REDUCE(aux_sym_format_clause_repeat1, 2),
+  [75] = {.entry = {.count = 2, .reusable = true}}, REDUCE(aux_sym_format_clause_repeat1, 2), SHIFT_REPEAT(43),
+  [78] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_plot_clause, 6),
+  [80] = {.entry = {.count = 1, .reusable = true}}, SHIFT(31),
+  [82] = {.entry = {.count = 1, .reusable = true}}, SHIFT(44),
+  [84] = {.entry = {.count = 1, .reusable = true}}, SHIFT(45),
+  [86] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_format_option, 3),
+  [88] = {.entry = {.count = 2, .reusable = true}}, REDUCE(aux_sym_source_call_repeat1, 2), SHIFT_REPEAT(31),
+  [91] = {.entry = {.count = 1, .reusable = true}}, REDUCE(aux_sym_source_call_repeat1, 2),
+  [93] = {.entry = {.count = 1, .reusable = true}}, SHIFT(49),
+  [95] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_with_clause, 2),
+  [97] = {.entry = {.count = 1, .reusable = true}}, SHIFT(3),
+  [99] = {.entry = {.count = 1, .reusable = true}}, SHIFT(54),
+  [101] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_series_clause, 3),
+  [103] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_source_call, 4),
+  [105] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_source_call, 5),
+  [107] = {.entry = {.count = 1, .reusable = true}},  ACCEPT_INPUT(),
+  [109] = {.entry = {.count = 1, .reusable = true}}, SHIFT(50),
+  [111] = {.entry = {.count = 1, .reusable = true}}, SHIFT(28),
+  [113] = {.entry = {.count = 1, .reusable = true}}, SHIFT(53),
+  [115] = {.entry = {.count = 1, .reusable = true}}, SHIFT(23),
+  [117] = {.entry = {.count = 1, .reusable = true}}, SHIFT(55),
+  [119] = {.entry = {.count = 1, .reusable = true}}, SHIFT(56),
+  [121] = {.entry = {.count = 1, .reusable = true}}, SHIFT(9),
+  [123] = {.entry = {.count = 1, .reusable = true}}, SHIFT(57),
+  [125] = {.entry = {.count = 1, .reusable = true}}, REDUCE(sym_refresh_clause, 4),
+  [127] = {.entry = {.count = 1, .reusable = true}}, SHIFT(11),
 };
 
 #ifdef __cplusplus